@@ -108,12 +108,18 @@ from static_frame.core.node_transpose import InterfaceBatchTranspose as Interfac
 from static_frame.core.node_transpose import InterfaceTranspose as InterfaceTranspose
 from static_frame.core.node_values import InterfaceBatchValues as InterfaceBatchValues
 from static_frame.core.node_values import InterfaceValues as InterfaceValues
+from static_frame.core.persist_policy import PersistPolicy as PersistPolicy
+from static_frame.core.persist_policy import PersistPolicy2Q as PersistPolicy2Q
+from static_frame.core.persist_policy import PersistPolicyLFU as PersistPolicyLFU
+from static_frame.core.persist_policy import PersistPolicyLRU as PersistPolicyLRU
 from static_frame.core.platform import Platform as Platform
 from static_frame.core.quilt import Quilt as Quilt
 from static_frame.core.reduce import InterfaceBatchReduceDispatch
 from static_frame.core.reduce import ReduceDispatch as ReduceDispatch
 from static_frame.core.reduce import ReduceDispatchAligned as ReduceDispatchAligned
 from static_frame.core.reduce import ReduceDispatchUnaligned as ReduceDispatchUnaligned
+from static_frame.core.row_filter import RowFilter as RowFilter
+from static_frame.core.row_filter import RowFilterColumn as RowFilterColumn
 from static_frame.core.series import Series as Series
 from static_frame.core.series import SeriesAssign as SeriesAssign
 from static_frame.core.series import SeriesHE as SeriesHE
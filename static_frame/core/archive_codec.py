@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import typing_extensions as tp
+
+from static_frame.core.exception import ErrorNPYDecode
+from static_frame.core.exception import ErrorNPYEncode
+
+if tp.TYPE_CHECKING:
+    TNDArrayAny = np.ndarray[tp.Any, tp.Any] #pragma: no cover
+
+#-------------------------------------------------------------------------------
+
+class Codec:
+    '''Compression codec for array data in an :obj:`Archive`. Codecs compress and decompress independent blocks of bytes; implementations must release the GIL such that blocks can be processed in a pool of threads.
+    '''
+    __slots__ = ()
+
+    NAME: str
+
+    @staticmethod
+    def available() -> bool:
+        return True
+
+    @staticmethod
+    def compress(data: memoryview) -> bytes:
+        raise NotImplementedError() #pragma: no cover
+
+    @staticmethod
+    def decompress(data: bytes, size: int) -> bytes:
+        raise NotImplementedError() #pragma: no cover
+
+
+class CodecZlib(Codec):
+    '''Codec using the ``zlib`` module of the standard library, at the fastest compression level.
+    '''
+    __slots__ = ()
+
+    NAME = 'zlib'
+
+    @staticmethod
+    def compress(data: memoryview) -> bytes:
+        return zlib.compress(data, 1)
+
+    @staticmethod
+    def decompress(data: bytes, size: int) -> bytes:
+        return zlib.decompress(data, bufsize=size)
+
+
+class CodecZstd(Codec):
+    '''Codec using the optional ``zstandard`` package.
+    '''
+    __slots__ = ()
+
+    NAME = 'zstd'
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import zstandard  # pylint: disable=W0611,C0415
+        except ImportError:
+            return False
+        return True
+
+    @staticmethod
+    def compress(data: memoryview) -> bytes:
+        import zstandard  # pylint: disable=C0415
+        return zstandard.ZstdCompressor(level=3).compress(data) # type: ignore
+
+    @staticmethod
+    def decompress(data: bytes, size: int) -> bytes:
+        import zstandard  # pylint: disable=C0415
+        return zstandard.ZstdDecompressor().decompress(data, max_output_size=size) # type: ignore
+
+
+class CodecLZ4(Codec):
+    '''Codec using the block format of the optional ``lz4`` package.
+    '''
+    __slots__ = ()
+
+    NAME = 'lz4'
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import lz4.block  # pylint: disable=W0611,C0415
+        except ImportError:
+            return False
+        return True
+
+    @staticmethod
+    def compress(data: memoryview) -> bytes:
+        import lz4.block  # pylint: disable=C0415
+        return lz4.block.compress(data, store_size=False) # type: ignore
+
+    @staticmethod
+    def decompress(data: bytes, size: int) -> bytes:
+        import lz4.block  # pylint: disable=C0415
+        return lz4.block.decompress(data, uncompressed_size=size) # type: ignore
+
+
+CODECS: tp.Dict[str, tp.Type[Codec]] = {cls.NAME: cls
+        for cls in (CodecZstd, CodecLZ4, CodecZlib)}
+
+CODEC_AUTO = 'auto'
+
+def codec_from_name(name: str) -> tp.Type[Codec]:
+    '''Return the :obj:`Codec` of ``name``. If ``name`` is "auto", return the first available of zstd, lz4, and zlib.
+    '''
+    if name == CODEC_AUTO:
+        for cls in CODECS.values():
+            if cls.available():
+                return cls
+    if name not in CODECS:
+        raise ErrorNPYEncode(f'No support for codec {name!r}; use one of {list(CODECS)} or {CODEC_AUTO!r}.')
+    cls = CODECS[name]
+    if not cls.available():
+        raise ModuleNotFoundError(f'The package required by codec {name!r} is not installed.')
+    return cls
+
+#-------------------------------------------------------------------------------
+
+class CodecBlocks:
+    '''Block-level framing of the compressed bytes of an array. The bytes are divided into blocks of ``BLOCK_SIZE`` (the last block may be shorter) and each block is compressed independently, permitting compression and decompression in a pool of threads. The framed bytes are the block count and block size, the compressed size of each block, and then the compressed blocks.
+    '''
+    BLOCK_SIZE = 4 * 1024 ** 2 # 4 MB
+    STRUCT_HEAD = struct.Struct('<IQ') # block count, block size
+    STRUCT_SIZE = '<{}Q'
+
+    @staticmethod
+    def _map(
+            func: tp.Callable[..., tp.Any],
+            *iterables: tp.Iterable[tp.Any],
+            count: int,
+            ) -> tp.Iterator[tp.Any]:
+        if count <= 1:
+            return map(func, *iterables)
+        workers = min(count, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return iter(list(executor.map(func, *iterables)))
+
+    @classmethod
+    def to_file(cls,
+            file: tp.IO[bytes],
+            array: TNDArrayAny,
+            codec: tp.Type[Codec],
+            ) -> None:
+        '''Write the compressed bytes of ``array``, in the order of its memory layout, to ``file``. ``array`` must be C or F contiguous.
+        '''
+        # NOTE: a uint8 view avoids a copy of the array's bytes and supports datetime64 dtypes, which cannot be exported through the buffer protocol
+        data = array.reshape(-1, order='A').view(np.uint8).data
+        block_size = cls.BLOCK_SIZE
+        starts = range(0, len(data), block_size)
+        count = len(starts)
+
+        blocks = list(cls._map(codec.compress,
+                (data[start: start + block_size] for start in starts),
+                count=count,
+                ))
+        file.write(cls.STRUCT_HEAD.pack(count, block_size))
+        file.write(struct.pack(cls.STRUCT_SIZE.format(count), *(len(b) for b in blocks)))
+        for b in blocks:
+            file.write(b)
+
+    @classmethod
+    def from_file(cls,
+            file: tp.IO[bytes],
+            dtype: np.dtype[tp.Any],
+            size: int,
+            codec: tp.Type[Codec],
+            ) -> TNDArrayAny:
+        '''Read compressed bytes from ``file`` into a new 1D array of ``dtype`` and ``size`` elements; each decompressed block is written directly into its region of the array.
+        '''
+        count, block_size = cls.STRUCT_HEAD.unpack(file.read(cls.STRUCT_HEAD.size))
+        sizes = struct.unpack(cls.STRUCT_SIZE.format(count), file.read(8 * count))
+        blocks = [file.read(s) for s in sizes]
+
+        array = np.empty(size, dtype=dtype)
+        target = array.view(np.uint8)
+        size_bytes = len(target)
+        if count != -(-size_bytes // block_size):
+            raise ErrorNPYDecode('Invalid compressed block count.')
+
+        def decompress(block: bytes, start: int) -> None:
+            stop = min(start + block_size, size_bytes)
+            target[start: stop] = np.frombuffer(codec.decompress(block, stop - start), dtype=np.uint8)
+
+        for _ in cls._map(decompress,
+                blocks,
+                range(0, size_bytes, block_size),
+                count=count,
+                ):
+            pass
+        array.flags.writeable = False
+        return array
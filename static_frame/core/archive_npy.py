@@ -15,8 +15,11 @@ from zipfile import ZipFile
 import numpy as np
 import typing_extensions as tp
 
-from static_frame.core.archive_zip import ZipFilePartRO
+from static_frame.core.archive_codec import Codec
+from static_frame.core.archive_codec import CodecBlocks
+from static_frame.core.archive_codec import codec_from_name
 from static_frame.core.archive_zip import ZipFileRO
+from static_frame.core.archive_zip import zip_info_aligned
 from static_frame.core.container_util import ContainerMap
 from static_frame.core.container_util import index_many_concat
 from static_frame.core.container_util import index_many_to_one
@@ -29,13 +32,20 @@ from static_frame.core.index_base import IndexBase
 from static_frame.core.index_datetime import dtype_to_index_cls
 from static_frame.core.interface_meta import InterfaceMeta
 from static_frame.core.metadata import NPYLabel
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import DTYPE_UNICODE_KIND
 from static_frame.core.util import JSONTranslator
 from static_frame.core.util import ManyToOneType
+from static_frame.core.util import PositionsAllocator
 from static_frame.core.util import TLabel
 from static_frame.core.util import TName
 from static_frame.core.util import TPathSpecifier
 from static_frame.core.util import TPathSpecifierOrIO
+from static_frame.core.util import array_dictionary_encode
+from static_frame.core.util import array_str_compact
+from static_frame.core.util import array_str_expand
 from static_frame.core.util import concat_resolved
 
 if tp.TYPE_CHECKING:
@@ -43,6 +53,8 @@ if tp.TYPE_CHECKING:
 
     from static_frame.core.frame import Frame  # pylint: disable=W0611,C0412 #pragma: no cover
     from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=W0611,C0412 #pragma: no cover
+    from static_frame.core.index_hierarchy import IndexHierarchy  # pylint: disable=W0611,C0412 #pragma: no cover
+    from static_frame.core.type_blocks import TypeBlocks  # pylint: disable=W0611,C0412 #pragma: no cover
 
     TNDArrayAny = np.ndarray[tp.Any, tp.Any] #pragma: no cover
     TDtypeAny = np.dtype[tp.Any] #pragma: no cover
@@ -52,6 +64,8 @@ if tp.TYPE_CHECKING:
 #-------------------------------------------------------------------------------
 
 
+HAS_WRITEV = hasattr(os, 'writev') # not available on Windows
+
 TNDIterFlags = tp.Sequence[tp.Literal['external_loop', 'buffered', 'zerosize_ok']]
 
 class NPYConverter:
@@ -84,8 +98,8 @@ class NPYConverter:
         return prefix + center + postfix
 
     @classmethod
-    def to_npy(cls, file: tp.IO[bytes], array: TNDArrayAny) -> None:
-        '''Write an NPY 1.0 file to the open, writeable, binary file given by ``file``. NPY 1.0 is used as structured arrays are not supported.
+    def _header_from_array(cls, array: TNDArrayAny) -> bytes:
+        '''Validate that ``array`` can be written as an NPY 1.0 file and return the encoded header.
         '''
         dtype = array.dtype
         if dtype.kind == DTYPE_OBJECT_KIND:
@@ -97,29 +111,60 @@ class NPYConverter:
         if array.ndim == 0 or array.ndim > 2:
             raise ErrorNPYEncode('No support for ndim other than 1 and 2.')
 
+        header = f'{{"descr":"{dtype.str}","fortran_order":{array.flags.f_contiguous},"shape":{array.shape}}}'
+        return cls._header_encode(header)
+
+    @staticmethod
+    def _array_to_buffer(array: TNDArrayAny) -> tp.Optional[memoryview]:
+        '''If ``array`` is C or F contiguous, return a view of its bytes, in the order of its memory layout, without copying; otherwise, return None.
+        '''
+        flags = array.flags
+        if flags.c_contiguous or flags.f_contiguous:
+            # NOTE: a uint8 view supports datetime64 dtypes, which cannot be exported through the buffer protocol
+            return array.reshape(-1, order='A').view(np.uint8).data
+        return None
+
+    @classmethod
+    def to_buffers(cls,
+            array: TNDArrayAny,
+            ) -> tp.Optional[tp.List[tp.Union[bytes, memoryview]]]:
+        '''If ``array`` is C or F contiguous, return the encoded header and a view of the array's bytes, which together are the bytes of an NPY 1.0 file, for writing with a vectored write; otherwise, return None.
+        '''
+        header = cls._header_from_array(array)
+        buffer = cls._array_to_buffer(array)
+        if buffer is None:
+            return None
+        return [header, buffer]
+
+    @classmethod
+    def to_npy(cls,
+            file: tp.IO[bytes],
+            array: TNDArrayAny,
+            codec: tp.Optional[tp.Type[Codec]] = None,
+            ) -> None:
+        '''Write an NPY 1.0 file to the open, writeable, binary file given by ``file``. NPY 1.0 is used as structured arrays are not supported. If ``codec`` is provided, the header is followed by array data compressed in blocks with ``codec``.
+        '''
+        file.write(cls._header_from_array(array))
+
         flags = array.flags
         fortran_order = flags.f_contiguous
 
+        if codec is not None:
+            if not fortran_order and not flags.c_contiguous:
+                array = np.ascontiguousarray(array)
+            CodecBlocks.to_file(file, array, codec)
+            return
+
+        # NOTE: contiguous arrays are written from a view of their bytes, without copying
+        buffer = cls._array_to_buffer(array)
+        if buffer is not None:
+            file.write(buffer)
+            return
+
         # NOTE: do not know how to create array with itmesize 0, assume array.itemsize > 0
         # NOTE: derived numpy configuration
         buffersize = max(cls.BUFFERSIZE_NUMERATOR // array.itemsize, 1)
 
-        header = f'{{"descr":"{dtype.str}","fortran_order":{fortran_order},"shape":{array.shape}}}'
-        file.write(cls._header_encode(header))
-
-        # NOTE: this works but forces copying everything in memory
-        # if flags.f_contiguous and not flags.c_contiguous:
-        #     file.write(array.T.tobytes())
-        # else:
-        #     file.write(array.tobytes())
-
-        # NOTE: this approach works with normal open files (but not zip files) and is not materially faster than using buffering
-        # if isinstance(file, io.BufferedWriter):
-        #     if fortran_order and not flags.c_contiguous:
-        #         array.T.tofile(file)
-        #     else:
-        #         array.tofile(file)
-
         # NOTE: this might be made more efficient by creating an ArrayKit function that extracts bytes directly, avoiding creating an array for each chunk.
         if fortran_order and not flags.c_contiguous:
             for chunk in np.nditer(
@@ -173,8 +218,9 @@ class NPYConverter:
             file: tp.IO[bytes],
             header_decode_cache: HeaderDecodeCacheType,
             memory_map: bool = False,
+            codec: tp.Optional[tp.Type[Codec]] = None,
             ) -> tp.Tuple[TNDArrayAny, tp.Optional[mmap.mmap]]:
-        '''Read an NPY 1.0 file.
+        '''Read an NPY 1.0 file. If ``codec`` is provided, array data is decompressed with ``codec``.
         '''
         if cls.MAGIC_PREFIX != file.read(cls.MAGIC_LEN):
             raise ErrorNPYDecode('Invalid NPY header found.')
@@ -192,7 +238,12 @@ class NPYConverter:
         else:
             raise ErrorNPYDecode(f'No support for {ndim}-dimensional arrays')
 
-        if memory_map:
+        array: TNDArrayAny
+        if codec is not None:
+            if memory_map:
+                raise ErrorNPYDecode(f'Cannot memory map arrays compressed with {codec.NAME}')
+            array = CodecBlocks.from_file(file, dtype, size, codec)
+        elif memory_map:
             # offset calculations derived from numpy/core/memmap.py
             offset_header = file.tell()
             byte_count = offset_header + size * dtype.itemsize
@@ -206,7 +257,7 @@ class NPYConverter:
                     offset=offset_mmap,
                     )
             # will always be immutable
-            array: TNDArrayAny = np.ndarray(shape,
+            array = np.ndarray(shape,
                     dtype=dtype,
                     buffer=mm,
                     offset=offset_array,
@@ -214,14 +265,11 @@ class NPYConverter:
                     )
             # assert not array.flags.writeable
             return array, mm
-
-        if dtype_kind == 'M' or dtype_kind == 'm' or file.__class__ is not ZipFilePartRO: # type: ignore
-            # NOTE: produces a read-only view on the existing data
-            array = np.frombuffer(file.read(), dtype=dtype)
         else:
-            # NOTE: using readinto shown to be faster than frombuffer, particularly in the context of tall Frames
+            # NOTE: using readinto shown to be faster than frombuffer, particularly in the context of tall Frames, as bytes are read into the array without an intermediary bytes object; a uint8 view supports datetime64 dtypes
             array = np.empty(size, dtype=dtype)
-            file.readinto(array.data) # type: ignore
+            if file.readinto(array.view(np.uint8)) != array.nbytes: # type: ignore
+                raise ErrorNPYDecode('Invalid NPY file: fewer bytes than declared in the header.')
             array.flags.writeable = False
 
         if fortran_order and ndim == 2:
@@ -295,11 +343,12 @@ class Archive:
 
 class ArchiveZip(Archive):
 
-    '''Archives based on a new ZipFile per Frame; ZipFile creation happens on __init__.
+    '''Archives based on a new ZipFile per Frame; ZipFile creation happens on __init__. If written with a ``codec``, arrays are compressed with that codec and the codec is recorded in the metadata; when reading, the codec is set from the metadata. As the ZIP is uncompressed and array data is aligned in the ZIP file, arrays can be memory mapped from a ZIP file given by path.
     '''
-    __slots__ = ()
+    __slots__ = ('_codec',)
 
     _archive: tp.Union[ZipFile, ZipFileRO]
+    _codec: tp.Optional[tp.Type[Codec]]
 
     FUNC_REMOVE_FP = os.remove
 
@@ -307,7 +356,9 @@ class ArchiveZip(Archive):
             fp: TPathSpecifier, # might be a BytesIO object
             writeable: bool,
             memory_map: bool,
+            codec: tp.Optional[str] = None,
             ):
+        self._codec = None if codec is None else codec_from_name(codec)
 
         if writeable:
             self._archive = ZipFile(fp, # pylint: disable=R1732
@@ -316,10 +367,12 @@ class ArchiveZip(Archive):
                 allowZip64=True,
                 )
         else:
+            if memory_map and isinstance(fp, io.IOBase):
+                raise RuntimeError(f'Cannot memory_map with {fp}')
             self._archive = ZipFileRO(fp)
             self._header_decode_cache = {}
 
-        if memory_map:
+        if memory_map and writeable:
             raise RuntimeError(f'Cannot memory_map with {self}')
 
         self._memory_map = memory_map
@@ -341,20 +394,31 @@ class ArchiveZip(Archive):
         yield from self._archive.namelist()
 
     def write_array(self, name: str, array: TNDArrayAny) -> None:
+        zf: ZipFile = self._archive # type: ignore
+        # NOTE: as the NPY header is padded to ARRAY_ALIGN, aligning the start of the file aligns the array, permitting aligned memory-mapped reads
+        zinfo = zip_info_aligned(zf, name, NPYConverter.ARRAY_ALIGN)
         # NOTE: zip only has 'w' mode, not 'wb'
         # NOTE: force_zip64 required for large files
-        f = self._archive.open(name, 'w', force_zip64=True) # type: ignore # pylint: disable=R1732
+        f = zf.open(zinfo, 'w', force_zip64=True) # pylint: disable=R1732
         try:
-            NPYConverter.to_npy(f, array)
+            NPYConverter.to_npy(f, array, self._codec)
         finally:
             f.close()
 
     def read_array(self, name: str) -> TNDArrayAny:
         f = self._archive.open(name) # pylint: disable=R1732
         try:
-            array, _ = NPYConverter.from_npy(f, self._header_decode_cache)
+            array, mm = NPYConverter.from_npy(f,
+                    self._header_decode_cache,
+                    self._memory_map,
+                    self._codec,
+                    )
         finally:
-            f.close()
+            f.close() # NOTE: can close the file after creating memory map
+        if mm is not None:
+            if not hasattr(self, '_closable'):
+                self._closable = []
+            self._closable.append(mm)
         array.flags.writeable = False
         return array
 
@@ -372,6 +436,8 @@ class ArchiveZip(Archive):
         return self._archive.getinfo(name).file_size
 
     def write_metadata(self, content: tp.Any) -> None:
+        if self._codec is not None:
+            content[NPYLabel.KEY_CODEC] = self._codec.NAME
         # writestr is a method on the ZipFile
         self._archive.writestr(
                 self.FILE_META,
@@ -379,24 +445,30 @@ class ArchiveZip(Archive):
                 )
 
     def read_metadata(self) -> tp.Any:
-        return json.loads(self._archive.read(self.FILE_META))
+        content = json.loads(self._archive.read(self.FILE_META))
+        if NPYLabel.KEY_CODEC in content:
+            self._codec = codec_from_name(content[NPYLabel.KEY_CODEC])
+        return content
 
     def size_metadata(self) -> int:
         return self._archive.getinfo(self.FILE_META).file_size
 
 class ArchiveDirectory(Archive):
-    '''Archive interface to a directory, where the directory is created on write and NPY files are authored into the files system.
+    '''Archive interface to a directory, where the directory is created on write and NPY files are authored into the files system. If written with a ``codec``, arrays are compressed with that codec and the codec is recorded in the metadata; when reading, the codec is set from the metadata.
     '''
-    __slots__ = ()
+    __slots__ = ('_codec',)
 
     _archive: TPathSpecifier
+    _codec: tp.Optional[tp.Type[Codec]]
     FUNC_REMOVE_FP = shutil.rmtree
 
     def __init__(self,
             fp: TPathSpecifier,
             writeable: bool,
             memory_map: bool,
+            codec: tp.Optional[str] = None,
             ):
+        self._codec = None if codec is None else codec_from_name(codec)
 
         if writeable:
             # because an error in writing will remove the entire directory, we requires the directory to be newly created
@@ -421,11 +493,37 @@ class ArchiveDirectory(Archive):
         fp = os.path.join(self._archive, name)
         return os.path.exists(fp)
 
+    @staticmethod
+    def _write_buffers(
+            fd: int,
+            buffers: tp.List[tp.Union[bytes, memoryview]],
+            ) -> None:
+        '''Write ``buffers`` to the file descriptor ``fd`` with vectored writes, continuing after partial writes.
+        '''
+        views = [memoryview(b) for b in buffers]
+        while views:
+            count = os.writev(fd, views)
+            while views and count >= len(views[0]):
+                count -= len(views.pop(0))
+            if views:
+                views[0] = views[0][count:]
+
     def write_array(self, name: str, array: TNDArrayAny) -> None:
         fp = os.path.join(self._archive, name)
+        if self._codec is None and HAS_WRITEV:
+            buffers = NPYConverter.to_buffers(array)
+            if buffers is not None:
+                # NOTE: header and array bytes are written in one system call without copying the array
+                fd = os.open(fp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    self._write_buffers(fd, buffers)
+                finally:
+                    os.close(fd)
+                return
+
         f = open(fp, 'wb') # pylint: disable=R1732
         try:
-            NPYConverter.to_npy(f, array)
+            NPYConverter.to_npy(f, array, self._codec)
         finally:
             f.close()
 
@@ -440,6 +538,7 @@ class ArchiveDirectory(Archive):
                 array, mm = NPYConverter.from_npy(f,
                         self._header_decode_cache,
                         self._memory_map,
+                        self._codec,
                         )
             finally:
                 f.close() # NOTE: can close the file after creating memory map
@@ -452,6 +551,7 @@ class ArchiveDirectory(Archive):
             array, _ = NPYConverter.from_npy(f,
                     self._header_decode_cache,
                     self._memory_map,
+                    self._codec,
                     )
         finally:
             f.close()
@@ -473,6 +573,8 @@ class ArchiveDirectory(Archive):
         return os.path.getsize(fp)
 
     def write_metadata(self, content: tp.Any) -> None:
+        if self._codec is not None:
+            content[NPYLabel.KEY_CODEC] = self._codec.NAME
         fp = os.path.join(self._archive, self.FILE_META)
         f = open(fp, 'w', encoding='utf-8') # pylint: disable=R1732
         try:
@@ -487,6 +589,8 @@ class ArchiveDirectory(Archive):
             post = json.loads(f.read())
         finally:
             f.close()
+        if NPYLabel.KEY_CODEC in post:
+            self._codec = codec_from_name(post[NPYLabel.KEY_CODEC])
         return post
 
     def size_metadata(self) -> int:
@@ -495,14 +599,14 @@ class ArchiveDirectory(Archive):
 
 
 class ArchiveZipWrapper(Archive):
-    '''Archive based on a shared (and already open/created) ZipFile.
+    '''Archive based on a shared (and already open/created) ZipFile. If given a ``ZipFileRO`` of an uncompressed ZIP, arrays can be memory mapped from the ZIP file; memory maps are closed when the arrays that use them are released. If writing to an uncompressed ZIP, array data is aligned in the ZIP file to ``NPYConverter.ARRAY_ALIGN``.
     '''
     __slots__ = ('prefix', '_delimiter')
 
-    _archive: ZipFile
+    _archive: tp.Union[ZipFile, ZipFileRO]
 
     def __init__(self,
-            zf: ZipFile,
+            zf: tp.Union[ZipFile, ZipFileRO],
             writeable: bool,
             memory_map: bool,
             delimiter: str,
@@ -514,8 +618,8 @@ class ArchiveZipWrapper(Archive):
 
         if not writeable:
             self._header_decode_cache = {}
-        if memory_map:
-            raise RuntimeError(f'Cannot memory_map with {self}')
+        if memory_map and zf.__class__ is not ZipFileRO:
+            raise RuntimeError(f'Cannot memory_map with {zf}')
         self._memory_map = memory_map
 
     def labels(self) -> tp.Iterator[str]:
@@ -526,6 +630,8 @@ class ArchiveZipWrapper(Archive):
             # split on the last observed separator
             if name.endswith(self._delimiter):
                 continue #pragma: no cover
+            if self._delimiter not in name:
+                continue # files at the root, such as a manifest, are not Frames
             dir_current, _ = name.rsplit(self._delimiter, maxsplit=1)
             if dir_current != dir_last:
                 dir_last = dir_current
@@ -544,9 +650,15 @@ class ArchiveZipWrapper(Archive):
         return True
 
     def write_array(self, name: str, array: TNDArrayAny) -> None:
-        # NOTE: force_zip64 required for large files
         name = f'{self.prefix}{self._delimiter}{name}'
-        f = self._archive.open(name, 'w', force_zip64=True)
+        zf: ZipFile = self._archive # type: ignore
+        if zf.compression == ZIP_STORED:
+            # NOTE: as the NPY header is padded to ARRAY_ALIGN, aligning the start of the file aligns the array, permitting aligned memory-mapped reads
+            zinfo = zip_info_aligned(zf, name, NPYConverter.ARRAY_ALIGN)
+            f = zf.open(zinfo, 'w', force_zip64=True)
+        else:
+            # NOTE: force_zip64 required for large files
+            f = zf.open(name, 'w', force_zip64=True)
         try:
             NPYConverter.to_npy(f, array)
         finally:
@@ -556,7 +668,11 @@ class ArchiveZipWrapper(Archive):
         name = f'{self.prefix}{self._delimiter}{name}'
         f = self._archive.open(name)
         try:
-            array, _ = NPYConverter.from_npy(f, self._header_decode_cache)
+            # NOTE: if memory mapping, the mmap is retained by the array and is closed when the array is released
+            array, _ = NPYConverter.from_npy(f,
+                    self._header_decode_cache,
+                    self._memory_map,
+                    )
         finally:
             f.close()
         array.flags.writeable = False
@@ -592,6 +708,180 @@ class ArchiveZipWrapper(Archive):
         return self._archive.getinfo(name).file_size
 
 
+class FrameSharedMemory(tp.NamedTuple):
+    '''
+    The picklable description of a :obj:`Frame` whose arrays are stored in a shared memory segment. Used for transferring a :obj:`Frame` from a worker process.
+    '''
+    segment: str # shared memory name
+    contents: tp.Dict[str, tp.Tuple[int, str, tp.Tuple[int, ...], bool]] # array name to offset, dtype, shape, fortran_order
+    metadata: tp.Dict[str, tp.Any]
+    constructor: tp.Type['Frame']
+
+
+class SharedMemorySegment:
+    '''
+    An attached shared memory segment. As the name of the segment is unlinked on attachment, the memory is released only when this object, and all arrays created from it, are released.
+    '''
+    __slots__ = (
+            '_shm',
+            '_view',
+            'address',
+            )
+
+    def __init__(self, name: str) -> None:
+        # NOTE: this import is conditional as this module is not supported in pyodide
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(name=name)
+        # NOTE: unlinking after attaching removes the name (and resource tracking) while this process retains the mapping
+        shm.unlink()
+        self._shm = shm
+        self._view: tp.Optional[TNDArrayAny] = np.frombuffer(shm.buf, dtype=np.uint8)
+        self.address: int = self._view.__array_interface__['data'][0]
+
+    def __del__(self) -> None:
+        # the exported buffer must be released before the segment can be closed
+        self._view = None
+        if hasattr(self, '_shm'): # not set if attaching failed
+            self._shm.close()
+
+
+class SharedMemoryArray:
+    '''
+    A region of a :obj:`SharedMemorySegment` exposed with the array interface. Arrays created from this object, and all views of those arrays, retain this object as their base, and thus retain the segment.
+    '''
+    __slots__ = (
+            '_segment',
+            '__array_interface__',
+            )
+
+    def __init__(self,
+            segment: SharedMemorySegment,
+            offset: int,
+            dtype: str,
+            shape: tp.Tuple[int, ...],
+            ) -> None:
+        self._segment = segment
+        self.__array_interface__ = dict(
+                version=3,
+                shape=shape,
+                typestr=dtype,
+                data=(segment.address + offset, True), # read-only
+                )
+
+
+class ArchiveSharedMemory(Archive):
+    '''Archive of arrays stored in one shared memory segment, permitting a :obj:`Frame` to be transferred between processes without pickling its arrays. When writing, arrays are collected and only copied into a new segment when the metadata is written, as metadata is always written last. When reading, arrays are immutable views of the segment.
+    '''
+    __slots__ = (
+            '_arrays',
+            '_metadata',
+            '_segment',
+            '_segment_name',
+            )
+
+    _archive: tp.Dict[str, tp.Tuple[int, str, tp.Tuple[int, ...], bool]]
+    # the segment attached when reading
+    _segment: tp.Optional[SharedMemorySegment]
+    # the name of the segment created when writing
+    _segment_name: str
+
+    def __init__(self,
+            fp: tp.Optional[FrameSharedMemory],
+            writeable: bool,
+            memory_map: bool,
+            ):
+        self._memory_map = memory_map
+        if writeable:
+            self._archive = {}
+            self._arrays: tp.List[tp.Tuple[str, TNDArrayAny]] = []
+            self._metadata: tp.Any = None
+            self._segment = None
+            self._segment_name = ''
+        else:
+            assert fp is not None
+            self._archive = fp.contents
+            self._metadata = fp.metadata
+            self._segment = SharedMemorySegment(fp.segment)
+            self._segment_name = fp.segment
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._archive
+
+    def labels(self) -> tp.Iterator[str]:
+        yield from self._archive
+
+    def write_array(self, name: str, array: TNDArrayAny) -> None:
+        dtype = array.dtype
+        if dtype.kind == DTYPE_OBJECT_KIND:
+            raise ErrorNPYEncode('No support for object dtypes.')
+        if dtype.names is not None:
+            raise ErrorNPYEncode('No support for structured arrays')
+        if array.ndim == 0 or array.ndim > 2:
+            raise ErrorNPYEncode('No support for ndim other than 1 and 2.')
+        self._arrays.append((name, array))
+
+    def read_array(self, name: str) -> TNDArrayAny:
+        offset, dtype, shape, fortran_order = self._archive[name]
+        assert self._segment is not None
+        array = np.asarray(SharedMemoryArray(
+                self._segment,
+                offset,
+                dtype,
+                shape,
+                ))
+        if fortran_order:
+            return array.T
+        return array
+
+    def size_array(self, name: str) -> int:
+        _, dtype, shape, _ = self._archive[name]
+        return int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+    def write_metadata(self, content: tp.Any) -> None:
+        from multiprocessing import resource_tracker
+        from multiprocessing.shared_memory import SharedMemory
+
+        self._metadata = content
+        align = NPYConverter.ARRAY_ALIGN
+        offset = 0
+        offsets = []
+        for _, array in self._arrays:
+            offsets.append(offset)
+            offset += -(-array.nbytes // align) * align
+
+        shm = SharedMemory(create=True, size=max(offset, 1))
+        try:
+            for (name, array), offset in zip(self._arrays, offsets):
+                flags = array.flags
+                fortran_order = flags.f_contiguous and not flags.c_contiguous
+                if fortran_order:
+                    array = array.T # C contiguous
+                dst: TNDArrayAny = np.ndarray(array.shape,
+                        dtype=array.dtype,
+                        buffer=shm.buf,
+                        offset=offset,
+                        )
+                dst[...] = array
+                del dst # release the exported buffer
+                self._archive[name] = (offset, array.dtype.str, array.shape, fortran_order)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        self._arrays.clear()
+        self._segment_name = shm.name
+        # NOTE: do not unlink, as the reading process will attach and unlink; as the resource tracker of this process might unlink the segment when this process exits, stop tracking it here
+        resource_tracker.unregister(shm._name, 'shared_memory') # type: ignore
+        shm.close()
+
+    def read_metadata(self) -> tp.Any:
+        return self._metadata
+
+    def size_metadata(self) -> int:
+        return 0
+
+
 #-------------------------------------------------------------------------------
 
 class ArchiveIndexConverter:
@@ -605,13 +895,17 @@ class ArchiveIndexConverter:
             archive: Archive,
             index: 'IndexBase',
             key_template_values: str,
+            key_template_labels: str,
+            key_indexers: str,
             key_types: str,
             depth: int,
             include: bool,
+            components: bool = False,
             ) -> None:
         '''
         Args:
             metadata: mutates in place with json components for class names of index types.
+            components: if True, also store the labels per depth and the indexers of an IndexHierarchy.
         '''
         if depth == 1 and index._map is None: # type: ignore
             pass # do not store anything
@@ -622,6 +916,14 @@ class ArchiveIndexConverter:
                 for i in range(depth):
                     archive.write_array(key_template_values.format(i), index.values_at_depth(i))
                 metadata[key_types] = [cls.__name__ for cls in index.index_types.values] # type: ignore
+                if not components:
+                    return
+                # NOTE: storing the unique labels per depth and the indexers permits creating an IndexHierarchy without factorizing values
+                if index._recache:
+                    index._update_array_cache()
+                for i, labels in enumerate(index._indices): # type: ignore
+                    archive.write_array(key_template_labels.format(i), labels.values)
+                archive.write_array(key_indexers, index._indexers) # type: ignore
 
     @staticmethod
     def array_encode(
@@ -643,33 +945,61 @@ class ArchiveIndexConverter:
             archive: Archive,
             metadata: tp.Dict[str, tp.Any],
             key_template_values: str,
+            key_template_labels: str,
+            key_indexers: str,
             key_types: str, # which key to fetch IH component types
             depth: int,
             cls_index: tp.Type['IndexBase'],
             name: TName,
             ) -> tp.Optional['IndexBase']:
-        '''Build index or columns.
+        '''Build index or columns. If the labels per depth and indexers of an IndexHierarchy were stored, the IndexHierarchy is created from them without factorizing values, and its map from labels to positions is built on first use.
         '''
         from static_frame.core.type_blocks import TypeBlocks
 
         if key_template_values.format(0) not in archive:
-            index = None
-        elif depth == 1:
-            index = cls_index(archive.read_array(key_template_values.format(0)),
-                    name=name,
-                    )
-        else:
-            index_tb = TypeBlocks.from_blocks(
-                    archive.read_array(key_template_values.format(i))
-                    for i in range(depth)
-                    )
-            index_constructors = [ContainerMap.str_to_cls(name)
+            return None
+
+        arrays = [archive.read_array(key_template_values.format(i)) for i in range(depth)]
+        if depth > 1 and key_indexers in archive:
+            index_constructors = [tp.cast(tp.Type[Index[tp.Any]], ContainerMap.str_to_cls(name))
                     for name in metadata[key_types]]
-            index = cls_index._from_type_blocks(index_tb, # type: ignore
+            return tp.cast(tp.Type['IndexHierarchy'], cls_index)._from_indices_and_indexers(
+                    indices=[ctor(archive.read_array(key_template_labels.format(i)))
+                            for i, ctor in enumerate(index_constructors)],
+                    indexers=archive.read_array(key_indexers),
+                    blocks=TypeBlocks.from_blocks(arrays),
                     name=name,
-                    index_constructors=index_constructors,
                     )
-        return index
+        return ArchiveIndexConverter.index_from_arrays(
+                arrays=arrays,
+                metadata=metadata,
+                key_types=key_types,
+                cls_index=cls_index,
+                name=name,
+                )
+
+    @staticmethod
+    def index_from_arrays(*,
+            arrays: tp.Sequence[TNDArrayAny],
+            metadata: tp.Dict[str, tp.Any],
+            key_types: str, # which key to fetch IH component types
+            cls_index: tp.Type['IndexBase'],
+            name: TName,
+            ) -> 'IndexBase':
+        '''Build index or columns from one array per depth.
+        '''
+        from static_frame.core.type_blocks import TypeBlocks
+
+        if len(arrays) == 1:
+            return cls_index(arrays[0], name=name)
+
+        index_tb = TypeBlocks.from_blocks(arrays)
+        index_constructors = [ContainerMap.str_to_cls(name)
+                for name in metadata[key_types]]
+        return cls_index._from_type_blocks(index_tb, # type: ignore
+                name=name,
+                index_constructors=index_constructors,
+                )
 
 
 class ArchiveFrameConverter:
@@ -682,7 +1012,16 @@ class ArchiveFrameConverter:
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
+            compact_strings: bool = False,
+            index_components: bool = False,
             ) -> None:
+        '''
+        Args:
+            dictionary_encode: If True, store each string block that is smaller when dictionary encoded as an array of integer codes and an array of unique values.
+            compact_strings: If True, store each unicode block that is smaller without padding as an array of the code points of all strings and an array of string lengths.
+            index_components: If True, store the labels per depth and the indexers of IndexHierarchy index and columns.
+        '''
         metadata: tp.Dict[str, tp.Any] = {}
 
         # NOTE: isolate custom pre-json encoding only where needed: on `name` attributes; the name might be nested tuples, so we cannot assume that name is just a string
@@ -712,23 +1051,49 @@ class ArchiveFrameConverter:
                 archive=archive,
                 index=frame._index,
                 key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_INDEX,
+                key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_INDEX,
+                key_indexers=NPYLabel.FILE_INDEXERS_INDEX,
                 key_types=NPYLabel.KEY_TYPES_INDEX,
                 depth=depth_index,
                 include=include_index,
+                components=index_components,
                 )
         ArchiveIndexConverter.index_encode(
                 metadata=metadata,
                 archive=archive,
                 index=frame._columns,
                 key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_COLUMNS,
+                key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS,
+                key_indexers=NPYLabel.FILE_INDEXERS_COLUMNS,
                 key_types=NPYLabel.KEY_TYPES_COLUMNS,
                 depth=depth_columns,
                 include=include_columns,
+                components=index_components,
                 )
         i = 0
+        blocks_encoded = []
+        blocks_compact = []
         for i, array in enumerate(block_iter, 1):
+            if dictionary_encode and array.dtype.kind in DTYPE_STR_KINDS:
+                values, codes = array_dictionary_encode(array)
+                if values.nbytes + codes.nbytes < array.nbytes:
+                    archive.write_array(NPYLabel.FILE_TEMPLATE_BLOCKS_VALUES.format(i-1), values)
+                    blocks_encoded.append(i-1)
+                    array = codes
+            # NOTE: a dictionary encoded block is now an integer array and is not compacted
+            if compact_strings and array.dtype.kind == DTYPE_UNICODE_KIND:
+                buffer, lengths = array_str_compact(array)
+                if buffer.nbytes + lengths.nbytes < array.nbytes:
+                    archive.write_array(NPYLabel.FILE_TEMPLATE_BLOCKS_BUFFER.format(i-1), buffer)
+                    blocks_compact.append([i-1, array.dtype.str])
+                    array = lengths
             archive.write_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i-1), array)
 
+        if blocks_encoded:
+            metadata[NPYLabel.KEY_BLOCKS_ENCODED] = blocks_encoded
+        if blocks_compact:
+            metadata[NPYLabel.KEY_BLOCKS_COMPACT] = blocks_compact
+
         metadata[NPYLabel.KEY_DEPTHS] = [
                 i, # block count
                 depth_index,
@@ -745,13 +1110,18 @@ class ArchiveFrameConverter:
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
+            compact_strings: bool = False,
+            index_components: bool = False,
+            codec: tp.Optional[str] = None,
             ) -> None:
         '''
         Write a :obj:`Frame` as an npz file.
         '''
-        archive = cls._ARCHIVE_CLS(fp,
+        archive = cls._ARCHIVE_CLS(fp, # type: ignore[call-arg]
                 writeable=True,
                 memory_map=False,
+                codec=codec,
                 )
         try:
             cls.frame_encode(
@@ -760,6 +1130,9 @@ class ArchiveFrameConverter:
                     include_index=include_index,
                     include_columns=include_columns,
                     consolidate_blocks=consolidate_blocks,
+                    dictionary_encode=dictionary_encode,
+                    compact_strings=compact_strings,
+                    index_components=index_components,
                     )
         except ErrorNPYEncode:
             archive.close()
@@ -770,14 +1143,117 @@ class ArchiveFrameConverter:
             raise
 
 
+    @staticmethod
+    def _block_decode(
+            archive: Archive,
+            index: int,
+            blocks_encoded: tp.Container[int],
+            blocks_compact: tp.Mapping[int, TDtypeAny],
+            ) -> TNDArrayAny:
+        '''
+        Read the block at ``index``, decoding it from codes and unique values if it was dictionary encoded, or from code points and lengths if it was compacted.
+        '''
+        array = archive.read_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(index))
+        if index in blocks_encoded:
+            values = archive.read_array(NPYLabel.FILE_TEMPLATE_BLOCKS_VALUES.format(index))
+            array = values[array]
+            array.flags.writeable = False
+        elif index in blocks_compact:
+            buffer = archive.read_array(NPYLabel.FILE_TEMPLATE_BLOCKS_BUFFER.format(index))
+            array = array_str_expand(buffer, array, blocks_compact[index])
+        return array
+
+    @classmethod
+    def _blocks_decode_select(cls,
+            *,
+            archive: Archive,
+            block_count: int,
+            blocks_encoded: tp.Container[int],
+            blocks_compact: tp.Mapping[int, TDtypeAny],
+            columns: tp.Optional[IndexBase],
+            columns_select: tp.Iterable[TLabel],
+            cls_columns: tp.Type[IndexBase],
+            ) -> tp.Tuple[TypeBlocks, IndexBase]:
+        '''
+        Read only the blocks that contain the columns selected by ``columns_select``, using array headers to determine block widths. Returns the selected TypeBlocks and columns; if columns were not stored, columns are created with ``cls_columns`` from the selected positions.
+        '''
+        from static_frame.core.type_blocks import TypeBlocks
+
+        names = [NPYLabel.FILE_TEMPLATE_BLOCKS.format(i) for i in range(block_count)]
+        shapes = [archive.read_array_header(name)[2] for name in names]
+
+        block_indices, block_positions, columns = cls._blocks_select_plan(
+                widths=[1 if len(shape) == 1 else shape[1] for shape in shapes],
+                columns=columns,
+                columns_select=columns_select,
+                cls_columns=cls_columns,
+                )
+        if block_indices:
+            tb = TypeBlocks.from_blocks(
+                    cls._block_decode(archive, index, blocks_encoded, blocks_compact)
+                    for index in block_indices
+                    )
+            if block_positions is not None:
+                tb = tb._extract(column_key=block_positions)
+        else:
+            rows = shapes[0][0] if shapes else 0
+            tb = TypeBlocks.from_zero_size_shape((rows, 0))
+        return tb, columns
+
+    @staticmethod
+    def _blocks_select_plan(
+            *,
+            widths: tp.Sequence[int],
+            columns: tp.Optional[IndexBase],
+            columns_select: tp.Iterable[TLabel],
+            cls_columns: tp.Type[IndexBase],
+            ) -> tp.Tuple[tp.List[int], tp.Optional[tp.List[int]], IndexBase]:
+        '''
+        Given the width of each stored block, determine the blocks to read for the columns selected by ``columns_select``. Returns the indices of the blocks to read; the positions to extract from the read blocks, or None if all columns of the read blocks are selected; and the selected columns. If columns were not stored, columns are created with ``cls_columns`` from the selected positions.
+        '''
+        if columns is not None:
+            if not isinstance(columns_select, (list, tuple, np.ndarray)):
+                columns_select = list(columns_select)
+            positions = PositionsAllocator.get(len(columns))[columns.isin(columns_select)]
+        else:
+            selected = set(columns_select)
+            positions = np.array([i for i in range(sum(widths)) if i in selected], dtype=DTYPE_INT_DEFAULT)
+
+        block_indices = []
+        block_positions: tp.List[int] = []
+        start = 0 # position of the first column of the current block
+        offset = 0 # position of the first column of the current block among read blocks
+        for index, width in enumerate(widths):
+            end = start + width
+            selected_block = positions[(positions >= start) & (positions < end)]
+            if len(selected_block):
+                block_indices.append(index)
+                block_positions.extend(selected_block - start + offset)
+                offset += width
+            start = end
+
+        if columns is not None:
+            columns = columns._extract_iloc(positions)
+        else:
+            columns = cls_columns(positions)
+        # if not all columns of read blocks are selected, return positions to extract
+        return (block_indices,
+                block_positions if offset != len(block_positions) else None,
+                columns,
+                )
+
     @classmethod
     def frame_decode(cls,
             *,
             archive: Archive,
             constructor: tp.Type[TFrameAny],
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
             ) -> TFrameAny:
         '''
         Create a :obj:`Frame` from an npz file.
+
+        Args:
+            columns_select: An optional iterable of column labels to retain, in the order stored; only the blocks containing those columns are read. If columns were not stored, labels are integer positions.
         '''
         from static_frame.core.type_blocks import TypeBlocks
 
@@ -791,6 +1267,9 @@ class ArchiveFrameConverter:
         name_columns = JSONTranslator.decode_element(names[2])
 
         block_count, depth_index, depth_columns = metadata[NPYLabel.KEY_DEPTHS]
+        blocks_encoded = frozenset(metadata.get(NPYLabel.KEY_BLOCKS_ENCODED, ()))
+        blocks_compact = {i: np.dtype(dtype_str)
+                for i, dtype_str in metadata.get(NPYLabel.KEY_BLOCKS_COMPACT, ())}
 
         cls_index: tp.Type[IndexBase]
         cls_columns: tp.Type[IndexBase]
@@ -801,6 +1280,8 @@ class ArchiveFrameConverter:
                 archive=archive,
                 metadata=metadata,
                 key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_INDEX,
+                key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_INDEX,
+                key_indexers=NPYLabel.FILE_INDEXERS_INDEX,
                 key_types=NPYLabel.KEY_TYPES_INDEX,
                 depth=depth_index,
                 cls_index=cls_index,
@@ -818,15 +1299,27 @@ class ArchiveFrameConverter:
                 archive=archive,
                 metadata=metadata,
                 key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_COLUMNS,
+                key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS,
+                key_indexers=NPYLabel.FILE_INDEXERS_COLUMNS,
                 key_types=NPYLabel.KEY_TYPES_COLUMNS,
                 depth=depth_columns,
                 cls_index=cls_columns,
                 name=name_columns,
                 )
 
-        if block_count:
+        if columns_select is not None:
+            tb, columns = cls._blocks_decode_select(
+                    archive=archive,
+                    block_count=block_count,
+                    blocks_encoded=blocks_encoded,
+                    blocks_compact=blocks_compact,
+                    columns=columns,
+                    columns_select=columns_select,
+                    cls_columns=constructor._COLUMNS_CONSTRUCTOR,
+                    )
+        elif block_count:
             tb = TypeBlocks.from_blocks(
-                    archive.read_array(NPYLabel.FILE_TEMPLATE_BLOCKS.format(i))
+                    cls._block_decode(archive, i, blocks_encoded, blocks_compact)
                     for i in range(block_count)
                     )
         else:
@@ -847,6 +1340,7 @@ class ArchiveFrameConverter:
             *,
             constructor: tp.Type[TFrameAny],
             fp: TPathSpecifierOrIO,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
             ) -> TFrameAny:
         '''
         Create a :obj:`Frame` from an npz file.
@@ -858,6 +1352,7 @@ class ArchiveFrameConverter:
         f = cls.frame_decode(
                 archive=archive,
                 constructor=constructor,
+                columns_select=columns_select,
                 )
         return f
 
@@ -866,6 +1361,7 @@ class ArchiveFrameConverter:
             *,
             constructor: tp.Type[TFrameAny],
             fp: TPathSpecifier,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
             ) -> tp.Tuple[TFrameAny, tp.Callable[[], None]]:
         '''
         Create a :obj:`Frame` from an npz file.
@@ -877,6 +1373,7 @@ class ArchiveFrameConverter:
         f = cls.frame_decode(
                 archive=archive,
                 constructor=constructor,
+                columns_select=columns_select,
                 )
         return f, archive.close
 
@@ -887,6 +1384,569 @@ class NPZFrameConverter(ArchiveFrameConverter):
 class NPYFrameConverter(ArchiveFrameConverter):
     _ARCHIVE_CLS = ArchiveDirectory
 
+#-------------------------------------------------------------------------------
+# for partitioned archives of row chunks
+
+class ArchiveFrameChunkedConverter:
+    '''
+    Methods to write and read a partitioned archive, where the index arrays and blocks of one or more :obj:`Frame` are stored in chunks of rows. The metadata stores the row count of each chunk and the dtype and width of each block, permitting chunks to be appended to an archive and ranges of rows to be read without reading other chunks.
+    '''
+    _ARCHIVE_CLS: tp.Type[Archive]
+
+    CHUNK_SIZE = 65_536
+
+    @staticmethod
+    def _dtype_aligned(dtype: TDtypeAny, dtype_archive: TDtypeAny) -> bool:
+        # NOTE: string dtypes of different widths are aligned; they are resolved when chunks are read
+        if dtype.kind in DTYPE_STR_KINDS:
+            return dtype.kind == dtype_archive.kind
+        return dtype == dtype_archive
+
+    @classmethod
+    def _frame_to_arrays(cls,
+            *,
+            frame: TFrameAny,
+            columns: tp.Optional[IndexBase],
+            layout: tp.Sequence[tp.Tuple[TDtypeAny, tp.Optional[int]]],
+            depth_index: int,
+            include_index: bool,
+            ) -> tp.Tuple[int, tp.List[TNDArrayAny]]:
+        '''
+        Return the row count and the arrays to be stored for ``frame``: the index arrays, if included, followed by blocks of the dtypes and widths of ``layout``, where a width of None denotes a 1D block.
+        '''
+        tb = frame._blocks
+        width = sum(1 if w is None else w for _, w in layout)
+        if tb.shape[1] != width:
+            raise ErrorNPYEncode(f'Frame has {tb.shape[1]} columns, not the {width} columns of the archive.')
+        if columns is not None and not columns.equals(frame._columns):
+            raise ErrorNPYEncode('Frame columns are not aligned with the columns of the archive.')
+
+        arrays: tp.List[TNDArrayAny] = []
+        if include_index:
+            if frame._index.depth != depth_index:
+                raise ErrorNPYEncode(f'Frame index has depth {frame._index.depth}, not the depth {depth_index} of the archive.')
+            if depth_index == 1:
+                arrays.append(frame._index.values)
+            else:
+                arrays.extend(frame._index.values_at_depth(d) for d in range(depth_index))
+
+        if len(tb._blocks) == len(layout) and all(
+                cls._dtype_aligned(b.dtype, dtype) and (
+                b.ndim == 1 if w is None else (b.ndim == 2 and b.shape[1] == w))
+                for b, (dtype, w) in zip(tb._blocks, layout)
+                ):
+            arrays.extend(tb._blocks) # no copies required
+        else:
+            start = 0
+            for dtype, w in layout:
+                if w is None:
+                    array = tb._extract_array_column(start)
+                    start += 1
+                else:
+                    array = tb._extract_array(column_key=slice(start, start + w))
+                    start += w
+                if not cls._dtype_aligned(array.dtype, dtype):
+                    raise ErrorNPYEncode(f'Frame columns of dtype {array.dtype} are not aligned with the dtype {dtype} of the archive.')
+                arrays.append(array)
+        return tb.shape[0], arrays
+
+    @staticmethod
+    def _arrays_to_chunks(
+            parts: tp.Iterable[tp.Tuple[int, tp.List[TNDArrayAny]]],
+            chunk_size: int,
+            ) -> tp.Iterator[tp.Tuple[int, tp.List[TNDArrayAny]]]:
+        '''
+        Given an iterable of row counts and arrays of those rows, yield row counts and arrays of ``chunk_size`` rows; the last chunk may have fewer rows. Only one part and one chunk are held in memory at a time.
+        '''
+        pending: tp.List[tp.List[TNDArrayAny]] = []
+        pending_rows = 0
+        for rows, arrays in parts:
+            start = 0
+            while start < rows:
+                count = min(chunk_size - pending_rows, rows - start)
+                pending.append([a[start: start + count] for a in arrays])
+                pending_rows += count
+                start += count
+                if pending_rows == chunk_size:
+                    yield pending_rows, [a[0] if len(a) == 1 else concat_resolved(a)
+                            for a in zip(*pending)]
+                    pending = []
+                    pending_rows = 0
+        if pending_rows:
+            yield pending_rows, [a[0] if len(a) == 1 else concat_resolved(a)
+                    for a in zip(*pending)]
+
+    @classmethod
+    def _frames_write(cls,
+            *,
+            archive: Archive,
+            metadata: tp.Dict[str, tp.Any],
+            frames: tp.Iterable[TFrameAny],
+            columns: tp.Optional[IndexBase],
+            ) -> None:
+        '''
+        Write the rows of ``frames`` as new chunks, then write ``metadata`` updated with the row counts of the new chunks. As metadata is written last, an interrupted write does not alter the rows of the archive.
+        '''
+        chunks = metadata[NPYLabel.KEY_CHUNKS]
+        depth_index = metadata[NPYLabel.KEY_DEPTHS][1]
+        include_index = chunks['index']
+        layout = [(np.dtype(dtype_str), w) for dtype_str, w in chunks['blocks']]
+
+        parts = (cls._frame_to_arrays(
+                frame=f,
+                columns=columns,
+                layout=layout,
+                depth_index=depth_index,
+                include_index=include_index,
+                ) for f in frames)
+
+        rows_chunks: tp.List[int] = chunks['rows']
+        depth_stored = depth_index if include_index else 0
+        for rows, arrays in cls._arrays_to_chunks(parts, chunks['size']):
+            chunk = len(rows_chunks)
+            for d, array in enumerate(arrays[:depth_stored]):
+                archive.write_array(NPYLabel.FILE_TEMPLATE_VALUES_INDEX_CHUNK.format(d, chunk), array)
+            for i, array in enumerate(arrays[depth_stored:]):
+                archive.write_array(NPYLabel.FILE_TEMPLATE_BLOCKS_CHUNK.format(i, chunk), array)
+            rows_chunks.append(rows)
+
+        archive.write_metadata(metadata)
+
+    @classmethod
+    def frames_encode(cls,
+            *,
+            archive: Archive,
+            frames: tp.Iterable[TFrameAny],
+            chunk_size: int = CHUNK_SIZE,
+            include_index: bool = True,
+            include_columns: bool = True,
+            consolidate_blocks: bool = False,
+            ) -> None:
+        '''
+        Write ``frames`` to a new archive. All :obj:`Frame` must have the columns and column dtypes of the first :obj:`Frame`, which also determines the names and index types of the archive.
+        '''
+        if chunk_size < 1:
+            raise ErrorNPYEncode('chunk_size must be greater than zero.')
+
+        frames = iter(frames)
+        frame = next(frames, None)
+        if frame is None:
+            raise ErrorNPYEncode('At least one Frame is required.')
+
+        metadata: tp.Dict[str, tp.Any] = {}
+        metadata[NPYLabel.KEY_NAMES] = [
+                JSONTranslator.encode_element(frame._name),
+                JSONTranslator.encode_element(frame._index._name),
+                JSONTranslator.encode_element(frame._columns._name),
+                ]
+        metadata[NPYLabel.KEY_TYPES] = [
+                frame._index.__class__.__name__,
+                frame._columns.__class__.__name__,
+                ]
+        depth_index = frame._index.depth
+        depth_columns = frame._columns.depth
+
+        # as with frame_encode, an auto-incremented index is not stored
+        include_index = include_index and not (
+                depth_index == 1 and frame._index._map is None) # type: ignore
+        if include_index and depth_index > 1:
+            metadata[NPYLabel.KEY_TYPES_INDEX] = [
+                    t.__name__ for t in frame._index.index_types.values]
+
+        ArchiveIndexConverter.index_encode(
+                metadata=metadata,
+                archive=archive,
+                index=frame._columns,
+                key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_COLUMNS,
+                key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS,
+                key_indexers=NPYLabel.FILE_INDEXERS_COLUMNS,
+                key_types=NPYLabel.KEY_TYPES_COLUMNS,
+                depth=depth_columns,
+                include=include_columns,
+                )
+
+        if consolidate_blocks:
+            layout = [[dtype.str, w] for dtype, w in frame._blocks._reblock_signature()]
+        else:
+            layout = [[b.dtype.str, None if b.ndim == 1 else b.shape[1]]
+                    for b in frame._blocks._blocks]
+
+        metadata[NPYLabel.KEY_DEPTHS] = [
+                len(layout), # block count
+                depth_index,
+                depth_columns]
+        metadata[NPYLabel.KEY_CHUNKS] = {
+                'size': chunk_size,
+                'rows': [],
+                'blocks': layout,
+                'index': include_index,
+                }
+
+        def gen() -> tp.Iterator[TFrameAny]:
+            yield frame
+            yield from frames
+
+        cls._frames_write(
+                archive=archive,
+                metadata=metadata,
+                frames=gen(),
+                columns=frame._columns if include_columns else None,
+                )
+
+    @classmethod
+    def frames_append(cls,
+            *,
+            archive: Archive,
+            frames: tp.Iterable[TFrameAny],
+            ) -> None:
+        '''
+        Append the rows of ``frames`` to an existing archive as new chunks. All :obj:`Frame` must have the columns and column dtypes of the archive.
+        '''
+        metadata = archive.read_metadata()
+        if NPYLabel.KEY_CHUNKS not in metadata:
+            raise ErrorNPYEncode('Archive is not chunked.')
+
+        cls_columns = ContainerMap.str_to_cls(metadata[NPYLabel.KEY_TYPES][1])
+        columns = ArchiveIndexConverter.index_decode(
+                archive=archive,
+                metadata=metadata,
+                key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_COLUMNS,
+                key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS,
+                key_indexers=NPYLabel.FILE_INDEXERS_COLUMNS,
+                key_types=NPYLabel.KEY_TYPES_COLUMNS,
+                depth=metadata[NPYLabel.KEY_DEPTHS][2],
+                cls_index=cls_columns, # type: ignore
+                name=None,
+                )
+        cls._frames_write(
+                archive=archive,
+                metadata=metadata,
+                frames=frames,
+                columns=columns,
+                )
+
+    @classmethod
+    def to_archive(cls,
+            *,
+            frames: tp.Iterable[TFrameAny],
+            fp: TPathSpecifier,
+            chunk_size: int = CHUNK_SIZE,
+            include_index: bool = True,
+            include_columns: bool = True,
+            consolidate_blocks: bool = False,
+            codec: tp.Optional[str] = None,
+            ) -> None:
+        '''
+        Write one or more :obj:`Frame` as a new chunked archive.
+        '''
+        archive = cls._ARCHIVE_CLS(fp, # type: ignore[call-arg]
+                writeable=True,
+                memory_map=False,
+                codec=codec,
+                )
+        try:
+            cls.frames_encode(
+                    archive=archive,
+                    frames=frames,
+                    chunk_size=chunk_size,
+                    include_index=include_index,
+                    include_columns=include_columns,
+                    consolidate_blocks=consolidate_blocks,
+                    )
+        except ErrorNPYEncode:
+            archive.close()
+            archive.__del__() # force cleanup
+            if os.path.exists(fp):
+                cls._ARCHIVE_CLS.FUNC_REMOVE_FP(fp)
+            raise
+
+    @classmethod
+    def append_archive(cls,
+            *,
+            frames: tp.Iterable[TFrameAny],
+            fp: TPathSpecifier,
+            ) -> None:
+        '''
+        Append one or more :obj:`Frame` to an existing chunked archive.
+        '''
+        # NOTE: the archive is opened for reading to validate its existence and to set the codec from the metadata; new chunks are then written beside existing chunks
+        archive = cls._ARCHIVE_CLS(fp,
+                writeable=False,
+                memory_map=False,
+                )
+        cls.frames_append(archive=archive, frames=frames)
+
+    @classmethod
+    def frame_decode(cls,
+            *,
+            archive: Archive,
+            constructor: tp.Type[TFrameAny],
+            start: int = 0,
+            stop: tp.Optional[int] = None,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            ) -> TFrameAny:
+        '''
+        Create a :obj:`Frame` from the rows ``start`` to ``stop`` of a chunked archive; only the chunks that contain those rows are read.
+        '''
+        from static_frame.core.type_blocks import TypeBlocks
+
+        metadata = archive.read_metadata()
+        if NPYLabel.KEY_CHUNKS not in metadata:
+            raise ErrorNPYDecode('Archive is not chunked.')
+
+        names = metadata[NPYLabel.KEY_NAMES]
+        name = JSONTranslator.decode_element(names[0])
+        name_index = JSONTranslator.decode_element(names[1])
+        name_columns = JSONTranslator.decode_element(names[2])
+
+        _, depth_index, depth_columns = metadata[NPYLabel.KEY_DEPTHS]
+        chunks = metadata[NPYLabel.KEY_CHUNKS]
+        include_index = chunks['index']
+        layout = [(np.dtype(dtype_str), w) for dtype_str, w in chunks['blocks']]
+
+        cls_index: tp.Type[IndexBase]
+        cls_columns: tp.Type[IndexBase]
+        cls_index, cls_columns = (ContainerMap.str_to_cls(name) # type: ignore
+                for name in metadata[NPYLabel.KEY_TYPES])
+
+        if constructor.STATIC != cls_columns.STATIC:
+            if constructor.STATIC:
+                cls_columns = cls_columns._IMMUTABLE_CONSTRUCTOR #type: ignore
+            else:
+                cls_columns = cls_columns._MUTABLE_CONSTRUCTOR #type: ignore
+
+        columns = ArchiveIndexConverter.index_decode(
+                archive=archive,
+                metadata=metadata,
+                key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_COLUMNS,
+                key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS,
+                key_indexers=NPYLabel.FILE_INDEXERS_COLUMNS,
+                key_types=NPYLabel.KEY_TYPES_COLUMNS,
+                depth=depth_columns,
+                cls_index=cls_columns,
+                name=name_columns,
+                )
+
+        if columns_select is not None:
+            block_indices, block_positions, columns = ArchiveFrameConverter._blocks_select_plan(
+                    widths=[1 if w is None else w for _, w in layout],
+                    columns=columns,
+                    columns_select=columns_select,
+                    cls_columns=constructor._COLUMNS_CONSTRUCTOR,
+                    )
+        else:
+            block_indices = list(range(len(layout)))
+            block_positions = None
+
+        rows_chunks: tp.List[int] = chunks['rows']
+        row_start, row_stop, _ = slice(start, stop).indices(sum(rows_chunks))
+        row_stop = max(row_start, row_stop)
+
+        depth_stored = depth_index if include_index else 0
+        parts_index: tp.List[tp.List[TNDArrayAny]] = [[] for _ in range(depth_stored)]
+        parts_blocks: tp.List[tp.List[TNDArrayAny]] = [[] for _ in block_indices]
+
+        def read(name: str, sl: slice, partial: bool) -> TNDArrayAny:
+            array = archive.read_array(name)
+            if partial: # copy to not retain the full chunk
+                array = array[sl].copy()
+                array.flags.writeable = False
+            return array
+
+        chunk_start = 0
+        for chunk, rows in enumerate(rows_chunks):
+            chunk_end = chunk_start + rows
+            if chunk_end > row_start and chunk_start < row_stop:
+                sl = slice(max(row_start, chunk_start) - chunk_start,
+                        min(row_stop, chunk_end) - chunk_start)
+                partial = sl.stop - sl.start != rows
+                for d in range(depth_stored):
+                    parts_index[d].append(read(
+                            NPYLabel.FILE_TEMPLATE_VALUES_INDEX_CHUNK.format(d, chunk),
+                            sl,
+                            partial,
+                            ))
+                for parts, i in zip(parts_blocks, block_indices):
+                    parts.append(read(
+                            NPYLabel.FILE_TEMPLATE_BLOCKS_CHUNK.format(i, chunk),
+                            sl,
+                            partial,
+                            ))
+            elif chunk_start >= row_stop:
+                break
+            chunk_start = chunk_end
+
+        def concat(
+                parts: tp.List[TNDArrayAny],
+                dtype: TDtypeAny,
+                shape: tp.Tuple[int, ...],
+                ) -> TNDArrayAny:
+            if len(parts) == 1:
+                return parts[0]
+            if parts:
+                array = concat_resolved(parts)
+            else:
+                array = np.empty(shape, dtype=dtype)
+            array.flags.writeable = False
+            return array
+
+        index: tp.Optional[IndexBase]
+        if include_index:
+            index = ArchiveIndexConverter.index_from_arrays(
+                    arrays=[concat(parts, DTYPE_INT_DEFAULT, (0,)) for parts in parts_index],
+                    metadata=metadata,
+                    key_types=NPYLabel.KEY_TYPES_INDEX,
+                    cls_index=cls_index,
+                    name=name_index,
+                    )
+        elif row_start:
+            # an auto-incremented index is labelled with positions in the archive
+            index = cls_index(PositionsAllocator.get(row_stop)[row_start:], name=name_index)
+        else:
+            index = None
+
+        if block_indices:
+            tb = TypeBlocks.from_blocks(concat(parts,
+                    layout[i][0],
+                    (0,) if layout[i][1] is None else (0, layout[i][1]),
+                    ) for parts, i in zip(parts_blocks, block_indices))
+            if block_positions is not None:
+                tb = tb._extract(column_key=block_positions)
+        else:
+            tb = TypeBlocks.from_zero_size_shape((row_stop - row_start, 0))
+
+        return constructor(tb,
+                own_data=True,
+                index=index,
+                own_index=index is not None,
+                columns=columns,
+                own_columns=columns is not None,
+                name=name,
+                )
+
+    @classmethod
+    def from_archive(cls,
+            *,
+            constructor: tp.Type[TFrameAny],
+            fp: TPathSpecifier,
+            start: int = 0,
+            stop: tp.Optional[int] = None,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            ) -> TFrameAny:
+        '''
+        Create a :obj:`Frame` from the rows ``start`` to ``stop`` of a chunked archive.
+        '''
+        archive = cls._ARCHIVE_CLS(fp,
+                writeable=False,
+                memory_map=False,
+                )
+        return cls.frame_decode(
+                archive=archive,
+                constructor=constructor,
+                start=start,
+                stop=stop,
+                columns_select=columns_select,
+                )
+
+
+class NPYFrameChunkedConverter(ArchiveFrameChunkedConverter):
+    _ARCHIVE_CLS = ArchiveDirectory
+
+
+class SharedMemoryFrameConverter(ArchiveFrameConverter):
+    _ARCHIVE_CLS = ArchiveSharedMemory
+
+    @classmethod
+    def to_shared_memory(cls, frame: TFrameAny) -> FrameSharedMemory:
+        '''
+        Copy the arrays of a :obj:`Frame` into a new shared memory segment, returning a picklable :obj:`FrameSharedMemory`. Raises ``ErrorNPYEncode`` if the :obj:`Frame` has arrays that cannot be stored, such as object arrays.
+        '''
+        archive = ArchiveSharedMemory(None,
+                writeable=True,
+                memory_map=False,
+                )
+        cls.frame_encode(archive=archive, frame=frame)
+        return FrameSharedMemory(
+                archive._segment_name,
+                archive._archive,
+                archive._metadata,
+                frame.__class__,
+                )
+
+    @classmethod
+    def from_shared_memory(cls, payload: FrameSharedMemory) -> TFrameAny:
+        '''
+        Create a :obj:`Frame` from a :obj:`FrameSharedMemory`. Arrays are immutable views of the shared memory segment, and the segment is released when the last of these arrays is released. This must be called only once per :obj:`FrameSharedMemory`.
+        '''
+        archive = ArchiveSharedMemory(payload,
+                writeable=False,
+                memory_map=True,
+                )
+        return cls.frame_decode(
+                archive=archive,
+                constructor=payload.constructor,
+                )
+
+    @classmethod
+    def encode(cls, post: tp.Any) -> tp.Any:
+        '''
+        If ``post`` is a :obj:`Frame`, return a :obj:`FrameSharedMemory`, or, if the :obj:`Frame` cannot be stored in shared memory, the :obj:`Frame`; return all other values unchanged.
+        '''
+        from static_frame.core.frame import Frame
+        if isinstance(post, Frame):
+            try:
+                return cls.to_shared_memory(post)
+            except ErrorNPYEncode:
+                return post
+        return post
+
+    @classmethod
+    def decode(cls, post: tp.Any) -> tp.Any:
+        '''
+        The inverse of ``encode``: if ``post`` is a :obj:`FrameSharedMemory`, return a :obj:`Frame`; return all other values unchanged.
+        '''
+        if post.__class__ is FrameSharedMemory:
+            return cls.from_shared_memory(post)
+        return post
+
+    @staticmethod
+    def release(post: tp.Any) -> None:
+        '''
+        If ``post`` is a :obj:`FrameSharedMemory` that will not be decoded, unlink its shared memory segment.
+        '''
+        if post.__class__ is FrameSharedMemory:
+            # attaching unlinks the name; the segment is released when this object is released
+            SharedMemorySegment(post.segment)
+
+    @classmethod
+    def decode_iter(cls, results: tp.Iterable[tp.Any]) -> tp.Generator[tp.Any, None, None]:
+        '''
+        Yield ``decode`` of each of ``results``. As segments created by worker processes are not tracked by this process, if this generator is closed before ``results`` is exhausted, the remaining results are consumed and their segments released.
+        '''
+        results = iter(results)
+        try:
+            for post in results:
+                yield cls.decode(post)
+        finally:
+            try:
+                for post in results:
+                    cls.release(post)
+            except Exception: # pylint: disable=W0703
+                pass # a failed worker did not create a segment
+
+
+class FuncSharedMemory:
+    '''
+    A picklable wrapper of a single-argument function, for use in a process pool, that returns :obj:`Frame` results as :obj:`FrameSharedMemory`; results are to be restored with ``SharedMemoryFrameConverter.decode``.
+    '''
+    __slots__ = ('_func',)
+
+    def __init__(self, func: tp.Callable[[tp.Any], tp.Any]) -> None:
+        self._func = func
+
+    def __call__(self, arg: tp.Any) -> tp.Any:
+        return SharedMemoryFrameConverter.encode(self._func(arg))
+
 #-------------------------------------------------------------------------------
 # for converting from components, unstructured Frames
 
@@ -1009,6 +2069,8 @@ class ArchiveComponentsConverter(metaclass=InterfaceMeta):
                     archive=self._archive,
                     index=index,
                     key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_INDEX,
+                    key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_INDEX,
+                    key_indexers=NPYLabel.FILE_INDEXERS_INDEX,
                     key_types=NPYLabel.KEY_TYPES_INDEX,
                     depth=depth_index,
                     include=True,
@@ -1040,6 +2102,8 @@ class ArchiveComponentsConverter(metaclass=InterfaceMeta):
                     archive=self._archive,
                     index=columns,
                     key_template_values=NPYLabel.FILE_TEMPLATE_VALUES_COLUMNS,
+                    key_template_labels=NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS,
+                    key_indexers=NPYLabel.FILE_INDEXERS_COLUMNS,
                     key_types=NPYLabel.KEY_TYPES_COLUMNS,
                     depth=depth_columns,
                     include=True,
@@ -1223,4 +2287,34 @@ class NPY(ArchiveComponentsConverter):
     '''
     _ARCHIVE_CLS = ArchiveDirectory
 
+    def from_frames_chunked(self,
+            frames: tp.Iterable[TFrameAny],
+            *,
+            chunk_size: int = ArchiveFrameChunkedConverter.CHUNK_SIZE,
+            include_index: bool = True,
+            include_columns: bool = True,
+            consolidate_blocks: bool = False,
+            ) -> None:
+        '''Given an iterable of Frames with the same columns and column dtypes, write out an NPY directory of row chunks, where each chunk stores ``chunk_size`` rows of each block and index array. Only one Frame and one chunk are held in memory at a time, permitting writing from a generator of Frames that, together, do not fit in memory. Rows can be read with ``Frame.from_npy_chunked`` and appended with ``Frame.to_npy_chunked``.
+
+        Args:
+            frames:
+            *
+            chunk_size: The number of rows per chunk.
+            include_index:
+            include_columns:
+            consolidate_blocks:
+        '''
+        if not self._writeable:
+            raise UnsupportedOperation('Open with mode "w" to write.')
+
+        NPYFrameChunkedConverter.frames_encode(
+                archive=self._archive,
+                frames=frames,
+                chunk_size=chunk_size,
+                include_index=include_index,
+                include_columns=include_columns,
+                consolidate_blocks=consolidate_blocks,
+                )
+
 
@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import io
 import os
+import tempfile
+import time
+from copy import copy
 from os import PathLike
 from struct import calcsize
 from struct import error as StructError
+from struct import pack
 from struct import unpack
 from types import TracebackType
 from zipfile import ZIP_STORED
 from zipfile import BadZipFile
+from zipfile import ZipFile
+from zipfile import ZipInfo
+from zlib import crc32
 
 import typing_extensions as tp
 
@@ -67,6 +74,7 @@ _CD_LOCAL_HEADER_OFFSET = 18
 
 # General purpose bit flags
 _MASK_ENCRYPTED = 1 << 0
+_MASK_USE_DATA_DESCRIPTOR = 1 << 3
 _MASK_COMPRESSED_PATCH = 1 << 5
 _MASK_STRONG_ENCRYPTION = 1 << 6
 _MASK_UTF_FILENAME = 1 << 11
@@ -89,6 +97,17 @@ _FH_UNCOMPRESSED_SIZE = 9
 _FH_FILENAME_LENGTH = 10
 _FH_EXTRA_FIELD_LENGTH = 11
 
+# The "data descriptor" signature, optionally written after file data when sizes are not known before writing
+_DD_SIGNATURE = b"PK\x07\x08"
+_ZIP64_LIMIT = (1 << 31) - 1
+
+# The size of the ZIP64 extra field written to the local file header when using force_zip64
+_EXTRA_ZIP64_SIZE = calcsize('<HHQQ')
+# The header ID of the extra field used to align file data, as used by Android's zipalign
+_EXTRA_ALIGN_ID = 0xD935
+# The prefix of the ZIP archive comment that records the position of the manifest file
+_MANIFEST_COMMENT_PREFIX = b'static-frame-manifest:'
+
 # The "Zip64 end of central directory locator" structure, magic number, and size
 _END_ARCHIVE64_LOCATOR_STRUCT = "<4sLQL"
 _END_ARCHIVE64_LOCATOR_STRING = b"PK\x06\x07"
@@ -211,12 +230,13 @@ def _extract_end_archive(file: tp.IO[bytes]) -> TEndArchive:
     start = data.rfind(_END_ARCHIVE_STRING)
     if start >= 0:
         # found the magic number; attempt to unpack and interpret
-        data = data[start: start + _END_ARCHIVE_SIZE]
-        if len(data) != _END_ARCHIVE_SIZE:
+        rec = data[start: start + _END_ARCHIVE_SIZE]
+        if len(rec) != _END_ARCHIVE_SIZE:
             raise BadZipFile('Corrupted ZIP.') #pragma: no cover
 
-        endrec = list(unpack(_END_ARCHIVE_STRUCT, data))
-        endrec.append(b'') # ignore comment
+        endrec = list(unpack(_END_ARCHIVE_STRUCT, rec))
+        comment_start = start + _END_ARCHIVE_SIZE
+        endrec.append(data[comment_start: comment_start + endrec[_ECD_COMMENT_SIZE]]) # type: ignore
         endrec.append(comment_max_start + start)
 
         # Try to read the "Zip64 end of central directory" structure
@@ -333,6 +353,13 @@ class ZipFilePartRO(io.BufferedIOBase):
         self._pos = self._file.tell()
         return count
 
+    def fileno(self) -> int:
+        '''Return the file descriptor of the ZIP file; as ``tell()`` returns positions in the ZIP file, this permits memory mapping regions of this part.
+        '''
+        if self._file is None:
+            raise ValueError("I/O operation on closed file.")
+        return self._file.fileno()
+
     def close(self) -> None:
         if self._file is not None:
             file = self._file
@@ -468,9 +495,11 @@ class ZipFileRO:
         '_file_ref_count',
         )
 
-    def __init__(self, file: PathLike[str] | str | tp.IO[bytes]) -> None:
-        '''Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
-        or append 'a'.'''
+    def __init__(self,
+            file: PathLike[str] | str | tp.IO[bytes],
+            zinfos: tp.Optional[tp.Iterable[ZipInfoRO]] = None,
+            ) -> None:
+        '''Open the ZIP file for reading. If ``zinfos`` are provided, they are used rather than reading the central directory.'''
         if isinstance(file, os.PathLike):
             file = os.fspath(file)
 
@@ -490,7 +519,8 @@ class ZipFileRO:
 
         try:
             self._name_to_info = {
-                    zinfo.filename: zinfo for zinfo in yield_zinfos(self._file, False)
+                    zinfo.filename: zinfo for zinfo in (
+                    zinfos if zinfos is not None else yield_zinfos(self._file, False))
                     }
         except BadZipFile:
             fp = self._file
@@ -615,8 +645,171 @@ class ZipFileRO:
             file.close()
 
 
+def zip_info_aligned(
+        zf: ZipFile,
+        name: str,
+        align: int,
+        ) -> ZipInfo:
+    '''Return a ``ZipInfo`` for writing ``name`` to ``zf`` with ``force_zip64``, where the local file header is padded with an extra field such that the file data starts at a position in the ZIP file that is a multiple of ``align``. Only meaningful for uncompressed (ZIP_STORED) files written in sequence.
+    '''
+    zinfo = ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zf.compression
+
+    filename, _ = zinfo._encodeFilenameFlags() # type: ignore
+    # NOTE: the local file header of the next file is written at start_dir
+    pos_data = (zf.start_dir
+            + _FILE_HEADER_SIZE
+            + len(filename)
+            + _EXTRA_ZIP64_SIZE
+            + 4 # header of the alignment extra field
+            )
+    pad = -pos_data % align
+    zinfo.extra = pack('<HH', _EXTRA_ALIGN_ID, pad) + bytes(pad)
+    return zinfo
+
+
 def zip_namelist(fp: PathLike[str] | str) -> tp.Iterator[str]:
     '''High-performance routine to list the contents of a zip. This will work with both compressed and uncompressed zips.
     '''
     with open(fp, 'rb') as file:  #pylint: disable=R1732
         yield from yield_zinfos(file, True)
+
+
+def zip_tombstone(
+        zf: ZipFile,
+        selector: tp.Callable[[str], bool],
+        start: int = 0,
+        stop: tp.Optional[int] = None,
+        relocate: bool = False,
+        ) -> int:
+    '''For a ``ZipFile`` opened in append mode, remove from the central directory the entries from position ``start`` to ``stop`` with names selected by ``selector``, as when those files are replaced by files written after ``stop``. If ``relocate``, the entries after ``stop`` with names selected by ``selector`` are moved to the position of the first entry removed, such that replacing files retains their order in the central directory. The bytes of removed files remain in the ZIP file, unreferenced, until the ZIP file is rewritten with ``zip_compact()``. Returns the number of entries removed.
+    '''
+    filelist = zf.filelist
+    stop = len(filelist) if stop is None else stop
+    span = filelist[start:stop]
+    retained = [zinfo for zinfo in span if not selector(zinfo.filename)]
+    count = len(span) - len(retained)
+    if count:
+        if relocate:
+            position = start + next(i for i, zinfo in enumerate(span) if selector(zinfo.filename))
+            moved = [zinfo for zinfo in filelist[stop:] if selector(zinfo.filename)]
+            filelist[stop:] = [zinfo for zinfo in filelist[stop:] if not selector(zinfo.filename)]
+            filelist[start:stop] = retained
+            filelist[position:position] = moved
+        else:
+            filelist[start:stop] = retained
+        zf.NameToInfo = {zinfo.filename: zinfo for zinfo in filelist}
+        # NOTE: the central directory is only written on close if modified. This relies on the private ZipFile._didModify, which ZipFile.close() checks before writing the central directory in CPython 3.9 through 3.12 (Lib/zipfile.py, and Lib/zipfile/__init__.py from 3.12); as entries are only removed in append mode, after a file has been written, this is already True in those versions; test_zip_tombstone_b tests removal without writing.
+        zf._didModify = True # type: ignore
+    return count
+
+
+def zip_compact(
+        fp: PathLike[str] | str,
+        align: int = 1,
+        exclude: tp.Optional[tp.Callable[[str], bool]] = None,
+        ) -> int:
+    '''Rewrite the ZIP file at ``fp`` with only the files referenced by its central directory, removing the bytes of files removed with ``zip_tombstone()`` as well as files with names selected by ``exclude``. Files are copied without decompression; the position of each local file header modulo ``align`` is retained, such that aligned file data remains aligned. Returns the number of bytes removed.
+    '''
+    fp = os.fspath(fp)
+    size_src = os.path.getsize(fp)
+    fd, fp_dst = tempfile.mkstemp(suffix='.zip', dir=os.path.dirname(os.path.abspath(fp)))
+
+    try:
+        with open(fp, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            with ZipFile(fp) as zf_src, ZipFile(dst, mode='w', allowZip64=True) as zf_dst:
+                for zinfo in zf_src.infolist():
+                    if exclude is not None and exclude(zinfo.filename):
+                        continue
+                    src.seek(zinfo.header_offset)
+                    fheader = unpack(_FILE_HEADER_STRUCT, src.read(_FILE_HEADER_SIZE))
+                    if fheader[_FH_SIGNATURE] != _FILE_HEADER_STRING:
+                        raise BadZipFile('Bad magic number for file header')
+                    size = (_FILE_HEADER_SIZE
+                            + fheader[_FH_FILENAME_LENGTH]
+                            + fheader[_FH_EXTRA_FIELD_LENGTH]
+                            + zinfo.compress_size
+                            )
+                    if zinfo.flag_bits & _MASK_USE_DATA_DESCRIPTOR:
+                        src.seek(zinfo.header_offset + size)
+                        if src.read(4) == _DD_SIGNATURE:
+                            size += 4
+                        zip64 = max(zinfo.compress_size, zinfo.file_size) > _ZIP64_LIMIT
+                        size += 20 if zip64 else 12
+
+                    pos = dst.tell()
+                    pad = (zinfo.header_offset - pos) % align
+                    if pad:
+                        # NOTE: bytes between files are not referenced by the central directory
+                        dst.write(bytes(pad))
+                        pos += pad
+
+                    src.seek(zinfo.header_offset)
+                    while size:
+                        chunk = src.read(min(size, 1 << 24))
+                        if not chunk:
+                            raise BadZipFile(f'Truncated file data: {zinfo.filename}')
+                        dst.write(chunk)
+                        size -= len(chunk)
+
+                    zinfo_dst = copy(zinfo)
+                    zinfo_dst.header_offset = pos
+                    zf_dst.filelist.append(zinfo_dst)
+                    zf_dst.NameToInfo[zinfo_dst.filename] = zinfo_dst
+
+                # NOTE: the central directory is written at start_dir when zf_dst is closed
+                zf_dst.start_dir = dst.tell()
+    except BaseException:
+        os.remove(fp_dst)
+        raise
+
+    os.replace(fp_dst, fp)
+    return size_src - os.path.getsize(fp)
+
+
+def zip_manifest_write(
+        zf: ZipFile,
+        name: str,
+        data: bytes,
+        ) -> None:
+    '''Write ``data`` as the uncompressed file ``name`` to ``zf``, removing any previously written file ``name`` from the central directory, and record the position of the file in the ZIP archive comment such that it can be read with ``zip_manifest_read()`` without reading the central directory.
+    '''
+    zip_tombstone(zf, name.__eq__)
+    zinfo = ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = ZIP_STORED
+    zf.writestr(zinfo, data)
+    zf.comment = _MANIFEST_COMMENT_PREFIX + str(zinfo.header_offset).encode()
+
+
+def zip_manifest_read(
+        fp: PathLike[str] | str,
+        name: str,
+        ) -> tp.Optional[bytes]:
+    '''Return the bytes of the file ``name`` written with ``zip_manifest_write()``, found by the position recorded in the ZIP archive comment, or None if the ZIP has no such file.
+    '''
+    with open(fp, 'rb') as file:
+        endrec = _extract_end_archive(file)
+        comment: bytes = endrec[_ECD_COMMENT] # type: ignore
+        if not comment.startswith(_MANIFEST_COMMENT_PREFIX):
+            return None
+        try:
+            offset = int(comment[len(_MANIFEST_COMMENT_PREFIX):])
+        except ValueError:
+            return None
+
+        file.seek(offset)
+        fheader_bytes = file.read(_FILE_HEADER_SIZE)
+        if len(fheader_bytes) != _FILE_HEADER_SIZE:
+            return None
+        fheader = unpack(_FILE_HEADER_STRUCT, fheader_bytes)
+        if (fheader[_FH_SIGNATURE] != _FILE_HEADER_STRING
+                or fheader[_FH_COMPRESSION_METHOD] != ZIP_STORED
+                or fheader[_FH_GENERAL_PURPOSE_FLAG_BITS] & _MASK_USE_DATA_DESCRIPTOR
+                or file.read(fheader[_FH_FILENAME_LENGTH]) != name.encode('utf-8')):
+            return None
+
+        file.seek(fheader[_FH_EXTRA_FIELD_LENGTH], 1)
+        data = file.read(fheader[_FH_COMPRESSED_SIZE])
+        if crc32(data) != fheader[_FH_CRC]:
+            raise BadZipFile(f'Bad CRC-32 for file {name!r}')
+        return data
@@ -3,6 +3,8 @@ from __future__ import annotations
 import numpy as np
 import typing_extensions as tp
 
+from static_frame.core.archive_npy import FuncSharedMemory
+from static_frame.core.archive_npy import SharedMemoryFrameConverter
 from static_frame.core.bus import Bus
 from static_frame.core.container import ContainerOperand
 from static_frame.core.display import Display
@@ -124,6 +126,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             '_chunksize',
             '_use_threads',
             '_mp_context',
+            '_shared_memory',
             )
 
     _config: StoreConfigMap
@@ -138,6 +141,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''Return a :obj:`Batch` from an iterable of :obj:`Frame`; labels will be drawn from :obj:`Frame.name`.
         '''
@@ -148,6 +152,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     #---------------------------------------------------------------------------
@@ -162,6 +167,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         config_map = StoreConfigMap.from_initializer(config)
 
@@ -174,6 +180,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -186,6 +193,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped TSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -199,6 +207,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -211,6 +220,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped CSV :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -224,6 +234,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -236,6 +247,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped pickle :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -249,6 +261,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -261,6 +274,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPZ :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -274,6 +288,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -286,6 +301,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped NPY :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -299,6 +315,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -311,6 +328,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to zipped parquet :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -324,6 +342,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
 
@@ -337,6 +356,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to an XLSX :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -351,6 +371,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
 
@@ -364,6 +385,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to an SQLite :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -377,6 +399,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -389,6 +412,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to an DuckDB :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -402,6 +426,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     @classmethod
@@ -414,6 +439,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> 'Batch':
         '''
         Given a file path to a HDF5 :obj:`Batch` store, return a :obj:`Batch` instance.
@@ -427,6 +453,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 chunksize=chunksize,
                 use_threads=use_threads,
                 mp_context=mp_context,
+                shared_memory=shared_memory,
                 )
 
     #---------------------------------------------------------------------------
@@ -439,6 +466,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ):
         '''
         Default constructor of a :obj:`Batch`.
@@ -454,6 +482,7 @@ class Batch(ContainerOperand, StoreClientMixin):
         self._chunksize = chunksize
         self._use_threads = use_threads
         self._mp_context = mp_context
+        self._shared_memory = shared_memory
 
     #---------------------------------------------------------------------------
     def _derive(self,
@@ -468,6 +497,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=self._max_workers,
                 chunksize=self._chunksize,
                 use_threads=self._use_threads,
+                shared_memory=self._shared_memory,
                 )
 
     @property
@@ -555,11 +585,24 @@ class Batch(ContainerOperand, StoreClientMixin):
                 mp_context=self._mp_context,
                 )
 
-        def gen_pool() -> TIteratorFrameItems:
-            with pool_executor() as executor:
-                yield from zip(labels,
-                        executor.map(caller, arg_iter, chunksize=self._chunksize)
-                        )
+        if self._shared_memory and not self._use_threads:
+            def gen_pool() -> TIteratorFrameItems:
+                with pool_executor() as executor:
+                    posts = SharedMemoryFrameConverter.decode_iter(
+                            executor.map(FuncSharedMemory(caller),
+                                    arg_iter,
+                                    chunksize=self._chunksize,
+                                    ))
+                    try:
+                        yield from zip(labels, posts)
+                    finally:
+                        posts.close() # release segments not consumed
+        else:
+            def gen_pool() -> TIteratorFrameItems:
+                with pool_executor() as executor:
+                    yield from zip(labels,
+                            executor.map(caller, arg_iter, chunksize=self._chunksize)
+                            )
         return self._derive(gen_pool)
 
     def _apply_pool_except(self,
@@ -578,18 +621,33 @@ class Batch(ContainerOperand, StoreClientMixin):
                 mp_context=self._mp_context,
                 )
 
+        shared_memory = self._shared_memory and not self._use_threads
+        if shared_memory:
+            caller = FuncSharedMemory(caller)
+
         def gen_pool() -> TIteratorFrameItems:
             futures = []
             with pool_executor() as executor:
                 for args in arg_iter:
                     futures.append(executor.submit(caller, args))
 
-                for label, future in zip(labels, futures):
-                    try:
-                        container = future.result()
-                    except exception:
-                        continue
-                    yield label, container
+                consumed = 0
+                try:
+                    for label, future in zip(labels, futures):
+                        consumed += 1
+                        try:
+                            container = future.result()
+                        except exception:
+                            continue
+                        if shared_memory:
+                            container = SharedMemoryFrameConverter.decode(container)
+                        yield label, container
+                finally:
+                    # release segments of results not consumed
+                    if shared_memory:
+                        for future in futures[consumed:]:
+                            if not future.cancel() and future.exception() is None:
+                                SharedMemoryFrameConverter.release(future.result())
 
         return self._derive(gen_pool)
 
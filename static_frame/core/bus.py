@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from itertools import zip_longest
 
@@ -14,6 +17,7 @@ from static_frame.core.display import DisplayActive
 from static_frame.core.display import DisplayHeader
 from static_frame.core.display_config import DisplayConfig
 from static_frame.core.doc_str import doc_inject
+from static_frame.core.doc_str import doc_update
 from static_frame.core.exception import ErrorInitBus
 from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.frame import Frame
@@ -26,6 +30,8 @@ from static_frame.core.node_iter import IterNodeNoArgReducible
 from static_frame.core.node_selector import InterfaceSelectTrio
 from static_frame.core.node_selector import InterGetItemILocReduces
 from static_frame.core.node_selector import InterGetItemLocReduces
+from static_frame.core.persist_policy import PersistPolicy
+from static_frame.core.persist_policy import PersistPolicyLRU
 from static_frame.core.series import Series
 from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
@@ -64,6 +70,45 @@ from static_frame.core.util import TPathSpecifier
 from static_frame.core.util import TSortKinds
 
 
+#-------------------------------------------------------------------------------
+def _from_zip_async_factory(
+        store_cls: tp.Type[Store],
+        format_label: str,
+        ) -> tp.Callable[..., tp.Coroutine[tp.Any, tp.Any, tp.Any]]:
+    '''
+    Return an asynchronous variant of a ``Bus.from_zip_*`` constructor, reading a zipped ``store_cls``, to be bound as a classmethod.
+    '''
+    async def from_zip_async(cls: tp.Type[TBusAny],
+            fp: TPathSpecifier,
+            *,
+            config: StoreConfigMapInitializer = None,
+            max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
+            index_constructor: TIndexCtorSpecifier = None,
+            max_concurrency: int = 4,
+            ) -> TBusAny:
+        return await cls._from_store_async(store_cls(fp),
+                config=config,
+                max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
+                index_constructor=index_constructor,
+                max_concurrency=max_concurrency,
+                )
+
+    name = f'from_zip_{format_label.lower()}_async'
+    from_zip_async.__name__ = name
+    from_zip_async.__qualname__ = f'Bus.{name}'
+    from_zip_async.__doc__ = f'''
+        Given a file path to zipped {format_label} :obj:`Bus` store, return a :obj:`Bus` instance, reading without blocking the running event loop.
+
+        {{args}}
+        '''
+    doc_update(from_zip_async, 'bus_constructor_async')
+    return from_zip_async
+
+
 #-------------------------------------------------------------------------------
 class FrameDeferredMeta(type):
     def __repr__(cls) -> str:
@@ -95,7 +140,7 @@ TVIndex = tp.TypeVar('TVIndex', bound=IndexBase, default=tp.Any) # pylint: disab
 
 class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a ContainerOperand
     '''
-    A randomly-accessible container of :obj:`Frame`. When created from a multi-table storage format (such as a zip-pickle or XLSX), a Bus will lazily read in components as they are accessed. When combined with the ``max_persist`` parameter, a Bus will not hold on to more than ``max_persist`` references, permitting low-memory reading of collections of :obj:`Frame`.
+    A randomly-accessible container of :obj:`Frame`. When created from a multi-table storage format (such as a zip-pickle or XLSX), a Bus will lazily read in components as they are accessed. When combined with the ``max_persist`` parameter, a Bus will not hold on to more than ``max_persist`` references, permitting low-memory reading of collections of :obj:`Frame`. Similarly, the ``max_persist_bytes`` parameter limits the total bytes of loaded :obj:`Frame`. Which :obj:`Frame` are released is determined by a :obj:`PersistPolicy`, by default least-recently used.
     '''
 
     __slots__ = (
@@ -106,8 +151,9 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         '_name',
         '_store',
         '_config',
-        '_last_accessed',
+        '_persist_policy',
         '_max_persist',
+        '_max_persist_bytes',
         )
 
     _values_mutable: TNDArrayAny
@@ -115,6 +161,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
     _store: tp.Optional[Store]
     _config: StoreConfigMap
     _name: TName
+    _persist_policy: tp.Optional[PersistPolicy]
 
     STATIC = False
     _NDIM: int = 1
@@ -192,6 +239,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             store: tp.Optional[Store] = None,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             own_data: bool = False,
             ) -> tp.Self:
         '''
@@ -203,6 +252,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 own_data=own_data,
                 own_index=True,
                 name=series.name,
@@ -231,6 +282,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         return cls(None, # will generate FrameDeferred array
@@ -239,9 +292,46 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 own_data=True,
                 )
 
+    @classmethod
+    async def _from_store_async(cls,
+            store: Store,
+            *,
+            config: StoreConfigMapInitializer = None,
+            max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
+            index_constructor: TIndexCtorSpecifier = None,
+            max_concurrency: int = 4,
+            ) -> tp.Self:
+        '''
+        Read labels in the default executor of the running event loop. If the :obj:`Bus` does not limit persisted :obj:`Frame`, read all :obj:`Frame` concurrently; otherwise, :obj:`Frame` are loaded lazily as with synchronous constructors.
+        '''
+        config_map = StoreConfigMap.from_initializer(config)
+        loop = asyncio.get_running_loop()
+        labels = await loop.run_in_executor(None,
+                lambda: list(store.labels(config=config_map)))
+
+        frames: tp.Optional[tp.List[TFrameAny]] = None
+        if max_persist is None and max_persist_bytes is None and persist_policy is None:
+            frames = await store.read_many_async(labels,
+                    config=config_map,
+                    max_concurrency=max_concurrency,
+                    )
+        return cls(frames,
+                index=labels,
+                index_constructor=index_constructor,
+                store=store,
+                config=config_map,
+                max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
+                )
+
     @classmethod
     @doc_inject(selector='bus_constructor')
     def from_zip_tsv(cls,
@@ -249,6 +339,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -260,6 +352,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -270,6 +364,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -281,6 +377,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -291,6 +389,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -302,6 +402,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -312,6 +414,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -323,6 +427,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -333,6 +439,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -344,6 +452,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -354,6 +464,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -365,9 +477,18 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
+    from_zip_tsv_async = classmethod(_from_zip_async_factory(StoreZipTSV, 'TSV'))
+    from_zip_csv_async = classmethod(_from_zip_async_factory(StoreZipCSV, 'CSV'))
+    from_zip_pickle_async = classmethod(_from_zip_async_factory(StoreZipPickle, 'pickle'))
+    from_zip_npz_async = classmethod(_from_zip_async_factory(StoreZipNPZ, 'NPZ'))
+    from_zip_npy_async = classmethod(_from_zip_async_factory(StoreZipNPY, 'NPY'))
+    from_zip_parquet_async = classmethod(_from_zip_async_factory(StoreZipParquet, 'parquet'))
+
     @classmethod
     @doc_inject(selector='bus_constructor')
     def from_xlsx(cls,
@@ -375,6 +496,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -387,6 +510,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -397,6 +522,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -408,6 +535,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -418,6 +547,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -429,6 +560,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -439,6 +572,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             *,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             index_constructor: TIndexCtorSpecifier = None,
             ) -> tp.Self:
         '''
@@ -450,6 +585,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         return cls._from_store(store,
                 config=config,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 index_constructor=index_constructor,
                 )
 
@@ -463,6 +600,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             store: tp.Optional[Store] = None,
             config: StoreConfigMapInitializer = None,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             own_index: bool = False,
             own_data: bool = False,
             ):
@@ -472,9 +611,16 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
 
         {args}
         '''
-        if max_persist is not None:
-            # use an (ordered) dictionary to give use an ordered set, simply pointing to None for all keys
-            self._last_accessed: tp.Dict[TLabel, None] = {}
+        if persist_policy is not None:
+            if len(persist_policy):
+                raise ErrorInitBus('persist_policy is already in use by another Bus')
+            self._persist_policy = persist_policy
+        elif max_persist is not None or max_persist_bytes is not None:
+            self._persist_policy = PersistPolicyLRU()
+        else:
+            self._persist_policy = None
+        if self._persist_policy is not None:
+            self._persist_policy._capacity = max_persist
 
         if own_index:
             self._index = index #type: ignore
@@ -525,8 +671,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 if value is FrameDeferred:
                     self._loaded[i] = False
                 elif isinstance(value, Frame): # permit FrameGO?
-                    if max_persist is not None:
-                        self._last_accessed[label] = None
+                    if self._persist_policy is not None:
+                        self._persist_policy._add(label, value.nbytes)
                     self._loaded[i] = True
                 else:
                     raise ErrorInitBus(f'supplied {value.__class__} is not a Frame or FrameDeferred.')
@@ -548,10 +694,21 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             raise ErrorInitBus('max_persist cannot be less than the number of already loaded Frames')
         self._max_persist = max_persist
 
+        if max_persist_bytes is not None and max_persist_bytes < 1:
+            raise ErrorInitBus('max_persist_bytes must be greater than zero')
+        self._max_persist_bytes = max_persist_bytes
+
         # providing None will result in default; providing a StoreConfig or StoreConfigMap will return an appropriate map
         self._config = StoreConfigMap.from_initializer(config)
 
     #---------------------------------------------------------------------------
+    def _persist_policy_derive(self) -> tp.Optional[PersistPolicy]:
+        '''Return a new, empty instance of the persist policy of this :obj:`Bus`, if defined, for use by a derived :obj:`Bus`.
+        '''
+        if self._persist_policy is None:
+            return None
+        return self._persist_policy._new()
+
     def _derive_from_series(self,
             series: TSeriesObject,
             *,
@@ -564,6 +721,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=self._store,
                 config=self._config,
                 max_persist=self._max_persist,
+                max_persist_bytes=self._max_persist_bytes,
+                persist_policy=self._persist_policy_derive(),
                 own_data=own_data,
                 )
 
@@ -597,6 +756,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=self._store,
                 config=self._config,
                 max_persist=self._max_persist,
+                max_persist_bytes=self._max_persist_bytes,
+                persist_policy=self._persist_policy_derive(),
                 own_index=True,
                 own_data=False,
                 )
@@ -755,38 +916,46 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
     #---------------------------------------------------------------------------
     # cache management
 
-    def _update_values_mutable_iloc(self, key: TILocSelector) -> None:
+    def _update_values_mutable_iloc(self,
+            key: TILocSelector,
+            frame_prefetched: tp.Optional[TFrameAny] = None,
+            ) -> None:
         '''
         Update _values_mutable with the key specified, where key can be any iloc.
 
         Args:
             key: always an iloc key.
+            frame_prefetched: if key is an integer, optionally provide the :obj:`Frame` already read from the Store for that position.
         '''
         max_persist = self._max_persist
         max_persist_active = max_persist is not None
+        max_persist_bytes = self._max_persist_bytes
+        policy = self._persist_policy
 
         target_loaded = self._loaded[key]
         target_loaded_count = target_loaded.sum()
         load = False if self._loaded_all else not target_loaded.all()
-        if not load and not max_persist_active:
+        if not load and policy is None:
             return
 
         index = self._index
         label: TLabel
         key_is_element = isinstance(key, INT_TYPES)
 
-        if not load and max_persist_active: # must update LRU position
+        if not load: # policy is defined, must record access
             labels = (index.iloc[key],) if key_is_element else index.iloc[key].values
-            for label in labels: # update LRU position
-                self._last_accessed[label] = self._last_accessed.pop(label, None)
+            for label in labels:
+                policy._access(label) # type: ignore
             return
 
         if self._store is None: # Store must be defined if we are partially loaded
             raise RuntimeError('no store defined')
 
         array = self._values_mutable
-        # selection might result in an element so types here are not precise
+        # selection might result in an element so types here are not precise; if an array, copy such that evicted Frame in the target remain available
         target_values: TNDArrayAny = array[key]
+        if not key_is_element:
+            target_values = target_values.copy()
 
         target_labels: TNDArrayAny | TIndexHierarchyAny
         if self._index._NDIM == 2:
@@ -809,14 +978,17 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         # NOTE: prepare iterable of pairs of label, Frame / FrameDeferred; ensure that for every FrameDeferred, the appropriate Frame is loaded and yielded from the store_reader in order. We must ensure within the target of requested Frame we do not delete any previously-loaded Frame. If max_persist is less than the target, reduce the target to max_persist.
 
         if key_is_element:
-            store_reader = iter((self._store.read(target_labels, config=self._config[target_labels]),)) # type: ignore
+            if frame_prefetched is None:
+                frame_prefetched = self._store.read(target_labels, config=self._config[target_labels]) # type: ignore
+            store_reader = iter((frame_prefetched,))
             targets_items = ((target_labels, target_values),) # type: ignore
         # more than one Frame
-        elif (not max_persist_active
+        elif (max_persist is None
                 or max_persist == 1
                 or loaded_needed <= loaded_available # pyright: ignore
+                or target_count <= max_persist # pyright: ignore
                 ):
-            # only read-in labels that are deferred; as loaded_needed is less than loaded_available, no Frame will be removed
+            # only read-in labels that are deferred; if loaded_needed is greater than loaded_available, some Frame have to be deleted, but as the target fits within max_persist, the policy can always select a Frame outside of the target
             if target_loaded_count:
                 labels_to_read = target_labels[~target_loaded]
             else: # no targets are loaded
@@ -824,67 +996,78 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
 
             store_reader = self._store.read_many(labels_to_read, config=self._config)
             targets_items = zip(target_labels, target_values)
-        # max_persist_active, must delete some Frame
+        # max_persist_active, target_count > max_persist
         else:
-            if loaded_needed <= max_persist:
-                # loaded_needed is less than _max_persist but greater than loaded_available, meaning that some Frame have to be deleted. we must ensure we do not delete a Frame we already have loaded within the target region, so move them to the back of the LRU
-                if target_loaded_count:
-                    # update LRU position to ensure we do not delete in target
-                    for label in target_labels[target_loaded]: # update LRU position
-                        self._last_accessed[label] = self._last_accessed.pop(label, None)
-                    labels_to_read = target_labels[~target_loaded]
-                else: # no targets are loaded
-                    labels_to_read = target_labels
-
-            else: # loaded_needed > max_persist:
-                # Need to load more than max_persist, so limit to last max_persist-length components. All other Frame, if loaded, will be deleted
-                # assert max_persist < len(target_labels)
-                target_labels = target_labels[-max_persist:] # type: ignore # pylint: disable=E1130
-                target_values = target_values[-max_persist:] # type: ignore # pylint: disable=E1130
-                target_loaded = target_loaded[-max_persist:] # type: ignore # pylint: disable=E1130
-
-                if target_loaded.any():
-                    # update LRU position to ensure we do not delete in target
-                    for label in target_labels[target_loaded]:
-                        self._last_accessed[label] = self._last_accessed.pop(label, None)
-                    labels_to_read = target_labels[~target_loaded]
-                else:
-                    # no targets are loaded, will only load a subset of targets of size equal to max_persist; can unpersist everything else
-                    labels_to_read = target_labels
+            # Need to select more than max_persist, so limit to last max_persist-length components.
+            target_labels = target_labels[-max_persist:] # pylint: disable=E1130
+            target_values = target_values[-max_persist:] # pylint: disable=E1130
+            target_loaded = target_loaded[-max_persist:] # pylint: disable=E1130
 
-                    array[self._loaded] = FrameDeferred
-                    self._loaded[NULL_SLICE] = False
-                    self._last_accessed.clear()
+            if target_loaded.any():
+                labels_to_read = target_labels[~target_loaded]
+            else:
+                # no targets are loaded, will only load a subset of targets of size equal to max_persist; can unpersist everything else that is not pinned
+                labels_to_read = target_labels
+                while self._evict(()):
+                    pass
+                loaded_count = self._loaded.sum()
 
             store_reader = self._store.read_many(labels_to_read, config=self._config)
             targets_items = zip(target_labels, target_values)
 
-        # Iterate over items that have been selected; there must be at least 1 FrameDeferred among this selection. Note that we iterate over all Frame in the target, not just those form the store, as we need to update LRU positions for all values in the target
+        if policy is not None:
+            protected: tp.Set[TLabel] = ({target_labels} # type: ignore
+                    if key_is_element else set(target_labels))
+
+        # Iterate over items that have been selected; there must be at least 1 FrameDeferred among this selection. Note that we iterate over all Frame in the target, not just those form the store, as we need to record access for all values in the target
         for label, frame in targets_items: # pyright: ignore
             idx = index._loc_to_iloc(label)
 
-            if frame is FrameDeferred:
-                frame = next(store_reader)
+            if frame is FrameDeferred or not self._loaded[idx]:
+                if frame is FrameDeferred:
+                    frame = next(store_reader)
+                    if policy is not None:
+                        policy._load(label, frame.nbytes)
+                else: # evicted earlier in this iteration; restore
+                    policy._restore(label, frame.nbytes) # type: ignore
                 array[idx] = frame
                 self._loaded[idx] = True # update loaded status
                 if max_persist_active:
                     loaded_count += 1
-
-            if max_persist_active: # update LRU position
-                self._last_accessed[label] = self._last_accessed.pop(label, None)
-
-                if loaded_count > max_persist: # pyright: ignore
-                    label_remove = next(iter(self._last_accessed))
-                    del self._last_accessed[label_remove]
-                    idx_remove = index._loc_to_iloc(label_remove)
-                    self._loaded[idx_remove] = False
-                    array[idx_remove] = FrameDeferred
-                    loaded_count -= 1
-
-
+                    # if max_persist is 1, only the last Frame of the target is retained
+                    if (loaded_count > max_persist # pyright: ignore
+                            and self._evict((label,) if max_persist == 1 else protected)):
+                        loaded_count -= 1
+            elif policy is not None:
+                policy._access(label)
+
+        if max_persist_bytes is not None and policy is not None:
+            # evict until under budget, never evicting from the target
+            while policy.nbytes > max_persist_bytes and self._evict(protected):
+                pass
+            if not key_is_element:
+                # as with max_persist, if the target exceeds max_persist_bytes, limit to the trailing components that fit, always retaining the last
+                for label in target_labels[:-1]:
+                    if policy.nbytes <= max_persist_bytes:
+                        break
+                    protected.discard(label)
+                    while policy.nbytes > max_persist_bytes and self._evict(protected):
+                        pass
 
         self._loaded_all = self._loaded.all()
 
+    def _evict(self, protected: tp.Container[TLabel]) -> bool:
+        '''
+        Replace the :obj:`Frame` selected by the persist policy with ``FrameDeferred``, never selecting a label in ``protected``. Returns False if no :obj:`Frame` can be evicted.
+        '''
+        label = self._persist_policy._evict(protected) # type: ignore
+        if label is None:
+            return False
+        idx = self._index._loc_to_iloc(label)
+        self._loaded[idx] = False
+        self._values_mutable[idx] = FrameDeferred
+        return True
+
     def unpersist(self) -> None:
         '''Replace all loaded :obj:`Frame` with :obj:`FrameDeferred`.
         '''
@@ -896,8 +1079,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         self._loaded[NULL_SLICE] = False
         self._loaded_all = False
 
-        if self._max_persist is not None:
-            self._last_accessed.clear()
+        if self._persist_policy is not None:
+            self._persist_policy._clear()
 
     #---------------------------------------------------------------------------
     # extraction
@@ -922,6 +1105,8 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 store=self._store,
                 config=self._config,
                 max_persist=self._max_persist,
+                max_persist_bytes=self._max_persist_bytes,
+                persist_policy=self._persist_policy_derive(),
                 own_index=True,
                 own_data=False, # force immutable copy
                 )
@@ -949,6 +1134,83 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
     def _drop_loc(self, key: TLocSelector) -> tp.Self:
         return self._drop_iloc(self._index._loc_to_iloc(key))
 
+    #---------------------------------------------------------------------------
+    # prefetching
+
+    def _iter_frames_prefetch(self, depth: int) -> TIterFrame:
+        '''
+        Yield all :obj:`Frame` in order, loading one at a time while a background thread reads, with ``Store.read_many``, the next ``depth`` deferred :obj:`Frame`. Prefetched :obj:`Frame` are held outside of the :obj:`Bus` until consumed, but count against ``max_persist`` and ``max_persist_bytes``: loaded :obj:`Frame` are evicted to make room for them, and fewer :obj:`Frame` are prefetched when the budget is exhausted. As each is consumed, ``max_persist``, ``max_persist_bytes`` and the persist policy are applied as when loading from the Store.
+        '''
+        store: Store = self._store # type: ignore
+        config = self._config
+        count = self.__len__()
+        max_persist = self._max_persist
+        max_persist_bytes = self._max_persist_bytes
+        policy: PersistPolicy = self._persist_policy # type: ignore
+
+        def read(positions: tp.List[int], labels: tp.List[TLabel]) -> tp.Dict[int, TFrameAny]:
+            return dict(zip(positions, store.read_many(labels, config=config)))
+
+        pos_next = 0 # next position to consider for prefetching
+        prefetched: tp.Dict[int, TFrameAny] = {}
+        prefetched_nbytes = 0
+
+        def submit(executor: ThreadPoolExecutor) -> tp.Optional[Future[tp.Dict[int, TFrameAny]]]:
+            nonlocal pos_next
+            limit = depth
+            if max_persist is not None:
+                # retain room for the Frame to be yielded next
+                limit = min(limit, max_persist - 1 - len(prefetched))
+            if max_persist_bytes is not None and prefetched_nbytes >= max_persist_bytes:
+                limit = 0
+
+            positions: tp.List[int] = []
+            while pos_next < count and len(positions) < limit:
+                if not self._loaded[pos_next]:
+                    positions.append(pos_next)
+                pos_next += 1
+            if not positions:
+                return None
+
+            if max_persist is not None:
+                loaded_count = self._loaded.sum()
+                while (loaded_count + len(prefetched) + len(positions) > max_persist
+                        and self._evict(())):
+                    loaded_count -= 1
+            # labels are selected in this thread; for an IndexHierarchy, iteration provides tuples
+            labels = list(self._index[positions])
+            return executor.submit(read, positions, labels)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = submit(executor)
+            for i in range(count):
+                if i not in prefetched and future is not None and not self._loaded[i]:
+                    frames = future.result()
+                    prefetched.update(frames)
+                    if max_persist_bytes is not None:
+                        prefetched_nbytes += sum(f.nbytes for f in frames.values())
+                        while (policy.nbytes + prefetched_nbytes > max_persist_bytes
+                                and self._evict(())):
+                            pass
+                    future = None
+                if future is None and pos_next < count:
+                    future = submit(executor) # read next while consuming these
+
+                frame = prefetched.pop(i, None)
+                if frame is not None and max_persist_bytes is not None:
+                    prefetched_nbytes -= frame.nbytes
+                # if not prefetched, a Frame evicted after being scheduled will be read here
+                self._update_values_mutable_iloc(key=i, frame_prefetched=frame)
+                yield self._values_mutable[i]
+
+    def _prefetch_depth(self) -> int:
+        '''
+        Return the prefetch depth if prefetching applies to iteration, else 0.
+        '''
+        if self._loaded_all or self._store is None:
+            return 0
+        return self._config.default.read_prefetch
+
     #---------------------------------------------------------------------------
     # axis functions
 
@@ -962,11 +1224,13 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             ) -> tp.Iterator[tp.Any]:
         if self._loaded_all:
             yield from self._values_mutable
-        elif self._max_persist is None: # load all at once if possible
+        elif depth := self._prefetch_depth():
+            yield from self._iter_frames_prefetch(depth)
+        elif self._max_persist is None and self._max_persist_bytes is None: # load all at once if possible
             if not self._loaded_all:
                 self._update_values_mutable_iloc(key=NULL_SLICE)
             yield from self._values_mutable
-        elif self._max_persist > 1:
+        elif self._max_persist is not None and self._max_persist > 1:
             i = 0
             i_max = len(self._index.values)
             while i < i_max:
@@ -976,7 +1240,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 for j in range(key.start, key.stop):
                     yield self._values_mutable[j]
                 i += self._max_persist
-        else: # max_persist is 1
+        else: # max_persist is 1, or only max_persist_bytes is set
             for i in range(self.__len__()):
                 self._update_values_mutable_iloc(key=i)
                 yield self._values_mutable[i]
@@ -989,11 +1253,13 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         '''
         if self._loaded_all:
             yield from zip(self._index, self._values_mutable)
-        elif self._max_persist is None: # load all at once if possible
+        elif depth := self._prefetch_depth():
+            yield from zip(self._index, self._iter_frames_prefetch(depth))
+        elif self._max_persist is None and self._max_persist_bytes is None: # load all at once if possible
             if not self._loaded_all:
                 self._update_values_mutable_iloc(key=NULL_SLICE)
             yield from zip(self._index, self._values_mutable)
-        elif self._max_persist > 1:
+        elif self._max_persist is not None and self._max_persist > 1:
             # if _max_persist is greater than 1, load as many Frame as possible (up to the max persist) at a time; this optimizes read operations from the Store
             labels = self._index.values
             i = 0
@@ -1004,7 +1270,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 self._update_values_mutable_iloc(key=key)
                 yield from zip(labels_select, self._values_mutable[key])
                 i += self._max_persist
-        else: # max_persist is 1
+        else: # max_persist is 1, or only max_persist_bytes is set
             for i, label in enumerate(self._index.values):
                 self._update_values_mutable_iloc(key=i)
                 yield label, self._values_mutable[i]
@@ -1022,7 +1288,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
             post.flags.writeable = False
             return post
 
-        if self._max_persist is None: # load all at once if possible
+        if self._max_persist is None and self._max_persist_bytes is None: # load all at once if possible
             # b._loaded_all must be False
             self._update_values_mutable_iloc(key=NULL_SLICE)
             post = self._values_mutable.copy()
@@ -1032,7 +1298,10 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         # return a new array; force new iteration to account for max_persist
         post = np.empty(self.__len__(), dtype=object)
 
-        if self._max_persist > 1:
+        if depth := self._prefetch_depth():
+            for i, f in enumerate(self._iter_frames_prefetch(depth)):
+                post[i] = f
+        elif self._max_persist is not None and self._max_persist > 1:
             i = 0
             i_max = len(self._index.values)
             while i < i_max:
@@ -1041,7 +1310,7 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
                 self._update_values_mutable_iloc(key=key)
                 post[key] = self._values_mutable[key]
                 i += self._max_persist
-        else: # max_persist is 1
+        else: # max_persist is 1, or only max_persist_bytes is set
             for i in range(self.__len__()):
                 self._update_values_mutable_iloc(key=i)
                 post[i] = self._values_mutable[i]
@@ -1110,12 +1379,20 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
 
     @property
     def shapes(self) -> TSeriesObject:
-        '''A :obj:`Series` describing the shape of each loaded :obj:`Frame`. Unloaded :obj:`Frame` will have a shape of None.
+        '''A :obj:`Series` describing the shape of each loaded :obj:`Frame`. Unloaded :obj:`Frame` will have a shape of None, unless the :obj:`Store` has a manifest (see ``StoreConfig.write_manifest``), in which case the shape of the stored :obj:`Frame` is provided without loading.
 
         Returns:
             :obj:`Series`
         '''
-        values = (f.shape if f is not FrameDeferred else None for f in self._values_mutable)
+        label_to_shape = None
+        if self._store is not None and not self._loaded_all:
+            label_to_shape = self._store._label_to_shape(self._config)
+
+        if label_to_shape is None:
+            values = (f.shape if f is not FrameDeferred else None for f in self._values_mutable)
+        else:
+            values = (f.shape if f is not FrameDeferred else label_to_shape.get(label)
+                    for label, f in zip(self._index, self._values_mutable))
         return Series(values, index=self._index, dtype=DTYPE_OBJECT, name='shape')
 
     @property
@@ -1124,6 +1401,12 @@ class Bus(ContainerBase, StoreClientMixin, tp.Generic[TVIndex]): # not a Contain
         '''
         return sum(f.nbytes if f is not FrameDeferred else 0 for f in self._values_mutable)
 
+    @property
+    def persist_policy(self) -> tp.Optional[PersistPolicy]:
+        '''The :obj:`PersistPolicy` selecting which loaded :obj:`Frame` are replaced with ``FrameDeferred``, providing counters of hits, misses, and evictions; None if neither ``max_persist``, ``max_persist_bytes``, nor ``persist_policy`` were provided.
+        '''
+        return self._persist_policy
+
     @property
     def status(self) -> TFrameAny:
         '''
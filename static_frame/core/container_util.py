@@ -27,6 +27,8 @@ from static_frame.core.rank import rank_1d
 from static_frame.core.util import BOOL_TYPES
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_STR
 from static_frame.core.util import DTYPE_STR_KINDS
@@ -1159,6 +1161,45 @@ def array_from_value_iter(
                 )
     return values
 
+# Python types that, if all elements of a sequence are of that type, can be converted to an array of the corresponding dtype without element-wise evaluation
+_TYPE_TO_DTYPE: tp.Dict[type, TDtypeAny] = {
+        int: DTYPE_INT_DEFAULT,
+        float: DTYPE_FLOAT_DEFAULT,
+        bool: DTYPE_BOOL,
+        str: DTYPE_STR,
+        }
+
+def array_from_sequence(
+        values: tp.Sequence[tp.Any],
+        dtype: TDtypeSpecifier = None,
+        ) -> TNDArrayAny:
+    '''
+    Return an immutable array from a sequence of values, as from a column of rows. If ``dtype`` is not provided, the types of the elements are collected once for all values: if all are of the same Python type, the array is created directly with the corresponding dtype; otherwise, element-wise type evaluation is used.
+
+    Args:
+        dtype: A dtype specifier; if conversion to this dtype fails, the dtype will be evaluated from the values.
+    '''
+    array: tp.Optional[TNDArrayAny] = None
+    if dtype is None:
+        types = set(map(type, values))
+        dtype_found = _TYPE_TO_DTYPE.get(types.pop()) if len(types) == 1 else None
+        if dtype_found is not None:
+            try:
+                array = np.array(values, dtype=dtype_found)
+            except OverflowError: # an integer too large for int64
+                pass
+    else:
+        try:
+            array = np.array(values, dtype=dtype)
+        except (ValueError, TypeError, OverflowError):
+            # the dtype may not be compatible, as in ValueError: cannot convert float NaN to integer
+            pass
+    if array is None:
+        array, _ = iterable_to_array_1d(values, dtype=dtype)
+    else:
+        array.flags.writeable = False
+    return array
+
 #-------------------------------------------------------------------------------
 # utilities for binary operator applications with type blocks
 
@@ -39,6 +39,12 @@ INDEX_CONSTRUCTOR = 'index_constructor: Optional class or constructor function t
 
 MAX_PERSIST = 'max_persist: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum number of :obj:`Frame` to remain in the :obj:`Bus`, regardless of the size of the :obj:`Bus`. If more than ``max_persist`` number of :obj:`Frame` are loaded, least-recently loaded :obj:`Frame` will be replaced by ``FrameDeferred``. A ``max_persist`` of 1, for example, permits reading one :obj:`Frame` at a time without ever holding in memory more than 1 :obj:`Frame`.'
 
+MAX_PERSIST_BYTES = 'max_persist_bytes: When loading :obj:`Frame` from a :obj:`Store`, optionally define the maximum number of bytes (as reported by :obj:`Frame.nbytes`) of loaded :obj:`Frame` to remain in the :obj:`Bus`. If loading a :obj:`Frame` exceeds this budget, least-recently used :obj:`Frame` will be replaced by ``FrameDeferred`` until the budget is met. Other :obj:`Frame` are replaced before those of the current selection; if the selection alone exceeds the budget, only its trailing :obj:`Frame` that fit (always at least the last) are retained. Can be used with or without ``max_persist``.'
+
+PERSIST_POLICY = 'persist_policy: Optionally provide a :obj:`PersistPolicy` instance, such as :obj:`PersistPolicyLRU`, :obj:`PersistPolicyLFU`, or :obj:`PersistPolicy2Q`, to select which loaded :obj:`Frame` are replaced when ``max_persist`` or ``max_persist_bytes`` are exceeded, and to record hits, misses, and evictions. If not provided, least-recently used :obj:`Frame` are replaced.'
+
+MAX_CONCURRENCY = 'max_concurrency: The maximum number of :obj:`Frame` read concurrently, each in a thread of the event loop\'s default executor.'
+
 MAX_WORKERS = 'max_workers: Number of parallel executors, as passed to the Thread- or ProcessPoolExecutor; ``None`` defaults to the max number of machine processes.'
 
 NAME = 'name: A hashable object to label the container.'
@@ -51,6 +57,8 @@ OWN_INDEX = '''own_index: Flag the passed index as ownable by this :obj:`static_
 
 RETAIN_LABELS = 'retain_labels: Boolean to determine if, along the axis of virtual concatentation, if component :obj:`Frame` labels should be used to form the outer depth of an :obj:`IndexHierarchy`. This is required to be ``True`` if component :obj:`Frame` labels are not globally unique along the axis of concatenation.'
 
+SHARED_MEMORY = 'shared_memory: When using the ProcessPoolExecutor, return :obj:`Frame` from worker processes in shared memory rather than by pickling their arrays; the resulting :obj:`Frame` are immutable views of shared memory, released when no longer referenced. :obj:`Frame` with object arrays are pickled.'
+
 STORE = 'store: A :obj:`Store` subclass.'
 
 STORE_CONFIG_MAP = 'config: A :obj:`StoreConfig`, or a mapping of label ot :obj:`StoreConfig`'
@@ -128,6 +136,7 @@ class DOC_TEMPLATE:
             max_workers=MAX_WORKERS,
             chunksize=CHUNKSIZE,
             use_threads=USE_THREADS,
+            shared_memory=SHARED_MEMORY,
             )
 
     argminmax = dict(
@@ -148,6 +157,7 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {SHARED_MEMORY}
             '''
             )
 
@@ -159,6 +169,7 @@ class DOC_TEMPLATE:
             {MAX_WORKERS}
             {CHUNKSIZE}
             {USE_THREADS}
+            {SHARED_MEMORY}
             '''
             )
 
@@ -168,6 +179,20 @@ class DOC_TEMPLATE:
             {FP}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PERSIST_POLICY}
+            '''
+            )
+
+    bus_constructor_async = dict(
+            args = f'''
+        Args:
+            {FP}
+            {STORE_CONFIG_MAP}
+            {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PERSIST_POLICY}
+            {MAX_CONCURRENCY}
             '''
             )
 
@@ -177,6 +202,8 @@ class DOC_TEMPLATE:
             {STORE}
             {STORE_CONFIG_MAP}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PERSIST_POLICY}
             '''
             )
 
@@ -334,6 +361,8 @@ class DOC_TEMPLATE:
             {RETAIN_LABELS}
             {DEEPCOPY_FROM_BUS}
             {MAX_PERSIST}
+            {MAX_PERSIST_BYTES}
+            {PERSIST_POLICY}
             '''
             )
 
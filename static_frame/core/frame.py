@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import csv
 import json
+import locale
+import mmap
+import os
 import pickle
 import sqlite3
 from collections import deque
@@ -12,6 +15,7 @@ from functools import partial
 from io import BytesIO
 from io import StringIO
 from itertools import chain
+from itertools import islice
 from itertools import product
 from itertools import zip_longest
 from operator import itemgetter
@@ -29,6 +33,7 @@ from arraykit import resolve_dtype_iter
 from arraykit import split_after_count
 from numpy.ma import MaskedArray
 
+from static_frame.core.archive_npy import NPYFrameChunkedConverter
 from static_frame.core.archive_npy import NPYFrameConverter
 from static_frame.core.archive_npy import NPZFrameConverter
 from static_frame.core.assign import Assign
@@ -37,6 +42,7 @@ from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import ContainerMap
 from static_frame.core.container_util import MessagePackElement
 from static_frame.core.container_util import apex_to_name
+from static_frame.core.container_util import array_from_sequence
 from static_frame.core.container_util import array_from_value_iter
 from static_frame.core.container_util import axis_window_items
 from static_frame.core.container_util import bloc_key_normalize
@@ -138,6 +144,7 @@ from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_NA_KINDS
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import DTYPE_STR_KINDS
 from static_frame.core.util import DTYPE_TIMEDELTA_KIND
 from static_frame.core.util import EMPTY_ARRAY
 from static_frame.core.util import FILL_VALUE_DEFAULT
@@ -186,7 +193,9 @@ from static_frame.core.util import TUFunc
 from static_frame.core.util import WarningsSilent
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_2d
+from static_frame.core.util import array_dictionary_encode
 from static_frame.core.util import array_to_duplicated
+from static_frame.core.util import array_widen
 from static_frame.core.util import blocks_to_array_2d
 from static_frame.core.util import concat_resolved
 from static_frame.core.util import dtype_from_element
@@ -194,6 +203,7 @@ from static_frame.core.util import dtype_kind_to_na
 from static_frame.core.util import dtype_to_fill_value
 from static_frame.core.util import file_like_manager
 from static_frame.core.util import full_for_fill
+from static_frame.core.util import get_concurrent_executor
 from static_frame.core.util import get_tuple_constructor
 from static_frame.core.util import iloc_to_insertion_iloc
 from static_frame.core.util import is_callable_or_mapping
@@ -215,6 +225,7 @@ if tp.TYPE_CHECKING:
     from xarray import Dataset  # pragma: no cover
 
     from static_frame.core.reduce import ReduceDispatchAligned  # pylint: disable=W0611,C0412 #pragma: no cover
+    from static_frame.core.row_filter import RowFilter  # pylint: disable=W0611,C0412 #pragma: no cover
 
     TNDArrayAny = np.ndarray[tp.Any, tp.Any] #pragma: no cover
     TDtypeAny = np.dtype[tp.Any] #pragma: no cover
@@ -1803,6 +1814,93 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             {consolidate_blocks}
             parameters: Provide a list of values for an SQL query expecting parameter substitution.
         '''
+        frames = cls._from_sql_chunks(query,
+                connection=connection,
+                chunksize=None,
+                index_depth=index_depth,
+                index_constructors=index_constructors,
+                columns_depth=columns_depth,
+                columns_select=columns_select,
+                columns_constructors=columns_constructors,
+                dtypes=dtypes,
+                name=name,
+                consolidate_blocks=consolidate_blocks,
+                parameters=parameters,
+                )
+        try:
+            return next(frames)
+        finally:
+            frames.close()
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_sql_iter(cls,
+            query: str,
+            *,
+            connection: sqlite3.Connection,
+            chunksize: int = 100_000,
+            index_depth: int = 0,
+            index_constructors: TIndexCtorSpecifiers = None,
+            columns_depth: int = 1,
+            columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            dtypes: TDtypesSpecifier = None,
+            consolidate_blocks: bool = False,
+            parameters: tp.Any = (),
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Return an iterator of :obj:`Frame`, each of at most ``chunksize`` rows, from an SQL query and a database connection object. Rows are fetched from the cursor with ``fetchmany()``, such that only one chunk of rows is held in memory at a time. Each :obj:`Frame` is named by its integer position in the iterator; if ``index_depth`` is zero, rows are labelled by their integer position in the results of the query.
+
+        Each :obj:`Frame` takes the dtypes of prior :obj:`Frame` where values can be represented without loss; otherwise, dtypes widen (e.g., from integer to float, or from integer or string to object) for that and all subsequent :obj:`Frame`; a field of only NULL values takes a prior float or datetime dtype, and widens a prior integer to float. As :obj:`Frame` already yielded are not changed, dtypes of a field may differ between earlier and later :obj:`Frame` (e.g., ``int64`` in the first :obj:`Frame` and ``object`` in those that follow); provide ``dtypes`` for the same dtypes in all :obj:`Frame`. To process chunks lazily as a :obj:`Bus` or :obj:`Quilt`, provide the iterator to ``Batch.from_frames()`` and write it to a :obj:`Store` (e.g. with ``Batch.to_zip_npy()``, providing a ``StoreConfig`` with a ``label_encoder`` and ``label_decoder`` for integer labels); then read that :obj:`Store` with ``Bus.from_zip_npy()`` or ``Quilt.from_zip_npy()`` and ``max_persist``.
+
+        Args:
+            query: A query string.
+            connection: A DBAPI2 (PEP 249) Connection object, such as those returned from SQLite (via the sqlite3 module) or PyODBC.
+            chunksize: The maximum number of rows in each :obj:`Frame`.
+            {dtypes}
+            index_depth:
+            index_constructors:
+            columns_depth:
+            columns_select: An optional iterable of field names to extract from the results of the query.
+            columns_constructors:
+            {consolidate_blocks}
+            parameters: Provide a list of values for an SQL query expecting parameter substitution.
+        '''
+        if chunksize < 1:
+            raise ErrorInitFrame('chunksize must be greater than zero.')
+        return cls._from_sql_chunks(query,
+                connection=connection,
+                chunksize=chunksize,
+                index_depth=index_depth,
+                index_constructors=index_constructors,
+                columns_depth=columns_depth,
+                columns_select=columns_select,
+                columns_constructors=columns_constructors,
+                dtypes=dtypes,
+                name=None,
+                consolidate_blocks=consolidate_blocks,
+                parameters=parameters,
+                )
+
+    @classmethod
+    def _from_sql_chunks(cls,
+            query: str,
+            *,
+            connection: sqlite3.Connection,
+            chunksize: tp.Optional[int],
+            index_depth: int,
+            index_constructors: TIndexCtorSpecifiers,
+            columns_depth: int,
+            columns_select: tp.Iterable[str | tp.Tuple[str, ...]] | None,
+            columns_constructors: TIndexCtorSpecifiers,
+            dtypes: TDtypesSpecifier,
+            name: TLabel,
+            consolidate_blocks: bool,
+            parameters: tp.Any,
+            ) -> tp.Generator[tp.Self, None, None]:
+        '''
+        Generator of :obj:`Frame` from an SQL query. If ``chunksize`` is None, a single :obj:`Frame` of all rows (possibly empty) is yielded; otherwise, :obj:`Frame` of at most ``chunksize`` rows, named by integer position, are yielded until the cursor is exhausted.
+        '''
         columns: tp.Optional[IndexBase] = None
         own_columns = False
 
@@ -1856,79 +1954,124 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                     selector_reduces = len(iloc_sel) == 1 # pyright: ignore
                     columns = columns.iloc[iloc_sel] # type: ignore
 
-            # NOTE: cannot own_index as we defer calling the constructor until after call Frame
-            # map dtypes in context of pre-index extraction
-            if index_depth > 0:
-                get_col_dtype = None if dtypes is None else get_col_dtype_factory(
-                        dtypes,
-                        [col for (col, *_) in cursor.description],
-                        )
+            fields = [col for (col, *_) in cursor.description]
+
+            def rows_to_frame(
+                    constructor: tp.Type[tp.Self],
+                    rows: tp.Iterable[tp.Sequence[tp.Any]],
+                    dtypes: TDtypesSpecifier,
+                    name: TLabel,
+                    own_columns: bool,
+                    start: tp.Optional[int] = None,
+                    dtypes_prior: tp.Optional[tp.List[TDtypeAny]] = None,
+                    ) -> tp.Self:
+                # transpose rows into columns once, such that each array is created from a sequence of values and the dtype of each is determined only once
+                values: tp.Sequence[tp.Sequence[tp.Any]] = list(zip(*rows))
+                if not values:
+                    values = [()] * len(fields)
+
+                # NOTE: dtypes are mapped to index arrays in the context of all fields, and to other arrays in the context of columns
+                get_col_dtype = None
+                if index_depth > 0 and dtypes is not None:
+                    get_col_dtype = get_col_dtype_factory(dtypes, fields)
+
+                def widen(pos: int, array: TNDArrayAny) -> TNDArrayAny:
+                    # widen array to the dtype of the same field in prior chunks, and record the (possibly widened) dtype for subsequent chunks
+                    if dtypes_prior is None:
+                        return array
+                    if pos == len(dtypes_prior):
+                        dtypes_prior.append(array.dtype)
+                        return array
+                    array = array_widen(array, dtypes_prior[pos])
+                    dtypes_prior[pos] = array.dtype
+                    return array
+
+                arrays_index = [widen(i, array_from_sequence(values[i],
+                        None if get_col_dtype is None else get_col_dtype(i)))
+                        for i in range(index_depth)]
+
+                values_columns = values[index_depth:]
+                if columns_select:
+                    values_columns = filter_row(values_columns)
 
-            index_constructor: TIndexCtorSpecifier
-            row_gen: tp.Callable[..., tp.Iterator[tp.Sequence[tp.Any]]] # pyright: ignore
-
-            if index_depth == 0:
-                index = None
-                row_gen = lambda: cursor
-                index_constructor = None
-            elif index_depth == 1:
-                index = [] # lazily populate
-                default_constructor: tp.Type[Index] = partial(Index, dtype=get_col_dtype(0)) if get_col_dtype else Index # type: ignore
-                # parital to include everything but values
-                index_constructor = constructor_from_optional_constructors(
-                        depth=index_depth,
-                        default_constructor=default_constructor,
-                        explicit_constructors=index_constructors,
-                        )
-                def row_gen() -> tp.Iterator[tp.Sequence[tp.Any]]:
-                    for row in cursor:
-                        index.append(row[0])
-                        yield row[1:]
-            else: # > 1
-                index = [list() for _ in range(index_depth)]
-
-                def default_constructor(
-                        iterables: tp.Iterable[tp.Iterable[TLabel]],
-                        index_constructors: TIndexCtorSpecifiers,
-                        ) -> IndexHierarchy: #pylint: disable=function-redefined
-                    if get_col_dtype:
-                        blocks = [iterable_to_array_1d(it, get_col_dtype(i))[0]
-                                for i, it in enumerate(iterables)]
-                    else:
-                        blocks = [iterable_to_array_1d(it)[0] for it in iterables]
-                    return IndexHierarchy._from_type_blocks(
-                            TypeBlocks.from_blocks(blocks),
-                            index_constructors=index_constructors,
-                            own_blocks=True,
+                get_col_dtype_columns = None if dtypes is None else get_col_dtype_factory(dtypes, columns)
+
+                def blocks() -> tp.Iterator[TNDArrayAny]:
+                    for i, v in enumerate(values_columns, index_depth):
+                        yield widen(i, array_from_sequence(v,
+                                None if get_col_dtype_columns is None else get_col_dtype_columns(i - index_depth)))
+
+                block_gen: tp.Callable[..., tp.Iterator[TNDArrayAny]]
+                if consolidate_blocks:
+                    block_gen = lambda: TypeBlocks.consolidate_blocks(blocks())
+                else:
+                    block_gen = blocks
+
+                index: tp.Any
+                index_constructor: TIndexCtorSpecifier
+
+                if index_depth == 0:
+                    # if given a start, label rows by their position in the query
+                    index = None if start is None else range(start, start + len(values[0]))
+                    index_constructor = None
+                elif index_depth == 1:
+                    index = arrays_index[0]
+                    # parital to include everything but values
+                    index_constructor = constructor_from_optional_constructors(
+                            depth=index_depth,
+                            default_constructor=Index,
+                            explicit_constructors=index_constructors,
+                            )
+                else: # > 1
+                    index = arrays_index
+
+                    def default_constructor(
+                            iterables: tp.Iterable[TNDArrayAny],
+                            index_constructors: TIndexCtorSpecifiers,
+                            ) -> IndexHierarchy:
+                        return IndexHierarchy._from_type_blocks(
+                                TypeBlocks.from_blocks(iterables),
+                                index_constructors=index_constructors,
+                                own_blocks=True,
+                                )
+                    # parital to include everything but values
+                    index_constructor = constructor_from_optional_constructors(
+                            depth=index_depth,
+                            default_constructor=default_constructor,
+                            explicit_constructors=index_constructors,
                             )
-                # parital to include everything but values
-                index_constructor = constructor_from_optional_constructors(
-                        depth=index_depth,
-                        default_constructor=default_constructor,
-                        explicit_constructors=index_constructors,
-                        )
 
-                def row_gen() -> tp.Iterator[tp.Sequence[tp.Any]]:
-                    for row in cursor:
-                        for i, label in enumerate(row[:index_depth]):
-                            index[i].append(label)
-                        yield row[index_depth:]
+                # NOTE: cannot own_index as the index constructor is called by Frame
+                return constructor(TypeBlocks.from_blocks(block_gen()),
+                        index=index,
+                        columns=columns,
+                        name=name,
+                        own_data=True,
+                        index_constructor=index_constructor,
+                        own_columns=own_columns,
+                        )
 
-            if columns_select:
-                row_gen_final = (filter_row(row) for row in row_gen())
-            else:
-                row_gen_final = row_gen() # type: ignore
+            if chunksize is None:
+                yield rows_to_frame(cls, cursor, dtypes, name, own_columns)
+                return
 
-            return cls.from_records(
-                    row_gen_final,
-                    columns=columns,
-                    index=index,
-                    dtypes=dtypes,
-                    name=name,
-                    own_columns=own_columns,
-                    index_constructor=index_constructor,
-                    consolidate_blocks=consolidate_blocks,
-                    )
+            count = 0
+            start = 0
+            dtypes_prior: tp.List[TDtypeAny] = []
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield rows_to_frame(cls,
+                        rows,
+                        dtypes,
+                        count,
+                        own_columns and not count,
+                        start,
+                        dtypes_prior,
+                        )
+                count += 1
+                start += len(rows)
         finally:
             if cursor:
                 cursor.close()
@@ -2171,6 +2314,247 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
 
 
     #---------------------------------------------------------------------------
+    def _widen_to_prior(self,
+            dtypes_prior: tp.List[TDtypeAny],
+            consolidate_blocks: bool,
+            ) -> tp.Self:
+        '''
+        Widen the columns of this delimited chunk to the dtypes, by position, of prior chunks, updating ``dtypes_prior`` in place. A column of only empty strings is taken as missing values.
+        '''
+        arrays = []
+        widened = False
+        for i, array in enumerate(self._blocks.axis_values(0)):
+            dtype = dtypes_prior[i]
+            post = array
+            if (array.dtype.kind in DTYPE_STR_KINDS
+                    and dtype.kind not in DTYPE_STR_KINDS
+                    and (array == array.dtype.type()).all()
+                    ):
+                post = np.full(len(array), None, dtype=DTYPE_OBJECT)
+                post.flags.writeable = False
+            post = array_widen(post, dtype)
+            dtypes_prior[i] = post.dtype
+            widened |= post is not array
+            arrays.append(post)
+
+        if not widened:
+            return self
+        return self.__class__(
+                TypeBlocks.from_blocks(TypeBlocks.consolidate_blocks(arrays)
+                        if consolidate_blocks else arrays),
+                index=self.index,
+                columns=self.columns,
+                name=self.name,
+                own_data=True,
+                own_index=True,
+                own_columns=True,
+                )
+
+    @staticmethod
+    def _delimited_lines(
+            fp: TPathSpecifierOrTextIOOrIterator,
+            *,
+            encoding: tp.Optional[str],
+            skip_footer: int,
+            ) -> tp.Generator[str, None, None]:
+        '''
+        Return an iterator of lines from a file path or a file-like object, excluding the trailing ``skip_footer`` lines.
+        '''
+        fpf = path_filter(fp) # normalize Path to strings
+
+        if not skip_footer:
+            if isinstance(fpf, str):
+                with open(fpf, 'r', encoding=encoding) as f:
+                    yield from f
+            else: # iterable of string lines, StringIO
+                yield from fpf
+        else:
+            row_buffer: tp.Deque[str] = deque(maxlen=skip_footer)
+
+            if isinstance(fpf, str):
+                with open(fpf, 'r', encoding=encoding) as f:
+                    for i, row in enumerate(f):
+                        if i >= skip_footer:
+                            yield row_buffer.popleft()
+                        row_buffer.append(row)
+            else:
+                for i, row in enumerate(fpf):
+                    if i >= skip_footer:
+                        yield row_buffer.popleft()
+                    row_buffer.append(row)
+
+    @staticmethod
+    def _delimited_byte_ranges(
+            fp: str,
+            *,
+            skip_lines: int,
+            skip_footer: int,
+            count: int,
+            encoding: tp.Optional[str],
+            quote_char: tp.Optional[str],
+            ) -> tp.Optional[tp.List[tp.Tuple[int, int]]]:
+        '''
+        Divide the lines of a file, after ``skip_lines`` and before the trailing ``skip_footer`` lines, into at most ``count`` ranges of bytes, each starting and ending at a line boundary. Ranges only end where the count of ``quote_char`` from the start is even, such that no range ends within a quoted field. Returns None if the file cannot be divided by newline bytes, or if the skipped lines end within a quoted field.
+        '''
+        encoding = encoding or locale.getpreferredencoding(False)
+        newline = '\n'.encode(encoding)
+        quote = quote_char.encode(encoding) if quote_char else b''
+        if newline != b'\n' or len(quote) > 1:
+            return None # a multi-byte encoding, such as UTF-16
+
+        with open(fp, 'rb') as f:
+            parity = 0
+            for _ in range(skip_lines):
+                line = f.readline()
+                if b'\r' in line.rstrip(b'\r\n'):
+                    return None # lines not terminated by a newline
+                if quote:
+                    parity = (parity + line.count(quote)) % 2
+            if parity:
+                return None # a quoted newline in the header, such that header lines are not records
+            start = f.tell()
+            size = os.fstat(f.fileno()).st_size
+            if start >= size:
+                return []
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = size
+                for _ in range(skip_footer):
+                    if end <= start:
+                        break
+                    pos = mm.rfind(b'\n', start, end - 1)
+                    end = start if pos < 0 else pos + 1
+
+                def count_quotes(a: int, b: int) -> int:
+                    if not quote:
+                        return 0
+                    total = 0
+                    for i in range(a, b, 0x4000000): # count in 64 MB blocks
+                        total += mm[i: min(i + 0x4000000, b)].count(quote)
+                    return total
+
+                ranges = []
+                range_start = start
+                size_target = (end - start) // count + 1
+                while range_start < end:
+                    pos = mm.find(b'\n', min(range_start + size_target, end) - 1, end)
+                    range_end = end if pos < 0 else pos + 1
+                    parity = count_quotes(range_start, range_end) % 2
+                    while parity and range_end < end:
+                        # extend to the next line until outside of a quoted field
+                        pos = mm.find(b'\n', range_end, end)
+                        range_end_next = end if pos < 0 else pos + 1
+                        parity = (parity + count_quotes(range_end, range_end_next)) % 2
+                        range_end = range_end_next
+                    ranges.append((range_start, range_end))
+                    range_start = range_end
+        return ranges
+
+    @staticmethod
+    def _delimited_range_to_arrays(
+            fp: str,
+            start: int,
+            stop: int,
+            encoding: tp.Optional[str],
+            dtypes: TDtypesSpecifier,
+            columns: tp.Optional[IndexBase],
+            index_depth: int,
+            line_select: tp.Optional[tp.Set[int]],
+            kwargs: tp.Dict[str, tp.Any],
+            ) -> tp.List[TNDArrayAny]:
+        '''
+        Parse the lines in a range of bytes of a delimited file. This is called in worker processes.
+        '''
+        with open(fp, 'rb') as f:
+            f.seek(start)
+            data = f.read(stop - start)
+        lines = StringIO(data.decode(encoding or locale.getpreferredencoding(False)), newline=None)
+        get_col_dtype = (None if dtypes is None
+                else get_col_dtype_factory(dtypes, columns, index_depth))
+        return delimited_to_arrays(
+                lines,
+                axis=1,
+                line_select=None if line_select is None else line_select.__contains__,
+                dtypes=get_col_dtype,
+                **kwargs,
+                )
+
+    @classmethod
+    def _delimited_ranges_to_arrays(cls,
+            fp: str,
+            *,
+            ranges: tp.Sequence[tp.Tuple[int, int]],
+            encoding: tp.Optional[str],
+            dtypes: TDtypesSpecifier,
+            columns: tp.Optional[IndexBase],
+            index_depth: int,
+            line_select: tp.Optional[tp.Set[int]],
+            skip_lines: int,
+            skip_footer: int,
+            max_workers: int,
+            mp_context: tp.Optional[str],
+            parse_kwargs: tp.Dict[str, tp.Any],
+            ) -> tp.List[TNDArrayAny]:
+        '''
+        Parse ranges of a delimited file in worker processes and concatenate the arrays of each column. Where the dtypes of a column differ between ranges such that concatenation would not produce the dtype of parsing all lines at once (other than integers and floats, or strings of different sizes), that column is parsed again from all lines.
+        '''
+        pool_executor = get_concurrent_executor(
+                use_threads=False,
+                max_workers=max_workers,
+                mp_context=mp_context,
+                )
+        func = partial(cls._delimited_range_to_arrays,
+                fp,
+                encoding=encoding,
+                dtypes=dtypes,
+                columns=columns,
+                index_depth=index_depth,
+                line_select=line_select,
+                kwargs=parse_kwargs,
+                )
+        with pool_executor() as executor:
+            futures = [executor.submit(func, start, stop) for start, stop in ranges]
+            results = [future.result() for future in futures]
+
+        def parse_all(select: tp.Optional[tp.Set[int]]) -> tp.List[TNDArrayAny]:
+            row_iter = cls._delimited_lines(fp, encoding=encoding, skip_footer=skip_footer)
+            for _ in islice(row_iter, skip_lines):
+                pass
+            get_col_dtype = (None if dtypes is None
+                    else get_col_dtype_factory(dtypes, columns, index_depth))
+            return delimited_to_arrays(
+                    row_iter,
+                    axis=1,
+                    line_select=None if select is None else select.__contains__,
+                    dtypes=get_col_dtype,
+                    **parse_kwargs,
+                    )
+
+        col_count = len(results[0])
+        if any(len(arrays) != col_count for arrays in results):
+            return parse_all(line_select) # ragged lines
+
+        values_arrays: tp.List[TNDArrayAny] = []
+        reparse: tp.List[int] = []
+        for i in range(col_count):
+            parts = [arrays[i] for arrays in results]
+            kinds = {a.dtype.kind for a in parts}
+            if len({a.dtype for a in parts}) == 1 or kinds <= {'i', 'f'} or kinds == {'U'}:
+                array = np.concatenate(parts)
+                array.flags.writeable = False
+                values_arrays.append(array)
+            else:
+                reparse.append(i)
+                values_arrays.append(parts[0]) # replaced below
+
+        if reparse:
+            # map positions of arrays to positions of fields in the file
+            fields = sorted(line_select) if line_select is not None else range(col_count)
+            arrays_reparse = parse_all({fields[i] for i in reparse})
+            for i, array in zip(reparse, arrays_reparse):
+                values_arrays[i] = array
+        return values_arrays
+
     @classmethod
     @doc_inject(selector='constructor_frame')
     def from_delimited(cls,
@@ -2201,6 +2585,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name: TLabel = None,
             consolidate_blocks: bool = False,
             store_filter: tp.Optional[StoreFilter] = None,
+            max_workers: tp.Optional[int] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> tp.Self:
         '''
         Create a :obj:`Frame` from a file path or a file-like object defining a delimited (CSV, TSV) data file.
@@ -2221,6 +2607,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             skip_header: Number of leading lines to skip.
             skip_footer: Number of trailing lines to skip.
             store_filter: A StoreFilter instance, defining translation between unrepresentable strings and types. By default it is disabled, and only empty fields or "NAN" are intepreted as NaN. To force usage, set the type of the column to string.
+            max_workers: If greater than 1 and ``fp`` is a file path, divide the lines of the file into ranges of bytes, each ending outside of a quoted field, and parse each range in a pool of processes. Not used if ``escape_char`` is set, or if the file cannot be divided by newline bytes.
+            mp_context: The multiprocessing context to use with ``max_workers``.
             {dtypes}
             {name}
             {consolidate_blocks}
@@ -2231,32 +2619,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         if skip_header < 0:
             raise ErrorInitFrame('skip_header must be greater than or equal to 0')
 
-        fpf = path_filter(fp) # normalize Path to strings
-
-        if not skip_footer:
-            def file_like() -> tp.Iterator[str]:
-                if isinstance(fpf, str):
-                    with open(fpf, 'r', encoding=encoding) as f:
-                        yield from f
-                else: # iterable of string lines, StringIO
-                    yield from fpf
-        else:
-            def file_like() -> tp.Iterator[str]:
-                row_buffer: tp.Deque[str] = deque(maxlen=skip_footer)
-
-                if isinstance(fpf, str):
-                    with open(fpf, 'r', encoding=encoding) as f:
-                        for i, row in enumerate(f):
-                            if i >= skip_footer:
-                                yield row_buffer.popleft()
-                            row_buffer.append(row)
-                else:
-                    for i, row in enumerate(fpf):
-                        if i >= skip_footer:
-                            yield row_buffer.popleft()
-                        row_buffer.append(row)
-
-        row_iter = file_like()
+        row_iter = cls._delimited_lines(fp, encoding=encoding, skip_footer=skip_footer)
         if skip_header:
             for _ in range(skip_header):
                 next(row_iter)
@@ -2365,6 +2728,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                         )
 
         line_select: tp.Optional[tp.Callable[[int], bool]]
+        positions_select: tp.Optional[tp.Set[int]] = None
+        # NOTE: dtypes are called with positions of all fields, before columns_select is applied
+        columns_all = columns
         if columns_select:
             if index_depth:
                 raise ErrorInitFrame('Cannot use columns_select if index_depth is greater than zero.')
@@ -2375,26 +2741,67 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             else: # assume columns_select are integers
                 columns_included = list(columns_select) # type: ignore
             # order of columns_included maters
-            line_select = set(columns_included).__contains__
+            positions_select = set(map(int, columns_included))
+            line_select = positions_select.__contains__
         else:
             line_select = None
 
         get_col_dtype = (None if dtypes is None
-                else get_col_dtype_factory(dtypes, columns, index_depth))
-        values_arrays: tp.Sequence[TNDArrayAny] = delimited_to_arrays(
-                row_iter,
-                axis=1, # process type per column
-                line_select=line_select,
-                delimiter=delimiter,
-                quoting=quoting,
-                quotechar=quote_char,
-                doublequote=quote_double,
-                escapechar=escape_char,
-                thousandschar=thousands_char,
-                decimalchar=decimal_char,
-                skipinitialspace=skip_initial_space,
-                dtypes=get_col_dtype,
-                )
+                else get_col_dtype_factory(dtypes, columns_all, index_depth))
+        values_arrays: tp.Sequence[TNDArrayAny] | None = None
+        fpf = path_filter(fp)
+        if (max_workers is not None
+                and max_workers > 1
+                and isinstance(fpf, str)
+                and escape_char is None # escaped quotes cannot be found by parity
+                ):
+            ranges = cls._delimited_byte_ranges(fpf,
+                    skip_lines=skip_header + columns_depth,
+                    skip_footer=skip_footer,
+                    count=max_workers,
+                    encoding=encoding,
+                    quote_char=None if quoting == csv.QUOTE_NONE else quote_char,
+                    )
+            if ranges is not None and len(ranges) > 1:
+                row_iter.close()
+                values_arrays = cls._delimited_ranges_to_arrays(fpf,
+                        ranges=ranges,
+                        encoding=encoding,
+                        dtypes=dtypes,
+                        columns=columns_all,
+                        index_depth=index_depth,
+                        line_select=positions_select,
+                        skip_lines=skip_header + columns_depth,
+                        skip_footer=skip_footer,
+                        max_workers=max_workers,
+                        mp_context=mp_context,
+                        parse_kwargs=dict(
+                                delimiter=delimiter,
+                                quoting=quoting,
+                                quotechar=quote_char,
+                                doublequote=quote_double,
+                                escapechar=escape_char,
+                                thousandschar=thousands_char,
+                                decimalchar=decimal_char,
+                                skipinitialspace=skip_initial_space,
+                                ),
+                        )
+
+        if values_arrays is None:
+            values_arrays = delimited_to_arrays(
+                    row_iter,
+                    axis=1, # process type per column
+                    line_select=line_select,
+                    dtypes=get_col_dtype,
+                    delimiter=delimiter,
+                    quoting=quoting,
+                    quotechar=quote_char,
+                    doublequote=quote_double,
+                    escapechar=escape_char,
+                    thousandschar=thousands_char,
+                    decimalchar=decimal_char,
+                    skipinitialspace=skip_initial_space,
+                    )
         if store_filter is not None:
             values_arrays = [store_filter.to_type_filter_array(a)
                     for a in values_arrays]
@@ -2520,6 +2927,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name: TLabel = None,
             consolidate_blocks: bool = False,
             store_filter: tp.Optional[StoreFilter] = None,
+            max_workers: tp.Optional[int] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> tp.Self:
         '''
         Specialized version of :obj:`Frame.from_delimited` for CSV files.
@@ -2552,6 +2961,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 name=name,
                 consolidate_blocks=consolidate_blocks,
                 store_filter=store_filter,
+                max_workers=max_workers,
+                mp_context=mp_context,
                 )
 
     @classmethod
@@ -2582,6 +2993,8 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             name: TLabel = None,
             consolidate_blocks: bool = False,
             store_filter: tp.Optional[StoreFilter] = None,
+            max_workers: tp.Optional[int] = None,
+            mp_context: tp.Optional[str] = None,
             ) -> tp.Self:
         '''
         Specialized version of :obj:`Frame.from_delimited` for TSV files.
@@ -2615,6 +3028,250 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 name=name,
                 consolidate_blocks=consolidate_blocks,
                 store_filter=store_filter,
+                max_workers=max_workers,
+                mp_context=mp_context,
+                )
+
+    @classmethod
+    @doc_inject(selector='constructor_frame')
+    def from_delimited_iter(cls,
+            fp: TPathSpecifierOrTextIOOrIterator,
+            *,
+            delimiter: str,
+            chunksize: int = 100_000,
+            index_depth: int = 0,
+            index_column_first: int = 0,
+            index_name_depth_level: tp.Optional[TDepthLevel] = None,
+            index_constructors: TIndexCtorSpecifiers = None,
+            index_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            columns_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            skip_header: int = 0,
+            skip_footer: int = 0,
+            skip_initial_space: bool = False,
+            quoting: int = csv.QUOTE_MINIMAL,
+            quote_char: str = '"',
+            quote_double: bool = True,
+            escape_char: tp.Optional[str] = None,
+            thousands_char: str = '',
+            decimal_char: str = '.',
+            encoding: tp.Optional[str] = None,
+            dtypes: TDtypesSpecifier = None,
+            consolidate_blocks: bool = False,
+            store_filter: tp.Optional[StoreFilter] = None,
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Return an iterator of :obj:`Frame`, each of at most ``chunksize`` rows, from a file path or a file-like object defining a delimited (CSV, TSV) data file. Lines are read lazily, such that only one chunk of lines is held in memory at a time. Each chunk is parsed with :obj:`Frame.from_delimited`, using the same header, and arguments, for all chunks. Each :obj:`Frame` is named by its integer position in the iterator; if ``index_depth`` is zero, rows are labelled by their integer position in the file after the header.
+
+        As with :obj:`Frame.from_sql_iter`, the dtypes of columns widen where values of a :obj:`Frame` cannot be represented by the dtypes of prior :obj:`Frame`; a column of only empty fields takes a prior float or datetime dtype, and widens a prior integer to float. A record with a quoted newline is never divided between :obj:`Frame`. To process chunks lazily as a :obj:`Bus` or :obj:`Quilt`, provide the iterator to ``Batch.from_frames()`` and write it to a :obj:`Store`, as described for :obj:`Frame.from_sql_iter`.
+
+        Args:
+            fp: A file path or a file-like object.
+            delimiter: The character used to seperate row elements.
+            chunksize: The maximum number of rows in each :obj:`Frame`.
+
+        All other arguments are as for :obj:`Frame.from_delimited`.
+        '''
+        if chunksize < 1:
+            raise ErrorInitFrame('chunksize must be greater than zero.')
+        if skip_header < 0:
+            raise ErrorInitFrame('skip_header must be greater than or equal to 0')
+
+        quote_count = quoting != csv.QUOTE_NONE and bool(quote_char)
+        quote_escaped = (escape_char + quote_char) if escape_char and quote_count else ''
+
+        def records(row_iter: tp.Iterator[str], count: int) -> tp.List[str]:
+            # collect the lines of at most count records, such that a record with a quoted newline is never split between chunks; a record continues while the count of quote_char is odd
+            lines: tp.List[str] = []
+            parity = 0
+            for line in row_iter:
+                lines.append(line)
+                if quote_count:
+                    if quote_escaped:
+                        line = line.replace(quote_escaped, '')
+                    parity = (parity + line.count(quote_char)) % 2
+                if not parity:
+                    count -= 1
+                    if not count:
+                        break
+            return lines
+
+        def frames() -> tp.Iterator[tp.Self]:
+            row_iter = cls._delimited_lines(fp, encoding=encoding, skip_footer=skip_footer)
+            for _ in islice(row_iter, skip_header):
+                pass
+            header = records(row_iter, columns_depth) if columns_depth else []
+
+            dtypes_prior: tp.List[TDtypeAny] = []
+            count = 0
+            start = 0
+            while True:
+                lines = records(row_iter, chunksize)
+                if not lines:
+                    break
+                f = cls.from_delimited(iter(header + lines),
+                        delimiter=delimiter,
+                        index_depth=index_depth,
+                        index_column_first=index_column_first,
+                        index_name_depth_level=index_name_depth_level,
+                        index_constructors=index_constructors,
+                        index_continuation_token=index_continuation_token,
+                        columns_depth=columns_depth,
+                        columns_name_depth_level=columns_name_depth_level,
+                        columns_constructors=columns_constructors,
+                        columns_continuation_token=columns_continuation_token,
+                        columns_select=columns_select,
+                        skip_initial_space=skip_initial_space,
+                        quoting=quoting,
+                        quote_char=quote_char,
+                        quote_double=quote_double,
+                        escape_char=escape_char,
+                        thousands_char=thousands_char,
+                        decimal_char=decimal_char,
+                        dtypes=dtypes,
+                        name=count,
+                        consolidate_blocks=consolidate_blocks,
+                        store_filter=store_filter,
+                        )
+                if index_depth == 0 and start:
+                    f = f.relabel(index=range(start, start + len(f)))
+                if dtypes_prior:
+                    f = f._widen_to_prior(dtypes_prior, consolidate_blocks)
+                else:
+                    dtypes_prior.extend(f.dtypes.values)
+                yield f
+                count += 1
+                start += len(f)
+
+        return frames()
+
+    @classmethod
+    def from_csv_iter(cls,
+            fp: TPathSpecifierOrTextIOOrIterator,
+            *,
+            chunksize: int = 100_000,
+            index_depth: int = 0,
+            index_column_first: int = 0,
+            index_name_depth_level: tp.Optional[TDepthLevel] = None,
+            index_constructors: TIndexCtorSpecifiers = None,
+            index_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            columns_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            skip_header: int = 0,
+            skip_footer: int = 0,
+            skip_initial_space: bool = False,
+            quoting: int = csv.QUOTE_MINIMAL,
+            quote_char: str = '"',
+            quote_double: bool = True,
+            escape_char: tp.Optional[str] = None,
+            thousands_char: str = '',
+            decimal_char: str = '.',
+            encoding: tp.Optional[str] = None,
+            dtypes: TDtypesSpecifier = None,
+            consolidate_blocks: bool = False,
+            store_filter: tp.Optional[StoreFilter] = None,
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Specialized version of :obj:`Frame.from_delimited_iter` for CSV files.
+
+        Returns:
+            Iterator of :obj:`Frame`
+        '''
+        return cls.from_delimited_iter(fp,
+                delimiter=',',
+                chunksize=chunksize,
+                index_depth=index_depth,
+                index_column_first=index_column_first,
+                index_name_depth_level=index_name_depth_level,
+                index_constructors=index_constructors,
+                index_continuation_token=index_continuation_token,
+                columns_depth=columns_depth,
+                columns_name_depth_level=columns_name_depth_level,
+                columns_constructors=columns_constructors,
+                columns_continuation_token=columns_continuation_token,
+                columns_select=columns_select,
+                skip_header=skip_header,
+                skip_footer=skip_footer,
+                skip_initial_space=skip_initial_space,
+                quoting=quoting,
+                quote_char=quote_char,
+                quote_double=quote_double,
+                escape_char=escape_char,
+                thousands_char=thousands_char,
+                decimal_char=decimal_char,
+                encoding=encoding,
+                dtypes=dtypes,
+                consolidate_blocks=consolidate_blocks,
+                store_filter=store_filter,
+                )
+
+    @classmethod
+    def from_tsv_iter(cls,
+            fp: TPathSpecifierOrTextIOOrIterator,
+            *,
+            chunksize: int = 100_000,
+            index_depth: int = 0,
+            index_column_first: int = 0,
+            index_name_depth_level: tp.Optional[TDepthLevel] = None,
+            index_constructors: TIndexCtorSpecifiers = None,
+            index_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            columns_continuation_token: tp.Union[TLabel, None] = CONTINUATION_TOKEN_INACTIVE,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            skip_header: int = 0,
+            skip_footer: int = 0,
+            skip_initial_space: bool = False,
+            quoting: int = csv.QUOTE_MINIMAL,
+            quote_char: str = '"',
+            quote_double: bool = True,
+            escape_char: tp.Optional[str] = None,
+            thousands_char: str = '',
+            decimal_char: str = '.',
+            encoding: tp.Optional[str] = None,
+            dtypes: TDtypesSpecifier = None,
+            consolidate_blocks: bool = False,
+            store_filter: tp.Optional[StoreFilter] = None,
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Specialized version of :obj:`Frame.from_delimited_iter` for TSV files.
+
+        Returns:
+            Iterator of :obj:`Frame`
+        '''
+        return cls.from_delimited_iter(fp,
+                delimiter='\t',
+                chunksize=chunksize,
+                index_depth=index_depth,
+                index_column_first=index_column_first,
+                index_name_depth_level=index_name_depth_level,
+                index_constructors=index_constructors,
+                index_continuation_token=index_continuation_token,
+                columns_depth=columns_depth,
+                columns_name_depth_level=columns_name_depth_level,
+                columns_constructors=columns_constructors,
+                columns_continuation_token=columns_continuation_token,
+                columns_select=columns_select,
+                skip_header=skip_header,
+                skip_footer=skip_footer,
+                skip_initial_space=skip_initial_space,
+                quoting=quoting,
+                quote_char=quote_char,
+                quote_double=quote_double,
+                escape_char=escape_char,
+                thousands_char=thousands_char,
+                decimal_char=decimal_char,
+                encoding=encoding,
+                dtypes=dtypes,
+                consolidate_blocks=consolidate_blocks,
+                store_filter=store_filter,
                 )
 
     @classmethod
@@ -2844,40 +3501,101 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
     @classmethod
     def from_npz(cls,
             fp: TPathSpecifierOrBinaryIO,
+            *,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
             ) -> TFrameAny:
         '''
         Create a :obj:`Frame` from an npz file.
+
+        Args:
+            fp: The path to the npz file.
+            columns_select: An optional iterable of column labels to retain, in the order stored; blocks not containing those columns are not decoded.
         '''
         # NOTE: `fp`` can be a bytes object
         return NPZFrameConverter.from_archive(
                 constructor=cls,
                 fp=fp,
+                columns_select=columns_select,
                 )
 
     @classmethod
     def from_npy(cls,
             fp: TPathSpecifier,
+            *,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
             ) -> TFrameAny:
         '''
         Create a :obj:`Frame` from an directory of npy files.
 
         Args:
             fp: The path to the NPY directory.
+            columns_select: An optional iterable of column labels to retain, in the order stored; npy files of blocks not containing those columns are not read.
         '''
         return NPYFrameConverter.from_archive(
                 constructor=cls,
                 fp=fp,
+                columns_select=columns_select,
+                )
+
+    @classmethod
+    def from_npy_chunked(cls,
+            fp: TPathSpecifier,
+            *,
+            start: int = 0,
+            stop: tp.Optional[int] = None,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            ) -> TFrameAny:
+        '''
+        Create a :obj:`Frame` from a range of rows of a directory of npy files written in chunks of rows. Only the chunks that contain the rows from ``start`` to ``stop`` are read.
+
+        Args:
+            fp: The path to the NPY directory.
+            start: The position of the first row to read; negative values count from the end.
+            stop: The position after the last row to read; if None, rows are read to the end.
+            columns_select: An optional iterable of column labels to retain, in the order stored; npy files of blocks not containing those columns are not read.
+        '''
+        return NPYFrameChunkedConverter.from_archive(
+                constructor=cls,
+                fp=fp,
+                start=start,
+                stop=stop,
+                columns_select=columns_select,
+                )
+
+    @classmethod
+    def from_npz_mmap(cls,
+            fp: TPathSpecifier,
+            *,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
+            ) -> tp.Tuple[TFrameAny, tp.Callable[[], None]]:
+        '''
+        Create a :obj:`Frame` from an npz file using memory maps. Only metadata, array headers, and labels are read on creation; the data of each column is read from disk only when it is accessed.
+
+        Args:
+            fp: The path to the npz file.
+            columns_select: An optional iterable of column labels to retain, in the order stored; blocks not containing those columns are not memory mapped.
+
+        Returns:
+            A tuple of :obj:`Frame` and the callable needed to close the open memory map objects. On some platforms this must be called before the process exits.
+        '''
+        return NPZFrameConverter.from_archive_mmap(
+                constructor=cls,
+                fp=fp,
+                columns_select=columns_select,
                 )
 
     @classmethod
     def from_npy_mmap(cls,
             fp: TPathSpecifier,
+            *,
+            columns_select: tp.Optional[tp.Iterable[TLabel]] = None,
             ) -> tp.Tuple[TFrameAny, tp.Callable[[], None]]:
         '''
-        Create a :obj:`Frame` from an directory of npy files using memory maps.
+        Create a :obj:`Frame` from an directory of npy files using memory maps. Only metadata, array headers, and labels are read on creation; the data of each column is read from disk only when it is accessed.
 
         Args:
             fp: The path to the NPY directory.
+            columns_select: An optional iterable of column labels to retain, in the order stored; npy files of blocks not containing those columns are not memory mapped.
 
         Returns:
             A tuple of :obj:`Frame` and the callable needed to close the open memory map objects. On some platforms this must be called before the process exits.
@@ -2885,6 +3603,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         return NPYFrameConverter.from_archive_mmap(
                 constructor=cls,
                 fp=fp,
+                columns_select=columns_select,
                 )
 
     @classmethod
@@ -3031,6 +3750,27 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 own_columns=own_columns,
                 )
 
+    @staticmethod
+    def _arrow_dictionary_to_array(
+            chunked_array: 'pyarrow.ChunkedArray',
+            ) -> tp.Optional[TNDArrayAny]:
+        '''
+        If ``chunked_array`` is a dictionary array without nulls, decode it by converting only the unique values of each chunk and selecting from them with the codes; otherwise, return None.
+        '''
+        import pyarrow
+
+        if (not pyarrow.types.is_dictionary(chunked_array.type)
+                or not chunked_array.num_chunks
+                or chunked_array.null_count):
+            return None
+        arrays = []
+        for chunk in chunked_array.chunks:
+            if chunk.dictionary.null_count:
+                return None
+            values = chunk.dictionary.to_numpy(zero_copy_only=False)
+            arrays.append(values[chunk.indices.to_numpy()])
+        return arrays[0] if len(arrays) == 1 else concat_resolved(arrays)
+
     @classmethod
     @doc_inject(selector='from_any')
     def from_arrow(cls,
@@ -3083,14 +3823,15 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             for col_idx, (name, chunked_array) in enumerate(
                     zip(value.column_names, value.columns)):
                 # NOTE: name will be the encoded columns representation, or auto increment integers; if an IndexHierarchy, will contain all depths: "['a' 1]"
-                # This creates a Series with an index; better to find a way to go only to numpy, but does not seem available on ChunkedArray, even with pyarrow==0.16.0
-                series = chunked_array.to_pandas(
-                        date_as_object=False, # get an np array
-                        self_destruct=True, # documented as "experimental"
-                        ignore_metadata=True,
-                        )
-
-                array_final = pandas_to_numpy(series, own_data=True)
+                array_final = cls._arrow_dictionary_to_array(chunked_array)
+                if array_final is None:
+                    # This creates a Series with an index; better to find a way to go only to numpy, but does not seem available on ChunkedArray, even with pyarrow==0.16.0
+                    series = chunked_array.to_pandas(
+                            date_as_object=False, # get an np array
+                            self_destruct=True, # documented as "experimental"
+                            ignore_metadata=True,
+                            )
+                    array_final = pandas_to_numpy(series, own_data=True)
 
                 if get_col_dtype:
                     # ordered values will include index positions
@@ -3197,6 +3938,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             columns_name_depth_level: tp.Optional[TDepthLevel] = None,
             columns_constructors: TIndexCtorSpecifiers = None,
             columns_select: tp.Optional[tp.Iterable[str]] = None,
+            row_filter: tp.Optional[RowFilter] = None,
+            row_groups: tp.Optional[tp.Iterable[int]] = None,
+            use_threads: bool = True,
             dtypes: TDtypesSpecifier = None,
             name: TLabel = None,
             consolidate_blocks: bool = False,
@@ -3213,6 +3957,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             columns_name_depth_level:
             columns_constructors:
             {columns_select}
+            row_filter: An optional :obj:`RowFilter` expression, evaluated by ``pyarrow`` after reading, selecting the rows to load. Columns referenced by ``row_filter`` are read even if not in ``columns_select``.
+            row_groups: An optional iterable of integer positions of row groups to read; if not provided, all row groups are read.
+            use_threads: If True, ``pyarrow`` decodes columns and row groups with multiple threads.
             {dtypes}
             {name}
             {consolidate_blocks}
@@ -3228,25 +3975,39 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
         if columns_select is not None and not isinstance(columns_select, list):
             columns_select = list(columns_select)
 
+        # NOTE: row_filter is applied to the table after reading, not given as read_table filters, as pruning row groups by statistics does not treat NaN as missing
+        filters = None if row_filter is None else row_filter.to_arrow()
+        columns_read = cls._parquet_columns_read(columns_select, row_filter)
+
         # NOTE: the order of columns_select will determine their order
-        try:
-            table = pq.read_table(fp,
-                    columns=columns_select,
-                    use_pandas_metadata=False,
-                    )
-        except ArrowInvalid:  # pragma: no cover
-            # support loading parquet files saved with pyarrow<1.0
-            # https://github.com/apache/arrow/issues/32660
-            table = pq.read_table(fp,  # pragma: no cover
-                    columns=columns_select,
-                    use_pandas_metadata=False,
-                    use_legacy_dataset=True,
+        if row_groups is not None:
+            pf = pq.ParquetFile(fpf)
+            table = cls._parquet_read_row_groups(pf,
+                    row_groups=cls._parquet_row_groups(pf, row_groups),
+                    columns_select=columns_read,
+                    filters=filters,
+                    use_threads=use_threads,
                     )
-        if columns_select:
-            # pq.read_table will silently accept requested columns that are not found; this can be identified if we got back fewer columns than requested
-            if len(table.column_names) < len(columns_select):
-                missing = set(columns_select) - set(table.column_names)
-                raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
+        else:
+            try:
+                table = pq.read_table(fp,
+                        columns=columns_read,
+                        use_pandas_metadata=False,
+                        use_threads=use_threads,
+                        )
+            except ArrowInvalid:  # pragma: no cover
+                # support loading parquet files saved with pyarrow<1.0
+                # https://github.com/apache/arrow/issues/32660
+                table = pq.read_table(fp,  # pragma: no cover
+                        columns=columns_read,
+                        use_pandas_metadata=False,
+                        use_legacy_dataset=True,
+                        )
+            cls._parquet_validate_columns(table, columns_read)
+            if filters is not None:
+                table = table.filter(filters)
+        if columns_read is not columns_select:
+            table = table.select(columns_select)
 
         return cls.from_arrow(table,
                 index_depth=index_depth,
@@ -3260,6 +4021,154 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 name=name
                 )
 
+    @staticmethod
+    def _parquet_columns_read(
+            columns_select: tp.Optional[tp.List[str]],
+            row_filter: tp.Optional[RowFilter],
+            ) -> tp.Optional[tp.List[str]]:
+        '''
+        Return the columns to read, extending ``columns_select`` with columns referenced by ``row_filter``; if no columns are added, ``columns_select`` is returned.
+        '''
+        if columns_select is None or row_filter is None:
+            return columns_select
+        extra = [label for label in dict.fromkeys(row_filter._iter_labels())
+                if label not in columns_select]
+        if not extra:
+            return columns_select
+        return columns_select + extra # type: ignore
+
+    @staticmethod
+    def _parquet_validate_columns(
+            table: 'pyarrow.Table',
+            columns_select: tp.Optional[tp.List[str]],
+            ) -> None:
+        if columns_select:
+            # pq.read_table will silently accept requested columns that are not found; this can be identified if we got back fewer columns than requested
+            if len(table.column_names) < len(columns_select):
+                missing = set(columns_select) - set(table.column_names)
+                raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
+
+    @staticmethod
+    def _parquet_row_groups(
+            pf: 'pyarrow.parquet.ParquetFile',
+            row_groups: tp.Iterable[int],
+            ) -> tp.List[int]:
+        '''
+        Return ``row_groups`` as a list, raising if any are not integer positions of row groups in ``pf``.
+        '''
+        count = pf.num_row_groups
+        post = list(row_groups)
+        for i in post:
+            if not isinstance(i, INT_TYPES) or not 0 <= i < count:
+                raise ErrorInitFrame(f'row group {i!r} is not a position of one of {count} row groups.')
+        return post
+
+    @staticmethod
+    def _parquet_read_row_groups(
+            pf: 'pyarrow.parquet.ParquetFile',
+            *,
+            row_groups: tp.List[int],
+            columns_select: tp.Optional[tp.List[str]],
+            filters: tp.Optional['pyarrow.compute.Expression'],
+            use_threads: bool,
+            ) -> 'pyarrow.Table':
+        '''
+        Read row groups from a ``ParquetFile``, applying the ``filters`` expression after reading.
+        '''
+        if columns_select:
+            missing = set(columns_select) - set(pf.schema_arrow.names)
+            if missing:
+                raise ErrorInitFrame(f'cannot load all columns in columns_select: missing {missing}')
+        table = pf.read_row_groups(row_groups,
+                columns=columns_select,
+                use_threads=use_threads,
+                use_pandas_metadata=False,
+                )
+        if filters is not None:
+            table = table.filter(filters)
+        return table
+
+    @classmethod
+    @doc_inject(selector='from_any')
+    def from_parquet_iter(cls,
+            fp: TPathSpecifier,
+            *,
+            index_depth: int = 0,
+            index_name_depth_level: tp.Optional[TDepthLevel] = None,
+            index_constructors: TIndexCtorSpecifiers = None,
+            columns_depth: int = 1,
+            columns_name_depth_level: tp.Optional[TDepthLevel] = None,
+            columns_constructors: TIndexCtorSpecifiers = None,
+            columns_select: tp.Optional[tp.Iterable[str]] = None,
+            row_filter: tp.Optional[RowFilter] = None,
+            row_groups: tp.Optional[tp.Iterable[int]] = None,
+            use_threads: bool = True,
+            dtypes: TDtypesSpecifier = None,
+            consolidate_blocks: bool = False,
+            ) -> tp.Iterator[tp.Self]:
+        '''
+        Return an iterator of :obj:`Frame`, one for each row group of a Parquet file, such that only one row group is held in memory at a time. Each :obj:`Frame` is named by the integer position of its row group; if ``index_depth`` is zero and ``row_filter`` is not provided, rows are labelled by their integer position in the file.
+
+        Args:
+            {fp}
+            {index_depth}
+            index_name_depth_level:
+            index_constructors:
+            {columns_depth}
+            columns_name_depth_level:
+            columns_constructors:
+            {columns_select}
+            row_filter: An optional :obj:`RowFilter` expression, evaluated by ``pyarrow`` after reading each row group, selecting the rows to load.
+            row_groups: An optional iterable of integer positions of row groups to read; if not provided, all row groups are read.
+            use_threads: If True, ``pyarrow`` decodes columns with multiple threads.
+            {dtypes}
+            {consolidate_blocks}
+        '''
+        import pyarrow.parquet as pq
+
+        if columns_select and index_depth != 0:
+            raise ErrorInitFrame(f'cannot load index_depth {index_depth} when columns_select is specified.')
+
+        pf = pq.ParquetFile(path_filter(fp))
+        if columns_select is not None and not isinstance(columns_select, list):
+            columns_select = list(columns_select)
+        filters = None if row_filter is None else row_filter.to_arrow()
+        columns_read = cls._parquet_columns_read(columns_select, row_filter)
+        row_groups_read = (range(pf.num_row_groups) if row_groups is None
+                else cls._parquet_row_groups(pf, row_groups))
+
+        # the position in the file of the first row of each row group
+        metadata = pf.metadata
+        starts = np.cumsum([0] + [metadata.row_group(i).num_rows
+                for i in range(metadata.num_row_groups)]).tolist()
+
+        def frames() -> tp.Iterator[tp.Self]:
+            for i in row_groups_read:
+                table = cls._parquet_read_row_groups(pf,
+                        row_groups=[i],
+                        columns_select=columns_read,
+                        filters=filters,
+                        use_threads=use_threads,
+                        )
+                if columns_read is not columns_select:
+                    table = table.select(columns_select)
+                f = cls.from_arrow(table,
+                        index_depth=index_depth,
+                        index_name_depth_level=index_name_depth_level,
+                        index_constructors=index_constructors,
+                        columns_depth=columns_depth,
+                        columns_name_depth_level=columns_name_depth_level,
+                        columns_constructors=columns_constructors,
+                        dtypes=dtypes,
+                        consolidate_blocks=consolidate_blocks,
+                        name=i,
+                        )
+                if index_depth == 0 and filters is None and starts[i]:
+                    f = f.relabel(index=range(starts[i], starts[i] + len(f)))
+                yield f
+
+        return frames()
+
     @staticmethod
     @doc_inject(selector='constructor_frame')
     def from_msgpack(
@@ -8664,9 +9573,13 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             include_index_name: bool = True,
             include_columns: bool = True,
             include_columns_name: bool = False,
+            dictionary_encode: bool = False,
             ) -> 'pyarrow.Table':
         '''
         Return a ``pyarrow.Table`` from this :obj:`Frame`.
+
+        Args:
+            dictionary_encode: If True, string columns are written as ``pyarrow.DictionaryArray`` of integer codes and unique values.
         '''
         import pyarrow
 
@@ -8681,7 +9594,7 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 force_str_names=True,
                 )
 
-        def arrays() -> tp.Iterator[TNDArrayAny]:
+        def arrays() -> tp.Iterator[tp.Union[TNDArrayAny, 'pyarrow.Array']]:
             for array, dtype in zip(
                     Store.get_column_iterator(frame=self, include_index=include_index),
                     dtypes,
@@ -8689,6 +9602,9 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 if (dtype.kind == DTYPE_DATETIME_KIND
                         and np.datetime_data(dtype)[0] not in DTU_PYARROW):
                     yield array.astype(DT64_NS)
+                elif dictionary_encode and dtype.kind in DTYPE_STR_KINDS:
+                    values, codes = array_dictionary_encode(array)
+                    yield pyarrow.DictionaryArray.from_arrays(codes, values)
                 else:
                     yield array
 
@@ -8703,9 +9619,15 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             include_index_name: bool = True,
             include_columns: bool = True,
             include_columns_name: bool = False,
+            row_group_size: tp.Optional[int] = None,
+            use_dictionary: tp.Union[bool, tp.Iterable[str]] = True,
             ) -> None:
         '''
         Write an Arrow Parquet binary file.
+
+        Args:
+            row_group_size: The maximum number of rows in each row group; if None, ``pyarrow`` will write row groups of up to 1024 * 1024 rows.
+            use_dictionary: If True, use dictionary encoding for all columns; if False, use no dictionary encoding; if an iterable of field names, use dictionary encoding only for those fields.
         '''
         import pyarrow.parquet as pq
 
@@ -8717,7 +9639,11 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 )
         fpf = path_filter(fp) # type: ignore
         # NOTE:  compression='none' shown to not provide a clear performance improvement over the assumed default, 'snappy'
-        pq.write_table(table, fpf)
+        pq.write_table(table,
+                fpf,
+                row_group_size=row_group_size,
+                use_dictionary=use_dictionary if isinstance(use_dictionary, bool) else list(use_dictionary),
+                )
 
 
     def to_msgpack(self) -> bytes:
@@ -9444,9 +10370,19 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
+            compact_strings: bool = False,
+            index_components: bool = False,
+            codec: tp.Optional[str] = None,
             ) -> None:
         '''
         Write a :obj:`Frame` as an npz file.
+
+        Args:
+            dictionary_encode: If True, store string columns that are smaller when dictionary encoded as integer codes and unique values; these are decoded when read.
+            compact_strings: If True, store unicode columns that are smaller without padding (such as those with strings of widely varying length) as code points and string lengths; these are decoded when read.
+            index_components: If True, also store the labels per depth and the indexers of ``IndexHierarchy`` index and columns, such that they are created when read without factorizing values, and, with memory mapping, without building the map from labels to positions until first use. This increases the size of the archive.
+            codec: Optionally compress arrays with a codec, one of "zstd" (requires ``zstandard``), "lz4" (requires ``lz4``), "zlib", or "auto" (the first available of those). Arrays are compressed in blocks that are compressed and decompressed in a pool of threads; the codec is recorded in the metadata and detected when read. Compressed arrays cannot be memory mapped.
         '''
         NPZFrameConverter.to_archive(
                 frame=self,
@@ -9454,6 +10390,10 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 include_index=include_index,
                 include_columns=include_columns,
                 consolidate_blocks=consolidate_blocks,
+                dictionary_encode=dictionary_encode,
+                compact_strings=compact_strings,
+                index_components=index_components,
+                codec=codec,
                 )
 
     def to_npy(self,
@@ -9462,9 +10402,19 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
             include_index: bool = True,
             include_columns: bool = True,
             consolidate_blocks: bool = False,
+            dictionary_encode: bool = False,
+            compact_strings: bool = False,
+            index_components: bool = False,
+            codec: tp.Optional[str] = None,
             ) -> None:
         '''
         Write a :obj:`Frame` as a directory of npy file.
+
+        Args:
+            dictionary_encode: If True, store string columns that are smaller when dictionary encoded as integer codes and unique values; these are decoded when read.
+            compact_strings: If True, store unicode columns that are smaller without padding (such as those with strings of widely varying length) as code points and string lengths; these are decoded when read.
+            index_components: If True, also store the labels per depth and the indexers of ``IndexHierarchy`` index and columns, such that they are created when read without factorizing values, and, with memory mapping, without building the map from labels to positions until first use. This increases the size of the archive.
+            codec: Optionally compress arrays with a codec, one of "zstd" (requires ``zstandard``), "lz4" (requires ``lz4``), "zlib", or "auto" (the first available of those). Arrays are compressed in blocks that are compressed and decompressed in a pool of threads; the codec is recorded in the metadata and detected when read. Compressed arrays cannot be memory mapped.
         '''
         NPYFrameConverter.to_archive(
                 frame=self,
@@ -9472,8 +10422,43 @@ class Frame(ContainerOperand, tp.Generic[TVIndex, TVColumns, tp.Unpack[TVDtypes]
                 include_index=include_index,
                 include_columns=include_columns,
                 consolidate_blocks=consolidate_blocks,
+                dictionary_encode=dictionary_encode,
+                compact_strings=compact_strings,
+                index_components=index_components,
+                codec=codec,
                 )
 
+    def to_npy_chunked(self,
+            fp: TPathSpecifier,
+            *,
+            chunk_size: int = NPYFrameChunkedConverter.CHUNK_SIZE,
+            include_index: bool = True,
+            include_columns: bool = True,
+            consolidate_blocks: bool = False,
+            codec: tp.Optional[str] = None,
+            append: bool = False,
+            ) -> None:
+        '''
+        Write a :obj:`Frame` as a directory of npy files in chunks of rows, such that ranges of rows can be read with ``Frame.from_npy_chunked`` without reading other chunks.
+
+        Args:
+            chunk_size: The number of rows per chunk.
+            codec: Optionally compress arrays with a codec, one of "zstd" (requires ``zstandard``), "lz4" (requires ``lz4``), "zlib", or "auto" (the first available of those).
+            append: If True, append the rows of this :obj:`Frame` as new chunks to an existing directory, which must have the same columns and column dtypes; the chunk size, index inclusion, and codec of the existing directory are used.
+        '''
+        if append:
+            NPYFrameChunkedConverter.append_archive(frames=(self,), fp=fp)
+        else:
+            NPYFrameChunkedConverter.to_archive(
+                    frames=(self,),
+                    fp=fp,
+                    chunk_size=chunk_size,
+                    include_index=include_index,
+                    include_columns=include_columns,
+                    consolidate_blocks=consolidate_blocks,
+                    codec=codec,
+                    )
+
     def to_pickle(self,
             fp: TPathSpecifier,
             *,
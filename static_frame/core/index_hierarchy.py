@@ -959,6 +959,41 @@ class IndexHierarchy(IndexBase, tp.Generic[tp.Unpack[TVIndices]]):
                 own_blocks=own_blocks,
                 )
 
+    @classmethod
+    def _from_indices_and_indexers(cls,
+            *,
+            indices: tp.List[Index[tp.Any]],
+            indexers: TNDArrayAny,
+            blocks: TypeBlocks,
+            name: TName = None,
+            ) -> tp.Self:
+        '''
+        Construct an :obj:`IndexHierarchy` from the components of a previously created :obj:`IndexHierarchy`, such as those read from an archive. As these components are known to be valid and unique, they are not validated, and the map from labels to positions is built on first use.
+
+        Args:
+            indices: list of :obj:`Index` of the unique labels per depth
+            indexers: a read-only 2D indexer array
+            blocks: a TypeBlocks of the values per depth
+        '''
+        obj: tp.Self = cls.__new__(cls)
+        obj._indices = [ # pyright: ignore
+            mutable_immutable_index_filter(cls.STATIC, index) # type: ignore
+            for index in indices
+            ]
+        obj._indexers = indexers
+        obj._name = name_filter(name)
+        obj._blocks = blocks
+        obj._values = None
+        obj._recache = False
+        obj._index_types = None
+        obj._pending_extensions = None
+        obj._map = HierarchicalLocMap(
+                indices=obj._indices, # pyright: ignore
+                indexers=indexers,
+                deferred=True,
+                )
+        return obj
+
     # --------------------------------------------------------------------------
     def _to_type_blocks(self) -> TypeBlocks:
         '''
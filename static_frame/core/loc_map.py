@@ -212,30 +212,42 @@ class HierarchicalLocMap:
     __slots__ = (
             'bit_offset_encoders',
             'encoding_can_overflow',
-            'encoded_indexer_map',
+            '_encoded_indexer_map',
+            '_indexers',
             )
 
     bit_offset_encoders: TNDArrayAny
     encoding_can_overflow: bool
-    encoded_indexer_map: FrozenAutoMap
+    _encoded_indexer_map: tp.Optional[FrozenAutoMap]
+    _indexers: tp.Optional[TNDArrayAny] # retained only until a deferred map is built
 
     def __init__(self: _HLMap,
             *,
             indices: tp.List[Index[tp.Any]],
             indexers: TNDArrayAny,
+            deferred: bool = False,
             ) -> None:
+        '''
+        Args:
+            deferred: If True, ``indexers`` are known to be unique and the map from encoded indexers to positions is built on first use.
+        '''
+        self._indexers = None
 
         if not len(indexers[0]):
             self.bit_offset_encoders = np.full(len(indices), 0, dtype=DTYPE_UINT_DEFAULT)
             self.encoding_can_overflow = False
-            self.encoded_indexer_map = EMPTY_FROZEN_AUTOMAP
+            self._encoded_indexer_map = EMPTY_FROZEN_AUTOMAP
             return
 
         self.bit_offset_encoders, self.encoding_can_overflow = self.build_offsets_and_overflow(
                 num_unique_elements_per_depth=list(map(len, indices))
                 )
+        if deferred:
+            self._encoded_indexer_map = None
+            self._indexers = indexers
+            return
         try:
-            self.encoded_indexer_map = self.build_encoded_indexers_map(
+            self._encoded_indexer_map = self.build_encoded_indexers_map(
                     encoding_can_overflow=self.encoding_can_overflow,
                     bit_offset_encoders=self.bit_offset_encoders,
                     indexers=indexers,
@@ -247,6 +259,24 @@ class HierarchicalLocMap:
                     )
             raise ErrorInitIndexNonUnique(duplicate_labels) from None
 
+    @property
+    def encoded_indexer_map(self: _HLMap) -> FrozenAutoMap:
+        '''The map from encoded indexers to positions, built on first use if deferred.
+        '''
+        if self._encoded_indexer_map is None:
+            self._encoded_indexer_map = self.build_encoded_indexers_map(
+                    encoding_can_overflow=self.encoding_can_overflow,
+                    bit_offset_encoders=self.bit_offset_encoders,
+                    indexers=self._indexers, # type: ignore
+                    )
+            self._indexers = None
+        return self._encoded_indexer_map
+
+    @encoded_indexer_map.setter
+    def encoded_indexer_map(self: _HLMap, value: FrozenAutoMap) -> None:
+        self._encoded_indexer_map = value
+        self._indexers = None
+
     def __deepcopy__(self: _HLMap,
             memo: tp.Dict[int, tp.Any],
             ) -> _HLMap:
@@ -256,7 +286,8 @@ class HierarchicalLocMap:
         obj: _HLMap = self.__class__.__new__(self.__class__)
         obj.bit_offset_encoders = array_deepcopy(self.bit_offset_encoders, memo)
         obj.encoding_can_overflow = self.encoding_can_overflow
-        obj.encoded_indexer_map = deepcopy(self.encoded_indexer_map, memo)
+        obj._encoded_indexer_map = deepcopy(self._encoded_indexer_map, memo)
+        obj._indexers = self._indexers # immutable
 
         memo[id(self)] = obj
         return obj
@@ -265,6 +296,7 @@ class HierarchicalLocMap:
         '''
         Ensure that reanimated NP arrays are set not writeable.
         '''
+        self._indexers = None
         for key, value in state[1].items():
             setattr(self, key, value)
         self.bit_offset_encoders.flags.writeable = False
@@ -21,9 +21,21 @@ class NPYLabel:
     KEY_TYPES = '__types__'
     KEY_TYPES_INDEX = '__types_index__'
     KEY_TYPES_COLUMNS = '__types_columns__'
+    KEY_BLOCKS_ENCODED = '__blocks_encoded__'
+    KEY_BLOCKS_COMPACT = '__blocks_compact__'
+    KEY_CODEC = '__codec__'
+    KEY_CHUNKS = '__chunks__'
     FILE_TEMPLATE_VALUES_INDEX = '__values_index_{}__.npy'
     FILE_TEMPLATE_VALUES_COLUMNS = '__values_columns_{}__.npy'
+    FILE_TEMPLATE_LABELS_INDEX = '__labels_index_{}__.npy'
+    FILE_TEMPLATE_LABELS_COLUMNS = '__labels_columns_{}__.npy'
+    FILE_INDEXERS_INDEX = '__indexers_index__.npy'
+    FILE_INDEXERS_COLUMNS = '__indexers_columns__.npy'
     FILE_TEMPLATE_BLOCKS = '__blocks_{}__.npy'
+    FILE_TEMPLATE_BLOCKS_VALUES = '__blocks_values_{}__.npy'
+    FILE_TEMPLATE_BLOCKS_BUFFER = '__blocks_buffer_{}__.npy'
+    FILE_TEMPLATE_VALUES_INDEX_CHUNK = '__values_index_{}_{}__.npy'
+    FILE_TEMPLATE_BLOCKS_CHUNK = '__blocks_{}_{}__.npy'
 
 
 class JSONMeta:
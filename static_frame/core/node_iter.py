@@ -52,6 +52,23 @@ TContainerAny = tp.TypeVar('TContainerAny',
         'Yarn[tp.Any]',
         )
 
+def map_shared_memory(
+        executor: tp.Any,
+        func: TCallableAny,
+        args: tp.Iterable[tp.Any],
+        chunksize: int,
+        ) -> tp.Generator[tp.Any, None, None]:
+    '''
+    Map ``func`` over ``args`` with a process pool ``executor``, transferring :obj:`Frame` results in shared memory. If the returned generator is closed before being exhausted, segments of results not consumed are released.
+    '''
+    # NOTE: archive_npy imports index, which imports this module; this import cannot be at the module level
+    from static_frame.core.archive_npy import FuncSharedMemory
+    from static_frame.core.archive_npy import SharedMemoryFrameConverter
+
+    return SharedMemoryFrameConverter.decode_iter(
+            executor.map(FuncSharedMemory(func), args, chunksize=chunksize))
+
+
 class IterNodeApplyType(Enum):
     SERIES_VALUES = 0
     SERIES_ITEMS = 1 # only used for iter_window_*
@@ -121,6 +138,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
 
         if not callable(func): # support array, Series mapping
@@ -147,9 +165,16 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
                 )
 
         with pool_executor() as executor:
-            yield from zip(func_keys,
-                    executor.map(func, arg_gen(), chunksize=chunksize)
-                    )
+            if shared_memory and not use_threads:
+                posts = map_shared_memory(executor, func, arg_gen(), chunksize)
+                try:
+                    yield from zip(func_keys, posts)
+                finally:
+                    posts.close() # release segments not consumed
+            else:
+                yield from zip(func_keys,
+                        executor.map(func, arg_gen(), chunksize=chunksize)
+                        )
 
     def _apply_iter_parallel(self,
             func: TCallableAny,
@@ -158,6 +183,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
             chunksize: int = 1,
             use_threads: bool = False,
             mp_context: tp.Optional[str] = None,
+            shared_memory: bool = False,
             ) -> tp.Iterator[tp.Any]:
 
         if not callable(func): # support array, Series mapping
@@ -174,7 +200,10 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
                 )
 
         with pool_executor() as executor:
-            yield from executor.map(func, arg_gen(), chunksize=chunksize)
+            if shared_memory and not use_threads:
+                yield from map_shared_memory(executor, func, arg_gen(), chunksize)
+            else:
+                yield from executor.map(func, arg_gen(), chunksize=chunksize)
 
     #---------------------------------------------------------------------------
     @doc_inject(selector='apply')
@@ -266,7 +295,8 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
             index_constructor: tp.Optional[TIndexCtorSpecifier]= None,
             max_workers: tp.Optional[int] = None,
             chunksize: int = 1,
-            use_threads: bool = False
+            use_threads: bool = False,
+            shared_memory: bool = False,
             ) -> TContainerAny:
         '''
         {doc} Employ parallel processing with either the ProcessPoolExecutor or ThreadPoolExecutor.
@@ -279,6 +309,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
             {max_workers}
             {chunksize}
             {use_threads}
+            {shared_memory}
         '''
         # only use when we need pairs of values to dynamically create an Index
         if IterNodeApplyType.is_items(self._apply_type):
@@ -290,6 +321,7 @@ class IterNodeDelegate(tp.Generic[TContainerAny]):
                         max_workers=max_workers,
                         chunksize=chunksize,
                         use_threads=use_threads,
+                        shared_memory=shared_memory,
                         ),
                 dtype=dtype,
                 name=name,
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import typing_extensions as tp
+
+from static_frame.core.util import TLabel
+
+
+class PersistPolicy:
+    '''
+    Base class of policies for selecting which loaded :obj:`Frame` a :obj:`Bus` replaces with ``FrameDeferred`` when ``max_persist`` or ``max_persist_bytes`` is exceeded. A policy tracks the labels of loaded :obj:`Frame`, maintains counters of hits, misses, and evictions, and permits labels to be pinned such that they are never evicted. A policy instance should only be given to one :obj:`Bus`; :obj:`Bus` derived from that :obj:`Bus` will use a new instance of the same policy.
+    '''
+
+    __slots__ = (
+            '_pinned',
+            '_label_to_nbytes',
+            '_nbytes',
+            '_hits',
+            '_misses',
+            '_evictions',
+            '_capacity',
+            )
+
+    def __init__(self,
+            *,
+            pinned: tp.Iterable[TLabel] = (),
+            ) -> None:
+        '''
+        Args:
+            pinned: Labels of :obj:`Frame` that, once loaded, are never evicted.
+        '''
+        self._pinned: tp.Set[TLabel] = set(pinned)
+        # the max_persist of the Bus using this policy, set by that Bus
+        self._capacity: tp.Optional[int] = None
+        self._label_to_nbytes: tp.Dict[TLabel, int] = {}
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _new(self) -> tp.Self:
+        '''Return a new, empty instance of this policy with the same configuration and pinned labels.
+        '''
+        return self.__class__(pinned=self._pinned)
+
+    def __repr__(self) -> str:
+        return (f'<{self.__class__.__name__} loaded={len(self)} nbytes={self._nbytes} '
+                f'hits={self._hits} misses={self._misses} evictions={self._evictions}>')
+
+    #---------------------------------------------------------------------------
+    # public interface
+
+    def pin(self, label: TLabel) -> None:
+        '''Pin the :obj:`Frame` of ``label`` such that, once loaded, it is never evicted. Pinned :obj:`Frame` may result in ``max_persist`` or ``max_persist_bytes`` being exceeded.
+        '''
+        self._pinned.add(label)
+
+    def unpin(self, label: TLabel) -> None:
+        '''Remove a previously pinned label, making it available for eviction.
+        '''
+        self._pinned.discard(label)
+
+    @property
+    def pinned(self) -> tp.FrozenSet[TLabel]:
+        '''The labels currently pinned.
+        '''
+        return frozenset(self._pinned)
+
+    @property
+    def hits(self) -> int:
+        '''The number of requests for a :obj:`Frame` that was already loaded.
+        '''
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        '''The number of requests for a :obj:`Frame` that had to be loaded from the :obj:`Store`.
+        '''
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        '''The number of loaded :obj:`Frame` replaced by ``FrameDeferred`` by this policy.
+        '''
+        return self._evictions
+
+    @property
+    def nbytes(self) -> int:
+        '''The total bytes of loaded :obj:`Frame` tracked by this policy.
+        '''
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return self._label_to_nbytes.__len__()
+
+    def __contains__(self, label: TLabel) -> bool:
+        return self._label_to_nbytes.__contains__(label)
+
+    #---------------------------------------------------------------------------
+    # interface for Bus
+
+    def _add(self, label: TLabel, nbytes: int) -> None:
+        '''Track a loaded :obj:`Frame` without counting a miss, as when a :obj:`Bus` is created with loaded :obj:`Frame`.
+        '''
+        # a label might be added while still tracked; replace its previous size
+        self._nbytes += nbytes - self._label_to_nbytes.get(label, 0)
+        self._label_to_nbytes[label] = nbytes
+        self._push(label)
+
+    def _load(self, label: TLabel, nbytes: int) -> None:
+        '''Track a :obj:`Frame` that has just been loaded from the :obj:`Store`.
+        '''
+        self._misses += 1
+        self._add(label, nbytes)
+
+    def _restore(self, label: TLabel, nbytes: int) -> None:
+        '''Track a requested :obj:`Frame` that was evicted but is still available without reading from the :obj:`Store`.
+        '''
+        self._hits += 1
+        self._add(label, nbytes)
+
+    def _access(self, label: TLabel) -> None:
+        '''Record a request for an already loaded :obj:`Frame`.
+        '''
+        self._hits += 1
+        self._touch(label)
+
+    def _evict(self, protected: tp.Container[TLabel]) -> tp.Optional[TLabel]:
+        '''Select, stop tracking, and return the label of the :obj:`Frame` to evict, never selecting a pinned label or a label in ``protected``. Returns None if no label can be evicted.
+        '''
+        label = self._victim(protected)
+        if label is None:
+            return None
+        self._pop(label)
+        self._nbytes -= self._label_to_nbytes.pop(label)
+        self._evictions += 1
+        return label
+
+    def _clear(self) -> None:
+        '''Stop tracking all labels, as when all :obj:`Frame` are unpersisted.
+        '''
+        self._label_to_nbytes.clear()
+        self._nbytes = 0
+        self._clear_order()
+
+    def _evictable(self,
+            labels: tp.Iterable[TLabel],
+            protected: tp.Container[TLabel],
+            ) -> tp.Optional[TLabel]:
+        '''Return the first label that is neither pinned nor protected.
+        '''
+        pinned = self._pinned
+        for label in labels:
+            if label not in pinned and label not in protected:
+                return label
+        return None
+
+    #---------------------------------------------------------------------------
+    # interface for subclasses
+
+    def _push(self, label: TLabel) -> None:
+        raise NotImplementedError() #pragma: no cover
+
+    def _touch(self, label: TLabel) -> None:
+        raise NotImplementedError() #pragma: no cover
+
+    def _victim(self, protected: tp.Container[TLabel]) -> tp.Optional[TLabel]:
+        raise NotImplementedError() #pragma: no cover
+
+    def _pop(self, label: TLabel) -> None:
+        raise NotImplementedError() #pragma: no cover
+
+    def _clear_order(self) -> None:
+        raise NotImplementedError() #pragma: no cover
+
+
+class PersistPolicyLRU(PersistPolicy):
+    '''
+    Evict the least-recently used :obj:`Frame`. This is the default policy of :obj:`Bus`.
+    '''
+
+    __slots__ = (
+            '_order',
+            )
+
+    def __init__(self,
+            *,
+            pinned: tp.Iterable[TLabel] = (),
+            ) -> None:
+        PersistPolicy.__init__(self, pinned=pinned)
+        # use an (ordered) dictionary to give use an ordered set, simply pointing to None for all keys
+        self._order: tp.Dict[TLabel, None] = {}
+
+    def _push(self, label: TLabel) -> None:
+        self._order.pop(label, None)
+        self._order[label] = None
+
+    def _touch(self, label: TLabel) -> None:
+        self._order[label] = self._order.pop(label, None)
+
+    def _victim(self, protected: tp.Container[TLabel]) -> tp.Optional[TLabel]:
+        return self._evictable(self._order, protected)
+
+    def _pop(self, label: TLabel) -> None:
+        del self._order[label]
+
+    def _clear_order(self) -> None:
+        self._order.clear()
+
+
+class PersistPolicyLFU(PersistPolicy):
+    '''
+    Evict the least-frequently used :obj:`Frame`, where frequency is counted from when the :obj:`Frame` was loaded; ties are broken by evicting the least-recently used.
+    '''
+
+    __slots__ = (
+            '_counts',
+            )
+
+    def __init__(self,
+            *,
+            pinned: tp.Iterable[TLabel] = (),
+            ) -> None:
+        PersistPolicy.__init__(self, pinned=pinned)
+        # insertion order is maintained as recency order to break ties
+        self._counts: tp.Dict[TLabel, int] = {}
+
+    def _push(self, label: TLabel) -> None:
+        self._counts.pop(label, None)
+        self._counts[label] = 1
+
+    def _touch(self, label: TLabel) -> None:
+        self._counts[label] = self._counts.pop(label, 0) + 1
+
+    def _victim(self, protected: tp.Container[TLabel]) -> tp.Optional[TLabel]:
+        pinned = self._pinned
+        # of equal counts, the least-recently used (first in order) is selected
+        label_min, _ = min(((label, count) for label, count in self._counts.items()
+                if label not in pinned and label not in protected),
+                key=lambda pair: pair[1],
+                default=(None, 0),
+                )
+        return label_min
+
+    def _pop(self, label: TLabel) -> None:
+        del self._counts[label]
+
+    def _clear_order(self) -> None:
+        self._counts.clear()
+
+
+class PersistPolicy2Q(PersistPolicy):
+    '''
+    A scan-resistant policy based on 2Q. Newly loaded :obj:`Frame` enter a probationary first-in, first-out queue; :obj:`Frame` accessed again while loaded, or loaded again shortly after eviction, are promoted to a protected least-recently used queue. Eviction takes from the probationary queue before the protected queue, such that a single pass over many :obj:`Frame` does not evict a frequently used set. When the protected queue is full, its least-recently used label is demoted to the probationary queue.
+    '''
+
+    __slots__ = (
+            '_probation',
+            '_protected',
+            '_protected_size',
+            '_ghost',
+            '_ghost_size',
+            )
+
+    def __init__(self,
+            *,
+            pinned: tp.Iterable[TLabel] = (),
+            protected_size: tp.Optional[int] = None,
+            ghost_size: int = 1024,
+            ) -> None:
+        '''
+        Args:
+            pinned: Labels of :obj:`Frame` that, once loaded, are never evicted.
+            protected_size: The maximum number of labels in the protected queue; if None, three quarters of the ``max_persist`` of the :obj:`Bus` (and at least one) is used, or the protected queue is unbounded if ``max_persist`` is not set.
+            ghost_size: The maximum number of labels evicted from the probationary queue to remember; if such a label is loaded again, it enters the protected queue.
+        '''
+        PersistPolicy.__init__(self, pinned=pinned)
+        self._probation: tp.Dict[TLabel, None] = {}
+        self._protected: tp.Dict[TLabel, None] = {}
+        self._protected_size = protected_size
+        self._ghost: tp.Dict[TLabel, None] = {}
+        self._ghost_size = ghost_size
+
+    def _new(self) -> tp.Self:
+        return self.__class__(
+                pinned=self._pinned,
+                protected_size=self._protected_size,
+                ghost_size=self._ghost_size,
+                )
+
+    def _protect(self, label: TLabel) -> None:
+        '''Add ``label`` as the most-recently used label of the protected queue, demoting least-recently used labels to the probationary queue if the protected queue is full.
+        '''
+        protected = self._protected
+        protected[label] = None
+
+        size = self._protected_size
+        if size is None and self._capacity is not None:
+            size = max(self._capacity * 3 // 4, 1)
+        if size is None:
+            return
+        while len(protected) > size:
+            demoted = next(iter(protected))
+            del protected[demoted]
+            self._probation[demoted] = None
+
+    def _push(self, label: TLabel) -> None:
+        if label in self._probation or label in self._protected:
+            self._touch(label)
+        elif label in self._ghost:
+            del self._ghost[label]
+            self._protect(label)
+        else:
+            self._probation[label] = None
+
+    def _touch(self, label: TLabel) -> None:
+        if label in self._probation:
+            del self._probation[label]
+        else:
+            self._protected.pop(label, None)
+        self._protect(label)
+
+    def _victim(self, protected: tp.Container[TLabel]) -> tp.Optional[TLabel]:
+        label = self._evictable(self._probation, protected)
+        if label is None:
+            label = self._evictable(self._protected, protected)
+        return label
+
+    def _pop(self, label: TLabel) -> None:
+        if label in self._probation:
+            del self._probation[label]
+            self._ghost[label] = None
+            if len(self._ghost) > self._ghost_size:
+                del self._ghost[next(iter(self._ghost))]
+        else:
+            del self._protected[label]
+
+    def _clear_order(self) -> None:
+        self._probation.clear()
+        self._protected.clear()
+        self._ghost.clear()
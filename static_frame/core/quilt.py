@@ -36,6 +36,7 @@ from static_frame.core.node_iter import IterNodeConstructorAxis
 from static_frame.core.node_iter import IterNodeWindow
 from static_frame.core.node_selector import InterGetItemILocCompoundReduces
 from static_frame.core.node_selector import InterGetItemLocCompoundReduces
+from static_frame.core.persist_policy import PersistPolicy
 from static_frame.core.series import Series
 from static_frame.core.store import Store
 from static_frame.core.store_client_mixin import StoreClientMixin
@@ -191,10 +192,14 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         bus = Bus._from_store(store=store,
                 config=config,
                 max_persist=max_persist, # None is default
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
         return cls(bus,
                 axis=axis,
@@ -213,6 +218,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped TSV :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -226,6 +233,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -238,6 +247,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped CSV :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -251,6 +262,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -263,6 +276,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped pickle :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -276,6 +291,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -288,6 +305,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped NPZ :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -301,6 +320,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -313,6 +334,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped NPY :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -326,6 +349,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -338,6 +363,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to zipped parquet :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -351,6 +378,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -363,6 +392,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to an XLSX :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -377,6 +408,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
 
@@ -390,6 +423,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to an SQLite :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -403,6 +438,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -415,6 +452,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to an DuckDB :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -428,6 +467,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     @classmethod
@@ -440,6 +481,8 @@ class Quilt(ContainerBase, StoreClientMixin):
             retain_labels: bool,
             deepcopy_from_bus: bool = False,
             max_persist: tp.Optional[int] = None,
+            max_persist_bytes: tp.Optional[int] = None,
+            persist_policy: tp.Optional[PersistPolicy] = None,
             ) -> 'Quilt':
         '''
         Given a file path to a HDF5 :obj:`Quilt` store, return a :obj:`Quilt` instance.
@@ -453,6 +496,8 @@ class Quilt(ContainerBase, StoreClientMixin):
                 retain_labels=retain_labels,
                 deepcopy_from_bus=deepcopy_from_bus,
                 max_persist=max_persist,
+                max_persist_bytes=max_persist_bytes,
+                persist_policy=persist_policy,
                 )
 
     #---------------------------------------------------------------------------
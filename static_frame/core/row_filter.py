@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import operator
+
+import numpy as np
+import typing_extensions as tp
+from arraykit import isna_element
+
+from static_frame.core.exception import ErrorInitStoreConfig
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import TLabel
+from static_frame.core.util import TNDArrayAny
+from static_frame.core.util import isin
+from static_frame.core.util import isna_array
+
+if tp.TYPE_CHECKING:
+    import pyarrow.compute as pc  # pylint: disable=W0611 #pragma: no cover
+
+    from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=W0611,C0412 #pragma: no cover
+
+# operator symbol: (SQL operator, array function)
+_OPERATORS: tp.Dict[str, tp.Tuple[str, tp.Callable[[tp.Any, tp.Any], tp.Any]]] = {
+        '==': ('=', operator.eq),
+        '!=': ('!=', operator.ne),
+        '<': ('<', operator.lt),
+        '<=': ('<=', operator.le),
+        '>': ('>', operator.gt),
+        '>=': ('>=', operator.ge),
+        }
+
+
+def _value_to_sql(value: tp.Any) -> tp.Any:
+    '''Convert NumPy scalars to Python objects that can be bound as SQL parameters.
+    '''
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class RowFilter:
+    '''
+    An expression of comparisons of column (or index) values to scalars, used with ``StoreConfig.row_filter`` to select rows when reading from a :obj:`Store`. Create expressions from :obj:`RowFilterColumn` and combine them with ``&``, ``|``, and ``~``. Stores that support it evaluate the expression when reading (as an SQL ``WHERE`` clause or with ``pyarrow.Table.filter()``); other stores apply it as a Boolean mask after reading.
+
+    All evaluations share the same handling of missing values (``None``, NaN, and NaT in arrays; NULL in SQL and ``pyarrow``): a missing value never satisfies a comparison to, or ``isin`` of, values that are not missing; comparing with ``==`` or ``!=`` to ``None`` (or NaN) selects rows that are, or are not, missing, and ``isin`` values that include ``None`` select missing rows; ``~`` selects exactly the rows its operand does not select.
+    '''
+    __slots__ = ()
+
+    def __and__(self, other: RowFilter) -> RowFilter:
+        return RowFilterAnd(self, other)
+
+    def __or__(self, other: RowFilter) -> RowFilter:
+        return RowFilterOr(self, other)
+
+    def __invert__(self) -> RowFilter:
+        return RowFilterNot(self)
+
+    def _key(self) -> tp.Tuple[tp.Any, ...]:
+        raise NotImplementedError() #pragma: no cover
+
+    def _iter_labels(self) -> tp.Iterator[TLabel]:
+        '''Yield the labels of all columns (or index depths) referenced by this expression.
+        '''
+        raise NotImplementedError() #pragma: no cover
+
+    def __eq__(self, other: tp.Any) -> bool:
+        if not isinstance(other, RowFilter):
+            return False
+        return self._key() == other._key()
+
+    def __ne__(self, other: tp.Any) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    #---------------------------------------------------------------------------
+
+    def to_sql(self) -> tp.Tuple[str, tp.List[tp.Any]]:
+        '''Return an SQL expression, with ``?`` placeholders, and a list of parameters to bind to those placeholders.
+        '''
+        raise NotImplementedError() #pragma: no cover
+
+    def to_arrow(self) -> 'pc.Expression':
+        '''Return a ``pyarrow.compute.Expression`` suitable for ``pyarrow.Table.filter()``. As missing values include NaN, this expression is not suitable for the ``filters`` argument of ``pyarrow.parquet.read_table``, which prunes row groups by statistics that do not count NaN as null.
+        '''
+        raise NotImplementedError() #pragma: no cover
+
+    def to_mask(self, frame: TFrameAny) -> TNDArrayAny:
+        '''Return a Boolean array, of the length of ``frame``, of the rows selected by this expression.
+        '''
+        raise NotImplementedError() #pragma: no cover
+
+    def filter(self, frame: TFrameAny) -> TFrameAny:
+        '''Return ``frame`` with only the rows selected by this expression.
+        '''
+        mask = self.to_mask(frame)
+        if mask.all():
+            return frame
+        return frame.iloc[mask]
+
+
+class RowFilterColumn:
+    '''
+    A reference to a column, or index depth, by name. Comparison operators, and the :py:meth:`isin` method, return :obj:`RowFilter` expressions.
+    '''
+    __slots__ = ('_label',)
+
+    def __init__(self, label: TLabel) -> None:
+        self._label = label
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__}: {self._label!r}>'
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._label))
+
+    def __eq__(self, value: tp.Any) -> RowFilter: # type: ignore[override]
+        return RowFilterCompare(self._label, '==', value)
+
+    def __ne__(self, value: tp.Any) -> RowFilter: # type: ignore[override]
+        return RowFilterCompare(self._label, '!=', value)
+
+    def __lt__(self, value: tp.Any) -> RowFilter:
+        return RowFilterCompare(self._label, '<', value)
+
+    def __le__(self, value: tp.Any) -> RowFilter:
+        return RowFilterCompare(self._label, '<=', value)
+
+    def __gt__(self, value: tp.Any) -> RowFilter:
+        return RowFilterCompare(self._label, '>', value)
+
+    def __ge__(self, value: tp.Any) -> RowFilter:
+        return RowFilterCompare(self._label, '>=', value)
+
+    def isin(self, values: tp.Iterable[tp.Any]) -> RowFilter:
+        '''Select rows where the value is one of ``values``.
+        '''
+        return RowFilterIsIn(self._label, values)
+
+
+#-------------------------------------------------------------------------------
+
+def _frame_to_array(frame: TFrameAny, label: TLabel) -> TNDArrayAny:
+    '''Return the values of a column, or of an index depth with the name ``label``.
+    '''
+    if label in frame.columns:
+        return frame._blocks._extract_array_column(frame.columns.loc_to_iloc(label))
+    index = frame.index
+    if index.depth == 1:
+        if index.name == label:
+            return index.values
+    elif label in index.names:
+        return index.values_at_depth(index.names.index(label))
+    raise ErrorInitStoreConfig(f'row_filter label {label!r} is not a column or index name.')
+
+
+def _quote(label: TLabel) -> str:
+    escaped = str(label).replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _array_compare(
+        array: TNDArrayAny,
+        func: tp.Callable[[tp.Any, tp.Any], tp.Any],
+        value: tp.Any,
+        ) -> TNDArrayAny:
+    '''Apply ``func`` to only the values of ``array`` that are not missing; missing values are never selected.
+    '''
+    isna = isna_array(array)
+    if not isna.any():
+        return func(array, value) # type: ignore
+    post = np.full(len(array), False, dtype=DTYPE_BOOL)
+    valid = ~isna
+    post[valid] = func(array[valid], value)
+    return post
+
+
+class RowFilterCompare(RowFilter):
+    __slots__ = ('_label', '_operator', '_value')
+
+    def __init__(self, label: TLabel, op: str, value: tp.Any) -> None:
+        if op not in _OPERATORS:
+            raise ErrorInitStoreConfig(f'unsupported operator: {op}')
+        if isna_element(value) and op != '==' and op != '!=':
+            raise ErrorInitStoreConfig(f'missing values can only be compared with == or !=, not {op}')
+        self._label = label
+        self._operator = op
+        self._value = value
+
+    def __repr__(self) -> str:
+        return f'({self._label!r} {self._operator} {self._value!r})'
+
+    def _key(self) -> tp.Tuple[tp.Any, ...]:
+        return (self.__class__, self._label, self._operator, self._value)
+
+    def _iter_labels(self) -> tp.Iterator[TLabel]:
+        yield self._label
+
+    def to_sql(self) -> tp.Tuple[str, tp.List[tp.Any]]:
+        label = _quote(self._label)
+        if isna_element(self._value):
+            return f'{label} IS {"" if self._operator == "==" else "NOT "}NULL', []
+        op = _OPERATORS[self._operator][0]
+        # NULL never satisfies the comparison; this avoids NULL results, such that NOT is the complement
+        return f'{label} IS NOT NULL AND {label} {op} ?', [_value_to_sql(self._value)]
+
+    def to_arrow(self) -> 'pc.Expression':
+        import pyarrow.compute as pc
+        field = pc.field(self._label)
+        isna = field.is_null(nan_is_null=True)
+        if isna_element(self._value):
+            return isna if self._operator == '==' else ~isna
+        func = _OPERATORS[self._operator][1]
+        return ~isna & func(field, self._value)
+
+    def to_mask(self, frame: TFrameAny) -> TNDArrayAny:
+        array = _frame_to_array(frame, self._label)
+        if isna_element(self._value):
+            isna = isna_array(array)
+            return isna if self._operator == '==' else ~isna
+        func = _OPERATORS[self._operator][1]
+        return _array_compare(array, func, self._value)
+
+
+class RowFilterIsIn(RowFilter):
+    __slots__ = ('_label', '_values', '_include_na')
+
+    def __init__(self, label: TLabel, values: tp.Iterable[tp.Any]) -> None:
+        self._label = label
+        self._values = tuple(values)
+        self._include_na = any(isna_element(v) for v in self._values)
+
+    def __repr__(self) -> str:
+        return f'({self._label!r} in {self._values!r})'
+
+    def _key(self) -> tp.Tuple[tp.Any, ...]:
+        return (self.__class__, self._label, self._values)
+
+    def _iter_labels(self) -> tp.Iterator[TLabel]:
+        yield self._label
+
+    def _values_valid(self) -> tp.List[tp.Any]:
+        return [v for v in self._values if not isna_element(v)]
+
+    def to_sql(self) -> tp.Tuple[str, tp.List[tp.Any]]:
+        label = _quote(self._label)
+        values = self._values_valid()
+        if not values:
+            return (f'{label} IS NULL', []) if self._include_na else ('1 = 0', [])
+        placeholders = ', '.join('?' for _ in values)
+        sql = f'{label} IS NOT NULL AND {label} IN ({placeholders})'
+        if self._include_na:
+            sql = f'{label} IS NULL OR ({sql})'
+        return sql, [_value_to_sql(v) for v in values]
+
+    def to_arrow(self) -> 'pc.Expression':
+        import pyarrow.compute as pc
+        field = pc.field(self._label)
+        isna = field.is_null(nan_is_null=True)
+        values = self._values_valid()
+        if not values:
+            return isna if self._include_na else pc.scalar(False)
+        post = ~isna & field.isin(values)
+        if self._include_na:
+            return isna | post
+        return post
+
+    def to_mask(self, frame: TFrameAny) -> TNDArrayAny:
+        array = _frame_to_array(frame, self._label)
+        post = _array_compare(array, isin, self._values_valid())
+        if self._include_na:
+            post |= isna_array(array)
+        return post
+
+
+class RowFilterAnd(RowFilter):
+    __slots__ = ('_left', '_right')
+
+    def __init__(self, left: RowFilter, right: RowFilter) -> None:
+        self._left = left
+        self._right = right
+
+    def __repr__(self) -> str:
+        return f'({self._left!r} & {self._right!r})'
+
+    def _key(self) -> tp.Tuple[tp.Any, ...]:
+        return (self.__class__, self._left._key(), self._right._key())
+
+    def _iter_labels(self) -> tp.Iterator[TLabel]:
+        yield from self._left._iter_labels()
+        yield from self._right._iter_labels()
+
+    def to_sql(self) -> tp.Tuple[str, tp.List[tp.Any]]:
+        left, left_params = self._left.to_sql()
+        right, right_params = self._right.to_sql()
+        return f'({left}) AND ({right})', left_params + right_params
+
+    def to_arrow(self) -> 'pc.Expression':
+        return self._left.to_arrow() & self._right.to_arrow()
+
+    def to_mask(self, frame: TFrameAny) -> TNDArrayAny:
+        return self._left.to_mask(frame) & self._right.to_mask(frame)
+
+
+class RowFilterOr(RowFilter):
+    __slots__ = ('_left', '_right')
+
+    def __init__(self, left: RowFilter, right: RowFilter) -> None:
+        self._left = left
+        self._right = right
+
+    def __repr__(self) -> str:
+        return f'({self._left!r} | {self._right!r})'
+
+    def _key(self) -> tp.Tuple[tp.Any, ...]:
+        return (self.__class__, self._left._key(), self._right._key())
+
+    def _iter_labels(self) -> tp.Iterator[TLabel]:
+        yield from self._left._iter_labels()
+        yield from self._right._iter_labels()
+
+    def to_sql(self) -> tp.Tuple[str, tp.List[tp.Any]]:
+        left, left_params = self._left.to_sql()
+        right, right_params = self._right.to_sql()
+        return f'({left}) OR ({right})', left_params + right_params
+
+    def to_arrow(self) -> 'pc.Expression':
+        return self._left.to_arrow() | self._right.to_arrow()
+
+    def to_mask(self, frame: TFrameAny) -> TNDArrayAny:
+        return self._left.to_mask(frame) | self._right.to_mask(frame)
+
+
+class RowFilterNot(RowFilter):
+    __slots__ = ('_operand',)
+
+    def __init__(self, operand: RowFilter) -> None:
+        self._operand = operand
+
+    def __repr__(self) -> str:
+        return f'~{self._operand!r}'
+
+    def _key(self) -> tp.Tuple[tp.Any, ...]:
+        return (self.__class__, self._operand._key())
+
+    def _iter_labels(self) -> tp.Iterator[TLabel]:
+        yield from self._operand._iter_labels()
+
+    def to_sql(self) -> tp.Tuple[str, tp.List[tp.Any]]:
+        operand, params = self._operand.to_sql()
+        return f'NOT ({operand})', params
+
+    def to_arrow(self) -> 'pc.Expression':
+        return ~self._operand.to_arrow()
+
+    def to_mask(self, frame: TFrameAny) -> TNDArrayAny:
+        return ~self._operand.to_mask(frame)
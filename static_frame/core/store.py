@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 from functools import partial
 from functools import wraps
 from itertools import chain
@@ -14,7 +16,9 @@ from static_frame.core.exception import StoreFileMutation
 from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.store_config import StoreConfig
+from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
+from static_frame.core.util import NOT_IN_CACHE_SENTINEL
 from static_frame.core.util import TCallableAny
 from static_frame.core.util import TLabel
 from static_frame.core.util import TPathSpecifier
@@ -61,6 +65,7 @@ class Store:
             '_fp',
             '_last_modified',
             '_weak_cache',
+            '_cache_lock',
             )
 
     def __init__(self, fp: TPathSpecifier):
@@ -75,6 +80,7 @@ class Store:
         self._last_modified = np.nan
         self._mtime_update()
         self._weak_cache: tp.MutableMapping[TLabel, TFrameAny] = WeakValueDictionary()
+        self._cache_lock = threading.Lock()
 
     def _mtime_update(self) -> None:
         if os.path.exists(self._fp):
@@ -100,7 +106,7 @@ class Store:
             {
                 attr: getattr(self, attr)
                 for attr in self.__slots__
-                if attr != '_weak_cache'
+                if attr != '_weak_cache' and attr != '_cache_lock'
             }
         )
 
@@ -108,6 +114,34 @@ class Store:
         for key, value in state[1].items():
             setattr(self, key, value)
         self._weak_cache = WeakValueDictionary()
+        self._cache_lock = threading.Lock()
+
+    #---------------------------------------------------------------------------
+    # weak_cache; as a Store might be read from more than one thread (as when a Bus prefetches), access is serialized with a lock
+
+    @staticmethod
+    def _cacheable(config: StoreConfig) -> bool:
+        '''As the weak_cache is keyed by label, only :obj:`Frame` read without a projection of columns or a filter of rows are cached.
+        '''
+        return config.columns_select is None and config.row_filter is None
+
+    def _cache_get(self, label: TLabel, config: StoreConfig) -> tp.Any:
+        '''Return the cached :obj:`Frame` for ``label``, or ``NOT_IN_CACHE_SENTINEL`` if not cached or if ``config`` is not cacheable.
+        '''
+        if not self._cacheable(config):
+            return NOT_IN_CACHE_SENTINEL
+        with self._cache_lock:
+            return self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+
+    def _cache_set(self, label: TLabel, frame: TFrameAny, config: StoreConfig) -> None:
+        if not self._cacheable(config):
+            return
+        with self._cache_lock:
+            self._weak_cache[label] = frame
+
+    def _cache_discard(self, label: TLabel) -> None:
+        with self._cache_lock:
+            self._weak_cache.pop(label, None)
 
     # def __copy__(self) -> 'Store':
     #     '''
@@ -257,6 +291,34 @@ class Store:
         '''
         return next(self.read_many((label,), config=config, container_type=container_type))
 
+    async def read_many_async(self,
+            labels: tp.Iterable[TLabel],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[TFrameAny] = Frame,
+            max_concurrency: int = 4,
+            ) -> tp.List[TFrameAny]:
+        '''Read many Frame, given by `labels`, from the Store, scheduling up to ``max_concurrency`` reads at a time in the default executor of the running event loop. Return a list of instances of `container_type` in the order of `labels`.
+
+        Concurrent reads require that each call of ``read()`` opens its own file or connection, as with the zip-based stores, :obj:`StoreSQLite`, :obj:`StoreDuckDB`, and :obj:`StoreXLSX`; :obj:`StoreHDF5` overrides this method to read serially, as PyTables is not thread safe.
+        '''
+        if max_concurrency < 1:
+            raise ErrorInitStore('max_concurrency must be greater than zero.')
+
+        config_map = StoreConfigMap.from_initializer(config)
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read(label: TLabel) -> TFrameAny:
+            async with semaphore:
+                return await loop.run_in_executor(None, partial(self.read,
+                        label,
+                        config=config_map[label],
+                        container_type=container_type,
+                        ))
+
+        return list(await asyncio.gather(*(read(label) for label in labels)))
+
     def write(self,
             items: tp.Iterable[tp.Tuple[str, TFrameAny]],
             *,
@@ -272,3 +334,10 @@ class Store:
             ) -> tp.Iterator[TLabel]:
         raise NotImplementedError() #pragma: no cover
 
+    def _label_to_shape(self,
+            config: StoreConfigMapInitializer = None,
+            ) -> tp.Optional[tp.Dict[TLabel, tp.Tuple[int, int]]]:
+        '''Return a mapping of label to the shape of each stored Frame if available without reading Frames, or None.
+        '''
+        return None
+
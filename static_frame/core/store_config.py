@@ -11,6 +11,9 @@ from static_frame.core.util import TDtypesSpecifier
 from static_frame.core.util import TIndexCtorSpecifiers
 from static_frame.core.util import TLabel
 
+if tp.TYPE_CHECKING:
+    from static_frame.core.row_filter import RowFilter  # pylint: disable=W0611 #pragma: no cover
+
 TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]]
 
 
@@ -31,6 +34,28 @@ def label_encode_tuple(source: tp.Tuple[tp.Any]) -> str:
     return f"({', '.join(parts)})"
 
 
+# NOTE: pragma values are interpolated into SQL, and so must be validated
+SQLITE_JOURNAL_MODES: tp.FrozenSet[tp.Union[str, int]] = frozenset(('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'))
+SQLITE_SYNCHRONOUS: tp.FrozenSet[tp.Union[str, int]] = frozenset(('OFF', 'NORMAL', 'FULL', 'EXTRA', 0, 1, 2, 3))
+
+def _sqlite_pragma_validate(
+        name: str,
+        value: tp.Optional[tp.Union[str, int]],
+        valid: tp.FrozenSet[tp.Union[str, int]],
+        ) -> None:
+    '''Raise if ``value`` is not None and not a member of ``valid``, comparing strings without case.
+    '''
+    if value is None:
+        return
+    if isinstance(value, str):
+        if value.upper() in valid:
+            return
+    elif isinstance(value, int) and not isinstance(value, bool) and value in valid:
+        return
+    raise ErrorInitStoreConfig(
+            f'Invalid {name} {value!r}; must be one of {sorted(valid, key=str)}.')
+
+
 #-------------------------------------------------------------------------------
 
 class StoreConfigHE(metaclass=InterfaceMeta):
@@ -45,6 +70,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     columns_name_depth_level: tp.Optional[TDepthLevel]
     columns_constructors: TIndexCtorSpecifiers
     columns_select: tp.Optional[tp.Iterable[str]]
+    row_filter: tp.Optional[RowFilter]
     dtypes: TDtypesSpecifier
     consolidate_blocks: bool
     skip_header: int
@@ -57,8 +83,19 @@ class StoreConfigHE(metaclass=InterfaceMeta):
     merge_hierarchical_labels: bool
     read_max_workers: tp.Optional[int]
     read_chunksize: int
+    read_prefetch: int
+    read_use_threads: bool
+    read_shared_memory: bool
+    read_memory_map: bool
     write_max_workers: tp.Optional[int]
     write_chunksize: int
+    write_manifest: bool
+    write_dictionary_encode: bool
+    write_compact_strings: bool
+    write_index_components: bool
+    write_codec: tp.Optional[str]
+    write_journal_mode: tp.Optional[str]
+    write_synchronous: tp.Optional[tp.Union[str, int]]
     mp_context: tp.Optional[str]
     _hash: tp.Optional[int]
 
@@ -70,6 +107,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'columns_name_depth_level',
             'columns_constructors',
             'columns_select',
+            'row_filter',
             'dtypes',
             'consolidate_blocks',
             'skip_header',
@@ -82,8 +120,19 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             'merge_hierarchical_labels',
             'read_max_workers',
             'read_chunksize',
+            'read_prefetch',
+            'read_use_threads',
+            'read_shared_memory',
+            'read_memory_map',
             'write_max_workers',
             'write_chunksize',
+            'write_manifest',
+            'write_dictionary_encode',
+            'write_compact_strings',
+            'write_index_components',
+            'write_codec',
+            'write_journal_mode',
+            'write_synchronous',
             'mp_context',
             '_hash'
             )
@@ -97,6 +146,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             columns_name_depth_level: tp.Optional[TDepthLevel] = None,
             columns_constructors: TIndexCtorSpecifiers = None,
             columns_select: tp.Optional[tp.Iterable[str]] = None,
+            row_filter: tp.Optional[RowFilter] = None,
             dtypes: TDtypesSpecifier = None,
             consolidate_blocks: bool = False,
             # not used by all constructors
@@ -113,14 +163,38 @@ class StoreConfigHE(metaclass=InterfaceMeta):
             # multiprocessing configuration
             read_max_workers: tp.Optional[int] = None,
             read_chunksize: int = 1,
+            read_prefetch: int = 0,
+            read_use_threads: bool = False,
+            read_shared_memory: bool = False,
+            read_memory_map: bool = False,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            write_manifest: bool = False,
+            write_dictionary_encode: bool = False,
+            write_compact_strings: bool = False,
+            write_index_components: bool = False,
+            write_codec: tp.Optional[str] = None,
+            write_journal_mode: tp.Optional[str] = None,
+            write_synchronous: tp.Optional[tp.Union[str, int]] = None,
             mp_context: tp.Optional[str] = None,
             ):
         '''
         Args:
+            columns_select: An optional iterable of column labels to read. Stores read only what is needed where the format permits: :obj:`StoreZipNPY` and :obj:`StoreZipNPZ` only decode the blocks containing selected columns, and :obj:`StoreSQLite` and :obj:`StoreDuckDB` only query the index and selected fields.
+            row_filter: An optional :obj:`RowFilter` expression, created with :obj:`RowFilterColumn`, selecting the rows to read. :obj:`StoreSQLite` and :obj:`StoreDuckDB` evaluate the expression as an SQL ``WHERE`` clause, and :obj:`StoreZipParquet` as a ``pyarrow`` expression applied to the table read; other stores apply it as a Boolean mask after reading. Labels in the expression refer to columns or, after reading, index names.
             include_index: Boolean to determine if the ``index`` is included in output.
             include_columns: Boolean to determine if the ``columns`` is included in output.
+            read_prefetch: When iterating over all :obj:`Frame` in a :obj:`Bus`, the number of subsequent :obj:`Frame` to read from the :obj:`Store` in a background thread while the current :obj:`Frame` is processed.
+            read_use_threads: When ``read_max_workers`` is set, read with a pool of threads rather than a pool of processes. This avoids pickling each :obj:`Frame` back from a worker process, and is efficient for formats whose decoding releases the GIL, such as decompression, NPY, and parquet.
+            read_shared_memory: When ``read_max_workers`` is set and a pool of processes is used, return each :obj:`Frame` from worker processes in shared memory rather than by pickling its arrays; the resulting :obj:`Frame` are immutable views of shared memory. :obj:`Frame` with object arrays are pickled.
+            read_memory_map: For :obj:`StoreZipNPY` of uncompressed (``ZIP_STORED``) archives, memory map arrays from the ZIP file rather than reading them into memory; memory maps are closed when the arrays that use them are released.
+            write_manifest: For zip-based :obj:`Store`, write a manifest of labels, shapes, dtypes, and file offsets into the ZIP, such that ``labels()`` and :obj:`Bus` shapes can be provided without reading the ZIP directory or any :obj:`Frame`. A shape is only provided if reading with the :obj:`Bus` configuration reproduces the stored shape: ``columns_select`` and ``row_filter`` are not set and, for delimited and parquet formats, ``index_depth`` and ``columns_depth`` match the depths written. When appending, a manifest is updated if present; appending with ``write_manifest`` to a ZIP without a manifest raises.
+            write_dictionary_encode: For :obj:`StoreZipNPZ` and :obj:`StoreZipNPY`, store string columns that are smaller when dictionary encoded as integer codes and unique values; these are decoded when read.
+            write_compact_strings: For :obj:`StoreZipNPZ` and :obj:`StoreZipNPY`, store unicode columns that are smaller without padding as code points and string lengths; these are decoded when read.
+            write_index_components: For :obj:`StoreZipNPZ` and :obj:`StoreZipNPY`, also store the labels per depth and the indexers of ``IndexHierarchy`` index and columns; see :py:meth:`Frame.to_npz`.
+            write_codec: For :obj:`StoreZipNPZ`, compress arrays with a codec, one of "zstd", "lz4", "zlib", or "auto"; see :py:meth:`Frame.to_npz`. The codec is detected when read.
+            write_journal_mode: For :obj:`StoreSQLite`, the ``journal_mode`` pragma used when writing: one of ``'DELETE'``, ``'TRUNCATE'``, ``'PERSIST'``, ``'MEMORY'``, ``'WAL'``, or ``'OFF'``.
+            write_synchronous: For :obj:`StoreSQLite`, the ``synchronous`` pragma used when writing: one of ``'OFF'``, ``'NORMAL'``, ``'FULL'``, or ``'EXTRA'``, or the equivalent integers 0 through 3.
         '''
         # constructor
         self.index_depth = index_depth
@@ -130,6 +204,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
         self.columns_name_depth_level = columns_name_depth_level
         self.columns_constructors = columns_constructors
         self.columns_select = columns_select
+        self.row_filter = row_filter
         self.dtypes = dtypes
         self.consolidate_blocks = consolidate_blocks
         self.skip_header = skip_header
@@ -147,8 +222,21 @@ class StoreConfigHE(metaclass=InterfaceMeta):
 
         self.read_max_workers = read_max_workers
         self.read_chunksize = read_chunksize
+        self.read_prefetch = read_prefetch
+        self.read_use_threads = read_use_threads
+        self.read_shared_memory = read_shared_memory
+        self.read_memory_map = read_memory_map
         self.write_max_workers = write_max_workers
         self.write_chunksize = write_chunksize
+        self.write_manifest = write_manifest
+        self.write_dictionary_encode = write_dictionary_encode
+        self.write_compact_strings = write_compact_strings
+        self.write_index_components = write_index_components
+        self.write_codec = write_codec
+        _sqlite_pragma_validate('write_journal_mode', write_journal_mode, SQLITE_JOURNAL_MODES)
+        _sqlite_pragma_validate('write_synchronous', write_synchronous, SQLITE_SYNCHRONOUS)
+        self.write_journal_mode = write_journal_mode
+        self.write_synchronous = write_synchronous
         self.mp_context = mp_context
         self._hash = None
 
@@ -193,6 +281,7 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self._hash_depth_specifier(self.columns_name_depth_level),
                     self.columns_constructors, # class or callable
                     self.columns_select if self.columns_select is None else tuple(self.columns_select),
+                    self.row_filter, # hashable RowFilter
                     self._hash_dtypes_specifier(self.dtypes),
                     self.consolidate_blocks, # bool
                     self.skip_header, # int
@@ -205,8 +294,19 @@ class StoreConfigHE(metaclass=InterfaceMeta):
                     self.merge_hierarchical_labels, # bool
                     self.read_max_workers, # Optional[int]
                     self.read_chunksize, # int
+                    self.read_prefetch, # int
+                    self.read_use_threads, # bool
+                    self.read_shared_memory, # bool
+                    self.read_memory_map, # bool
                     self.write_max_workers, # Optional[int]
                     self.write_chunksize, # int
+                    self.write_manifest, # bool
+                    self.write_dictionary_encode, # bool
+                    self.write_compact_strings, # bool
+                    self.write_index_components, # bool
+                    self.write_codec, # Optional[str]
+                    self.write_journal_mode, # Optional[str]
+                    self.write_synchronous, # Optional[Union[str, int]]
                     self.mp_context,
             ))
         return self._hash
@@ -249,6 +349,7 @@ class StoreConfig(StoreConfigHE):
             columns_name_depth_level: tp.Optional[TDepthLevel] = None,
             columns_constructors: TIndexCtorSpecifiers = None,
             columns_select: tp.Optional[tp.Iterable[str]] = None,
+            row_filter: tp.Optional[RowFilter] = None,
             dtypes: TDtypesSpecifier = None,
             consolidate_blocks: bool = False,
             skip_header: int = 0,
@@ -263,8 +364,19 @@ class StoreConfig(StoreConfigHE):
             label_decoder: tp.Optional[tp.Callable[[str], TLabel]] = None,
             read_max_workers: tp.Optional[int] = None,
             read_chunksize: int = 1,
+            read_prefetch: int = 0,
+            read_use_threads: bool = False,
+            read_shared_memory: bool = False,
+            read_memory_map: bool = False,
             write_max_workers: tp.Optional[int] = None,
             write_chunksize: int = 1,
+            write_manifest: bool = False,
+            write_dictionary_encode: bool = False,
+            write_compact_strings: bool = False,
+            write_index_components: bool = False,
+            write_codec: tp.Optional[str] = None,
+            write_journal_mode: tp.Optional[str] = None,
+            write_synchronous: tp.Optional[tp.Union[str, int]] = None,
             mp_context: tp.Optional[str] = None,
             ):
         StoreConfigHE.__init__(self,
@@ -275,6 +387,7 @@ class StoreConfig(StoreConfigHE):
                 columns_name_depth_level=columns_name_depth_level,
                 columns_constructors=columns_constructors,
                 columns_select=columns_select,
+                row_filter=row_filter,
                 dtypes=dtypes,
                 consolidate_blocks=consolidate_blocks,
                 skip_header=skip_header,
@@ -287,8 +400,19 @@ class StoreConfig(StoreConfigHE):
                 merge_hierarchical_labels=merge_hierarchical_labels,
                 read_max_workers=read_max_workers,
                 read_chunksize=read_chunksize,
+                read_prefetch=read_prefetch,
+                read_use_threads=read_use_threads,
+                read_shared_memory=read_shared_memory,
+                read_memory_map=read_memory_map,
                 write_max_workers=write_max_workers,
                 write_chunksize=write_chunksize,
+                write_manifest=write_manifest,
+                write_dictionary_encode=write_dictionary_encode,
+                write_compact_strings=write_compact_strings,
+                write_index_components=write_index_components,
+                write_codec=write_codec,
+                write_journal_mode=write_journal_mode,
+                write_synchronous=write_synchronous,
                 mp_context=mp_context,
         )
         self.label_encoder = label_encoder
@@ -352,8 +476,15 @@ class StoreConfigMap:
             'label_decoder',
             'read_max_workers',
             'read_chunksize',
+            'read_prefetch',
+            'read_use_threads',
+            'read_shared_memory',
+            'read_memory_map',
             'write_max_workers',
             'write_chunksize',
+            'write_manifest',
+            'write_journal_mode',
+            'write_synchronous',
     )
 
     @classmethod
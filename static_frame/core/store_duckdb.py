@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import os
+from collections import deque
+from concurrent.futures import Future
 from contextlib import suppress
 from functools import partial
+from itertools import chain
 
-import numpy as np
 import typing_extensions as tp
-from numpy import ma
 
 from static_frame.core.container_util import constructor_from_optional_constructors
 from static_frame.core.container_util import index_from_optional_constructors
@@ -14,6 +15,7 @@ from static_frame.core.frame import Frame
 from static_frame.core.index import Index
 from static_frame.core.index_base import IndexBase
 from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.row_filter import _quote
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
@@ -27,11 +29,14 @@ from static_frame.core.util import TIndexHierarchyCtor
 from static_frame.core.util import TIndexInitializer
 from static_frame.core.util import TLabel
 from static_frame.core.util import TNDArrayAny
+from static_frame.core.util import get_concurrent_executor
 
 if tp.TYPE_CHECKING:
+    import pyarrow as pa  # pragma: no cover
     from duckdb import DuckDBPyConnection  # pragma: no cover
 
     from static_frame.core.generic_aliases import TFrameAny  # pylint: disable=C0412 #pragma: no cover
+    from static_frame.core.row_filter import RowFilter  # pylint: disable=C0412 #pragma: no cover
 
 # NOTE: general approach taken in aligning columns into a Frame
 # '''
@@ -49,18 +54,17 @@ class StoreDuckDB(Store):
     _EXT: tp.FrozenSet[str] =  frozenset(('.db', '.duckdb'))
 
     @classmethod
-    def _frame_to_connection(cls,
+    def _frame_to_arrow(cls,
             *,
             frame: TFrameAny,
-            label: str,
-            connection: 'DuckDBPyConnection',
             include_index: bool,
             include_columns: bool,
-            ) -> 'DuckDBPyConnection':
+            ) -> 'pa.Table':
         '''
-        Args:
-            label: string to be used as the table name.
+        Return a ``pyarrow.Table`` of the fields to be written for ``frame``; numeric arrays are not copied.
         '''
+        import pyarrow as pa
+
         field_names, _ = cls.get_field_names_and_dtypes(
                 frame=frame,
                 include_index=include_index,
@@ -69,30 +73,62 @@ class StoreDuckDB(Store):
                 include_columns_name=False,
                 force_brackets=False
                 )
-        label_arrays = zip(field_names,
-                cls.get_column_iterator(frame, include_index=include_index)
+        return pa.Table.from_arrays(
+                [pa.array(a) for a in cls.get_column_iterator(frame, include_index=include_index)],
+                names=[str(name) for name in field_names],
                 )
-        # note: this does not yet work SET max_expression_depth TO "70000":
-        query = [f'CREATE TABLE {label} AS WITH']
-        w = []
-        s = ['SELECT']
 
-        for i, (label, array) in enumerate(label_arrays):
-            # TEMP: waiting on duckdb to support registering arrays
-            exec(f'a{i} = array')
-            w.append(f't{i} AS (SELECT ROW_NUMBER() OVER() AS rownum, * FROM a{i})')
-            s.append(f't{i}.column0 AS "{label}",')
+    @classmethod
+    def _frame_to_connection(cls,
+            *,
+            frame: TFrameAny,
+            label: str,
+            connection: 'DuckDBPyConnection',
+            include_index: bool,
+            include_columns: bool,
+            table: tp.Optional['pa.Table'] = None,
+            ) -> 'DuckDBPyConnection':
+        '''
+        Args:
+            label: string to be used as the table name.
+            table: optionally, the result of ``_frame_to_arrow()`` for ``frame``.
+        '''
+        if table is None:
+            table = cls._frame_to_arrow(
+                    frame=frame,
+                    include_index=include_index,
+                    include_columns=include_columns,
+                    )
+        # NOTE: registering a pyarrow Table permits DuckDB to read the Arrow buffers directly
+        view = f'__sf_{label}__'
+        connection.register(view, table)
+        try:
+            return connection.execute(f'CREATE TABLE {label} AS SELECT * FROM "{view}"')
+        finally:
+            connection.unregister(view)
 
-        query.append(', '.join(w))
-        s.append('from t0')
-        query.extend(s)
+    @staticmethod
+    def _arrow_to_array(chunked: 'pa.ChunkedArray') -> TNDArrayAny:
+        '''
+        Return an immutable array from a column of a ``pyarrow.Table``. Numeric columns without nulls in one chunk are not copied.
+        '''
+        import pyarrow as pa
 
-        r = range(len(field_names))
-        for i, j in zip(r[:-1], r[1:]):
-            query.append(f'join t{j} on t{i}.rownum = t{j}.rownum')
+        dtype = chunked.type
+        if pa.types.is_dictionary(dtype): # ENUM
+            dtype = dtype.value_type
+            chunked = chunked.cast(dtype)
+        elif pa.types.is_decimal(dtype):
+            dtype = pa.float64()
+            chunked = chunked.cast(dtype)
 
-        msg = ' '.join(query)
-        return connection.execute(msg)
+        values = chunked.chunk(0) if chunked.num_chunks == 1 else chunked.combine_chunks()
+        # NOTE: integers with nulls are converted to floats with NaN
+        array: TNDArrayAny = values.to_numpy(zero_copy_only=False)
+        if (pa.types.is_string(dtype) or pa.types.is_large_string(dtype)) and not values.null_count:
+            array = array.astype(str)
+        array.flags.writeable = False
+        return array
 
     @classmethod
     def _connection_to_frame(cls,
@@ -103,23 +139,34 @@ class StoreDuckDB(Store):
             index_depth: int = 0,
             index_constructors: TIndexCtorSpecifiers = None,
             columns_depth: int = 1,
+            columns_select: tp.Optional[tp.Iterable[str]] = None,
             columns_constructors: TIndexCtorSpecifiers = None,
+            row_filter: tp.Optional[RowFilter] = None,
             name: TLabel = NAME_DEFAULT,
             consolidate_blocks: bool = False,
             ) -> TFrameAny:
-        labels: tp.List[TLabel] = []
-        arrays: tp.List[TNDArrayAny] = []
-        for l, a in connection.query(
-                f'select * from {label}').fetchnumpy().items():
-            labels.append(l)
-            if a.__class__ is ma.MaskedArray:
-                # we assume these are always floating arrays; with DuckDB 1.0.0, we cannot use the `fill_value` in the MaskedArray
-                a = a.filled(np.nan)
-            elif a.__class__ is not np.ndarray:
-                # assume we have a categorical of strings
-                a = a.to_numpy().astype(str)
-            a.flags.writeable = False
-            arrays.append(a)
+        fields_query = '*'
+        if columns_select is not None and columns_depth <= 1:
+            # push the selection into the query such that only the index and selected fields are read
+            fields = connection.query(f'select * from {label} limit 0').columns
+            selected = set(columns_select)
+            fields_select = [f for f in fields[index_depth:] if f in selected]
+            if fields_select:
+                fields_query = ', '.join(_quote(f)
+                        for f in chain(fields[:index_depth], fields_select))
+                columns_select = None
+
+        query = f'select {fields_query} from {label}'
+        parameters: tp.List[tp.Any] = []
+        if row_filter is not None:
+            # push the filter into the query as a where clause
+            where, parameters = row_filter.to_sql()
+            query = f'{query} where {where}'
+
+        table = connection.execute(query, parameters).fetch_arrow_table()
+        labels: tp.List[TLabel] = list(table.column_names)
+        arrays: tp.List[TNDArrayAny] = [cls._arrow_to_array(c) for c in table.columns]
+        del table
 
         index: tp.Optional[TIndexInitializer]
         index_constructor: TIndexCtorSpecifier
@@ -159,6 +206,8 @@ class StoreDuckDB(Store):
                     explicit_constructors=index_constructors,
                     )
 
+        columns: tp.Optional[IndexBase] = None
+        own_columns = False
         if columns_depth == 1:
             columns, own_columns = index_from_optional_constructors(
                     labels,
@@ -179,6 +228,12 @@ class StoreDuckDB(Store):
                     explicit_constructors=columns_constructors,
                     )
 
+        if columns_select is not None and columns is not None:
+            # NOTE: hierarchical columns are only identifiable after delimited field names are parsed
+            iloc_sel = columns._loc_to_iloc(columns.isin(tuple(columns_select)))
+            arrays = [arrays[i] for i in iloc_sel] # type: ignore
+            columns = columns._extract_iloc(iloc_sel) # type: ignore
+
         if consolidate_blocks:
             arrays = TypeBlocks.consolidate_blocks(arrays) # type: ignore
         tb = TypeBlocks.from_blocks(arrays)
@@ -207,18 +262,50 @@ class StoreDuckDB(Store):
         with suppress(FileNotFoundError):
             os.remove(self._fp)
 
+        def to_arrow(item: tp.Tuple[TLabel, TFrameAny]) -> tp.Tuple[TLabel, TFrameAny, 'pa.Table']:
+            label, frame = item
+            c = config_map[label]
+            return label, frame, self._frame_to_arrow(
+                    frame=frame,
+                    include_index=c.include_index,
+                    include_columns=c.include_columns,
+                    )
+
+        max_workers = config_map.default.write_max_workers
         with duckdb.connect(self._fp, read_only=False) as conn:
-            for label, frame in items:
+
+            def to_connection(label: TLabel, frame: TFrameAny, table: 'pa.Table') -> None:
                 c = config_map[label]
-                # if label is STORE_LABEL_DEFAULT this will raise
-                label = config_map.default.label_encode(label)
                 self._frame_to_connection(
                         frame=frame,
-                        label=label,
+                        # if label is STORE_LABEL_DEFAULT this will raise
+                        label=config_map.default.label_encode(label),
                         connection=conn,
                         include_index=c.include_index,
                         include_columns=c.include_columns,
+                        table=table,
+                        )
+
+            conn.execute('BEGIN TRANSACTION')
+            if max_workers is not None and max_workers > 1:
+                # NOTE: Arrow conversion releases the GIL, and Arrow tables are not pickled, so threads are used; only table creation is serial. At most max_workers conversions are submitted ahead of the table being created, such that only that many Arrow tables are held.
+                pool_executor = get_concurrent_executor(
+                        use_threads=True,
+                        max_workers=max_workers,
+                        mp_context=None,
                         )
+                with pool_executor() as executor:
+                    futures: tp.Deque[Future[tp.Tuple[TLabel, TFrameAny, 'pa.Table']]] = deque()
+                    for item in items:
+                        futures.append(executor.submit(to_arrow, item))
+                        if len(futures) > max_workers:
+                            to_connection(*futures.popleft().result())
+                    while futures:
+                        to_connection(*futures.popleft().result())
+            else:
+                for item in items:
+                    to_connection(*to_arrow(item))
+            conn.execute('COMMIT')
 
     @store_coherent_non_write
     def read_many(self,
@@ -243,8 +330,9 @@ class StoreDuckDB(Store):
                         index_depth=c.index_depth,
                         index_constructors=c.index_constructors,
                         columns_depth=c.columns_depth,
-                        # columns_select=c.columns_select,
+                        columns_select=c.columns_select,
                         columns_constructors=c.columns_constructors,
+                        row_filter=c.row_filter,
                         name=name,
                         consolidate_blocks=c.consolidate_blocks
                         )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
 import numpy as np
 import typing_extensions as tp
 
 # from static_frame.core.doc_str import doc_inject
+from static_frame.core.exception import ErrorInitStore
 from static_frame.core.frame import Frame
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
@@ -92,6 +95,7 @@ class StoreHDF5(Store):
                 columns_depth = c.columns_depth
                 columns_constructors = c.columns_constructors
                 consolidate_blocks = c.consolidate_blocks
+                columns_select = None if c.columns_select is None else set(c.columns_select)
                 if c.dtypes:
                     raise NotImplementedError('using config.dtypes on HDF5 not yet supported')
 
@@ -103,6 +107,10 @@ class StoreHDF5(Store):
 
                 def blocks() -> tp.Iterator[TNDArrayAny]:
                     for col_idx, colname in enumerate(colnames):
+                        if (columns_select is not None
+                                and col_idx >= index_depth
+                                and colname not in columns_select):
+                            continue # do not read unselected columns
                         # can also do: table.read(field=colname)
                         array = table.col(colname) # pyright: ignore
                         if array.dtype.kind in DTYPE_STR_KINDS:
@@ -122,7 +130,7 @@ class StoreHDF5(Store):
                     data = TypeBlocks.from_blocks(blocks())
 
                 # this will own_data in subsequent constructor call
-                yield container_type._from_data_index_arrays_column_labels(
+                f = container_type._from_data_index_arrays_column_labels(
                         data=data,
                         index_depth=index_depth,
                         index_arrays=index_arrays,
@@ -132,6 +140,29 @@ class StoreHDF5(Store):
                         columns_constructors=columns_constructors,
                         name=label,
                         )
+                if c.row_filter is not None:
+                    f = c.row_filter.filter(f)
+                yield f
+
+    async def read_many_async(self,
+            labels: tp.Iterable[TLabel],
+            *,
+            config: StoreConfigMapInitializer = None,
+            container_type: tp.Type[TFrameAny] = Frame,
+            max_concurrency: int = 4,
+            ) -> tp.List[TFrameAny]:
+        '''Read many Frame, given by `labels`, from the Store in the default executor of the running event loop. As PyTables is not thread safe, all Frame are read serially in one call of the executor, and ``max_concurrency`` is not used. Return a list of instances of `container_type` in the order of `labels`.
+        '''
+        if max_concurrency < 1:
+            raise ErrorInitStore('max_concurrency must be greater than zero.')
+
+        def read() -> tp.List[TFrameAny]:
+            return list(self.read_many(labels,
+                    config=config,
+                    container_type=container_type,
+                    ))
+
+        return await asyncio.get_running_loop().run_in_executor(None, read)
 
     @store_coherent_non_write
     def labels(self, *,
@@ -4,15 +4,18 @@ import os
 import sqlite3
 from contextlib import suppress
 from fractions import Fraction
+from itertools import chain
 
 import numpy as np
 import typing_extensions as tp
 
 # from static_frame.core.doc_str import doc_inject
 from static_frame.core.frame import Frame
+from static_frame.core.row_filter import _quote
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
 from static_frame.core.store import store_coherent_write
+from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.util import DTYPE_BOOL
@@ -22,6 +25,7 @@ from static_frame.core.util import DTYPE_STR_KINDS
 from static_frame.core.util import TLabel
 
 if tp.TYPE_CHECKING:
+    from static_frame.core.row_filter import RowFilter  # pylint: disable=W0611 #pragma: no cover
     TDtypeAny = np.dtype[tp.Any] #pragma: no cover
 
 TFrameAny = Frame[tp.Any, tp.Any, tp.Unpack[tp.Tuple[tp.Any, ...]]]  #pragma: no cover
@@ -31,6 +35,8 @@ class StoreSQLite(Store):
 
     _EXT: tp.FrozenSet[str] =  frozenset(('.db', '.sqlite'))
     _BYTES_ONE = b'1'
+    # the maximum number of rows given to each call to executemany()
+    _WRITE_BATCH_ROWS = 10_000
 
     @staticmethod
     def _dtype_to_affinity_type(
@@ -51,16 +57,16 @@ class StoreSQLite(Store):
         return 'NONE'
 
     @classmethod
-    def _frame_to_table(cls,
+    def _frame_to_statements(cls,
             *,
             frame: TFrameAny,
-            label: str, # can be None
-            cursor: sqlite3.Cursor,
+            label: str,
             include_columns: bool,
             include_index: bool,
-            # store_filter: tp.Optional[StoreFilter]
-            ) -> None:
-
+            ) -> tp.Tuple[str, str]:
+        '''
+        Return the ``CREATE TABLE`` and ``INSERT`` statements for writing ``frame`` to the table ``label``.
+        '''
         # here we provide a row-based represerntation that is externally usable as an slqite db; an alternative approach would be to store one cell pre column, where the column iststored as as binary BLOB; see here https://stackoverflow.com/questions/18621513/python-insert-numpy-array-into-sqlite3-database
         field_names, dtypes = cls.get_field_names_and_dtypes(
                 frame=frame,
@@ -88,15 +94,48 @@ class StoreSQLite(Store):
 
         create_fields = ', '.join(f'{k} {v}' for k, v in field_name_to_field_type)
         create = f'CREATE TABLE "{label}" ({create_fields}{create_primary_key})'
-        cursor.execute(create)
 
         # works for IndexHierarchy too
         insert_fields = ', '.join(f'{k}' for k in field_names)
         insert_template = ', '.join('?' for _ in field_names)
         insert = f'INSERT INTO "{label}" ({insert_fields}) VALUES ({insert_template})'
+        return create, insert
 
-        values = cls._get_row_iterator(frame=frame, include_index=include_index)
-        cursor.executemany(insert, values())
+    @classmethod
+    def _frame_to_rows(cls,
+            *,
+            frame: TFrameAny,
+            include_index: bool,
+            ) -> tp.Iterator[tp.List[tp.Tuple[tp.Any, ...]]]:
+        '''
+        Yield lists of up to ``_WRITE_BATCH_ROWS`` rows of Python objects. Converting column arrays with ``tolist()`` avoids creating an array, and NumPy scalars, per row.
+        '''
+        arrays = list(cls.get_column_iterator(frame, include_index=include_index))
+        count = frame.shape[0]
+        step = cls._WRITE_BATCH_ROWS
+        for start in range(0, count, step):
+            stop = start + step
+            yield list(zip(*(a[start:stop].tolist() for a in arrays)))
+
+    @classmethod
+    def _frame_to_table(cls,
+            *,
+            frame: TFrameAny,
+            label: str, # can be None
+            cursor: sqlite3.Cursor,
+            include_columns: bool,
+            include_index: bool,
+            # store_filter: tp.Optional[StoreFilter]
+            ) -> None:
+        create, insert = cls._frame_to_statements(
+                frame=frame,
+                label=label,
+                include_columns=include_columns,
+                include_index=include_index,
+                )
+        cursor.execute(create)
+        for rows in cls._frame_to_rows(frame=frame, include_index=include_index):
+            cursor.executemany(insert, rows)
 
     @store_coherent_write
     def write(self,
@@ -107,6 +146,7 @@ class StoreSQLite(Store):
             ) -> None:
 
         config_map = StoreConfigMap.from_initializer(config)
+        config_default = config_map.default
 
         # NOTE: register adapters for NP types:
         # numpy types go in as blobs if they are not individually converted tp python types
@@ -124,13 +164,16 @@ class StoreSQLite(Store):
 
         with sqlite3.connect(self._fp, detect_types=sqlite3.PARSE_DECLTYPES) as conn:
             cursor = conn.cursor()
+            for pragma in self._write_pragmas(config_default):
+                cursor.execute(pragma)
+            # write all tables in a single transaction
+            cursor.execute('BEGIN')
+            # NOTE: as inserts are serial, and rows of Python objects are larger to transfer between processes than to create, Frames are always converted to rows in this process
             for label, frame in items:
                 c = config_map[label]
-                # if label is STORE_LABEL_DEFAULT this will raise
-                label = config_map.default.label_encode(label)
-
                 self._frame_to_table(frame=frame,
-                        label=label,
+                        # if label is STORE_LABEL_DEFAULT this will raise
+                        label=config_default.label_encode(label),
                         cursor=cursor,
                         include_columns=c.include_columns,
                         include_index=c.include_index,
@@ -139,6 +182,47 @@ class StoreSQLite(Store):
 
             conn.commit()
 
+    @staticmethod
+    def _write_pragmas(config: StoreConfig) -> tp.Iterator[str]:
+        '''
+        Yield ``PRAGMA`` statements for configuring the connection used for writing.
+        '''
+        if config.write_journal_mode is not None:
+            yield f'PRAGMA journal_mode = {config.write_journal_mode}'
+        if config.write_synchronous is not None:
+            yield f'PRAGMA synchronous = {config.write_synchronous}'
+
+    @staticmethod
+    def _query_select(
+            *,
+            label: str,
+            cursor: sqlite3.Cursor,
+            index_depth: int,
+            columns_depth: int,
+            columns_select: tp.Optional[tp.Iterable[str]],
+            row_filter: tp.Optional[RowFilter],
+            ) -> tp.Tuple[str, tp.Optional[tp.Iterable[str]], tp.List[tp.Any]]:
+        '''
+        Return the query to read the table ``label``, the ``columns_select`` that remains to be applied by ``Frame.from_sql``, and the query parameters. If possible, ``columns_select`` is pushed into the query such that only the index and selected fields are read; ``row_filter`` is always pushed into the query as a ``WHERE`` clause.
+        '''
+        fields_query = '*'
+        if columns_select is not None and columns_depth <= 1:
+            # NOTE: hierarchical columns are only identifiable after delimited field names are parsed
+            cursor.execute(f'PRAGMA table_info("{label}")')
+            fields = [row[1] for row in cursor]
+            selected = set(columns_select)
+            fields_select = [f for f in fields[index_depth:] if f in selected]
+            if fields_select:
+                fields_query = ', '.join(_quote(f)
+                        for f in chain(fields[:index_depth], fields_select))
+                columns_select = None
+
+        query = f'SELECT {fields_query} from "{label}"'
+        if row_filter is None:
+            return query, columns_select, []
+        where, parameters = row_filter.to_sql()
+        return f'{query} WHERE {where}', columns_select, parameters
+
     @store_coherent_non_write
     def read_many(self,
             labels: tp.Iterable[TLabel],
@@ -154,21 +238,30 @@ class StoreSQLite(Store):
                 detect_types=sqlite3.PARSE_DECLTYPES
                 ) as conn:
 
+            cursor = conn.cursor()
             for label in labels:
                 c = config_map[label]
                 label_encoded = config_map.default.label_encode(label)
                 name = label
-                query = f'SELECT * from "{label_encoded}"'
+                query, columns_select, parameters = self._query_select(
+                        label=label_encoded,
+                        cursor=cursor,
+                        index_depth=c.index_depth,
+                        columns_depth=c.columns_depth,
+                        columns_select=c.columns_select,
+                        row_filter=c.row_filter,
+                        )
                 yield container_type.from_sql(query=query,
                         connection=conn,
                         index_depth=c.index_depth,
                         index_constructors=c.index_constructors,
                         columns_depth=c.columns_depth,
-                        columns_select=c.columns_select,
+                        columns_select=columns_select,
                         columns_constructors=c.columns_constructors,
                         dtypes=c.dtypes,
                         name=name,
-                        consolidate_blocks=c.consolidate_blocks
+                        consolidate_blocks=c.consolidate_blocks,
+                        parameters=parameters,
                         )
 
     @store_coherent_non_write
@@ -550,7 +550,7 @@ class StoreXLSX(Store):
                     explicit_constructors=columns_constructors, # cannot supply name
                     )
 
-            yield container_type.from_records(data,
+            f = container_type.from_records(data,
                     index=index,
                     columns=columns,
                     dtypes=dtypes,
@@ -559,6 +559,9 @@ class StoreXLSX(Store):
                     name=name,
                     consolidate_blocks=consolidate_blocks
                     )
+            if c.row_filter is not None:
+                f = c.row_filter.filter(f)
+            yield f
         wb.close()
 
     @store_coherent_non_write
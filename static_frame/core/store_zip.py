@@ -1,19 +1,34 @@
 from __future__ import annotations
 
+import json
 import os
 import pickle
+import threading
+import warnings
 import zipfile
 from io import BytesIO
 from io import StringIO
 
+import numpy as np
 import typing_extensions as tp
 
 from static_frame.core.archive_npy import ArchiveFrameConverter
 from static_frame.core.archive_npy import ArchiveZipWrapper
+from static_frame.core.archive_npy import FuncSharedMemory
+from static_frame.core.archive_npy import NPYConverter
+from static_frame.core.archive_npy import SharedMemoryFrameConverter
+from static_frame.core.archive_zip import ZipFileRO
+from static_frame.core.archive_zip import ZipInfoRO
+from static_frame.core.archive_zip import zip_compact
+from static_frame.core.archive_zip import zip_manifest_read
+from static_frame.core.archive_zip import zip_manifest_write
 from static_frame.core.archive_zip import zip_namelist
+from static_frame.core.archive_zip import zip_tombstone
 from static_frame.core.container_util import container_to_exporter_attr
+from static_frame.core.exception import ErrorInitStoreConfig
 from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.exception import StoreLabelNonUnique
+from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.store import Store
 from static_frame.core.store import store_coherent_non_write
@@ -24,6 +39,7 @@ from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_config import StoreConfigMapInitializer
 from static_frame.core.util import NOT_IN_CACHE_SENTINEL
 from static_frame.core.util import TCallableAny
+from static_frame.core.util import TDtypeAny
 from static_frame.core.util import TLabel
 from static_frame.core.util import get_concurrent_executor
 
@@ -52,11 +68,223 @@ class PayloadFrameToBytes(tp.NamedTuple):
     exporter: FrameExporter
 
 
+class ZipFileThreadLocal:
+    '''
+    Provide, to each thread that calls ``get()``, its own ZipFile opened for reading the same file, as a ZipFile cannot be shared for concurrent reads. All ZipFile are closed on exiting the context manager.
+    '''
+    __slots__ = (
+            '_fp',
+            '_local',
+            '_zfs',
+            )
+
+    def __init__(self, fp: str) -> None:
+        self._fp = fp
+        self._local = threading.local()
+        self._zfs: tp.List[zipfile.ZipFile] = []
+
+    def get(self) -> zipfile.ZipFile:
+        zf: tp.Optional[zipfile.ZipFile] = getattr(self._local, 'zf', None)
+        if zf is None:
+            # NOTE: the ZipFile is cached per thread and closed in __exit__(), so cannot be opened with a context manager
+            zf = zipfile.ZipFile(self._fp) # pylint: disable=R1732
+            self._local.zf = zf
+            self._zfs.append(zf) # list append is thread safe
+        return zf
+
+    def __enter__(self) -> 'ZipFileThreadLocal':
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        for zf in self._zfs:
+            zf.close()
+        self._zfs.clear()
+
+
+class StoreZipManifest:
+    '''
+    The shape, dtypes, and bytes of each :obj:`Frame` in a zip-based :obj:`Store`, and the position and size of each file in the ZIP. Written into the ZIP when ``StoreConfig.write_manifest`` is True; the position of the manifest is recorded in the ZIP archive comment such that it can be read without reading the ZIP directory.
+    '''
+    NAME = '__manifest__.json'
+
+    __slots__ = (
+            '_frames',
+            '_members',
+            )
+
+    def __init__(self,
+            frames: tp.Optional[tp.Dict[str, tp.Dict[str, tp.Any]]] = None,
+            members: tp.Optional[tp.Dict[str, tp.List[int]]] = None,
+            ) -> None:
+        # NOTE: keys are encoded labels, in the order of their files in the ZIP
+        self._frames: tp.Dict[str, tp.Dict[str, tp.Any]] = {} if frames is None else frames
+        self._members: tp.Dict[str, tp.List[int]] = {} if members is None else members
+
+    @classmethod
+    def read(cls, fp: str) -> tp.Optional['StoreZipManifest']:
+        '''Return the manifest of the ZIP at ``fp``, or None if the ZIP has no manifest.
+        '''
+        data = zip_manifest_read(fp, cls.NAME)
+        if data is None:
+            return None
+        post = json.loads(data)
+        return cls(post['frames'], post['members'])
+
+    def write(self, zf: zipfile.ZipFile) -> None:
+        '''Record the files presently in ``zf`` and write this manifest into ``zf``.
+        '''
+        name_manifest = self.NAME
+        self._members = {zinfo.filename: [
+                zinfo.header_offset,
+                zinfo.file_size,
+                zinfo.flag_bits,
+                zinfo.compress_type,
+                ] for zinfo in zf.filelist if zinfo.filename != name_manifest}
+        data = json.dumps({'frames': self._frames, 'members': self._members})
+        zip_manifest_write(zf, name_manifest, data.encode('utf-8'))
+
+    @staticmethod
+    def describe(frame: TFrameAny, config: StoreConfig) -> tp.Dict[str, tp.Any]:
+        '''Return the description of ``frame``, written with ``config``, recorded in a manifest. The depths of the index and columns written are recorded such that a shape is only reported for reads that reproduce that layout.
+        '''
+        return {
+                'shape': frame.shape,
+                'dtypes': [dt.str for dt in frame._blocks.dtypes],
+                'nbytes': frame.nbytes,
+                'depths': [
+                        frame.index.depth if config.include_index else 0,
+                        frame.columns.depth if config.include_columns else 0,
+                        ],
+                }
+
+    def add(self, label_encoded: str, description: tp.Dict[str, tp.Any]) -> None:
+        '''Record the description of a :obj:`Frame`, replacing any previously recorded :obj:`Frame` of the same label in its position.
+        '''
+        self._frames[label_encoded] = description
+
+    def labels(self) -> tp.Iterator[str]:
+        '''The encoded labels of recorded :obj:`Frame`.
+        '''
+        return iter(self._frames)
+
+    def shape(self, label_encoded: str) -> tp.Tuple[int, int]:
+        rows, columns = self._frames[label_encoded]['shape']
+        return rows, columns
+
+    def depths(self, label_encoded: str) -> tp.Optional[tp.Tuple[int, int]]:
+        '''The depths of the index and columns written, or None if not recorded.
+        '''
+        depths = self._frames[label_encoded].get('depths')
+        if depths is None:
+            return None
+        index_depth, columns_depth = depths
+        return index_depth, columns_depth
+
+    def dtypes(self, label_encoded: str) -> tp.List[TDtypeAny]:
+        return [np.dtype(dt) for dt in self._frames[label_encoded]['dtypes']]
+
+    def nbytes(self, label_encoded: str) -> int:
+        return self._frames[label_encoded]['nbytes'] # type: ignore
+
+    def zinfos(self) -> tp.Iterator[ZipInfoRO]:
+        '''Return a ``ZipInfoRO`` for each file, for opening files by position without reading the ZIP directory.
+        '''
+        for name, (offset, size, flag_bits, compress_type) in self._members.items():
+            if compress_type != zipfile.ZIP_STORED:
+                raise zipfile.BadZipFile('Cannot process compressed zips')
+            zinfo = ZipInfoRO(name)
+            zinfo.header_offset = offset
+            zinfo.file_size = size
+            zinfo.flag_bits = flag_bits
+            yield zinfo
+
+
+
+def _append_mode_manifest(
+        fp: str,
+        config_map: StoreConfigMap,
+        ) -> tp.Tuple[tp.Literal['w', 'a'], tp.Optional[StoreZipManifest]]:
+    '''Return the ZipFile mode for appending to the ZIP at ``fp``, and the manifest to update: the manifest of an existing ZIP, if it has one, or a new manifest if creating a ZIP with ``write_manifest``. Raises if ``write_manifest`` is set and an existing ZIP has no manifest, as the manifest cannot describe the existing :obj:`Frame` without reading them.
+    '''
+    if os.path.exists(fp):
+        manifest = StoreZipManifest.read(fp)
+        if manifest is None and config_map.default.write_manifest:
+            raise StoreParameterConflict(
+                    'Cannot write a manifest when appending to a ZIP without a manifest; rewrite the ZIP with write().')
+        return 'a', manifest
+    return 'w', StoreZipManifest() if config_map.default.write_manifest else None
+
+
+def _manifest_label_to_shape(
+        fp: str,
+        config: StoreConfigMapInitializer,
+        depths_stored: bool,
+        ) -> tp.Optional[tp.Dict[TLabel, tp.Tuple[int, int]]]:
+    '''Return a mapping of label to shape from the manifest of the ZIP at ``fp``, or None if the ZIP has no manifest. Labels are only included if reading with ``config`` reproduces the stored shape: ``columns_select`` and ``row_filter`` are not set and, if the format does not store the depths of the index and columns (``depths_stored``), ``index_depth`` and ``columns_depth`` are those written.
+    '''
+    manifest = StoreZipManifest.read(fp)
+    if manifest is None:
+        return None
+    config_map = StoreConfigMap.from_initializer(config)
+    post = {}
+    for name in manifest.labels():
+        label = config_map.default.label_decode(name)
+        c = config_map[label]
+        if c.columns_select is not None or c.row_filter is not None:
+            continue
+        if not depths_stored and manifest.depths(name) != (c.index_depth, c.columns_depth):
+            continue
+        post[label] = manifest.shape(name)
+    return post
+
+
+def _columns_select_deferred(
+        config: tp.Union[StoreConfigHE, StoreConfig],
+        ) -> tp.Optional[tp.Iterable[TLabel]]:
+    '''If ``config.row_filter`` refers to labels not read because of ``config.columns_select``, return ``config.columns_select``, to be applied with ``_columns_select_project()`` after reading all columns and filtering; otherwise, return None.
+    '''
+    if config.row_filter is None or config.columns_select is None:
+        return None
+    selected = set(config.columns_select)
+    if all(label in selected for label in config.row_filter._iter_labels()):
+        return None
+    return config.columns_select
+
+
+def _columns_select_project(
+        frame: TFrameAny,
+        columns_select: tp.Iterable[TLabel],
+        ) -> TFrameAny:
+    '''Return ``frame`` with only the columns in ``columns_select``, retaining the stored order of columns.
+    '''
+    selected = set(columns_select)
+    return frame[[label for label in frame.columns if label in selected]]
+
+
+def _store_zip_compact(fp: str, align: int) -> int:
+    '''Compact the ZIP at ``fp`` with ``zip_compact()``, rewriting the manifest, if present, with the new positions of files.
+    '''
+    size = os.path.getsize(fp)
+    manifest = StoreZipManifest.read(fp)
+    if manifest is None:
+        return zip_compact(fp, align=align)
+
+    zip_compact(fp, align=align, exclude=StoreZipManifest.NAME.__eq__)
+    with zipfile.ZipFile(fp, mode='a', allowZip64=True) as zf:
+        manifest.write(zf)
+    return size - os.path.getsize(fp)
+
+
+
 class _StoreZip(Store):
 
     _EXT: tp.FrozenSet[str] = frozenset(('.zip',))
     _EXT_CONTAINED: str = ''
     _EXPORTER: TCallableAny
+    # if True, _build_frame() applies config.row_filter when reading
+    _ROW_FILTER_NATIVE: bool = False
+    # if True, the depths of the index and columns are restored when reading, regardless of config.index_depth and config.columns_depth
+    _DEPTHS_STORED: bool = False
 
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[TFrameAny]) -> FrameConstructor:
@@ -71,12 +299,47 @@ class _StoreZip(Store):
             ) -> TFrameAny:
         raise NotImplementedError
 
+    @classmethod
+    def _build_frame_filtered(cls,
+            src: bytes,
+            name: TLabel,
+            config: tp.Union[StoreConfigHE, StoreConfig],
+            constructor: FrameConstructor,
+            ) -> TFrameAny:
+        '''
+        Call _build_frame() and, if the format does not apply ``config.row_filter`` when reading, apply it to the resulting Frame.
+        '''
+        row_filter = config.row_filter
+        if cls._ROW_FILTER_NATIVE or row_filter is None:
+            return cls._build_frame(
+                    src=src,
+                    name=name,
+                    config=config,
+                    constructor=constructor,
+                    )
+        columns_select = _columns_select_deferred(config)
+        if columns_select is not None:
+            # NOTE: read all columns such that row_filter can be evaluated
+            kwargs = {attr: getattr(config, attr)
+                    for attr in StoreConfigHE.__slots__ if not attr.startswith('_')}
+            kwargs['columns_select'] = None
+            config = StoreConfigHE(**kwargs)
+        frame = row_filter.filter(cls._build_frame(
+                src=src,
+                name=name,
+                config=config,
+                constructor=constructor,
+                ))
+        if columns_select is not None:
+            return _columns_select_project(frame, columns_select)
+        return frame
+
     @classmethod
     def _payload_to_frame(cls, payload: PayloadBytesToFrame) -> TFrameAny:
         '''
-        Single argument wrapper for _build_frame().
+        Single argument wrapper for _build_frame_filtered().
         '''
-        return cls._build_frame(
+        return cls._build_frame_filtered(
                 src=payload.src,
                 name=payload.name,
                 config=payload.config,
@@ -100,12 +363,27 @@ class _StoreZip(Store):
             ) -> tp.Iterator[TLabel]:
         config_map = StoreConfigMap.from_initializer(config)
 
+        manifest = StoreZipManifest.read(self._fp)
+        if manifest is not None:
+            ext = '' if strip_ext else self._EXT_CONTAINED
+            for name in manifest.labels():
+                yield config_map.default.label_decode(name + ext)
+            return
+
         for name in zip_namelist(self._fp):
+            if name == StoreZipManifest.NAME:
+                continue
             if strip_ext:
                 name = name.replace(self._EXT_CONTAINED, '')
             # always use default decoder
             yield config_map.default.label_decode(name)
 
+    @store_coherent_non_write
+    def _label_to_shape(self,
+            config: StoreConfigMapInitializer = None,
+            ) -> tp.Optional[tp.Dict[TLabel, tp.Tuple[int, int]]]:
+        return _manifest_label_to_shape(self._fp, config, self._DEPTHS_STORED)
+
     @store_coherent_non_write
     def _read_many_single_thread(self,
             labels: tp.Iterable[TLabel],
@@ -123,25 +401,24 @@ class _StoreZip(Store):
                 # Since the value can be deallocated between lookup & extraction,
                 # we have to handle it with `get`` & a sentinel to ensure we
                 # don't have a race condition
-                cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+                c: StoreConfig = config_map[label]
+                cache_lookup = self._cache_get(label, c)
                 if cache_lookup is not NOT_IN_CACHE_SENTINEL:
-                    yield self._set_container_type(cache_lookup, container_type) # type: ignore
+                    yield self._set_container_type(cache_lookup, container_type)
                     continue
 
-                c: StoreConfig = config_map[label]
-
                 label_encoded: str = config_map.default.label_encode(label)
                 # NOTE: bytes read here are decompressed and CRC checked when using ZipFile; the resulting bytes, downstream, are treated as an uncompressed zip
                 src: bytes = zf.read(label_encoded + self._EXT_CONTAINED)
 
-                frame = self._build_frame(
+                frame = self._build_frame_filtered(
                         src=src,
                         name=label,
                         config=c,
                         constructor=constructor,
                 )
                 # Newly read frame, add it to our weak_cache
-                self._weak_cache[label] = frame
+                self._cache_set(label, frame, c)
                 yield frame
 
     @store_coherent_non_write
@@ -171,9 +448,9 @@ class _StoreZip(Store):
             results: tp.Dict[TLabel, tp.Optional[TFrameAny]] = {}
             for label in labels:
                 count_labels += 1
-                cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+                cache_lookup = self._cache_get(label, config_map[label])
                 if cache_lookup is not NOT_IN_CACHE_SENTINEL:
-                    results[label] = self._set_container_type(cache_lookup, container_type) # type: ignore
+                    results[label] = self._set_container_type(cache_lookup, container_type)
                     count_cache += 1
                 else:
                     results[label] = None
@@ -214,24 +491,52 @@ class _StoreZip(Store):
                             constructor=constructor,
                             )
 
+        use_threads = config_map.default.read_use_threads
         chunksize = config_map.default.read_chunksize
         pool_executor = get_concurrent_executor(
-                use_threads=False,
+                use_threads=use_threads,
                 max_workers=config_map.default.read_max_workers,
                 mp_context=config_map.default.mp_context,
                 )
 
-        with pool_executor() as executor:
-            frame_gen = executor.map(self._payload_to_frame, gen(), chunksize=chunksize)
+        with ZipFileThreadLocal(self._fp) as zftl, pool_executor() as executor:
+            if use_threads:
+                # NOTE: reading and decompressing bytes, as well as building the frame, is done in each thread, as both can release the GIL; the weak_cache is only updated in this thread
+                def read_frame(label: TLabel) -> TFrameAny:
+                    label_encoded: str = config_map.default.label_encode(label)
+                    src: bytes = zftl.get().read(label_encoded + self._EXT_CONTAINED)
+                    return self._build_frame_filtered(
+                            src=src,
+                            name=label,
+                            config=config_map[label],
+                            constructor=constructor,
+                            )
 
-            for label, cached_frame in results_items():
-                if cached_frame is not None:
-                    yield cached_frame
-                else:
-                    frame = next(frame_gen)
-                    # Newly read frame, add it to our weak_cache
-                    self._weak_cache[label] = frame
-                    yield frame
+                frame_gen = executor.map(read_frame,
+                        (label for label, cached_frame in results_items()
+                        if cached_frame is None),
+                        )
+            elif config_map.default.read_shared_memory:
+                frame_gen = SharedMemoryFrameConverter.decode_iter(
+                        executor.map(FuncSharedMemory(self._payload_to_frame),
+                                gen(),
+                                chunksize=chunksize,
+                                ))
+            else:
+                frame_gen = executor.map(self._payload_to_frame, gen(), chunksize=chunksize)
+
+            try:
+                for label, cached_frame in results_items():
+                    if cached_frame is not None:
+                        yield cached_frame
+                    else:
+                        frame = next(frame_gen)
+                        # Newly read frame, add it to our weak_cache
+                        self._cache_set(label, frame, config_map[label])
+                        yield frame
+            finally:
+                # if shared memory is used, release segments not consumed
+                frame_gen.close() # type: ignore
 
     # --------------------------------------------------------------------------
 
@@ -239,19 +544,20 @@ class _StoreZip(Store):
     def _payload_to_bytes(payload: PayloadFrameToBytes) -> LabelAndBytes:
         raise NotImplementedError('implement on derived class') #pragma: no cover
 
-    @store_coherent_write
-    def write(self,
+    def _label_and_bytes(self,
             items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
-            *,
-            config: StoreConfigMapInitializer = None,
-            compression: int = zipfile.ZIP_DEFLATED,
-            ) -> None:
-        config_map = StoreConfigMap.from_initializer(config)
+            config_map: StoreConfigMap,
+            descriptions: tp.Optional[tp.Dict[TLabel, tp.Dict[str, tp.Any]]],
+            ) -> tp.Iterator[LabelAndBytes]:
+        '''Encode each Frame to bytes, optionally with a pool of processes. If ``descriptions`` is provided, the manifest description of each Frame is added by label.
+        '''
         multiprocess = (config_map.default.write_max_workers is not None and
                         config_map.default.write_max_workers > 1)
 
         def gen() -> tp.Iterable[PayloadFrameToBytes]:
             for label, frame in items:
+                if descriptions is not None:
+                    descriptions[label] = StoreZipManifest.describe(frame, config_map[label])
                 yield PayloadFrameToBytes( # pylint: disable=no-value-for-parameter
                         name=label,
                         config=config_map[label].to_store_config_he(),
@@ -265,15 +571,25 @@ class _StoreZip(Store):
                     max_workers=config_map.default.write_max_workers,
                     mp_context=config_map.default.mp_context,
                     )
-            def label_and_bytes() -> tp.Iterator[LabelAndBytes]:
-                with pool_executor() as executor:
-                    yield from executor.map(self._payload_to_bytes,
-                            gen(),
-                            chunksize=config_map.default.write_chunksize)
+            with pool_executor() as executor:
+                yield from executor.map(self._payload_to_bytes,
+                        gen(),
+                        chunksize=config_map.default.write_chunksize)
         else:
-            label_and_bytes = lambda: (self._payload_to_bytes(x) for x in gen())
+            yield from (self._payload_to_bytes(x) for x in gen())
 
+    @store_coherent_write
+    def write(self,
+            items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
+            *,
+            config: StoreConfigMapInitializer = None,
+            compression: int = zipfile.ZIP_DEFLATED,
+            ) -> None:
+        config_map = StoreConfigMap.from_initializer(config)
         labels_encoded = set() # track uniqueness post encoding
+        manifest = StoreZipManifest() if config_map.default.write_manifest else None
+        descriptions: tp.Optional[tp.Dict[TLabel, tp.Dict[str, tp.Any]]] = (
+                None if manifest is None else {})
 
         try:
             with zipfile.ZipFile(self._fp,
@@ -281,7 +597,7 @@ class _StoreZip(Store):
                     compression=compression,
                     allowZip64=True,
                     ) as zf:
-                for label, frame_bytes in label_and_bytes():
+                for label, frame_bytes in self._label_and_bytes(items, config_map, descriptions):
                     label_encoded = config_map.default.label_encode(label)
 
                     if label_encoded in labels_encoded:
@@ -289,12 +605,66 @@ class _StoreZip(Store):
                     labels_encoded.add(label_encoded)
 
                     zf.writestr(label_encoded + self._EXT_CONTAINED, frame_bytes)
+                    if manifest is not None:
+                        manifest.add(label_encoded, descriptions.pop(label)) # type: ignore
+
+                if manifest is not None:
+                    manifest.write(zf)
         except ErrorNPYEncode:
             # NOTE: catch NPY failures and remove self._fp to not leave a malformed zip
             if os.path.exists(self._fp):
                 os.remove(self._fp)
             raise
 
+    @store_coherent_write
+    def append(self,
+            items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
+            *,
+            config: StoreConfigMapInitializer = None,
+            compression: int = zipfile.ZIP_DEFLATED,
+            ) -> None:
+        '''Write Frames to the end of an existing ZIP (or to a new ZIP) without rewriting Frames already stored. Frames with labels already in the ZIP replace the stored Frames, retaining their position in ``labels()``; replaced Frames are removed from the ZIP's directory but their bytes remain in the file until :py:meth:`compact` is called.
+        '''
+        config_map = StoreConfigMap.from_initializer(config)
+        labels_encoded = set() # track uniqueness post encoding
+        mode, manifest = _append_mode_manifest(self._fp, config_map)
+        descriptions: tp.Optional[tp.Dict[TLabel, tp.Dict[str, tp.Any]]] = (
+                None if manifest is None else {})
+
+        with warnings.catch_warnings():
+            # NOTE: names of replaced files are duplicated until those files are tombstoned
+            warnings.filterwarnings('ignore', message='Duplicate name', category=UserWarning)
+            with zipfile.ZipFile(self._fp,
+                    mode=mode,
+                    compression=compression,
+                    allowZip64=True,
+                    ) as zf:
+                try:
+                    for label, frame_bytes in self._label_and_bytes(items, config_map, descriptions):
+                        label_encoded = config_map.default.label_encode(label)
+
+                        if label_encoded in labels_encoded:
+                            raise StoreLabelNonUnique(label_encoded)
+                        labels_encoded.add(label_encoded)
+
+                        name = label_encoded + self._EXT_CONTAINED
+                        stop = len(zf.filelist)
+                        zf.writestr(name, frame_bytes)
+                        zip_tombstone(zf, name.__eq__, stop=stop, relocate=True)
+                        self._cache_discard(label)
+                        if manifest is not None:
+                            manifest.add(label_encoded, descriptions.pop(label)) # type: ignore
+                finally:
+                    # NOTE: record all Frames written, even if a subsequent Frame fails
+                    if manifest is not None:
+                        manifest.write(zf)
+
+    @store_coherent_write
+    def compact(self) -> int:
+        '''Rewrite the ZIP without the bytes of Frames replaced by :py:meth:`append`. Returns the number of bytes removed.
+        '''
+        return _store_zip_compact(self._fp, align=1)
+
 
 class _StoreZipDelimited(_StoreZip):
     # store attribute of passed-in container_type to use for construction
@@ -321,6 +691,7 @@ class _StoreZipDelimited(_StoreZip):
             columns_depth=config.columns_depth,
             columns_name_depth_level=config.columns_name_depth_level,
             columns_constructors=config.columns_constructors,
+            columns_select=config.columns_select,
             dtypes=config.dtypes,
             name=name,
             consolidate_blocks=config.consolidate_blocks,
@@ -367,6 +738,7 @@ class StoreZipPickle(_StoreZip):
     '''
     _EXT_CONTAINED = '.pickle'
     _EXPORTER = pickle.dumps # NOTE: might be able to use to_pickle
+    _DEPTHS_STORED = True
 
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[TFrameAny]) -> FrameConstructor:
@@ -411,6 +783,7 @@ class StoreZipNPZ(_StoreZip):
     '''
     _EXT_CONTAINED = '.npz'
     _EXPORTER = Frame.to_npz
+    _DEPTHS_STORED = True
 
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[TFrameAny]) -> FrameConstructor:
@@ -425,6 +798,7 @@ class StoreZipNPZ(_StoreZip):
         ) -> TFrameAny:
         return constructor(
             BytesIO(src),
+            columns_select=config.columns_select,
             )
 
     @staticmethod
@@ -435,6 +809,10 @@ class StoreZipNPZ(_StoreZip):
                 dst,
                 include_index=c.include_index,
                 include_columns=c.include_columns,
+                dictionary_encode=c.write_dictionary_encode,
+                compact_strings=c.write_compact_strings,
+                index_components=c.write_index_components,
+                codec=c.write_codec,
                 )
         return payload.name, dst.getvalue()
 
@@ -445,6 +823,7 @@ class StoreZipParquet(_StoreZip):
     '''
     _EXT_CONTAINED = '.parquet'
     _EXPORTER = Frame.to_parquet
+    _ROW_FILTER_NATIVE = True
 
     @classmethod
     def _container_type_to_constructor(cls, container_type: tp.Type[TFrameAny]) -> FrameConstructor:
@@ -466,6 +845,7 @@ class StoreZipParquet(_StoreZip):
             columns_name_depth_level=config.columns_name_depth_level,
             columns_constructors=config.columns_constructors,
             columns_select=config.columns_select,
+            row_filter=config.row_filter,
             dtypes=config.dtypes,
             name=name,
             consolidate_blocks=config.consolidate_blocks,
@@ -487,11 +867,17 @@ class StoreZipParquet(_StoreZip):
 
 #-------------------------------------------------------------------------------
 class StoreZipNPY(Store):
-    '''A zip of NPY files. This does not presently support multi-processing.
+    '''A zip of NPY files. This does not presently support multi-processing, but supports reading with a pool of threads with ``read_use_threads``. If the ZIP is uncompressed (written with ``ZIP_STORED``), arrays are aligned in the ZIP file and can be memory mapped with ``read_memory_map``.
     '''
     _EXT: tp.FrozenSet[str] = frozenset(('.zip',))
     _DELIMITER = '/'
 
+    @store_coherent_non_write
+    def _label_to_shape(self,
+            config: StoreConfigMapInitializer = None,
+            ) -> tp.Optional[tp.Dict[TLabel, tp.Tuple[int, int]]]:
+        return _manifest_label_to_shape(self._fp, config, True)
+
     @store_coherent_write
     def write(self,
             items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
@@ -500,6 +886,7 @@ class StoreZipNPY(Store):
             compression: int = zipfile.ZIP_DEFLATED,
             ) -> None:
         config_map = StoreConfigMap.from_initializer(config)
+        manifest = StoreZipManifest() if config_map.default.write_manifest else None
 
         try:
             with zipfile.ZipFile(self._fp,
@@ -521,13 +908,89 @@ class StoreZipNPY(Store):
                             include_index=c.include_index,
                             include_columns=c.include_columns,
                             consolidate_blocks=c.consolidate_blocks,
+                            dictionary_encode=c.write_dictionary_encode,
+                            compact_strings=c.write_compact_strings,
+                            index_components=c.write_index_components,
                             )
+                    if manifest is not None:
+                        manifest.add(archive.prefix, StoreZipManifest.describe(frame, c))
+
+                if manifest is not None:
+                    manifest.write(zf)
         except ErrorNPYEncode:
             # NOTE: catch NPY failures and remove self._fp to not leave a malformed zip
             if os.path.exists(self._fp):
                 os.remove(self._fp)
             raise
 
+    @store_coherent_write
+    def append(self,
+            items: tp.Iterable[tp.Tuple[TLabel, TFrameAny]],
+            *,
+            config: StoreConfigMapInitializer = None,
+            compression: int = zipfile.ZIP_DEFLATED,
+            ) -> None:
+        '''Write Frames to the end of an existing ZIP (or to a new ZIP) without rewriting Frames already stored. Frames with labels already in the ZIP replace the stored Frames, retaining their position in ``labels()``; replaced Frames are removed from the ZIP's directory but their bytes remain in the file until :py:meth:`compact` is called. If a Frame cannot be encoded, the files written for that Frame are removed from the directory and the stored Frame, if any, is retained.
+        '''
+        config_map = StoreConfigMap.from_initializer(config)
+        labels_encoded = set()
+        mode, manifest = _append_mode_manifest(self._fp, config_map)
+        delimiter = self._DELIMITER
+
+        with warnings.catch_warnings():
+            # NOTE: names of replaced files are duplicated until those files are tombstoned
+            warnings.filterwarnings('ignore', message='Duplicate name', category=UserWarning)
+            with zipfile.ZipFile(self._fp,
+                    mode=mode,
+                    compression=compression,
+                    allowZip64=True,
+                    ) as zf:
+                archive = ArchiveZipWrapper(zf,
+                        writeable=True,
+                        memory_map=False,
+                        delimiter=delimiter,
+                        )
+                try:
+                    for label, frame in items:
+                        c: StoreConfig = config_map[label]
+                        label_encoded = config_map.default.label_encode(label)
+
+                        if label_encoded in labels_encoded:
+                            raise StoreLabelNonUnique(label_encoded)
+                        labels_encoded.add(label_encoded)
+
+                        archive.prefix = label_encoded # mutate
+                        selector = lambda name: name.rsplit(delimiter, 1)[0] == label_encoded # pylint: disable=W0640
+                        stop = len(zf.filelist)
+                        try:
+                            ArchiveFrameConverter.frame_encode(
+                                    archive=archive,
+                                    frame=frame,
+                                    include_index=c.include_index,
+                                    include_columns=c.include_columns,
+                                    consolidate_blocks=c.consolidate_blocks,
+                                    dictionary_encode=c.write_dictionary_encode,
+                                    compact_strings=c.write_compact_strings,
+                                    index_components=c.write_index_components,
+                                    )
+                        except ErrorNPYEncode:
+                            zip_tombstone(zf, selector, start=stop)
+                            raise
+                        zip_tombstone(zf, selector, stop=stop, relocate=True)
+                        self._cache_discard(label)
+                        if manifest is not None:
+                            manifest.add(label_encoded, StoreZipManifest.describe(frame, c))
+                finally:
+                    # NOTE: record all Frames written, even if a subsequent Frame fails
+                    if manifest is not None:
+                        manifest.write(zf)
+
+    @store_coherent_write
+    def compact(self) -> int:
+        '''Rewrite the ZIP without the bytes of Frames replaced by :py:meth:`append`, retaining the alignment of array data. Returns the number of bytes removed.
+        '''
+        return _store_zip_compact(self._fp, align=NPYConverter.ARRAY_ALIGN)
+
     @store_coherent_non_write
     def labels(self, *,
             config: StoreConfigMapInitializer = None,
@@ -536,6 +999,12 @@ class StoreZipNPY(Store):
 
         config_map = StoreConfigMap.from_initializer(config)
 
+        manifest = StoreZipManifest.read(self._fp)
+        if manifest is not None:
+            yield from (config_map.default.label_decode(name)
+                    for name in manifest.labels())
+            return
+
         with zipfile.ZipFile(self._fp) as zf:
             archive = ArchiveZipWrapper(zf,
                     writeable=False,
@@ -555,24 +1024,111 @@ class StoreZipNPY(Store):
             ) -> tp.Iterator[TFrameAny]:
 
         config_map = StoreConfigMap.from_initializer(config)
+        memory_map = config_map.default.read_memory_map
 
-        with zipfile.ZipFile(self._fp) as zf:
+        if (not memory_map
+                and config_map.default.read_use_threads
+                and config_map.default.read_max_workers is not None):
+            yield from self._read_many_threads(
+                    labels,
+                    config_map=config_map,
+                    container_type=container_type,
+                    )
+            return
+
+        zf: tp.Union[zipfile.ZipFile, ZipFileRO]
+        # NOTE: ZipFileRO only supports uncompressed ZIPs, and provides positions in the ZIP file necessary for memory mapping
+        if memory_map:
+            # NOTE: if a manifest is available, files are opened by their recorded positions without reading the ZIP directory
+            manifest = StoreZipManifest.read(self._fp)
+            try:
+                zf = ZipFileRO(self._fp, None if manifest is None else manifest.zinfos())
+            except zipfile.BadZipFile as e:
+                with zipfile.ZipFile(self._fp) as zf_compressed:
+                    compressed = any(zinfo.compress_type != zipfile.ZIP_STORED
+                            for zinfo in zf_compressed.infolist())
+                if compressed:
+                    raise ErrorInitStoreConfig('read_memory_map requires an uncompressed ZIP, written with ZIP_STORED.') from e
+                raise
+        else:
+            zf = zipfile.ZipFile(self._fp)
+        with zf:
             archive = ArchiveZipWrapper(zf,
                     writeable=False,
-                    memory_map=False,
+                    memory_map=memory_map,
                     delimiter=self._DELIMITER,
                     )
             for label in labels:
-                cache_lookup = self._weak_cache.get(label, NOT_IN_CACHE_SENTINEL)
+                c = config_map[label]
+                cache_lookup = self._cache_get(label, c)
                 if cache_lookup is not NOT_IN_CACHE_SENTINEL:
-                    yield _StoreZip._set_container_type(cache_lookup, container_type) # type: ignore
+                    yield _StoreZip._set_container_type(cache_lookup, container_type)
                     continue
 
                 archive.prefix = config_map.default.label_encode(label) # mutate
+                columns_select = _columns_select_deferred(c)
                 frame = ArchiveFrameConverter.frame_decode(
                             archive=archive,
                             constructor=container_type,
+                            columns_select=c.columns_select if columns_select is None else None,
                             )
+                if c.row_filter is not None:
+                    frame = c.row_filter.filter(frame)
+                if columns_select is not None:
+                    frame = _columns_select_project(frame, columns_select)
                 # Newly read frame, add it to our weak_cache
-                self._weak_cache[label] = frame
+                self._cache_set(label, frame, c)
                 yield frame
+
+    def _read_many_threads(self,
+            labels: tp.Iterable[TLabel],
+            *,
+            config_map: StoreConfigMap,
+            container_type: tp.Type[TFrameAny],
+            ) -> tp.Iterator[TFrameAny]:
+        '''
+        Read many frames with a pool of threads, each thread using its own ZipFile; the weak_cache is only read and updated in the calling thread.
+        '''
+        cached: tp.List[tp.Tuple[TLabel, tp.Any]] = [
+                (label, self._cache_get(label, config_map[label]))
+                for label in labels]
+
+        pool_executor = get_concurrent_executor(
+                use_threads=True,
+                max_workers=config_map.default.read_max_workers,
+                mp_context=None,
+                )
+
+        with ZipFileThreadLocal(self._fp) as zftl, pool_executor() as executor:
+            def read_frame(label: TLabel) -> TFrameAny:
+                archive = ArchiveZipWrapper(zftl.get(),
+                        writeable=False,
+                        memory_map=False,
+                        delimiter=self._DELIMITER,
+                        )
+                archive.prefix = config_map.default.label_encode(label)
+                c = config_map[label]
+                columns_select = _columns_select_deferred(c)
+                frame = ArchiveFrameConverter.frame_decode(
+                        archive=archive,
+                        constructor=container_type,
+                        columns_select=c.columns_select if columns_select is None else None,
+                        )
+                if c.row_filter is not None:
+                    frame = c.row_filter.filter(frame)
+                if columns_select is not None:
+                    frame = _columns_select_project(frame, columns_select)
+                return frame
+
+            frame_gen = executor.map(read_frame,
+                    (label for label, cache_lookup in cached
+                    if cache_lookup is NOT_IN_CACHE_SENTINEL),
+                    )
+            for label, cache_lookup in cached:
+                if cache_lookup is not NOT_IN_CACHE_SENTINEL:
+                    yield _StoreZip._set_container_type(cache_lookup, container_type)
+                else:
+                    frame = next(frame_gen)
+                    # Newly read frame, add it to our weak_cache
+                    self._cache_set(label, frame, config_map[label])
+                    yield frame
@@ -89,6 +89,7 @@ DTYPE_COMPLEX_KIND = 'c'
 DTYPE_FLOAT_KIND = 'f'
 DTYPE_OBJECT_KIND = 'O'
 DTYPE_BOOL_KIND = 'b'
+DTYPE_UNICODE_KIND = 'U'
 
 DTYPE_STR_KINDS = ('U', 'S') # S is np.bytes_
 DTYPE_INT_KINDS = ('i', 'u') # signed and unsigned
@@ -1210,6 +1211,36 @@ def concat_resolved(
     out.flags.writeable = False
     return out
 
+def array_widen(
+        array: TNDArrayAny,
+        dtype: TDtypeAny,
+        ) -> TNDArrayAny:
+    '''
+    Given an ``array`` and the ``dtype`` of previously created arrays of the same field (such as from a prior chunk), return an immutable array of a dtype that can represent values of both without loss. An object array of only ``None`` (missing values) takes ``dtype`` if it supports NaN or NaT, and a float if ``dtype`` is an integer.
+    '''
+    dt_array = array.dtype
+    if dt_array == dtype:
+        return array
+
+    if (dt_array.kind == DTYPE_OBJECT_KIND
+            and dtype.kind != DTYPE_OBJECT_KIND
+            and all(v is None for v in array)
+            ):
+        if dtype.kind in DTYPE_INEXACT_KINDS or dtype.kind in DTYPE_NAT_KINDS:
+            dt_resolve = dtype
+        elif dtype.kind in DTYPE_INT_KINDS:
+            dt_resolve = DTYPE_FLOAT_DEFAULT
+        else:
+            return array
+    else:
+        dt_resolve = resolve_dtype(dt_array, dtype)
+        if dt_resolve == dt_array:
+            return array
+
+    post = array.astype(dt_resolve)
+    post.flags.writeable = False
+    return post
+
 def blocks_to_array_2d(
         blocks: tp.Iterable[TNDArrayAny], # can be iterator
         shape: tp.Optional[tp.Tuple[int, int]] = None,
@@ -1478,6 +1509,48 @@ def ufunc_unique1d_indexer(array: TNDArrayAny,
 
     return values, indexer
 
+def array_dictionary_encode(array: TNDArrayAny,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Dictionary encode an array of any shape, returning the sorted unique values and an array of codes of the same shape as ``array``, such that ``values[codes]`` is equal to ``array``. Codes use the smallest unsigned integer dtype that can index the unique values.
+    '''
+    values, indexer = ufunc_unique1d_indexer(array.reshape(-1))
+    codes = indexer.astype(np.min_scalar_type(max(len(values) - 1, 0))).reshape(array.shape)
+    codes.flags.writeable = False
+    return values, codes
+
+def array_str_compact(array: TNDArrayAny,
+        ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
+    '''
+    Encode a unicode array of any shape without padding, returning a 1D array of the code points of all strings, in order, and an array of the length of each string, of the same shape as ``array``. Both use the smallest unsigned integer dtype sufficient for their values.
+    '''
+    width = array.dtype.itemsize // 4
+    flat = np.ascontiguousarray(array.reshape(-1))
+    lengths = np.char.str_len(flat)
+    points = flat.view(array.dtype.str[0] + 'u4').reshape(len(flat), width)
+    buffer = points[np.arange(width) < lengths[:, None]]
+    buffer = buffer.astype(np.min_scalar_type(buffer.max() if len(buffer) else 0))
+    lengths = lengths.astype(np.min_scalar_type(width)).reshape(array.shape)
+    buffer.flags.writeable = False
+    lengths.flags.writeable = False
+    return buffer, lengths
+
+def array_str_expand(
+        buffer: TNDArrayAny,
+        lengths: TNDArrayAny,
+        dtype: TDtypeAny,
+        ) -> TNDArrayAny:
+    '''
+    Decode the code points and lengths returned by :py:func:`array_str_compact` into a unicode array of ``dtype``, with the shape of ``lengths``.
+    '''
+    width = dtype.itemsize // 4
+    flat_lengths = lengths.reshape(-1)
+    points = np.zeros((len(flat_lengths), width), dtype=dtype.str[0] + 'u4')
+    points[np.arange(width) < flat_lengths[:, None]] = buffer
+    array = points.view(dtype).reshape(lengths.shape)
+    array.flags.writeable = False
+    return array
+
 def ufunc_unique1d_positions(array: TNDArrayAny,
         ) -> tp.Tuple[TNDArrayAny, TNDArrayAny]:
     '''
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import gzip
 import os
 import tempfile
+from functools import partial
 from io import BytesIO
 from io import StringIO
 from pathlib import Path
@@ -228,6 +230,36 @@ class WWW:
                     extractor=extractor,
                     )
 
+    @classmethod
+    @doc_inject(selector='www')
+    async def from_file_async(cls,
+            url: tp.Union[str, request.Request],
+            *,
+            encoding: str = 'utf-8',
+            in_memory: tp.Optional[bool] = None,
+            buffer_size: int = 8192,
+            fp: tp.Optional[tp.Union[Path, str]] = None,
+            ) -> WWWReturnType:
+        '''
+        {doc}
+        The download is performed in the default executor of the running event loop.
+
+        Args:
+            {url}
+            {encoding}
+            {in_memory}
+            {buffer_size}
+            {fp}
+        '''
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(cls.from_file,
+                url,
+                encoding=encoding,
+                in_memory=in_memory,
+                buffer_size=buffer_size,
+                fp=fp,
+                ))
+
 
     @classmethod
     @doc_inject(selector='www')
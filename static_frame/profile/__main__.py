@@ -1421,6 +1421,114 @@ class FrameFromNPZ_R(FrameFromNPZ, Reference):
         pd.read_parquet(self.fp2_parquet)
 
 
+class NPYCopy(Perf):
+    '''Compare writing and reading NPY directories with views of array bytes, vectored writes, and reading into allocated arrays (Native) to writing and reading with copies of array bytes (Reference).
+    '''
+    NUMBER = 10
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.sff1 = ff_cached('s(100,10_000)|v(int,bool,float)|c(I,str)')
+        self.sff2 = ff_cached('s(1_000_000,10)|v(float)|c(I,str)')
+        self.arrays1 = list(self.sff1._blocks._blocks)
+        self.arrays2 = list(self.sff2._blocks._blocks)
+
+        self.fp = tempfile.mkdtemp()
+        self.fp1 = os.path.join(self.fp, '1')
+        self.fp2 = os.path.join(self.fp, '2')
+        self._write_copy(self.fp1, self.arrays1)
+        self._write_copy(self.fp2, self.arrays2)
+
+        self.meta = {
+            'write_wide_mixed': FunctionMetaData(
+                perf_status=PerfStatus.EXPLAINED_WIN,
+                explanation='bytes of each array are not copied by tobytes()',
+                ),
+            'write_tall_uniform': FunctionMetaData(
+                perf_status=PerfStatus.EXPLAINED_WIN,
+                explanation='bytes of each array are not copied by tobytes()',
+                ),
+            'read_wide_mixed': FunctionMetaData(
+                perf_status=PerfStatus.EXPLAINED_WIN,
+                explanation='bytes are read into an allocated array without an intermediary bytes object',
+                ),
+            'read_tall_uniform': FunctionMetaData(
+                perf_status=PerfStatus.EXPLAINED_WIN,
+                explanation='bytes are read into an allocated array without an intermediary bytes object',
+                ),
+            }
+
+    def __del__(self) -> None:
+        import shutil
+        shutil.rmtree(self.fp)
+
+    @staticmethod
+    def _write_copy(fp: str, arrays: tp.Sequence[np.ndarray]) -> None:
+        from static_frame.core.archive_npy import NPYConverter
+        os.makedirs(fp, exist_ok=True)
+        for i, array in enumerate(arrays):
+            with open(os.path.join(fp, f'{i}.npy'), 'wb') as f:
+                f.write(NPYConverter._header_from_array(array))
+                f.write(array.tobytes(order='A'))
+
+    @staticmethod
+    def _write_view(fp: str, arrays: tp.Sequence[np.ndarray]) -> None:
+        from static_frame.core.archive_npy import ArchiveDirectory
+        if os.path.exists(fp):
+            import shutil
+            shutil.rmtree(fp)
+        archive = ArchiveDirectory(fp, writeable=True, memory_map=False)
+        for i, array in enumerate(arrays):
+            archive.write_array(f'{i}.npy', array)
+
+    @staticmethod
+    def _read_copy(fp: str, count: int) -> None:
+        from static_frame.core.archive_npy import NPYConverter
+        for i in range(count):
+            with open(os.path.join(fp, f'{i}.npy'), 'rb') as f:
+                f.read(NPYConverter.MAGIC_LEN)
+                dtype, _, shape = NPYConverter._header_decode(f, {})
+                np.frombuffer(f.read(), dtype=dtype).reshape(shape)
+
+    @staticmethod
+    def _read_view(fp: str, count: int) -> None:
+        from static_frame.core.archive_npy import ArchiveDirectory
+        archive = ArchiveDirectory(fp, writeable=False, memory_map=False)
+        for i in range(count):
+            archive.read_array(f'{i}.npy')
+
+
+class NPYCopy_N(NPYCopy, Native):
+
+    def write_wide_mixed(self) -> None:
+        self._write_view(self.fp1, self.arrays1)
+
+    def write_tall_uniform(self) -> None:
+        self._write_view(self.fp2, self.arrays2)
+
+    def read_wide_mixed(self) -> None:
+        self._read_view(self.fp1, len(self.arrays1))
+
+    def read_tall_uniform(self) -> None:
+        self._read_view(self.fp2, len(self.arrays2))
+
+
+class NPYCopy_R(NPYCopy, Reference):
+
+    def write_wide_mixed(self) -> None:
+        self._write_copy(self.fp1, self.arrays1)
+
+    def write_tall_uniform(self) -> None:
+        self._write_copy(self.fp2, self.arrays2)
+
+    def read_wide_mixed(self) -> None:
+        self._read_copy(self.fp1, len(self.arrays1))
+
+    def read_tall_uniform(self) -> None:
+        self._read_copy(self.fp2, len(self.arrays2))
+
+
 class FrameFromCSV(Perf):
     NUMBER = 1
 
@@ -0,0 +1,91 @@
+import io
+import os
+import zipfile
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import frame_fixtures as ff
+import numpy as np
+
+from static_frame.core.archive_codec import CodecBlocks
+from static_frame.core.archive_codec import CodecZlib
+from static_frame.core.archive_codec import CodecZstd
+from static_frame.core.archive_codec import codec_from_name
+from static_frame.core.exception import ErrorNPYDecode
+from static_frame.core.exception import ErrorNPYEncode
+from static_frame.core.frame import Frame
+from static_frame.core.metadata import NPYLabel
+from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import temp_file
+
+
+class TestUnit(TestCase):
+
+    #---------------------------------------------------------------------------
+    def test_codec_from_name_a(self) -> None:
+        self.assertIs(codec_from_name('zlib'), CodecZlib)
+        self.assertIn(codec_from_name('auto').NAME, ('zstd', 'lz4', 'zlib'))
+        with self.assertRaises(ErrorNPYEncode):
+            codec_from_name('foo')
+
+    def test_codec_from_name_b(self) -> None:
+        with patch.object(CodecZstd, 'available', return_value=False):
+            with self.assertRaises(ModuleNotFoundError):
+                codec_from_name('zstd')
+
+    #---------------------------------------------------------------------------
+    def test_codec_blocks_a(self) -> None:
+        a1 = np.arange(10_000, dtype=np.int64).reshape(100, 100)
+        bio = io.BytesIO()
+        with patch.object(CodecBlocks, 'BLOCK_SIZE', 3_000):
+            CodecBlocks.to_file(bio, a1, CodecZlib)
+            bio.seek(0)
+            count, block_size = CodecBlocks.STRUCT_HEAD.unpack(bio.read(12))
+            self.assertEqual((count, block_size), (27, 3_000))
+
+        # the block size is read from the framing
+        bio.seek(0)
+        a2 = CodecBlocks.from_file(bio, a1.dtype, a1.size, CodecZlib)
+
+        self.assertEqual(a2.tolist(), a1.ravel().tolist())
+        self.assertFalse(a2.flags.writeable)
+
+    def test_codec_blocks_b(self) -> None:
+        a1 = np.array(['2020-01-01', '2021-05-03'], dtype='datetime64[D]')
+        bio = io.BytesIO()
+        CodecBlocks.to_file(bio, a1, CodecZlib)
+        bio.seek(0)
+        with self.assertRaises(ErrorNPYDecode):
+            CodecBlocks.from_file(bio, a1.dtype, 1_000_000, CodecZlib)
+        bio.seek(0)
+        a2 = CodecBlocks.from_file(bio, a1.dtype, 2, CodecZlib)
+        self.assertEqual(a2.tolist(), a1.tolist())
+
+    #---------------------------------------------------------------------------
+    def test_frame_to_npz_codec_a(self) -> None:
+        f1 = ff.parse('s(20,8)|v(int,str,bool,dtD,float)|i(ID,dtD)|c(I,str)').rename('foo')
+        # a non-contiguous block
+        f1 = f1.assign[f1.columns[0]](np.arange(40)[::2])
+
+        with temp_file('.npz') as fp:
+            with patch.object(CodecBlocks, 'BLOCK_SIZE', 64):
+                f1.to_npz(fp, codec='zlib')
+                f2 = Frame.from_npz(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+
+            with zipfile.ZipFile(fp) as zf:
+                self.assertIn(f'"{NPYLabel.KEY_CODEC}": "zlib"', zf.read('__meta__.json').decode())
+
+            f3 = Frame.from_npz(fp, columns_select=f1.columns[2:4])
+            self.assertTrue(f1.iloc[:, 2:4].equals(f3, compare_dtype=True))
+
+    def test_frame_to_npy_codec_a(self) -> None:
+        f1 = ff.parse('s(30,3)|v(float)').rename('foo')
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp, codec='auto')
+            f2 = Frame.from_npy(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_name=True))
+            with self.assertRaises(ErrorNPYDecode):
+                Frame.from_npy_mmap(fp)
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import contextlib
+import mmap
 import os
+import pickle
 # import typing_extensions as tp
 import zipfile
+from io import BytesIO
 from io import StringIO
 from io import UnsupportedOperation
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import frame_fixtures as ff
 import numpy as np
+import typing_extensions as tp
 from numpy.lib.format import write_array
 
 from static_frame.core.archive_npy import NPY
@@ -17,14 +22,27 @@ from static_frame.core.archive_npy import NPZ
 from static_frame.core.archive_npy import ArchiveDirectory
 from static_frame.core.archive_npy import ArchiveZip
 from static_frame.core.archive_npy import ArchiveZipWrapper
+from static_frame.core.archive_npy import FrameSharedMemory
 from static_frame.core.archive_npy import NPYConverter
+from static_frame.core.archive_npy import NPYFrameChunkedConverter
+from static_frame.core.archive_npy import NPYFrameConverter
+from static_frame.core.archive_npy import SharedMemoryArray
+from static_frame.core.archive_npy import SharedMemoryFrameConverter
+from static_frame.core.batch import Batch
 from static_frame.core.bus import Bus
 from static_frame.core.exception import AxisInvalid
 from static_frame.core.exception import ErrorNPYDecode
 from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.frame import Frame
+from static_frame.core.frame import FrameGO
 from static_frame.core.index import Index
+from static_frame.core.index import IndexGO
+from static_frame.core.index_auto import IndexAutoFactory
+from static_frame.core.loc_map import HierarchicalLocMap
 from static_frame.core.metadata import NPYLabel
+from static_frame.core.store_config import StoreConfig
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import TNDArrayAny
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import temp_file
 
@@ -87,6 +105,25 @@ class TestUnit(TestCase):
                 with self.assertRaises(ErrorNPYEncode):
                     NPYConverter.to_npy(f, a1)
 
+    def test_to_npy_g(self) -> None:
+        a1 = np.arange(12, dtype=np.int64).reshape(3, 4).T
+        a2 = np.array(['2020-01-01', '2021-05-03'], dtype='datetime64[D]')
+
+        buffers = NPYConverter.to_buffers(a1)
+        self.assertEqual(len(buffers), 2)
+        # array bytes are a view without copying
+        self.assertTrue(np.shares_memory(np.frombuffer(buffers[1], dtype=np.uint8), a1))
+
+        self.assertIsNone(NPYConverter.to_buffers(a1[::2]))
+        with self.assertRaises(ErrorNPYEncode):
+            NPYConverter.to_buffers(np.array([None]))
+
+        with temp_file('.npy') as fp:
+            for a in (a1, a2, a1[::2]):
+                with open(fp, 'wb') as f:
+                    NPYConverter.to_npy(f, a)
+                self.assertEqual(np.load(fp).tolist(), a.tolist())
+
     def test_from_npy_a(self) -> None:
         a1 = np.arange(20)
 
@@ -175,6 +212,69 @@ class TestUnit(TestCase):
                 with self.assertRaises(ErrorNPYDecode):
                     a2, _ = NPYConverter.header_from_npy(f, {})
 
+    def test_from_npy_i(self) -> None:
+        a1 = np.array(['2020-01-01', '2021-05-03'], dtype='datetime64[D]')
+        bio = BytesIO()
+        NPYConverter.to_npy(bio, a1)
+
+        bio.seek(0)
+        a2, _ = NPYConverter.from_npy(bio, {})
+        self.assertEqual(a2.tolist(), a1.tolist())
+        self.assertFalse(a2.flags.writeable)
+
+        bio = BytesIO(bio.getvalue()[:-3])
+        with self.assertRaises(ErrorNPYDecode):
+            NPYConverter.from_npy(bio, {})
+
+    def test_frame_decode_columns_select_a(self) -> None:
+
+        class ArchiveDirectoryRecord(ArchiveDirectory):
+            names: tp.List[str] = []
+
+            def read_array(self, name: str) -> TNDArrayAny:
+                self.names.append(name)
+                return ArchiveDirectory.read_array(self, name)
+
+        f1 = Frame.from_fields((np.arange(3), np.arange(3) * 2, ('a', 'b', 'c'), (True, False, True)),
+                columns=('p', 'q', 'r', 's'),
+                index=('x', 'y', 'z'),
+                )
+        f1 = Frame(f1._blocks.consolidate(), index=f1.index, columns=f1.columns)
+
+        with TemporaryDirectory() as fp_dir:
+            fp = os.path.join(fp_dir, 'f1')
+            f1.to_npy(fp)
+            archive = ArchiveDirectoryRecord(fp, writeable=False, memory_map=False)
+
+            f2 = NPYFrameConverter.frame_decode(
+                    archive=archive,
+                    constructor=Frame,
+                    columns_select=('s', 'q'),
+                    )
+            self.assertEqual(f2.to_pairs(),
+                    (('q', (('x', 0), ('y', 2), ('z', 4))), ('s', (('x', True), ('y', False), ('z', True))))
+                    )
+            blocks = [n for n in archive.names if n.startswith('__blocks')]
+            self.assertEqual(blocks, ['__blocks_0__.npy', '__blocks_2__.npy'])
+
+            f3 = NPYFrameConverter.frame_decode(
+                    archive=archive,
+                    constructor=FrameGO,
+                    columns_select=('t',),
+                    )
+            self.assertEqual(f3.shape, (3, 0))
+            self.assertIs(f3.columns.__class__, IndexGO)
+
+    def test_frame_decode_columns_select_b(self) -> None:
+        f1 = ff.parse('s(3,4)|v(int,bool)')
+
+        with TemporaryDirectory() as fp_dir:
+            fp = os.path.join(fp_dir, 'f1')
+            f1.to_npy(fp, include_columns=False)
+            f2 = Frame.from_npy(fp, columns_select=(3, 0))
+            self.assertEqual(f2.columns.values.tolist(), [0, 3])
+            self.assertEqual(f2.values.tolist(), f1.iloc[:, [0, 3]].values.tolist())
+
     #---------------------------------------------------------------------------
 
     def test_archive_zip_a(self) -> None:
@@ -213,6 +313,26 @@ class TestUnit(TestCase):
             a2 = ad2.read_array('a1.npy')
             self.assertTrue((a1 == a2).all())
 
+    def test_archive_directory_e(self) -> None:
+        writev = os.writev
+        def writev_partial(fd: int, buffers: tp.Sequence[memoryview]) -> int:
+            # write at most 5 bytes to force continuing after partial writes
+            return writev(fd, [buffers[0][:5]])
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+
+            a1 = np.arange(24).reshape(4, 6)
+            ad1 = ArchiveDirectory(fp, writeable=True, memory_map=False)
+            with patch.object(os, 'writev', writev_partial):
+                ad1.write_array('a1.npy', a1)
+            ad1.write_array('a2.npy', a1[:, ::2]) # not contiguous
+
+            ad2 = ArchiveDirectory(fp, writeable=False, memory_map=False)
+            self.assertEqual(ad2.read_array('a1.npy').tolist(), a1.tolist())
+            self.assertEqual(ad2.read_array('a2.npy').tolist(), a1[:, ::2].tolist())
+            self.assertEqual(np.load(os.path.join(fp, 'a1.npy')).tolist(), a1.tolist())
+
     #---------------------------------------------------------------------------
     def test_archive_components_npz_write_arrays_a(self) -> None:
         with temp_file('.zip') as fp:
@@ -633,6 +753,207 @@ class TestUnit(TestCase):
                 post3 = archive.size_metadata()
                 self.assertEqual(post3, 90)
 
+    #---------------------------------------------------------------------------
+    def test_shared_memory_frame_converter_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,bool,str,dtD,float)|i(ID,dtD)|c(IH,(str,int))').rename('a')
+        payload = SharedMemoryFrameConverter.to_shared_memory(f1)
+        self.assertIs(payload.__class__, FrameSharedMemory)
+
+        payload = pickle.loads(pickle.dumps(payload))
+        f2 = SharedMemoryFrameConverter.from_shared_memory(payload)
+        self.assertTrue(f2.equals(f1,
+                compare_dtype=True,
+                compare_class=True,
+                compare_name=True,
+                ))
+        block = f2._blocks._blocks[0]
+        self.assertIs(block.base.__class__, SharedMemoryArray)
+        self.assertFalse(block.flags.writeable)
+
+        # views retain the shared memory after the Frame is released
+        s1 = f2.iloc[1:, 2]
+        del f2, block
+        self.assertEqual(s1.values.tolist(), f1.iloc[1:, 2].values.tolist())
+
+    def test_shared_memory_frame_converter_b(self) -> None:
+        a1 = np.arange(12).reshape(3, 4).T.copy()
+        a2 = np.asfortranarray(np.arange(8).reshape(4, 2))
+        f1 = FrameGO(TypeBlocks.from_blocks((a1, a2)), name='b')
+        self.assertTrue(f1._blocks._blocks[1].flags.f_contiguous)
+
+        f2 = SharedMemoryFrameConverter.decode(SharedMemoryFrameConverter.encode(f1))
+        self.assertIs(f2.__class__, FrameGO)
+        self.assertTrue(f2.equals(f1, compare_dtype=True))
+
+        f3 = Frame.from_fields((np.arange(2), np.array((None, 'a'))))
+        self.assertIs(SharedMemoryFrameConverter.encode(f3), f3)
+        self.assertEqual(SharedMemoryFrameConverter.encode(3), 3)
+        self.assertEqual(SharedMemoryFrameConverter.decode('a'), 'a')
+
+        f4 = SharedMemoryFrameConverter.decode(SharedMemoryFrameConverter.encode(Frame()))
+        self.assertEqual(f4.shape, (0, 0))
+
+
+    #---------------------------------------------------------------------------
+    def test_index_hierarchy_components_a(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,float)|i(IH,(str,dtD))|c(IH,(str,int))').rename(index=('a', 'b'))
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp, index_components=True)
+            names = set(os.listdir(fp))
+            self.assertIn(NPYLabel.FILE_INDEXERS_INDEX, names)
+            self.assertIn(NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS.format(1), names)
+
+            with patch.object(HierarchicalLocMap, 'build_encoded_indexers_map',
+                    wraps=HierarchicalLocMap.build_encoded_indexers_map) as mock:
+                f2, close = Frame.from_npy_mmap(fp)
+                # the map from labels to positions is not built on open
+                self.assertEqual(mock.call_count, 0)
+                self.assertIsInstance(f2.index._indexers.base, mmap.mmap)
+
+                self.assertEqual(f2.index.loc_to_iloc(f1.index.iloc[7]), 7)
+                self.assertEqual(mock.call_count, 1)
+
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+            self.assertEqual(f2.index.index_types.values.tolist(), f1.index.index_types.values.tolist())
+            close()
+
+            f3 = FrameGO.from_npy(fp)
+            f3[('x', 0)] = 0
+            self.assertEqual(f3.columns.values.tolist()[-1], ['x', 0])
+
+    def test_index_hierarchy_components_b(self) -> None:
+        f1 = ff.parse('s(6,2)|i(IH,(str,int))|c(IH,(str,int))')
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp, index_components=True)
+            # archives without components are read by factorizing values
+            os.remove(os.path.join(fp, NPYLabel.FILE_INDEXERS_INDEX))
+            f2 = Frame.from_npy(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True))
+            self.assertIsNotNone(f2.index._map._encoded_indexer_map)
+            self.assertIsNone(f2.columns._map._encoded_indexer_map)
+
+    def test_index_hierarchy_components_c(self) -> None:
+        f1 = ff.parse('s(6,2)|i(IH,(str,int))|c(IH,(str,int))')
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            # components are not stored by default
+            f1.to_npy(fp)
+            names = set(os.listdir(fp))
+            self.assertNotIn(NPYLabel.FILE_INDEXERS_INDEX, names)
+            self.assertNotIn(NPYLabel.FILE_TEMPLATE_LABELS_COLUMNS.format(0), names)
+            self.assertTrue(f1.equals(Frame.from_npy(fp), compare_dtype=True, compare_class=True))
+
+        with temp_file('.zip') as fp:
+            config = StoreConfig(write_index_components=True)
+            Batch.from_frames((f1.rename('a'),)).to_zip_npz(fp, config=config)
+            with zipfile.ZipFile(fp) as zf:
+                with zipfile.ZipFile(BytesIO(zf.read('a.npz'))) as zf_npz:
+                    self.assertIn(NPYLabel.FILE_INDEXERS_INDEX, zf_npz.namelist())
+            f2 = Bus.from_zip_npz(fp)['a']
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True))
+
+    #---------------------------------------------------------------------------
+    def test_npy_frame_chunked_a(self) -> None:
+        f1 = ff.parse('s(25,4)|v(int,str,bool,float)|i(IH,(str,dtD))|c(I,str)').rename('foo')
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy_chunked(fp, chunk_size=7)
+            names = set(os.listdir(fp))
+            self.assertIn(NPYLabel.FILE_TEMPLATE_BLOCKS_CHUNK.format(3, 3), names)
+            self.assertIn(NPYLabel.FILE_TEMPLATE_VALUES_INDEX_CHUNK.format(1, 3), names)
+            self.assertNotIn(NPYLabel.FILE_TEMPLATE_BLOCKS_CHUNK.format(0, 4), names)
+
+            f2 = Frame.from_npy_chunked(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+
+            f3 = FrameGO.from_npy_chunked(fp, start=5, stop=16, columns_select=f1.columns[[1, 3]])
+            self.assertIs(f3.__class__, FrameGO)
+            self.assertTrue(f1.iloc[5:16, [1, 3]].equals(f3, compare_dtype=True, compare_class=False))
+
+            f4 = Frame.from_npy_chunked(fp, start=-3)
+            self.assertTrue(f1.iloc[-3:].equals(f4, compare_dtype=True))
+            # reading a range within one chunk does not retain the chunk
+            self.assertIsNone(f4._blocks._blocks[0].base)
+
+            self.assertEqual(Frame.from_npy_chunked(fp, start=10, stop=8).shape, (0, 4))
+
+    def test_npy_frame_chunked_b(self) -> None:
+        f1 = ff.parse('s(10,3)|v(int,str)|c(I,str)')
+
+        with TemporaryDirectory() as fp:
+            fp = os.path.join(fp, 'a')
+            with NPY(fp, 'w') as npy:
+                npy.from_frames_chunked(
+                        (f1.iloc[i: i + 3].relabel(index=IndexAutoFactory)
+                        for i in range(0, 10, 3)),
+                        chunk_size=4,
+                        )
+            # an auto-incremented index is not stored
+            self.assertFalse(any(n.startswith('__values_index') for n in os.listdir(fp)))
+            f2 = Frame.from_npy_chunked(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True))
+
+            f3 = Frame.from_npy_chunked(fp, start=5, stop=7)
+            self.assertEqual(f3.index.values.tolist(), [5, 6])
+            self.assertEqual(f3.values.tolist(), f1.iloc[5:7].values.tolist())
+
+            # appended strings may be of a different width
+            f4 = f1.iloc[:2].assign[f1.columns[1]]('abcdefghijkl')
+            f4.to_npy_chunked(fp, append=True)
+            f5 = Frame.from_npy_chunked(fp, start=8)
+            self.assertEqual(f5.shape, (4, 3))
+            self.assertEqual(f5.iloc[-1, 1], 'abcdefghijkl')
+            self.assertEqual(f5.dtypes.values.tolist(), f1.dtypes.values.tolist()[:1] + [np.dtype('<U12'), f1.dtypes.values[2]])
+
+    def test_npy_frame_chunked_c(self) -> None:
+        f1 = Frame.from_fields((np.arange(6), np.arange(6, 12), np.arange(6) / 2, np.arange(6) / 4),
+                columns=tuple('abcd'),
+                )
+
+        with TemporaryDirectory() as fp:
+            fp = os.path.join(fp, 'a')
+            f1.to_npy_chunked(fp, chunk_size=4, consolidate_blocks=True, codec='zlib')
+            self.assertEqual(len(f1._blocks._blocks), 4)
+            self.assertEqual(len(Frame.from_npy_chunked(fp)._blocks._blocks), 2)
+
+            # blocks of appended frames are aligned to the blocks of the archive
+            f1.to_npy_chunked(fp, append=True)
+            f2 = Frame.from_npy_chunked(fp)
+            self.assertEqual(f2.shape, (12, 4))
+            self.assertEqual(f2.values.tolist(), np.vstack((f1.values, f1.values)).tolist())
+
+            with self.assertRaises(ErrorNPYEncode):
+                f1.relabel(columns=tuple('abce')).to_npy_chunked(fp, append=True)
+            with self.assertRaises(ErrorNPYEncode):
+                f1.astype(str).to_npy_chunked(fp, append=True)
+            with self.assertRaises(ErrorNPYEncode):
+                f1.iloc[:, :3].to_npy_chunked(fp, append=True)
+            # failed appends do not alter the rows of the archive
+            self.assertEqual(Frame.from_npy_chunked(fp).shape, (12, 4))
+
+    def test_npy_frame_chunked_d(self) -> None:
+        with TemporaryDirectory() as fp:
+            fp = os.path.join(fp, 'a')
+            with self.assertRaises(ErrorNPYEncode):
+                NPYFrameChunkedConverter.to_archive(frames=(), fp=fp)
+            self.assertFalse(os.path.exists(fp))
+
+            with self.assertRaises(ErrorNPYEncode):
+                ff.parse('s(2,2)').to_npy_chunked(fp, chunk_size=0)
+
+            f1 = ff.parse('s(2,2)').rename(index='foo')
+            f1.to_npy(fp)
+            with self.assertRaises(ErrorNPYDecode):
+                Frame.from_npy_chunked(fp)
+            with self.assertRaises(ErrorNPYEncode):
+                f1.to_npy_chunked(fp, append=True)
+
 
 if __name__ == '__main__':
     import unittest
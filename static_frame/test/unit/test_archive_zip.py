@@ -1,4 +1,5 @@
 import io
+import warnings
 from pathlib import Path
 from zipfile import ZIP_DEFLATED
 from zipfile import BadZipFile
@@ -9,7 +10,11 @@ import numpy as np
 # from static_frame.core.archive_zip import ZipFilePartRO
 from static_frame.core.archive_zip import ZipFileRO
 from static_frame.core.archive_zip import ZipInfoRO
+from static_frame.core.archive_zip import zip_compact
+from static_frame.core.archive_zip import zip_manifest_read
+from static_frame.core.archive_zip import zip_manifest_write
 from static_frame.core.archive_zip import zip_namelist
+from static_frame.core.archive_zip import zip_tombstone
 from static_frame.core.frame import Frame
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import temp_file
@@ -202,3 +207,130 @@ class TestUnit(TestCase):
 
             self.assertEqual(list(zip_namelist(fp)), ['0', '1', '2', '3'])
 
+
+    #---------------------------------------------------------------------------
+    def test_zip_tombstone_a(self) -> None:
+
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w') as zf:
+                for i in range(4):
+                    zf.writestr(str(i), b'0' * 100)
+
+            with ZipFile(fp, 'a') as zf:
+                stop = len(zf.filelist)
+                zf.writestr('4', b'1')
+                self.assertEqual(zip_tombstone(zf, ('1', '3', '4').__contains__, stop=stop), 2)
+                self.assertEqual(zip_tombstone(zf, ('5',).__contains__, stop=stop), 0)
+
+            self.assertEqual(list(zip_namelist(fp)), ['0', '2', '4'])
+            self.assertEqual(zip_compact(fp), 2 * (30 + 1 + 100))
+
+            with ZipFile(fp) as zf:
+                self.assertEqual(zf.namelist(), ['0', '2', '4'])
+                self.assertEqual(zf.read('4'), b'1')
+                self.assertIsNone(zf.testzip())
+
+    def test_zip_tombstone_b(self) -> None:
+
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w') as zf:
+                for i in range(4):
+                    zf.writestr(str(i), b'0')
+
+            # removing entries without writing relies on ZipFile._didModify to write the central directory on close
+            with ZipFile(fp, 'a') as zf:
+                self.assertEqual(zip_tombstone(zf, '2'.__eq__), 1)
+                self.assertTrue(zf._didModify) # type: ignore
+
+            self.assertEqual(list(zip_namelist(fp)), ['0', '1', '3'])
+            with ZipFile(fp) as zf:
+                self.assertEqual(zf.namelist(), ['0', '1', '3'])
+
+    def test_zip_tombstone_c(self) -> None:
+
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w') as zf:
+                for name in ('a/0', 'b/0', 'b/1', 'c/0'):
+                    zf.writestr(name, b'0')
+
+            # replaced entries are moved to the position of those removed
+            with warnings.catch_warnings(), ZipFile(fp, 'a') as zf:
+                warnings.filterwarnings('ignore', message='Duplicate name', category=UserWarning)
+                stop = len(zf.filelist)
+                zf.writestr('b/0', b'1')
+                zf.writestr('b/2', b'1')
+                selector = lambda name: name.startswith('b/')
+                self.assertEqual(zip_tombstone(zf, selector, stop=stop, relocate=True), 2)
+
+            self.assertEqual(list(zip_namelist(fp)), ['a/0', 'b/0', 'b/2', 'c/0'])
+            zip_compact(fp)
+            with ZipFile(fp) as zf:
+                self.assertEqual(zf.namelist(), ['a/0', 'b/0', 'b/2', 'c/0'])
+                self.assertEqual(zf.read('b/0'), b'1')
+                self.assertIsNone(zf.testzip())
+
+    def test_zip_compact_a(self) -> None:
+
+        class Unseekable(io.RawIOBase):
+            def __init__(self) -> None:
+                self.buffer = io.BytesIO()
+            def writable(self) -> bool:
+                return True
+            def write(self, b: bytes) -> int: # type: ignore
+                return self.buffer.write(b)
+
+        # writing to an unseekable stream uses data descriptors
+        dst = Unseekable()
+        with ZipFile(dst, 'w', compression=ZIP_DEFLATED) as zf:
+            for i in range(3):
+                with zf.open(str(i), 'w') as f:
+                    f.write(str(i).encode() * 1000)
+
+        with temp_file('.zip') as fp:
+            Path(fp).write_bytes(dst.buffer.getvalue())
+            with ZipFile(fp, 'a') as zf:
+                self.assertTrue(zf.getinfo('0').flag_bits & 0x08)
+                zip_tombstone(zf, '1'.__eq__)
+
+            self.assertTrue(zip_compact(fp) > 0)
+            with ZipFile(fp) as zf:
+                self.assertEqual(zf.namelist(), ['0', '2'])
+                self.assertEqual(zf.read('2'), b'2' * 1000)
+                self.assertIsNone(zf.testzip())
+
+    #---------------------------------------------------------------------------
+    def test_zip_manifest_a(self) -> None:
+
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w', compression=ZIP_DEFLATED) as zf:
+                zf.writestr('a', b'0' * 100)
+            self.assertIsNone(zip_manifest_read(fp, 'm'))
+
+            with ZipFile(fp, 'a') as zf:
+                zip_manifest_write(zf, 'm', b'foo')
+            self.assertEqual(zip_manifest_read(fp, 'm'), b'foo')
+            self.assertIsNone(zip_manifest_read(fp, 'n'))
+
+            with ZipFile(fp, 'a', compression=ZIP_DEFLATED) as zf:
+                zf.writestr('b', b'1' * 100)
+                zip_manifest_write(zf, 'm', b'bar')
+
+            self.assertEqual(zip_manifest_read(fp, 'm'), b'bar')
+            self.assertEqual(list(zip_namelist(fp)), ['a', 'b', 'm'])
+
+    def test_zip_manifest_b(self) -> None:
+
+        with temp_file('.zip') as fp:
+            with ZipFile(fp, 'w') as zf:
+                zf.comment = b'static-frame-manifest:x'
+            self.assertIsNone(zip_manifest_read(fp, 'm'))
+
+            with ZipFile(fp, 'w') as zf:
+                zip_manifest_write(zf, 'm', b'foo')
+            data = bytearray(Path(fp).read_bytes())
+            pos = data.index(b'foo')
+            data[pos: pos + 3] = b'bar'
+            Path(fp).write_bytes(data)
+
+            with self.assertRaises(BadZipFile):
+                zip_manifest_read(fp, 'm')
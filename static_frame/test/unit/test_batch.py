@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import datetime
+import os
 import time
 
 import frame_fixtures as ff
 import numpy as np
+import pytest
 
+from static_frame.core.archive_npy import SharedMemoryArray
 from static_frame.core.batch import Batch
 from static_frame.core.batch import normalize_container
 from static_frame.core.display_config import DisplayConfig
@@ -34,6 +37,9 @@ def func1(f: Frame) -> Frame:
 def func2(label: TLabel, f: Frame) -> Frame:
     return f.loc['q']
 
+def func3(f: Frame) -> Frame:
+    return f * 2
+
 class TestUnit(TestCase):
 
     def test_normalize_container_a(self) -> None:
@@ -390,6 +396,59 @@ class TestUnit(TestCase):
         self.assertEqual(post.to_pairs(),
                 (('d', (('f3', 20),)), ('b', (('f3', 60),))))
 
+    def test_batch_apply_shared_memory_a(self) -> None:
+        f1 = ff.parse('s(3,4)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(2,3)|v(str,bool)|i(I,str)').rename('f2')
+        f3 = ff.parse('s(2,2)|v(object)').rename('f3')
+
+        def get_batch() -> Batch:
+            return Batch.from_frames((f1, f2, f3), max_workers=2, shared_memory=True)
+
+        post = dict(get_batch().apply(func3).items())
+        self.assertTrue(post['f1'].equals(f1 * 2, compare_dtype=True))
+        self.assertTrue(post['f2'].equals(f2 * 2, compare_dtype=True))
+        self.assertTrue(post['f3'].equals(f3 * 2, compare_dtype=True))
+
+        self.assertEqual(post['f1']._blocks._blocks[0].base.__class__, SharedMemoryArray)
+        # object arrays are pickled
+        self.assertIs(post['f3']._blocks._blocks[0].base, None)
+
+        post = dict(get_batch().iloc[:1].items())
+        self.assertTrue(post['f2'].equals(f2.iloc[:1]))
+
+        # derived Batch retain shared_memory
+        post = dict(get_batch().apply(func3).apply(func3).items())
+        self.assertTrue(post['f1'].equals(f1 * 4, compare_dtype=True))
+
+    def test_batch_apply_shared_memory_b(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1,2), b=(3,4)), index=('x', 'y'), name='f1')
+        f2 = Frame.from_dict(dict(d=(10,20), b=(50,60)), index=('x', 'q'), name='f2')
+
+        post = Batch.from_frames((f1, f2), max_workers=2, shared_memory=True
+                ).apply_except(func1, KeyError).to_frame()
+        self.assertEqual(post.to_pairs(),
+                (('d', (('f2', 20),)), ('b', (('f2', 60),))))
+
+    @pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason='no /dev/shm')
+    def test_batch_apply_shared_memory_c(self) -> None:
+        frames = [Frame(np.arange(20).reshape(4, 5), name=str(i)) for i in range(8)]
+        segments = set(os.listdir('/dev/shm'))
+
+        batch = Batch.from_frames(frames, max_workers=2, shared_memory=True).apply(func3)
+        items = iter(batch.items())
+        label, frame = next(items)
+        self.assertEqual(frame.sum().sum(), 380)
+        # closing before consuming all results releases their segments
+        del items, batch
+        self.assertEqual(set(os.listdir('/dev/shm')) - segments, set())
+
+        batch = Batch.from_frames(frames, max_workers=2, shared_memory=True
+                ).apply_except(func3, KeyError)
+        items = iter(batch.items())
+        next(items)
+        del items, batch
+        self.assertEqual(set(os.listdir('/dev/shm')) - segments, set())
+
     #---------------------------------------------------------------------------
 
     def test_batch_apply_items_a(self) -> None:
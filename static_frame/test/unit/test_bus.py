@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import ast
+import asyncio
+import mmap
 import os
 import pickle
+import zipfile
 from datetime import date
 from datetime import datetime
 from hashlib import sha256
+from unittest.mock import patch
 
 import frame_fixtures as ff
 import numpy as np
@@ -20,14 +24,17 @@ from static_frame.core.exception import ErrorNPYEncode
 from static_frame.core.exception import StoreFileMutation
 from static_frame.core.frame import Frame
 from static_frame.core.hloc import HLoc
+from static_frame.core.index import Index
 from static_frame.core.index_auto import IndexAutoConstructorFactory
 from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.index_datetime import IndexDate
 from static_frame.core.index_datetime import IndexYearMonth
 from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.row_filter import RowFilterColumn
 from static_frame.core.series import Series
 from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_config import StoreConfigMap
+from static_frame.core.store_zip import StoreZipNPZ
 from static_frame.core.store_zip import StoreZipTSV
 from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import skip_no_hdf5
@@ -265,6 +272,73 @@ class TestUnit(TestCase):
                     (('f1', None), ('f2', (3, 2)), ('f3', (2, 2 )))
                     )
 
+    def test_bus_from_zip_parquet_async_a(self) -> None:
+        f1 = ff.parse('s(4,2)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(3,5)|v(str)').rename('f2')
+        f3 = ff.parse('s(2,2)|v(bool)').rename('f3')
+        config = StoreConfig(index_depth=1, include_index=True)
+        b1 = Bus.from_frames((f1, f2, f3), config=config)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_parquet(fp)
+
+            b2 = asyncio.run(Bus.from_zip_parquet_async(fp, config=config, max_concurrency=2))
+            self.assertEqual(b2.status['loaded'].values.tolist(), [True, True, True])
+            self.assertTrue(b2.equals(Bus.from_zip_parquet(fp, config=config)))
+
+            b3 = asyncio.run(Bus.from_zip_parquet_async(fp, config=config, max_persist=2))
+            self.assertEqual(b3.status['loaded'].values.tolist(), [False, False, False])
+            self.assertEqual(b3['f2'].shape, (3, 5))
+
+    def test_bus_from_zip_npy_async_a(self) -> None:
+        f1 = ff.parse('s(4,2)|v(int,float)').rename('f1')
+        f2 = ff.parse('s(3,5)|v(str)').rename('f2')
+        b1 = Bus.from_frames((f1, f2))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npy(fp)
+            b2 = asyncio.run(Bus.from_zip_npy_async(fp))
+            self.assertTrue(b2.equals(b1, compare_dtype=True))
+            self.assertEqual(b2.status['loaded'].values.tolist(), [True, True])
+
+    def test_bus_shapes_b(self) -> None:
+        f1 = ff.parse('s(2,3)|v(int)').rename('f1')
+        f2 = ff.parse('s(4,2)|v(str)').rename('f2')
+        b1 = Bus.from_frames((f1, f2))
+
+        for to_zip, from_zip in (
+                (Bus.to_zip_pickle, Bus.from_zip_pickle),
+                (Bus.to_zip_npy, Bus.from_zip_npy),
+                ):
+            with temp_file('.zip') as fp:
+                to_zip(b1, fp, config=StoreConfig(write_manifest=True))
+
+                b2 = from_zip(fp)
+                self.assertEqual(b2.shapes.to_pairs(),
+                        (('f1', (2, 3)), ('f2', (4, 2))))
+                self.assertFalse(b2._loaded.any())
+
+    def test_bus_shapes_c(self) -> None:
+        f1 = ff.parse('s(3,2)|v(int)|c(I,str)').rename('f1')
+        b1 = Bus.from_frames((f1,))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_parquet(fp, config=StoreConfig(include_index=False, write_manifest=True))
+
+            b2 = Bus.from_zip_parquet(fp)
+            self.assertEqual(b2.shapes.to_pairs(), (('f1', (3, 2)),))
+
+            # the stored shape is not reported if the read does not reproduce it
+            for config in (
+                    StoreConfig(index_depth=1),
+                    StoreConfig(columns_select=('zZbu',)),
+                    ):
+                b3 = Bus.from_zip_parquet(fp, config=config)
+                self.assertEqual(b3.shapes.to_pairs(), (('f1', None),))
+                shape = b3['f1'].shape
+                self.assertNotEqual(shape, (3, 2))
+                self.assertEqual(b3.shapes.to_pairs(), (('f1', shape),))
+
     @skip_win
     def test_bus_nbytes_a(self) -> None:
         f1 = Frame.from_dict(
@@ -771,6 +845,48 @@ class TestUnit(TestCase):
         for frame in frames:
             self.assertEqualFrames(frame, b2[frame.name])
 
+    def test_bus_to_sqlite_d(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4), c=(5,6)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(c=(1,2,3), b=(4,5,6)),
+                index=('x', 'y', 'z'),
+                name='f2')
+
+        b1 = Bus.from_frames((f1, f2))
+        config = StoreConfig(index_depth=1, columns_select=('c',))
+
+        with temp_file('.sqlite') as fp:
+            b1.to_sqlite(fp)
+            b2 = Bus.from_sqlite(fp, config=config)
+            self.assertEqual(b2['f1'].to_pairs(),
+                    (('c', (('x', 5), ('y', 6))),))
+            self.assertEqual(b2['f2'].to_pairs(),
+                    (('c', (('x', 1), ('y', 2), ('z', 3))),))
+
+    def test_bus_to_sqlite_e(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=Index(('x', 'y'), name='i'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(a=(1,2,3), b=(4,5,6)),
+                index=Index(('x', 'y', 'z'), name='i'),
+                name='f2')
+
+        b1 = Bus.from_frames((f1, f2))
+        config = StoreConfig(index_depth=1, row_filter=(RowFilterColumn('a') > 1) & (RowFilterColumn('i') != 'z'))
+
+        with temp_file('.sqlite') as fp:
+            b1.to_sqlite(fp)
+            b2 = Bus.from_sqlite(fp, config=config)
+            self.assertEqual(b2['f1'].to_pairs(),
+                    (('a', (('y', 2),)), ('b', (('y', 4),))))
+            self.assertEqual(b2['f2'].to_pairs(),
+                    (('a', (('y', 2),)), ('b', (('y', 5),))))
+
     @skip_win
     def test_bus_to_sqlite_b(self) -> None:
         '''
@@ -1479,15 +1595,15 @@ class TestUnit(TestCase):
             self.assertTrue(b2._loaded_all)
 
             _ = b2.iloc[[1, 0]]
-            self.assertEqual(list(b2._last_accessed.keys()),
+            self.assertEqual(list(b2._persist_policy._order.keys()),
                     ['2', '3', '1', '0'])
 
             _ = b2.iloc[3]
-            self.assertEqual(list(b2._last_accessed.keys()),
+            self.assertEqual(list(b2._persist_policy._order.keys()),
                     ['2', '1', '0', '3'])
 
             _ = b2.iloc[:3]
-            self.assertEqual(list(b2._last_accessed.keys()),
+            self.assertEqual(list(b2._persist_policy._order.keys()),
                     ['3', '0', '1', '2'])
 
     def test_bus_max_persist_f(self) -> None:
@@ -1713,6 +1829,227 @@ class TestUnit(TestCase):
                     [('a', 5), ('a', 6)],
                     )
 
+    def test_bus_max_persist_n(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(6):
+                yield str(i), Frame(np.arange(10).reshape(2, 5))
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+
+            b2 = Bus.from_zip_pickle(fp, config=config, max_persist=3)
+            _ = b2.iloc[[3, 4, 0]]
+            # selection is larger than max_persist, but only two need to be loaded
+            b3 = b2.iloc[2:]
+            self.assertEqual(b3._loaded.tolist(), [False, True, True, True])
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, True, True, True])
+
+    def test_bus_read_prefetch_a(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(10):
+                yield str(i), Frame(np.arange(10).reshape(2, 5) + i)
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1, read_prefetch=3)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            for max_persist in (1, 2, 4):
+                b2 = Bus.from_zip_npz(fp, config=config, max_persist=max_persist)
+                post = []
+                for label, f in b2.items():
+                    self.assertTrue(b2._loaded.sum() <= max_persist)
+                    post.append((label, f.sum().sum()))
+                self.assertEqual(post, [(str(i), 45 + 10 * i) for i in range(10)])
+                self.assertEqual(b2._loaded.sum(), max_persist)
+                self.assertEqual(b2.persist_policy.misses, 10) # type: ignore
+
+            b3 = Bus.from_zip_npz(fp, config=config)
+            self.assertEqual([f.shape for f in b3._axis_element()], [(2, 5)] * 10)
+            self.assertTrue(b3._loaded_all)
+
+    def test_bus_read_prefetch_b(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(10):
+                yield str(i), Frame(np.arange(10).reshape(2, 5) + i)
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1, read_prefetch=2)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+
+            b2 = Bus.from_zip_pickle(fp, config=config, max_persist=2)
+            _ = b2.iloc[[3, 7]]
+            # 3 and 7 are evicted before being reached and are read again
+            post = b2.values
+            self.assertEqual([f.sum().sum() for f in post], [45 + 10 * i for i in range(10)])
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, False, False, False, False, True, True])
+            self.assertEqual(b2.persist_policy.misses, 12) # type: ignore
+
+            b3 = Bus.from_zip_pickle(fp, config=config, max_persist_bytes=100)
+            self.assertTrue(b3.equals(b1))
+            self.assertEqual(b3._loaded.sum(), 1)
+
+    def test_bus_read_prefetch_c(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(10):
+                yield str(i), Frame(np.arange(10).reshape(2, 5) + i)
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1, read_prefetch=3)
+        read_many = StoreZipNPZ.read_many
+        counts = []
+
+        def read_many_count(self: StoreZipNPZ, labels: tp.List[str], **kwargs: tp.Any) -> tp.Iterator[Frame]:
+            counts.append(len(labels))
+            return read_many(self, labels, **kwargs)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            with patch.object(StoreZipNPZ, 'read_many', read_many_count):
+                # prefetched Frame count against max_persist
+                b2 = Bus.from_zip_npz(fp, config=config, max_persist=3)
+                self.assertEqual(len(tuple(b2.items())), 10)
+                self.assertTrue(max(counts) <= 2)
+                self.assertEqual(b2._loaded.sum(), 3)
+
+                counts.clear()
+                b3 = Bus.from_zip_npz(fp, config=config, max_persist=1)
+                self.assertTrue(b3.equals(b1))
+                self.assertEqual(counts, [1] * 10)
+
+    def test_bus_max_persist_bytes_a(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(6):
+                # 80 bytes for even, 160 bytes for odd
+                yield str(i), Frame(np.arange(10 * (1 + i % 2)).reshape(2, -1))
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+
+            b2 = Bus.from_zip_pickle(fp, config=config, max_persist_bytes=250)
+            for label in b2.index:
+                _ = b2[label]
+                self.assertTrue(b2.nbytes <= 250)
+
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, True, True])
+            self.assertEqual(b2.nbytes, 240)
+            self.assertEqual(b2._persist_policy.nbytes, 240)
+
+            # re-accessing 4 makes 5 the least-recently used
+            _ = b2['4']
+            _ = b2['0']
+            self.assertEqual(b2._loaded.tolist(),
+                    [True, False, False, False, True, False])
+            self.assertEqual(b2._persist_policy.nbytes, 160)
+
+            b2.unpersist()
+            self.assertEqual(b2._persist_policy.nbytes, 0)
+
+    def test_bus_max_persist_bytes_b(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(6):
+                yield str(i), Frame(np.arange(10).reshape(2, 5))
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            b2 = Bus.from_zip_npz(fp, config=config, max_persist_bytes=100)
+            # a selection larger than the budget retains the trailing Frame that fit
+            b3 = b2.iloc[1:4]
+            self.assertEqual(b3._loaded.tolist(), [False, False, True])
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, True, False, False])
+            self.assertEqual(b2._persist_policy.nbytes, 80)
+            self.assertEqual(b3.shapes.values.tolist(), [None, None, (2, 5)])
+
+            # the next load evicts until under budget
+            _ = b2.iloc[0]
+            self.assertEqual(b2._loaded.tolist(),
+                    [True, False, False, False, False, False])
+
+            # iteration loads one Frame at a time
+            post = [f.shape for _, f in b2.items()]
+            self.assertEqual(len(post), 6)
+            self.assertEqual(b2._loaded.sum(), 1)
+            self.assertEqual(len(b2.values), 6)
+            self.assertEqual(b2._loaded.sum(), 1)
+
+    def test_bus_max_persist_bytes_c(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(6):
+                yield str(i), Frame(np.arange(10).reshape(2, 5))
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+
+            b2 = Bus.from_zip_pickle(fp,
+                    config=config,
+                    max_persist=3,
+                    max_persist_bytes=200,
+                    )
+            for _ in b2.items():
+                self.assertTrue(b2._loaded.sum() <= 3)
+                self.assertTrue(b2.nbytes <= 200)
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, False, True, True])
+
+            _ = b2.iloc[0]
+            self.assertEqual(b2._loaded.tolist(),
+                    [True, False, False, False, False, True])
+
+            # derived containers retain the budget
+            b3 = b2.iloc[2:]
+            self.assertEqual(b3._max_persist_bytes, 200)
+
+    def test_bus_max_persist_bytes_d(self) -> None:
+        with self.assertRaises(ErrorInitBus):
+            Bus(None, index=('a',), store=StoreZipTSV('foo.zip'), max_persist_bytes=0)
+
+    def test_bus_max_persist_bytes_e(self) -> None:
+        def items() -> tp.Iterator[tp.Tuple[str, Frame]]:
+            for i in range(6):
+                yield str(i), Frame(np.arange(10_000).reshape(100, 100))
+
+        b1 = Bus.from_items(items())
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+
+            b2 = Bus.from_zip_pickle(fp, config=config, max_persist_bytes=200_000)
+            b3 = b2.iloc[[0, 3, 5]]
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, False, False, True, False, True])
+            self.assertEqual(b2._persist_policy.nbytes, 160_000)
+            self.assertEqual(b3._loaded.tolist(), [False, True, True])
+            self.assertTrue(b3.equals(b1.iloc[[0, 3, 5]]))
+
+            # a single Frame larger than the budget is retained
+            b4 = Bus.from_zip_pickle(fp, config=config, max_persist_bytes=50_000)
+            _ = b4.iloc[[1, 2]]
+            self.assertEqual(b4._loaded.tolist(),
+                    [False, False, True, False, False, False])
+            self.assertEqual(b4._persist_policy.nbytes, 80_000)
+
 
     #---------------------------------------------------------------------------
 
@@ -2635,6 +2972,22 @@ class TestUnit(TestCase):
                 ((0, ((0, 1930.4), (1, -1760.34), (2, 1857.34), (3, 1699.34))), (1, ((0, -610.8), (1, 3243.94), (2, -823.14), (3, 114.58))), (2, ((0, 694.3), (1, -72.96), (2, 1826.02), (3, 604.1))), (3, ((0, 1080.4), (1, 2580.34), (2, 700.42), (3, 3338.48))))
                 )
 
+    def test_bus_npy_c(self) -> None:
+        f1 = ff.parse('s(4,2)').rename('f1')
+        f2 = ff.parse('s(4,5)|v(int,str,bool)').rename('f2')
+        f3 = ff.parse('s(2,2)|i(ID,dtD)').rename('f3')
+
+        b1 = Bus.from_frames((f1, f2, f3))
+        config = StoreConfig(read_memory_map=True)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npy(fp, compression=zipfile.ZIP_STORED)
+            b2 = Bus.from_zip_npy(fp, config=config, max_persist=2)
+            for f_src, f_dst in zip(b1.values, b2.values):
+                self.assertTrue(f_src.equals(f_dst, compare_dtype=True, compare_name=True))
+            self.assertIs(b2['f2']._blocks._blocks[1].base.__class__, mmap.mmap)
+            self.assertEqual(b2._loaded.sum(), 2)
+
     def test_bus_npy_b(self) -> None:
         f1 = ff.parse('s(4,2)').rename('f1')
         f2 = ff.parse('s(4,5)').rename('f2')
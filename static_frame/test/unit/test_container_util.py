@@ -18,6 +18,7 @@ from static_frame import Series
 from static_frame.core.container_util import ContainerMap
 from static_frame.core.container_util import apex_to_name
 from static_frame.core.container_util import apply_binary_operator_blocks_columnar
+from static_frame.core.container_util import array_from_sequence
 from static_frame.core.container_util import arrays_from_index_frame
 from static_frame.core.container_util import bloc_key_normalize
 from static_frame.core.container_util import container_to_exporter_attr
@@ -958,6 +959,33 @@ class TestUnit(TestCase):
             )
         self.assertEqual(labels, [1, 2])
 
+    #---------------------------------------------------------------------------
+
+    def test_array_from_sequence_a(self) -> None:
+        post = array_from_sequence((1, 2, 3))
+        self.assertEqual(post.dtype, np.dtype(np.int64))
+        self.assertFalse(post.flags.writeable)
+
+        self.assertEqual(array_from_sequence(('a', 'bcd')).dtype, np.dtype('<U3'))
+        self.assertEqual(array_from_sequence((True, False)).dtype, np.dtype(bool))
+        self.assertEqual(array_from_sequence((0.5, np.nan)).dtype, np.dtype(np.float64))
+
+        # mixed types are evaluated element-wise
+        self.assertEqual(array_from_sequence((1, None)).dtype, np.dtype(object))
+        self.assertEqual(array_from_sequence((2**70, 1)).dtype, np.dtype(object))
+        self.assertEqual(len(array_from_sequence(())), 0)
+
+    def test_array_from_sequence_b(self) -> None:
+        post = array_from_sequence((1, 2), np.float32)
+        self.assertEqual(post.dtype, np.dtype(np.float32))
+        self.assertFalse(post.flags.writeable)
+
+        post = array_from_sequence((1, None, 3.5), float)
+        self.assertEqual(post.dtype, np.dtype(np.float64))
+
+        with self.assertRaises(ValueError):
+            array_from_sequence((1, 'a'), int)
+
 
 if __name__ == '__main__':
     import unittest
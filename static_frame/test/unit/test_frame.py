@@ -5,11 +5,13 @@ import dataclasses
 import datetime
 import io
 import itertools as it
+import mmap
 import os
 import pickle
 import sqlite3
 import string
 import unittest
+import zipfile
 from collections import OrderedDict
 from collections import defaultdict
 from collections import namedtuple
@@ -60,6 +62,7 @@ from static_frame.core.exception import InvalidFillValue
 from static_frame.core.fill_value_auto import FillValueAuto
 from static_frame.core.frame import FrameAssignBLoc
 from static_frame.core.frame import FrameAssignILoc
+from static_frame.core.row_filter import RowFilterColumn
 from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_filter import StoreFilter
 from static_frame.core.store_xlsx import StoreXLSX
@@ -1067,6 +1070,30 @@ class TestUnit(TestCase):
                 ((0, ((1, 2), (30, 34), (54, 95), (65, 73))), (1, ((1, 'a'), (30, 'b'), (54, 'c'), (65, 'd'))), (2, ((1, False), (30, True), (54, False), (65, True))))
                 )
 
+    def test_frame_from_arrow_dictionary_a(self) -> None:
+        import pyarrow as pa
+
+        f1 = Frame.from_fields((('a', 'b', 'a', 'a'), (1, 2, 3, 4)),
+                columns=('x', 'y'),
+                )
+        at = f1.to_arrow(include_index=False, dictionary_encode=True)
+        self.assertTrue(pa.types.is_dictionary(at.column('x').type))
+        self.assertFalse(pa.types.is_dictionary(at.column('y').type))
+
+        f2 = Frame.from_arrow(at)
+        self.assertEqual(f2.to_pairs(),
+                (('x', ((0, 'a'), (1, 'b'), (2, 'a'), (3, 'a'))), ('y', ((0, 1), (1, 2), (2, 3), (3, 4))))
+                )
+        # chunked dictionary arrays, and dictionary arrays with nulls
+        at = pa.table({'x': pa.chunked_array([
+                pa.array(['a', 'b']).dictionary_encode(),
+                pa.array(['c', 'a']).dictionary_encode(),
+                ])})
+        self.assertEqual(Frame.from_arrow(at)['x'].values.tolist(), ['a', 'b', 'c', 'a'])
+
+        at = pa.table({'x': pa.array(['a', None, 'a']).dictionary_encode()})
+        self.assertEqual(Frame.from_arrow(at)['x'].isna().values.tolist(), [False, True, False])
+
     #---------------------------------------------------------------------------
 
     def test_frame_to_parquet_a(self) -> None:
@@ -1454,6 +1481,64 @@ class TestUnit(TestCase):
         with self.assertRaises(ValueError):
             f1 = Frame.from_parquet(None)
 
+    def test_frame_from_parquet_g(self) -> None:
+        f1 = Frame.from_fields((np.arange(10), np.arange(10) * 0.5),
+                columns=('a', 'b'),
+                )
+        with temp_file('.parquet') as fp:
+            f1.to_parquet(fp, include_index=False, row_group_size=4)
+
+            f2 = Frame.from_parquet(fp, row_groups=(1, 2))
+            self.assertEqual(f2['a'].values.tolist(), [4, 5, 6, 7, 8, 9])
+
+            f3 = Frame.from_parquet(fp,
+                    row_groups=[0],
+                    columns_select=['b'],
+                    row_filter=RowFilterColumn('b') > 0.5,
+                    use_threads=False,
+                    )
+            self.assertEqual(f3.to_pairs(),
+                    (('b', ((0, 1.0), (1, 1.5))),)
+                    )
+            with self.assertRaises(ErrorInitFrame):
+                Frame.from_parquet(fp, row_groups=[0], columns_select=['c'])
+            for row_groups in ([3], [-1], [0.5]):
+                with self.assertRaises(ErrorInitFrame):
+                    Frame.from_parquet(fp, row_groups=row_groups)
+
+    def test_frame_from_parquet_iter_a(self) -> None:
+        f1 = Frame.from_fields((np.arange(10), np.arange(10) * 0.5),
+                columns=('a', 'b'),
+                index=tuple('abcdefghij'),
+                )
+        with temp_file('.parquet') as fp:
+            f1.to_parquet(fp, row_group_size=4, use_dictionary=['__index0__'])
+
+            frames = list(Frame.from_parquet_iter(fp, index_depth=1))
+            self.assertEqual([f.name for f in frames], [0, 1, 2])
+            self.assertEqual([len(f) for f in frames], [4, 4, 2])
+            f2 = Frame.from_concat(frames)
+            self.assertTrue(f2.equals(f1))
+
+            frames = list(Frame.from_parquet_iter(fp,
+                    row_groups=[2, 0],
+                    columns_select=['a'],
+                    ))
+            self.assertEqual([f.name for f in frames], [2, 0])
+            self.assertEqual(frames[0].to_pairs(),
+                    (('a', ((8, 8), (9, 9))),)
+                    )
+
+            frames = list(Frame.from_parquet_iter(fp,
+                    index_depth=1,
+                    row_filter=RowFilterColumn('a') >= 3,
+                    ))
+            self.assertEqual([len(f) for f in frames], [1, 4, 2])
+
+            # invalid row groups raise before iteration
+            with self.assertRaises(ErrorInitFrame):
+                Frame.from_parquet_iter(fp, row_groups=[0, 3])
+
     #---------------------------------------------------------------------------
 
     def test_frame_from_msgpack_a(self) -> None:
@@ -7311,6 +7396,171 @@ class TestUnit(TestCase):
         self.assertEqual(f3.columns.name, 'index')
         self.assertEqual(f3.to_pairs(), (('column', ()),))
 
+    def test_frame_from_csv_columns_select_dtypes_a(self) -> None:
+        s = io.StringIO('a,b,c\n1,x,2.5\n3,y,4.5\n')
+        f1 = sf.Frame.from_csv(s, columns_select=('b', 'c'), dtypes={'c': str})
+        self.assertEqual(f1.dtypes.values.tolist(), [np.dtype('<U1'), np.dtype('<U3')])
+
+    def test_frame_from_csv_max_workers_a(self) -> None:
+        with temp_file('.csv') as fp:
+            with open(fp, 'w') as f:
+                f.write('header\na,b,c,d\n')
+                for i in range(300):
+                    b = f'"multi\nline, {i}"' if i % 7 == 0 else f'v{i}'
+                    c = '' if i == 150 else str(i / 2)
+                    d = 'x' if i == 290 else str(i)
+                    f.write(f'{i},{b},{c},{d}\n')
+                f.write('footer\n')
+
+            ranges = Frame._delimited_byte_ranges(fp,
+                    skip_lines=2,
+                    skip_footer=1,
+                    count=4,
+                    encoding=None,
+                    quote_char='"',
+                    )
+            self.assertEqual(len(ranges), 4) # type: ignore
+            with open(fp, 'rb') as f:
+                data = f.read()
+            for start, stop in ranges: # type: ignore
+                self.assertEqual(data[start: stop].count(b'"') % 2, 0)
+                self.assertEqual(data[stop - 1: stop], b'\n')
+            self.assertEqual(data[ranges[-1][1]:], b'footer\n') # type: ignore
+
+            f1 = sf.Frame.from_csv(fp, skip_header=1, skip_footer=1)
+            f2 = sf.Frame.from_csv(fp, skip_header=1, skip_footer=1, max_workers=4)
+            self.assertTrue(f1.equals(f2, compare_dtype=True))
+            self.assertEqual(f2.dtypes.values.tolist(),
+                    [np.dtype(np.int64), np.dtype('<U15'), np.dtype(np.float64), np.dtype('<U3')])
+
+            f3 = sf.Frame.from_csv(fp,
+                    skip_header=1,
+                    skip_footer=1,
+                    columns_select=('a', 'd'),
+                    dtypes={'a': float},
+                    max_workers=3,
+                    )
+            self.assertEqual(f3.dtypes.values.tolist(), [np.dtype(np.float64), np.dtype('<U3')])
+            self.assertEqual(f3['a'].sum(), f1['a'].sum())
+
+    def test_frame_from_csv_max_workers_b(self) -> None:
+        with temp_file('.csv') as fp:
+            with open(fp, 'w') as f:
+                f.write('a 12" note\na,b\n')
+                for i in range(20):
+                    f.write(f'{i},"v\n{i}"\n')
+
+            # an odd count of quotes in skipped lines falls back to parsing serially
+            ranges = Frame._delimited_byte_ranges(fp,
+                    skip_lines=2,
+                    skip_footer=0,
+                    count=2,
+                    encoding=None,
+                    quote_char='"',
+                    )
+            self.assertIsNone(ranges)
+            f1 = sf.Frame.from_csv(fp, skip_header=1)
+            f2 = sf.Frame.from_csv(fp, skip_header=1, max_workers=2)
+            self.assertTrue(f1.equals(f2, compare_dtype=True))
+
+    def test_frame_from_tsv_max_workers_a(self) -> None:
+        f1 = ff.parse('s(40,4)|v(int,str,bool,float)').rename(index='i')
+        with temp_file('.txt') as fp:
+            f1.to_tsv(fp)
+            f2 = sf.Frame.from_tsv(fp, index_depth=1, max_workers=2)
+            self.assertTrue(f2.equals(sf.Frame.from_tsv(fp, index_depth=1), compare_dtype=True))
+
+        with temp_file('.txt') as fp:
+            with open(fp, 'w') as f:
+                f.write('a\tb\n')
+            self.assertEqual(sf.Frame.from_tsv(fp, max_workers=2).shape, (0, 2))
+
+    #---------------------------------------------------------------------------
+
+    def test_frame_from_csv_iter_a(self) -> None:
+        s = io.StringIO('a,b,c\n' +
+                ''.join(f'{i},{"x" * (i + 1)},{i / 2}\n' for i in range(7)) +
+                'footer\n')
+
+        frames = list(sf.Frame.from_csv_iter(s, chunksize=3, skip_footer=1))
+        self.assertEqual([f.name for f in frames], [0, 1, 2])
+        self.assertEqual([f.index.values.tolist() for f in frames],
+                [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual([f.dtypes.values.tolist() for f in frames],
+                [[np.dtype(np.int64), np.dtype('<U3'), np.dtype(np.float64)],
+                [np.dtype(np.int64), np.dtype('<U6'), np.dtype(np.float64)],
+                [np.dtype(np.int64), np.dtype('<U7'), np.dtype(np.float64)]],
+                )
+        s.seek(0)
+        f = sf.Frame.from_csv(s, skip_footer=1)
+        self.assertTrue(sf.Frame.from_concat(frames).equals(f, compare_dtype=True))
+
+        s.seek(0)
+        frames = list(sf.Frame.from_csv_iter(s,
+                chunksize=4,
+                skip_footer=1,
+                columns_select=('c',),
+                ))
+        self.assertEqual([f.to_pairs() for f in frames],
+                [(('c', ((0, 0.0), (1, 0.5), (2, 1.0), (3, 1.5))),),
+                (('c', ((4, 2.0), (5, 2.5), (6, 3.0))),)])
+
+        with self.assertRaises(ErrorInitFrame):
+            sf.Frame.from_csv_iter(s, chunksize=0)
+
+    def test_frame_from_csv_iter_b(self) -> None:
+        # dtypes of prior chunks are retained for subsequent chunks
+        s = io.StringIO('a,b\n1,2\n3,4\n5,6.5\n')
+        frames = list(sf.Frame.from_csv_iter(s, chunksize=2, dtypes={'b': float}))
+        self.assertEqual([f['b'].dtype for f in frames], [np.dtype(np.float64)] * 2)
+
+        s = io.StringIO('a,b\nx,1\ny,2\nz,3\n')
+        frames = list(sf.Frame.from_csv_iter(s, chunksize=2, index_depth=1))
+        self.assertEqual([f.index.values.tolist() for f in frames], [['x', 'y'], ['z']])
+        self.assertEqual([f['b'].dtype for f in frames], [np.dtype(np.int64)] * 2)
+
+        self.assertEqual(list(sf.Frame.from_csv_iter(io.StringIO('a,b\n'))), [])
+
+    def test_frame_from_csv_iter_c(self) -> None:
+        # a later float widens, and a later empty field is NaN
+        s = io.StringIO('a,b\n1,x\n2,y\n2.5,z\n,w\n3,v\n')
+        frames = list(sf.Frame.from_csv_iter(s, chunksize=1))
+        self.assertEqual([f['a'].dtype.kind for f in frames], ['i', 'i', 'f', 'f', 'f'])
+        self.assertEqual(frames[2]['a'].values.tolist(), [2.5])
+        self.assertTrue(np.isnan(frames[3]['a'].values[0]))
+        self.assertEqual(frames[4]['a'].values.tolist(), [3.0])
+        self.assertEqual([f['b'].dtype.kind for f in frames], ['U'] * 5)
+
+        # an empty field following only integers widens to float
+        s = io.StringIO('a,b\n1,x\n,y\n')
+        frames = list(sf.Frame.from_csv_iter(s, chunksize=1))
+        self.assertEqual([f['a'].dtype.kind for f in frames], ['i', 'f'])
+        self.assertTrue(np.isnan(frames[1]['a'].values[0]))
+
+    def test_frame_from_csv_iter_d(self) -> None:
+        # a quoted newline on a chunk boundary is not divided between chunks
+        s = io.StringIO('a,b\n1,"p\nq"\n2,r\n3,"s\n\nt"\n4,u\n')
+        frames = list(sf.Frame.from_csv_iter(s, chunksize=1))
+        self.assertEqual([f.index.values.tolist() for f in frames], [[0], [1], [2], [3]])
+        self.assertEqual([f['b'].values.tolist() for f in frames],
+                [['p\nq'], ['r'], ['s\n\nt'], ['u']])
+        s.seek(0)
+        self.assertTrue(sf.Frame.from_concat(frames).equals(sf.Frame.from_csv(s)))
+
+        # quote characters escaped are not counted
+        s = io.StringIO('a,b\n1,"x\\"\ny"\n2,z\n')
+        frames = list(sf.Frame.from_csv_iter(s, chunksize=1, escape_char='\\'))
+        self.assertEqual([f['b'].values.tolist() for f in frames], [['x"\ny'], ['z']])
+
+    def test_frame_from_tsv_iter_a(self) -> None:
+        f1 = ff.parse('s(10,3)|v(int,str,bool)').rename(index='i')
+        with temp_file('.txt') as fp:
+            f1.to_tsv(fp)
+            frames = list(sf.Frame.from_tsv_iter(fp, chunksize=4, index_depth=1))
+            self.assertEqual([len(f) for f in frames], [4, 4, 2])
+            self.assertTrue(sf.Frame.from_concat(frames).equals(
+                    sf.Frame.from_tsv(fp, index_depth=1), compare_dtype=True))
+
     #---------------------------------------------------------------------------
 
     def test_frame_to_pairs_a(self) -> None:
@@ -10842,6 +11092,56 @@ class TestUnit(TestCase):
             f2.equals(f3, compare_dtype=True, compare_class=True, compare_name=True)
             self.assertEqual(f3._blocks.shapes.tolist(), [(20, 50)])
 
+    def test_frame_to_npy_dictionary_encode_a(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,str)|i(I,str)|c(I,str)').rename('foo')
+        f1 = f1.assign.iloc[:, 1](np.array(['aaaaaaaa', 'b'] * 10))
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp, dictionary_encode=True)
+            self.assertTrue(os.path.exists(os.path.join(fp, '__blocks_values_1__.npy')))
+            f2 = Frame.from_npy(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+
+            f3 = Frame.from_npy(fp, columns_select=f1.columns[1:2])
+            self.assertTrue(f1.iloc[:, 1:2].equals(f3, compare_dtype=True))
+
+            f4, finalizer = Frame.from_npy_mmap(fp)
+            self.assertTrue(f1.equals(f4, compare_dtype=True))
+            finalizer()
+
+    def test_frame_to_npz_dictionary_encode_a(self) -> None:
+        # columns that are not smaller when encoded are stored as is
+        f1 = ff.parse('s(6,2)|v(str)').rename('foo')
+
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp, dictionary_encode=True)
+            with zipfile.ZipFile(fp) as zf:
+                self.assertNotIn('__blocks_values_0__.npy', zf.namelist())
+            f2 = Frame.from_npz(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_name=True))
+
+    def test_frame_to_npy_compact_strings_a(self) -> None:
+        f1 = ff.parse('s(20,4)|v(int,str)|i(I,str)|c(I,str)').rename('foo')
+        f1 = f1.assign.iloc[:, 1](np.array(['a' * 200] + ['b'] * 19))
+
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp, compact_strings=True, dictionary_encode=True)
+            # the dictionary encoded block is not compacted
+            self.assertTrue(os.path.exists(os.path.join(fp, '__blocks_values_1__.npy')))
+            self.assertFalse(os.path.exists(os.path.join(fp, '__blocks_buffer_1__.npy')))
+            self.assertTrue(os.path.exists(os.path.join(fp, '__blocks_buffer_3__.npy')))
+            f2 = Frame.from_npy(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp, compact_strings=True)
+            with zipfile.ZipFile(fp) as zf:
+                self.assertIn('__blocks_buffer_1__.npy', zf.namelist())
+            f3 = Frame.from_npz(fp, columns_select=f1.columns[1:2])
+            self.assertTrue(f1.iloc[:, 1:2].equals(f3, compare_dtype=True))
+
     def test_frame_to_npy_failure_a(self) -> None:
         from datetime import date
         with TemporaryDirectory() as fp:
@@ -10921,6 +11221,42 @@ class TestUnit(TestCase):
             self.assertFalse(os.path.exists(fp))
             os.mkdir(fp)
 
+    def test_frame_from_npy_memory_map_f(self) -> None:
+        f1 = ff.parse('s(10,6)|v(int,str,bool)|c(I,str)').rename('foo')
+        with TemporaryDirectory() as fp:
+            os.rmdir(fp) # let it be re-created
+            f1.to_npy(fp)
+            f2, finalizer = Frame.from_npy_mmap(fp, columns_select=('zUvW', 'zkuW'))
+            self.assertTrue(f1[['zUvW', 'zkuW']].equals(f2, compare_dtype=True))
+            del f2
+            finalizer()
+
+    def test_frame_from_npz_memory_map_a(self) -> None:
+        f1 = ff.parse('s(1_000,4)|v(int,str,bool,float)|i(I,str)|c(I,str)').rename('foo')
+        with temp_file('.npz') as fp:
+            f1.to_npz(fp)
+            f2, finalizer = Frame.from_npz_mmap(fp)
+            self.assertTrue(f1.equals(f2, compare_dtype=True, compare_class=True, compare_name=True))
+            for block in f2._blocks._blocks:
+                self.assertIs(block.base.__class__, mmap.mmap)
+                self.assertTrue(block.flags.aligned)
+                self.assertFalse(block.flags.writeable)
+
+            f3, finalizer3 = Frame.from_npz_mmap(fp, columns_select=['zUvW'])
+            self.assertEqual(f3.shape, (1_000, 1))
+            self.assertEqual(f3.values.tolist(), f1[['zUvW']].values.tolist())
+            del f2, f3
+            finalizer()
+            finalizer3()
+
+    def test_frame_from_npz_memory_map_b(self) -> None:
+        f1 = ff.parse('s(4,2)|v(int)')
+        bio = io.BytesIO()
+        f1.to_npz(bio)
+        bio.seek(0)
+        with self.assertRaises(RuntimeError):
+            Frame.from_npz_mmap(bio) # type: ignore
+
 
     #---------------------------------------------------------------------------
 
@@ -12033,6 +12369,157 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_frame_from_sql_dtypes_a(self) -> None:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (i TEXT, j INTEGER, a INTEGER, b REAL, c TEXT, d INTEGER)')
+        conn.executemany('INSERT INTO t VALUES (?, ?, ?, ?, ?, ?)',
+                [('p', 0, 1, 0.5, 'x', None), ('q', 1, 2, None, 'yy', 3)])
+
+        f1 = sf.Frame.from_sql('select * from t', connection=conn, index_depth=2)
+        self.assertEqual(f1.index.dtypes.values.tolist(),
+                [np.dtype('<U1'), np.dtype(np.int64)])
+        self.assertEqual(f1.dtypes.values.tolist(),
+                [np.dtype(np.int64), np.dtype(object), np.dtype('<U2'), np.dtype(object)])
+
+        f2 = sf.Frame.from_sql('select * from t',
+                connection=conn,
+                index_depth=1,
+                dtypes={'i': 'U4', 'b': float, 'd': float},
+                columns_select=('a', 'b', 'd'),
+                )
+        self.assertEqual(f2.index.dtype, np.dtype('<U4'))
+        self.assertEqual(f2.dtypes.values.tolist(),
+                [np.dtype(np.int64), np.dtype(np.float64), np.dtype(np.float64)])
+        self.assertEqual(f2['a'].values.tolist(), [1, 2])
+        self.assertEqual(f2['d'].isna().values.tolist(), [True, False])
+
+    def test_frame_from_sql_iter_a(self) -> None:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (i TEXT, a INTEGER, b REAL, c TEXT)')
+        conn.executemany('INSERT INTO t VALUES (?, ?, ?, ?)',
+                [(f'k{x}', x, x / 2, 'x' * (x + 1)) for x in range(7)])
+
+        frames = list(sf.Frame.from_sql_iter('select * from t',
+                connection=conn,
+                chunksize=3,
+                index_depth=1,
+                ))
+        self.assertEqual([f.name for f in frames], [0, 1, 2])
+        self.assertEqual([f.shape for f in frames], [(3, 3), (3, 3), (1, 3)])
+        self.assertEqual([f.dtypes.values.tolist() for f in frames],
+                [[np.dtype(np.int64), np.dtype(np.float64), np.dtype('<U3')],
+                [np.dtype(np.int64), np.dtype(np.float64), np.dtype('<U6')],
+                [np.dtype(np.int64), np.dtype(np.float64), np.dtype('<U7')]],
+                )
+        f = sf.Frame.from_concat(frames)
+        self.assertTrue(f.equals(sf.Frame.from_sql('select * from t',
+                connection=conn,
+                index_depth=1,
+                ), compare_name=False))
+
+        # dtypes of the first chunk are used for subsequent chunks
+        frames = list(sf.Frame.from_sql_iter('select * from t order by a desc',
+                connection=conn,
+                chunksize=6,
+                ))
+        self.assertEqual(frames[1]['b'].dtype, np.dtype(np.float64))
+        self.assertEqual(frames[1]['b'].values.tolist(), [0.0])
+        self.assertEqual(frames[1].index.values.tolist(), [6])
+
+        self.assertEqual(list(sf.Frame.from_sql_iter('select * from t where a > 10',
+                connection=conn,
+                )), [])
+
+        with self.assertRaises(ErrorInitFrame):
+            sf.Frame.from_sql_iter('select * from t', connection=conn, chunksize=0)
+
+    def test_frame_from_sql_iter_b(self) -> None:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (a INTEGER, b TEXT)')
+        conn.executemany('INSERT INTO t VALUES (?, ?)', [(x, str(x)) for x in range(5)])
+
+        config = sf.StoreConfig(label_encoder=str, label_decoder=int)
+        with temp_file('.zip') as fp:
+            sf.Batch.from_frames(sf.Frame.from_sql_iter('select * from t',
+                    connection=conn,
+                    chunksize=2,
+                    )).to_zip_npy(fp, config=config)
+            q = sf.Quilt.from_zip_npy(fp,
+                    config=config,
+                    max_persist=1,
+                    retain_labels=False,
+                    )
+            self.assertEqual(q.shape, (5, 2))
+            self.assertEqual(q['a'].values.tolist(), [0, 1, 2, 3, 4])
+            self.assertEqual(q.to_frame().dtypes.values.tolist(),
+                    [np.dtype(np.int64), np.dtype('<U1')])
+
+    def test_frame_from_sql_iter_c(self) -> None:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (i INTEGER, a, b TEXT)')
+        conn.executemany('INSERT INTO t VALUES (?, ?, ?)',
+                [(0, 1, 'x'), (1, 2, 'y'), (2, 2.5, None), (3, None, 'z'), (4, 3, None)])
+
+        frames = list(sf.Frame.from_sql_iter('select * from t',
+                connection=conn,
+                chunksize=1,
+                index_depth=1,
+                ))
+        # a later float widens, and is not truncated to the integer of prior chunks
+        self.assertEqual([f['a'].dtype.kind for f in frames], ['i', 'i', 'f', 'f', 'f'])
+        self.assertEqual(frames[2]['a'].values.tolist(), [2.5])
+        # a later NULL in a float field is NaN
+        self.assertTrue(np.isnan(frames[3]['a'].values[0]))
+        self.assertEqual(frames[4]['a'].values.tolist(), [3.0])
+        # a later NULL in a string field is None
+        self.assertEqual(frames[2]['b'].values.tolist(), [None])
+        self.assertEqual(frames[4]['b'].values.tolist(), [None])
+
+        # a NULL following only integers widens to float
+        frames = list(sf.Frame.from_sql_iter('select a from t where i in (0, 3)',
+                connection=conn,
+                chunksize=1,
+                ))
+        self.assertEqual([f['a'].dtype.kind for f in frames], ['i', 'f'])
+        self.assertTrue(np.isnan(frames[1]['a'].values[0]))
+
+        # a NULL mixed with integers is object, as without chunks
+        frames = list(sf.Frame.from_sql_iter('select a from t where i != 2',
+                connection=conn,
+                chunksize=2,
+                ))
+        self.assertEqual([f['a'].dtype.kind for f in frames], ['i', 'O'])
+        self.assertEqual(frames[1]['a'].values.tolist(), [None, 3])
+
+    def test_frame_from_sql_iter_d(self) -> None:
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (a, b)')
+        conn.executemany('INSERT INTO t VALUES (?, ?)',
+                [(1, 'ab'), (2, 'cd'), ('x', 3), (4, 'efg'), (None, None)])
+
+        # dtypes widen from the first Frame that requires it; earlier Frame are not changed
+        frames = list(sf.Frame.from_sql_iter('select * from t',
+                connection=conn,
+                chunksize=2,
+                ))
+        self.assertEqual([f.dtypes.values.tolist() for f in frames],
+                [[np.dtype(np.int64), np.dtype('<U2')],
+                [np.dtype(object), np.dtype(object)],
+                [np.dtype(object), np.dtype(object)]],
+                )
+        self.assertEqual(frames[1].values.tolist(), [['x', 3], [4, 'efg']])
+
+        # providing dtypes gives the same dtypes in all Frame
+        frames = list(sf.Frame.from_sql_iter('select * from t',
+                connection=conn,
+                chunksize=2,
+                dtypes=object,
+                ))
+        self.assertEqual({tuple(f.dtypes.values.tolist()) for f in frames},
+                {(np.dtype(object), np.dtype(object))})
+
+    #---------------------------------------------------------------------------
+
     def test_frame_from_records_items_a(self) -> None:
 
         def gen() -> tp.Iterator[tp.Tuple[TLabel, tp.Dict[TLabel, tp.Any]]]:
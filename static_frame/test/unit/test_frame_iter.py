@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from operator import itemgetter
+from operator import methodcaller
+
 import frame_fixtures as ff
 import numpy as np
 import typing_extensions as tp
@@ -669,6 +672,25 @@ class TestUnit(TestCase):
                 ((False, 'False: 2'), (True, 'True: 2'))
                 )
 
+    def test_frame_iter_group_apply_pool_a(self) -> None:
+        f1 = ff.parse('s(8,3)|v(int,str,float)').assign[0].apply(lambda s: s % 3)
+
+        post1 = f1.iter_group(0).apply_pool(methodcaller('transpose'),
+                max_workers=2,
+                shared_memory=True,
+                )
+        post2 = f1.iter_group(0).apply(methodcaller('transpose'))
+        self.assertEqual(post1.index.values.tolist(), post2.index.values.tolist())
+        for f_post1, f_post2 in zip(post1.values, post2.values):
+            self.assertTrue(f_post1.equals(f_post2, compare_dtype=True))
+
+        post3 = f1.iter_group_items(0).apply_pool(itemgetter(1),
+                max_workers=2,
+                shared_memory=True,
+                )
+        self.assertEqual(post3.index.values.tolist(), [0, 1, 2])
+        self.assertTrue(post3[1].equals(f1.loc[f1[0] == 1], compare_dtype=True))
+
     def test_frame_iter_group_items_c1(self) -> None:
         # Test optimized sorting approach. Data must have a non-object dtype and key must be single
         data = np.array([[0, 1, 1, 3],
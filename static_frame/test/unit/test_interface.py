@@ -30,7 +30,7 @@ class TestUnit(TestCase):
 
         self.assertEqual(
             counts.to_pairs(),
-            (('Accessor Datetime', 23), ('Accessor Fill Value', 26), ('Accessor Hashlib', 10), ('Accessor Reduce', 20), ('Accessor Regular Expression', 7), ('Accessor String', 39), ('Accessor Transpose', 24), ('Accessor Type Clinic', 5), ('Accessor Values', 3), ('Assignment', 16), ('Attribute', 12), ('Constructor', 40), ('Dictionary-Like', 7), ('Display', 6), ('Exporter', 33), ('Iterator', 396), ('Method', 106), ('Operator Binary', 24), ('Operator Unary', 4), ('Selector', 13))
+            (('Accessor Datetime', 23), ('Accessor Fill Value', 26), ('Accessor Hashlib', 10), ('Accessor Reduce', 20), ('Accessor Regular Expression', 7), ('Accessor String', 39), ('Accessor Transpose', 24), ('Accessor Type Clinic', 5), ('Accessor Values', 3), ('Assignment', 16), ('Attribute', 12), ('Constructor', 47), ('Dictionary-Like', 7), ('Display', 6), ('Exporter', 34), ('Iterator', 396), ('Method', 106), ('Operator Binary', 24), ('Operator Unary', 4), ('Selector', 13))
             )
 
     def test_interface_summary_c(self) -> None:
@@ -156,7 +156,7 @@ class TestUnit(TestCase):
                 max_args=99,
                 )
         self.assertEqual(inter['signature_no_args'].values.tolist(),
-            ['from_file()', 'from_gzip()', 'from_zip()']
+            ['from_file()', 'from_file_async()', 'from_gzip()', 'from_zip()']
             )
 
     def test_interface_summary_name_obj_iter_b(self) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 from copy import deepcopy
 
 import numpy as np
@@ -187,6 +188,23 @@ class TestHierarchicalLocMapUnit(TestCase):
         else:
             assert False, 'exception not raised'
 
+    def test_init_e(self) -> None:
+        indices = [Index(np_arange(5)), Index(tuple('ABCDE'))]
+        indexers = np.array([[3, 3, 0], [4, 2, 1]])
+
+        hlmap1 = HierarchicalLocMap(indices=indices, indexers=indexers, deferred=True)
+        self.assertIsNone(hlmap1._encoded_indexer_map)
+
+        hlmap2 = pickle.loads(pickle.dumps(hlmap1))
+        hlmap3 = deepcopy(hlmap1)
+
+        self.assertEqual(hlmap1.loc_to_iloc((0, 'B'), indices), 2)
+        self.assertIsNotNone(hlmap1._encoded_indexer_map)
+        self.assertIsNone(hlmap1._indexers)
+
+        for hlmap in (hlmap2, hlmap3):
+            self.assertListEqual(list(hlmap.encoded_indexer_map), [35, 19, 8])
+
     #---------------------------------------------------------------------------
 
     def test_build_offsets_and_overflow_a(self) -> None:
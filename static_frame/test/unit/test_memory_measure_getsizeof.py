@@ -520,8 +520,9 @@ class TestUnit(TestCase):
             b._name,
             b._store,
             b._config,
-            # b._last_accessed, # not initialized, not a "max_persist" bus
+            b._persist_policy,
             b._max_persist,
+            b._max_persist_bytes,
         )) + getsizeof(b))
 
     def test_getsizeof_total_bus_maxpersist(self) -> None:
@@ -553,8 +554,9 @@ class TestUnit(TestCase):
                 b2._name,
                 b2._store,
                 b2._config,
-                b2._last_accessed,
+                b2._persist_policy,
                 b2._max_persist,
+                b2._max_persist_bytes,
             )) + getsizeof(b2))
 
     #---------------------------------------------------------------------------
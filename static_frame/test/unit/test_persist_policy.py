@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import frame_fixtures as ff
+import numpy as np
+
+from static_frame.core.bus import Bus
+from static_frame.core.exception import ErrorInitBus
+from static_frame.core.frame import Frame
+from static_frame.core.persist_policy import PersistPolicy2Q
+from static_frame.core.persist_policy import PersistPolicyLFU
+from static_frame.core.persist_policy import PersistPolicyLRU
+from static_frame.core.store_config import StoreConfig
+from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import temp_file
+
+
+class TestUnit(TestCase):
+
+    #---------------------------------------------------------------------------
+    def test_persist_policy_lru_a(self) -> None:
+        p = PersistPolicyLRU()
+        for label in 'abc':
+            p._load(label, 10)
+        self.assertEqual(len(p), 3)
+        self.assertEqual(p.nbytes, 30)
+        self.assertEqual(p.misses, 3)
+
+        p._access('a')
+        self.assertEqual(p.hits, 1)
+        self.assertEqual(p._evict(()), 'b')
+        self.assertEqual(p._evict({'c'}), 'a')
+        self.assertEqual(p._evict({'c'}), None)
+        self.assertEqual(p.evictions, 2)
+        self.assertEqual(p.nbytes, 10)
+        self.assertTrue('c' in p)
+        self.assertFalse('a' in p)
+
+    def test_persist_policy_lru_b(self) -> None:
+        p = PersistPolicyLRU(pinned=('a',))
+        p._load('a', 10)
+        p._load('b', 10)
+        self.assertEqual(p._evict(()), 'b')
+        self.assertEqual(p._evict(()), None)
+
+        p.unpin('a')
+        self.assertEqual(p.pinned, frozenset())
+        self.assertEqual(p._evict(()), 'a')
+        p.pin('b')
+        self.assertEqual(p.pinned, frozenset(('b',)))
+
+        p._load('c', 5)
+        p._clear()
+        self.assertEqual(len(p), 0)
+        self.assertEqual(p.nbytes, 0)
+
+    def test_persist_policy_lru_c(self) -> None:
+        p1 = PersistPolicyLRU(pinned=('a',))
+        p1._load('a', 10)
+        p2 = p1._new()
+        self.assertEqual(len(p2), 0)
+        self.assertEqual(p2.pinned, frozenset(('a',)))
+        self.assertEqual(repr(p1),
+                '<PersistPolicyLRU loaded=1 nbytes=10 hits=0 misses=1 evictions=0>')
+
+    #---------------------------------------------------------------------------
+    def test_persist_policy_lfu_a(self) -> None:
+        p = PersistPolicyLFU()
+        for label in 'abc':
+            p._load(label, 10)
+        p._access('a')
+        p._access('a')
+        p._access('c')
+        # b has the lowest count
+        self.assertEqual(p._evict(()), 'b')
+        # c has a lower count than a
+        self.assertEqual(p._evict(()), 'c')
+
+        p._load('d', 10)
+        p._access('d')
+        p._access('d')
+        # tie between a and d broken by recency
+        self.assertEqual(p._evict(()), 'a')
+        self.assertEqual(p._evict({'d'}), None)
+
+    #---------------------------------------------------------------------------
+    def test_persist_policy_2q_a(self) -> None:
+        p = PersistPolicy2Q()
+        p._load('hot', 10)
+        p._access('hot') # promoted
+        for label in 'abc':
+            p._load(label, 10)
+        # scan is evicted before the hot label, though hot is least-recently used
+        self.assertEqual(p._evict(()), 'a')
+        self.assertEqual(p._evict({'b'}), 'c')
+        self.assertEqual(p._evict({'b'}), 'hot')
+
+    def test_persist_policy_2q_b(self) -> None:
+        p = PersistPolicy2Q(ghost_size=1)
+        p._load('a', 10)
+        p._load('b', 10)
+        self.assertEqual(p._evict(()), 'a')
+        self.assertEqual(p._evict(()), 'b')
+        # only b is remembered
+        p._load('a', 10)
+        p._load('b', 10)
+        self.assertEqual(list(p._probation), ['a'])
+        self.assertEqual(list(p._protected), ['b'])
+
+        p2 = p._new()
+        self.assertEqual(p2._ghost_size, 1)
+        p._clear()
+        self.assertEqual(len(p._probation) + len(p._protected) + len(p._ghost), 0)
+
+    def test_persist_policy_2q_c(self) -> None:
+        p = PersistPolicy2Q()
+        p._load('a', 10)
+        p._restore('a', 20)
+        # a label added while tracked is not duplicated or double counted
+        self.assertEqual(p.nbytes, 20)
+        self.assertEqual(len(p), 1)
+        self.assertEqual(list(p._probation), [])
+        self.assertEqual(list(p._protected), ['a'])
+        self.assertEqual(p._evict(()), 'a')
+        self.assertEqual(p.nbytes, 0)
+        self.assertEqual(p._evict(()), None)
+
+    def test_persist_policy_2q_d(self) -> None:
+        p = PersistPolicy2Q(protected_size=2)
+        for label in 'abc':
+            p._load(label, 10)
+            p._access(label)
+        # the least-recently used protected label is demoted
+        self.assertEqual(list(p._protected), ['b', 'c'])
+        self.assertEqual(list(p._probation), ['a'])
+        self.assertEqual(p._new()._protected_size, 2)
+
+        p = PersistPolicy2Q()
+        p._capacity = 4
+        for label in 'abcd':
+            p._load(label, 10)
+            p._access(label)
+        self.assertEqual(list(p._protected), ['b', 'c', 'd'])
+        self.assertEqual(p._evict(()), 'a')
+
+    #---------------------------------------------------------------------------
+    def test_persist_policy_bus_a(self) -> None:
+        frames = [ff.parse('s(2,2)').rename(str(i)) for i in range(6)]
+        b1 = Bus.from_frames(frames)
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            policy = PersistPolicy2Q()
+            b2 = Bus.from_zip_npz(fp, config=config, max_persist=3, persist_policy=policy)
+            self.assertIs(b2.persist_policy, policy)
+
+            for _ in range(3):
+                _ = b2['0']
+            for label in b2.index: # a scan
+                _ = b2[label]
+
+            self.assertTrue(b2._loaded[0])
+            self.assertEqual(b2._loaded.sum(), 3)
+            self.assertEqual(policy.misses, 6)
+            self.assertEqual(policy.hits, 3)
+            self.assertEqual(policy.evictions, 3)
+
+    def test_persist_policy_bus_b(self) -> None:
+        frames = [ff.parse('s(2,2)').rename(str(i)) for i in range(6)]
+        b1 = Bus.from_frames(frames)
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_npz(fp)
+
+            policy = PersistPolicyLRU(pinned=('1',))
+            b2 = Bus.from_zip_npz(fp, config=config, max_persist=1, persist_policy=policy)
+            _ = b2['1']
+            _ = b2['2']
+            # pinned Frame is retained, exceeding max_persist
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, True, True, False, False, False])
+
+            post = tuple(b2.items())
+            self.assertEqual(len(post), 6)
+            self.assertEqual(b2._loaded.tolist(),
+                    [False, True, False, False, False, True])
+
+            # derived Bus get a new policy with the same pins
+            b3 = b2.iloc[2:]
+            self.assertIsNot(b3.persist_policy, policy)
+            self.assertEqual(b3.persist_policy.pinned, frozenset(('1',))) # type: ignore
+
+            with self.assertRaises(ErrorInitBus):
+                Bus.from_zip_npz(fp, config=config, persist_policy=policy)
+
+            b2.unpersist()
+            self.assertEqual(len(policy), 0)
+
+    def test_persist_policy_bus_c(self) -> None:
+        f1 = Frame(np.arange(4).reshape(2, 2), name='a')
+        policy = PersistPolicyLFU()
+        # without limits, a policy records loaded Frame but never evicts
+        b1 = Bus.from_frames((f1,)).rename('x')
+        self.assertIs(b1.persist_policy, None)
+        b2 = Bus.from_series(b1.to_series(), persist_policy=policy)
+        self.assertEqual(len(policy), 1)
+        self.assertEqual(b2.iloc[0].shape, (2, 2))
+        self.assertEqual(policy.hits, 1)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -561,6 +561,23 @@ class TestUnit(TestCase):
             self.assertEqual(post.shape, (10, 1))
             self.assertEqual(set(post.index.values_at_depth(0)), {'c'})
 
+    def test_quilt_extract_g3(self) -> None:
+        from string import ascii_lowercase
+        config = StoreConfig(include_index=True, index_depth=1)
+
+        with temp_file('.zip') as fp:
+
+            items = ((ascii_lowercase[i], Frame(np.arange(2_000).reshape(1_000, 2), columns=tuple('xy'))) for i in range(4))
+
+            Batch(items).to_zip_pickle(fp, config=config)
+
+            q1 = Quilt.from_zip_pickle(fp, max_persist_bytes=20_000, retain_labels=True, config=config)
+            self.assertEqual(q1.shape, (4_000, 2))
+            post = q1.iloc[2_000:2_010, 1:]
+            self.assertEqual(post.shape, (10, 1))
+            self.assertEqual(q1._bus._loaded.sum(), 1)
+            self.assertEqual(q1._bus.nbytes, 16_000)
+
     #---------------------------------------------------------------------------
 
     def test_quilt_extract_array_a1(self) -> None:
@@ -1661,6 +1678,22 @@ class TestUnit(TestCase):
 
             self.assertTrue(q1.equals(q2, compare_class=True, compare_dtype=True, compare_name=True))
 
+    def test_quilt_to_zip_npy_b(self) -> None:
+
+        f1 = ff.parse('s(4,4)|v(int,float)|c(I,str)').rename('f1')
+        f2 = ff.parse('s(4,4)|v(str,bool)|c(I,str)').rename('f2')
+        q1 = Quilt.from_frames((f1, f2), retain_labels=True, axis=0)
+
+        with temp_file('.zip') as fp:
+            q1.to_zip_npy(fp)
+            q2 = Quilt.from_zip_npy(fp,
+                    retain_labels=True,
+                    axis=0,
+                    config=StoreConfig(columns_select=('zUvW',)),
+                    )
+            self.assertEqual(q2.columns.values.tolist(), ['zUvW'])
+            self.assertTrue(q2.to_frame().equals(q1.to_frame()[['zUvW']], compare_dtype=True))
+
     #---------------------------------------------------------------------------
 
     def test_quilt_equals_a(self) -> None:
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import pickle
+import sqlite3
+
+import numpy as np
+
+from static_frame.core.exception import ErrorInitStoreConfig
+from static_frame.core.frame import Frame
+from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.row_filter import RowFilterColumn
+from static_frame.core.row_filter import RowFilterCompare
+from static_frame.core.store_config import StoreConfig
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    #---------------------------------------------------------------------------
+    def test_row_filter_to_sql_a(self) -> None:
+        rf = ((RowFilterColumn('a') >= np.int64(2)) & ~(RowFilterColumn('b "c"') == 'x')) | RowFilterColumn('c').isin((1, 2))
+        self.assertEqual(rf.to_sql(),
+                ('(("a" IS NOT NULL AND "a" >= ?) AND (NOT ("b ""c""" IS NOT NULL AND "b ""c""" = ?))) OR ("c" IS NOT NULL AND "c" IN (?, ?))',
+                [2, 'x', 1, 2])
+                )
+        self.assertIs(rf.to_sql()[1][0].__class__, int)
+
+    def test_row_filter_to_sql_b(self) -> None:
+        rf = RowFilterColumn('a').isin(())
+        self.assertEqual(rf.to_sql(), ('1 = 0', []))
+
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (a INTEGER)')
+        conn.executemany('INSERT INTO t VALUES (?)', ((1,), (2,)))
+        where, parameters = rf.to_sql()
+        self.assertEqual(conn.execute(f'SELECT * FROM t WHERE {where}', parameters).fetchall(), [])
+
+    def test_row_filter_to_mask_a(self) -> None:
+        f = Frame.from_fields(((1, 2, 3, 4), ('a', 'b', 'c', 'd')),
+                columns=('x', 'y'),
+                index=IndexHierarchy.from_product((1, 2), ('p', 'q'), name=('i', 'j')),
+                )
+        rf = (RowFilterColumn('x') > 1) & (RowFilterColumn('j') != 'q')
+        self.assertEqual(rf.to_mask(f).tolist(), [False, False, True, False])
+        self.assertEqual(rf.filter(f).to_pairs(),
+                (('x', (((2, 'p'), 3),)), ('y', (((2, 'p'), 'c'),))))
+
+        rf = RowFilterColumn('y').isin(('a', 'd')) | (RowFilterColumn('i') == 2)
+        self.assertEqual(rf.to_mask(f).tolist(), [True, False, True, True])
+
+        rf = RowFilterColumn('x') > 0
+        self.assertIs(rf.filter(f), f)
+
+        with self.assertRaises(ErrorInitStoreConfig):
+            (RowFilterColumn('z') > 0).to_mask(f)
+
+    def test_row_filter_to_arrow_a(self) -> None:
+        import pyarrow as pa
+
+        table = pa.table({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        rf = ~(RowFilterColumn('a') < 2) & RowFilterColumn('b').isin(('x', 'z'))
+        self.assertEqual(table.filter(rf.to_arrow()).to_pydict(), {'a': [3], 'b': ['z']})
+
+    def test_row_filter_null_a(self) -> None:
+        import pyarrow as pa
+
+        a = (1.0, None, 3.0, 4.0)
+        b = ('x', 'y', None, 'z')
+        f = Frame.from_fields((a, b), columns=('a', 'b'))
+        table = pa.table({'a': a, 'b': b, 'i': range(4)})
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (i INTEGER, a REAL, b TEXT)')
+        conn.executemany('INSERT INTO t VALUES (?, ?, ?)', zip(range(4), a, b))
+
+        a_col = RowFilterColumn('a')
+        b_col = RowFilterColumn('b')
+        filters = (
+                (a_col > 2, [2, 3]),
+                (~(a_col > 2), [0, 1]),
+                (a_col != 1, [2, 3]),
+                (~(a_col == 1), [1, 2, 3]),
+                (a_col == None, [1]), # pylint: disable=C0121
+                (a_col != np.nan, [0, 2, 3]),
+                (b_col.isin(('x', 'z')), [0, 3]),
+                (~b_col.isin(('x', 'z')), [1, 2]),
+                (b_col.isin(('y', None)), [1, 2]),
+                (b_col.isin((None,)), [2]),
+                (~(a_col > 2) & (b_col != 'x'), [1]),
+                )
+        for rf, expected in filters:
+            # NumPy masks, SQL, and pyarrow select the same rows
+            self.assertEqual(np.nonzero(rf.to_mask(f))[0].tolist(), expected)
+            where, parameters = rf.to_sql()
+            post = conn.execute(f'SELECT i FROM t WHERE {where} ORDER BY i', parameters).fetchall()
+            self.assertEqual([row[0] for row in post], expected)
+            self.assertEqual(table.filter(rf.to_arrow())['i'].to_pylist(), expected)
+
+        with self.assertRaises(ErrorInitStoreConfig):
+            _ = a_col > None
+
+    def test_row_filter_eq_a(self) -> None:
+        rf1 = (RowFilterColumn('a') > 2) | RowFilterColumn('b').isin(['x'])
+        rf2 = (RowFilterColumn('a') > 2) | RowFilterColumn('b').isin(('x',))
+        self.assertEqual(rf1, rf2)
+        self.assertEqual(hash(rf1), hash(rf2))
+        self.assertNotEqual(rf1, RowFilterColumn('a') > 2)
+        self.assertNotEqual(rf1, None)
+
+        c1 = StoreConfig(row_filter=rf1).to_store_config_he()
+        c2 = StoreConfig(row_filter=rf2).to_store_config_he()
+        self.assertEqual(c1, c2)
+        self.assertEqual(hash(c1), hash(c2))
+        self.assertNotEqual(c1, StoreConfig().to_store_config_he())
+
+        self.assertEqual(pickle.loads(pickle.dumps(rf1)), rf1)
+
+    def test_row_filter_compare_a(self) -> None:
+        with self.assertRaises(ErrorInitStoreConfig):
+            RowFilterCompare('a', '=~', 3)
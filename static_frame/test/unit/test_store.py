@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import pickle
 from itertools import product
 
 import numpy as np
 
+from static_frame.core.exception import ErrorInitStore
 from static_frame.core.exception import ErrorInitStoreConfig
 from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
@@ -193,6 +195,23 @@ class TestUnit(TestCase):
         with self.assertRaises(NotImplementedError):
             hash(StoreConfig())
 
+    def test_store_config_sqlite_pragma_a(self) -> None:
+        config = StoreConfig(write_journal_mode='wal', write_synchronous=1)
+        self.assertEqual(config.write_journal_mode, 'wal')
+        self.assertEqual(config.write_synchronous, 1)
+        self.assertEqual(StoreConfigHE(write_synchronous='EXTRA').write_synchronous, 'EXTRA')
+
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(write_journal_mode='OFF; DROP TABLE a')
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfigHE(write_journal_mode='FAST')
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(write_synchronous=4)
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(write_synchronous=True)
+        with self.assertRaises(ErrorInitStoreConfig):
+            StoreConfig(write_synchronous='NORMAL; DROP TABLE a')
+
     #---------------------------------------------------------------------------
     def test_store_config_map_a(self) -> None:
 
@@ -351,6 +370,31 @@ class TestUnit(TestCase):
         assert "abc" not in s2._weak_cache
         assert not s2._weak_cache
 
+    #---------------------------------------------------------------------------
+
+    def test_store_read_many_async_a(self) -> None:
+
+        class StoreDerived(Store):
+            _EXT = frozenset(('.txt',))
+
+            def read_many(self, labels, *, config=None, container_type=Frame): # type: ignore
+                for label in labels:
+                    yield container_type.from_element(config.index_depth, # type: ignore
+                            index=('a',),
+                            columns=('b',),
+                            name=label,
+                            )
+
+        st = StoreDerived(fp='foo.txt')
+        config = {'x': StoreConfig(index_depth=1), 'y': StoreConfig(index_depth=2)}
+
+        post = asyncio.run(st.read_many_async(('y', 'x', 'y'), config=config, max_concurrency=2))
+        self.assertEqual([f.name for f in post], ['y', 'x', 'y'])
+        self.assertEqual([f.iloc[0, 0] for f in post], [2, 1, 2])
+
+        with self.assertRaises(ErrorInitStore):
+            asyncio.run(st.read_many_async(('x',), max_concurrency=0))
+
 
 if __name__ == '__main__':
     import unittest
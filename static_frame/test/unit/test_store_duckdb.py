@@ -1,9 +1,11 @@
 import os
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import frame_fixtures as ff
 
 from static_frame.core.frame import Frame
+from static_frame.core.row_filter import RowFilterColumn
 from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_duckdb import StoreDuckDB
 
@@ -183,6 +185,56 @@ def test_store_duckdb_write_a():
         assert post[1].equals(f2, compare_dtype=True)
 
 
+def test_store_duckdb_write_b():
+    import duckdb
+
+    f1 = ff.parse('s(6,3)|v(int64,str,bool)|i(I,str)|c(I,str)')
+    f2 = ff.parse('s(4,5)|v(float64,int8)|i(I,str)|c(I,str)')
+
+    config = StoreConfig(index_depth=1, write_max_workers=2)
+
+    with TemporaryDirectory() as fp_dir:
+        fp = os.path.join(fp_dir, 'test.db')
+        st = StoreDuckDB(fp)
+        st.write((('a', f1), ('b', f2)), config=config)
+        assert list(st.labels()) == ['a', 'b']
+
+        with duckdb.connect(fp, read_only=True) as conn:
+            types = conn.execute('select data_type from information_schema.columns where table_name = ?', ['a']).fetchall()
+        assert types == [('VARCHAR',), ('BIGINT',), ('VARCHAR',), ('BOOLEAN',)]
+
+        post = list(st.read_many(('a', 'b'), config=config))
+        assert post[0].equals(f1, compare_dtype=True)
+        assert post[1].equals(f2, compare_dtype=True)
+
+
+
+def test_store_duckdb_write_c():
+    frames = [ff.parse('s(4,3)|v(int64,float64)').rename(f'f{i}') for i in range(6)]
+    events = []
+
+    def items():
+        for f in frames:
+            events.append(('item', f.name))
+            yield f.name, f
+
+    frame_to_connection = StoreDuckDB._frame_to_connection
+
+    def frame_to_connection_record(self, **kwargs):
+        events.append(('table', kwargs['label']))
+        return frame_to_connection(**kwargs)
+
+    config = StoreConfig(write_max_workers=2)
+    with TemporaryDirectory() as fp_dir:
+        fp = os.path.join(fp_dir, 'test.db')
+        st = StoreDuckDB(fp)
+        with patch.object(StoreDuckDB, '_frame_to_connection', frame_to_connection_record):
+            st.write(items(), config=config)
+        assert list(st.labels()) == [f.name for f in frames]
+
+    # tables are created before all Frames are converted
+    assert events.index(('table', 'f0')) < events.index(('item', 'f5'))
+
 
 def test_store_duckdb_read_a():
     import duckdb
@@ -206,3 +258,82 @@ def test_store_duckdb_read_a():
         assert (f4.to_pairs() ==
                 (('zZbu', (('zZbu', -88017), ('ztsv', 92867), ('zUvW', 84967), ('zkuW', 13448), ('zmVj', 175579), ('z2Oo', 58768))), ('ztsv', (('zZbu', 162197), ('ztsv', -41157), ('zUvW', 5729), ('zkuW', -168387), ('zmVj', 140627), ('z2Oo', 66269))), ('zUvW', (('zZbu', -3648), ('ztsv', 91301), ('zUvW', 30205), ('zkuW', 54020), ('zmVj', 129017), ('z2Oo', 35021)))))
 
+
+
+def test_store_duckdb_read_b():
+    f1 = ff.parse('s(6,4)|v(int64,float64,bool)|i(I,str)|c(I,str)')
+    f2 = ff.parse('s(4,3)|v(float64)|i(I,str)|c(I,str)')
+
+    config = StoreConfig(index_depth=1, columns_select=('zUvW', 'zZbu'))
+
+    with TemporaryDirectory() as fp_dir:
+        fp = os.path.join(fp_dir, 'test.db')
+        st = StoreDuckDB(fp)
+        st.write((('a', f1), ('b', f2)))
+
+        post = list(st.read_many(('a', 'b'), config=config))
+        assert post[0].columns.values.tolist() == ['zZbu', 'zUvW']
+        assert post[0].values.tolist() == f1[['zZbu', 'zUvW']].values.tolist()
+        assert post[0].index.values.tolist() == f1.index.values.tolist()
+        assert post[1].columns.values.tolist() == ['zZbu', 'zUvW']
+
+
+def test_store_duckdb_read_c():
+    import duckdb
+
+    f1 = ff.parse('s(3,4)|v(int64)|c((I,I),(str,str))')
+    conn = duckdb.connect()
+    StoreDuckDB._frame_to_connection(frame=f1,
+            label='foo',
+            connection=conn,
+            include_index=False,
+            include_columns=True,
+            )
+    f2 = StoreDuckDB._connection_to_frame(container_type=Frame,
+            connection=conn,
+            label='foo',
+            columns_depth=2,
+            columns_select=[('ztsv', 'zmhG'), ('zZbu', 'zIA5')],
+            )
+    assert f2.columns.values.tolist() == [['zZbu', 'zIA5'], ['ztsv', 'zmhG']]
+    assert f2.values.tolist() == f1.iloc[:, [1, 3]].values.tolist()
+
+
+def test_store_duckdb_read_d():
+    f1 = ff.parse('s(6,4)|v(int64,float64,bool)|i(I,str)|c(I,str)')
+
+    rf = (RowFilterColumn('zZbu') > 60000) & ~RowFilterColumn('zUvW').isin((True,))
+    config = StoreConfig(index_depth=1, row_filter=rf)
+
+    with TemporaryDirectory() as fp_dir:
+        fp = os.path.join(fp_dir, 'test.db')
+        st = StoreDuckDB(fp)
+        st.write((('a', f1),))
+
+        post = st.read('a', config=config)
+        assert post.index.values.tolist() == ['ztsv', 'zUvW', 'zmVj']
+        assert post.values.tolist() == f1.loc[['ztsv', 'zUvW', 'zmVj']].values.tolist()
+
+
+def test_store_duckdb_read_e():
+    import duckdb
+
+    conn = duckdb.connect()
+    conn.execute("CREATE TYPE mood AS ENUM ('p', 'q')")
+    conn.execute('CREATE TABLE foo (a BIGINT, b DOUBLE, c VARCHAR, d mood, e DECIMAL(4, 1), f INTEGER)')
+    conn.execute("INSERT INTO foo VALUES (1, 0.5, 'x', 'p', 1.5, 3), (2, 1.5, 'y', 'q', 2.5, NULL)")
+
+    f = StoreDuckDB._connection_to_frame(container_type=Frame,
+            connection=conn,
+            label='foo',
+            )
+    assert [dt.kind for dt in f.dtypes.values] == ['i', 'f', 'U', 'U', 'f', 'f']
+    assert f.iloc[:, :5].to_pairs() == (
+            ('a', ((0, 1), (1, 2))),
+            ('b', ((0, 0.5), (1, 1.5))),
+            ('c', ((0, 'x'), (1, 'y'))),
+            ('d', ((0, 'p'), (1, 'q'))),
+            ('e', ((0, 1.5), (1, 2.5))),
+            )
+    assert f['f'].isna().values.tolist() == [False, True]
+    assert not f._blocks._blocks[0].flags.writeable
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+
 import typing_extensions as tp
 
+from static_frame.core.exception import ErrorInitStore
 from static_frame.core.frame import Frame
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.store_config import StoreConfig
@@ -198,6 +202,35 @@ class TestUnit(TestCase):
                 f_src = frames[i]
                 self.assertEqualFrames(f_src, f_loaded, compare_dtype=False)
 
+    @skip_no_hdf5
+    def test_store_hdf5_read_many_async_a(self) -> None:
+        f1 = Frame.from_dict(dict(x=(1, 2), y=(3, 4)), index=('a', 'b'), name='f1')
+        f2 = Frame.from_dict(dict(a=(1, 2, 3)), index=('x', 'y', 'z'), name='f2')
+        threads = []
+
+        class StoreHDF5Recorded(StoreHDF5):
+            def read_many(self, labels, *, config=None, container_type=Frame): # type: ignore
+                for frame in super().read_many(labels, config=config, container_type=container_type):
+                    threads.append(threading.get_ident())
+                    yield frame
+
+        config = StoreConfig(index_depth=1)
+        with temp_file('.hdf5') as fp:
+            st = StoreHDF5Recorded(fp)
+            st.write(((f.name, f) for f in (f1, f2)), config=config)
+
+            post = asyncio.run(st.read_many_async(('f2', 'f1', 'f2'), config=config, max_concurrency=3))
+            self.assertEqual([f.name for f in post], ['f2', 'f1', 'f2'])
+            self.assertEqualFrames(post[1], f1)
+            self.assertEqualFrames(post[2], f2)
+            # all Frame are read serially in one thread of the executor
+            self.assertEqual(len(threads), 3)
+            self.assertEqual(len(set(threads)), 1)
+            self.assertNotEqual(threads[0], threading.get_ident())
+
+            with self.assertRaises(ErrorInitStore):
+                asyncio.run(st.read_many_async(('f1',), max_concurrency=0))
+
 
 if __name__ == '__main__':
     import unittest
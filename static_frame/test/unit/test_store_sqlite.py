@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from fractions import Fraction
 
+import frame_fixtures as ff
 import numpy as np
 import typing_extensions as tp
 
 from static_frame.core.frame import Frame
+from static_frame.core.index import Index
 from static_frame.core.index_hierarchy import IndexHierarchy
+from static_frame.core.row_filter import RowFilterColumn
 from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_config import StoreConfigMap
 from static_frame.core.store_sqlite import StoreSQLite
@@ -164,6 +167,35 @@ class TestUnit(TestCase):
 
             self.assertEqual(list(st2.labels()), ['f2'])
 
+    def test_store_sqlite_write_g(self) -> None:
+        f1 = ff.parse('s(7,4)|v(int,float,bool,str)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,2)|v(float32,int8)|i(I,str)|c(I,str)').rename('b')
+
+        rows = list(StoreSQLite._frame_to_rows(frame=f1, include_index=True))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][0], ('zZbu', -88017, -610.8, True, 'z2Oo'))
+        self.assertIs(rows[0][0][1].__class__, int)
+
+        class StoreSQLiteBatched(StoreSQLite):
+            _WRITE_BATCH_ROWS = 3
+
+        rows = list(StoreSQLiteBatched._frame_to_rows(frame=f1, include_index=False))
+        self.assertEqual([len(r) for r in rows], [3, 3, 1])
+
+        for config in (
+                StoreConfig(index_depth=1, write_journal_mode='OFF', write_synchronous='OFF'),
+                StoreConfig(index_depth=1, write_journal_mode='wal', write_synchronous=1),
+                StoreConfig(index_depth=1, write_max_workers=2),
+                ):
+            with temp_file('.sqlite') as fp:
+                st = StoreSQLite(fp)
+                st.write(((f.name, f) for f in (f1, f2)), config=config)
+                self.assertEqual(list(st.labels()), ['a', 'b'])
+
+                post = list(st.read_many(('a', 'b'), config=config))
+                self.assertEqual(post[0].to_pairs(), f1.to_pairs())
+                self.assertEqual(post[1].values.tolist(), f2.values.tolist())
+
     #---------------------------------------------------------------------------
 
     def test_store_sqlite_read_many_a(self) -> None:
@@ -220,6 +252,51 @@ class TestUnit(TestCase):
                 f_src = frames[i]
                 self.assertEqualFrames(f_src, f_loaded, compare_dtype=False)
 
+    def test_store_sqlite_read_many_b(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(x=(1,2,-5,200), y=(3,4,-5,-3000), z=(0.5, 1.5, 2.5, 3.5)),
+                index=IndexHierarchy.from_product(('I', 'II'), ('a', 'b')),
+                name='f1')
+        f2 = Frame.from_dict(
+                {'a': (1,2,3), 'b "c"': (4,5,6)},
+                index=('x', 'y', 'z'),
+                name='f2')
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f.name, f) for f in (f1, f2)))
+
+            config_map = StoreConfigMap.from_initializer({
+                    'f1': StoreConfig(index_depth=2, columns_select=('z', 'x')),
+                    'f2': StoreConfig(index_depth=1, columns_select=('b "c"',)),
+                    })
+            post = tuple(st1.read_many(('f1', 'f2'), config=config_map))
+            self.assertEqual(post[0].to_pairs(),
+                    (('x', ((('I', 'a'), 1), (('I', 'b'), 2), (('II', 'a'), -5), (('II', 'b'), 200))), ('z', ((('I', 'a'), 0.5), (('I', 'b'), 1.5), (('II', 'a'), 2.5), (('II', 'b'), 3.5))))
+                    )
+            self.assertEqual(post[1].to_pairs(),
+                    (('b "c"', (('x', 4), ('y', 5), ('z', 6))),)
+                    )
+
+    def test_store_sqlite_read_many_c(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(x=(1,2,-5,200), y=('a', 'b', 'c', 'd')),
+                index=Index(('p', 'q', 'r', 's'), name='i'),
+                name='f1')
+
+        with temp_file('.sqlite') as fp:
+            st1 = StoreSQLite(fp)
+            st1.write(((f.name, f) for f in (f1,)))
+
+            rf = ((RowFilterColumn('x') > 0) & (RowFilterColumn('y') != 'b')) | (RowFilterColumn('i') == 'r')
+            config = StoreConfig(index_depth=1, columns_select=('y',), row_filter=rf)
+            post = st1.read('f1', config=config)
+            self.assertEqual(post.to_pairs(),
+                    (('y', (('p', 'a'), ('r', 'c'), ('s', 'd'))),)
+                    )
+
 
 if __name__ == '__main__':
     import unittest
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import mmap
+import os
+import zipfile
+
 import frame_fixtures as ff
+import numpy as np
+import pytest
 import typing_extensions as tp
 
+from static_frame.core.archive_npy import SharedMemoryArray
 from static_frame.core.exception import ErrorInitStore
+from static_frame.core.exception import ErrorInitStoreConfig
+from static_frame.core.exception import ErrorNPYEncode
+from static_frame.core.exception import StoreLabelNonUnique
+from static_frame.core.exception import StoreParameterConflict
 from static_frame.core.frame import Frame
 from static_frame.core.frame import FrameGO
 from static_frame.core.frame import FrameHE
 from static_frame.core.index_datetime import IndexDate
+from static_frame.core.row_filter import RowFilterColumn
 from static_frame.core.store_config import StoreConfig
 from static_frame.core.store_config import StoreConfigMap
+from static_frame.core.store_sqlite import StoreSQLite
 from static_frame.core.store_zip import StoreZipCSV
+from static_frame.core.store_zip import StoreZipManifest
 from static_frame.core.store_zip import StoreZipNPY
 from static_frame.core.store_zip import StoreZipNPZ
 from static_frame.core.store_zip import StoreZipParquet
@@ -366,6 +380,228 @@ class TestUnit(TestCase):
                     self.assertIs(f1, f2)
 
 
+    def test_store_read_many_threads_a(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+        config = StoreConfig(
+                index_depth=1,
+                read_max_workers=2,
+                read_use_threads=True,
+                )
+        for klass in (StoreZipTSV, StoreZipCSV, StoreZipPickle, StoreZipParquet, StoreZipNPZ):
+            with temp_file('.zip') as fp:
+                st = klass(fp)
+                st.write(((f.name, f) for f in (f1, f2, f3)), config=config)
+
+                post = tuple(st.read_many(('baz', 'bar', 'foo', 'bar'), config=config))
+                self.assertEqual([f.name for f in post], ['baz', 'bar', 'foo', 'bar'])
+                self.assertEqual(post[0].to_pairs(), f3.to_pairs())
+                self.assertEqual(post[2].to_pairs(), f1.to_pairs())
+                self.assertEqual(len(st._weak_cache), 3)
+
+    def test_store_read_many_threads_b(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+        config = StoreConfig(
+                index_depth=1,
+                read_max_workers=3,
+                read_use_threads=True,
+                )
+        with temp_file('.zip') as fp:
+            st = StoreZipTSV(fp)
+            st.write(((f.name, f) for f in (f1, f2, f3)), config=config)
+
+            foo = st.read('foo', config=config)
+            post = tuple(st.read_many(('foo', 'bar', 'baz'), config=config, container_type=FrameGO))
+            # a cached frame is converted to the requested container type
+            self.assertIs(post[0].__class__, FrameGO)
+            self.assertIs(post[1].__class__, FrameGO)
+            self.assertIs(st._weak_cache['bar'], post[1])
+
+            post2 = tuple(st.read_many(('baz', 'foo'), config=config, container_type=FrameGO))
+            self.assertIs(post2[0], post[2])
+            self.assertIs(st._weak_cache['foo'], foo)
+
+
+    def test_store_read_many_shared_memory_a(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+        config = StoreConfig(
+                index_depth=1,
+                read_max_workers=2,
+                read_shared_memory=True,
+                )
+        # NOTE: parquet Frames have object indices and are pickled
+        for klass in (StoreZipTSV, StoreZipPickle, StoreZipNPZ):
+            with temp_file('.zip') as fp:
+                st = klass(fp)
+                st.write(((f.name, f) for f in (f1, f2, f3)), config=config)
+
+                post = tuple(st.read_many(('bar', 'foo'), config=config))
+                self.assertIs(post[0]._blocks._blocks[0].base.__class__, SharedMemoryArray)
+                self.assertIs(st._weak_cache['foo'], post[1])
+                del post
+
+                post = tuple(st.read_many(('baz', 'bar', 'foo'), config=config, container_type=FrameGO))
+                self.assertEqual([f.name for f in post], ['baz', 'bar', 'foo'])
+                self.assertIs(post[0].__class__, FrameGO)
+                self.assertEqual(post[0].to_pairs(), f3.to_pairs())
+
+    @pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason='no /dev/shm')
+    def test_store_read_many_shared_memory_b(self) -> None:
+        frames = [Frame(np.arange(20).reshape(4, 5), name=str(i)) for i in range(8)]
+        config = StoreConfig(
+                index_depth=1,
+                read_max_workers=2,
+                read_shared_memory=True,
+                )
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in frames), config=config)
+            segments = set(os.listdir('/dev/shm'))
+
+            reader = st.read_many([f.name for f in frames], config=config)
+            self.assertEqual(next(reader).shape, (4, 5))
+            # closing before consuming all results releases their segments
+            reader.close()
+            self.assertEqual(set(os.listdir('/dev/shm')) - segments, set())
+
+
+    #---------------------------------------------------------------------------
+    def test_store_zip_append_a(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+        f4 = ff.parse('s(6,2)|v(int)').rename('bar')
+        config = StoreConfig(index_depth=1, columns_depth=1)
+
+        for klass in (StoreZipTSV, StoreZipPickle, StoreZipNPZ):
+            with temp_file('.zip') as fp:
+                st = klass(fp)
+                st.write(((f.name, f) for f in (f1, f2)), config=config)
+                size = os.path.getsize(fp)
+                bar = st.read('bar', config=config)
+
+                st.append(((f.name, f) for f in (f4, f3)), config=config)
+                self.assertEqual(list(st.labels()), ['foo', 'bar', 'baz'])
+                self.assertTrue(st.read('bar', config=config).equals(f4))
+                self.assertIsNot(st.read('bar', config=config), bar)
+                self.assertTrue(st.read('baz', config=config).equals(f3))
+
+                self.assertTrue(st.compact() > 0)
+                self.assertTrue(os.path.getsize(fp) > size)
+                self.assertEqual(list(st.labels()), ['foo', 'bar', 'baz'])
+                self.assertTrue(st.read('foo', config=config).equals(f1))
+                self.assertTrue(st.read('bar', config=config).equals(f4))
+                self.assertEqual(st.compact(), 0)
+
+    def test_store_zip_append_b(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+        config = StoreConfig(index_depth=1)
+
+        with temp_file('.zip') as fp:
+            os.remove(fp)
+            st = StoreZipPickle(fp)
+            # appending to a file that does not exist creates it
+            st.append(((f.name, f) for f in (f1,)))
+            self.assertEqual(list(st.labels()), ['foo'])
+
+            with self.assertRaises(StoreLabelNonUnique):
+                st.append(((f.name, f) for f in (f2, f2)))
+
+            st2 = StoreZipPickle(fp)
+            st2.append(((f.name, f) for f in (f3,)))
+            # as with write, append does not check for changes by other Store
+            st.append(((f.name, f) for f in (f2,)))
+
+            # a replaced Frame retains its position
+            self.assertEqual(list(st.labels()), ['foo', 'bar', 'baz'])
+            self.assertTrue(st.read('baz', config=config).equals(f3))
+
+
+    def test_store_zip_manifest_a(self) -> None:
+        f1, f2, f3 = get_test_framesA()
+        f4 = ff.parse('s(6,2)|v(int,str)').rename('bar')
+        config = StoreConfig(index_depth=1, write_manifest=True)
+
+        for klass in (StoreZipTSV, StoreZipPickle, StoreZipNPZ):
+            with temp_file('.zip') as fp:
+                st = klass(fp)
+                st.write(((f.name, f) for f in (f1, f2)), config=config)
+
+                manifest = StoreZipManifest.read(fp)
+                self.assertEqual(list(manifest.labels()), ['foo', 'bar'])
+                self.assertEqual(manifest.shape('bar'), f2.shape)
+                self.assertEqual(manifest.dtypes('bar'), f2.dtypes.values.tolist())
+                self.assertEqual(manifest.nbytes('foo'), f1.nbytes)
+
+                # the manifest is not a label
+                self.assertEqual(list(st.labels()), ['foo', 'bar'])
+                self.assertEqual(list(st.labels(strip_ext=False)),
+                        ['foo' + klass._EXT_CONTAINED, 'bar' + klass._EXT_CONTAINED])
+                self.assertIn(StoreZipManifest.NAME, zipfile.ZipFile(fp).namelist())
+                self.assertEqual(st._label_to_shape(config), {'foo': f1.shape, 'bar': f2.shape})
+
+                st.append(((f.name, f) for f in (f4, f3)), config=config)
+                self.assertEqual(list(st.labels()), ['foo', 'bar', 'baz'])
+                self.assertEqual(st._label_to_shape(config),
+                        {'foo': f1.shape, 'bar': f4.shape, 'baz': f3.shape})
+
+                st.compact()
+                manifest = StoreZipManifest.read(fp)
+                self.assertEqual(list(manifest.labels()), ['foo', 'bar', 'baz'])
+                with zipfile.ZipFile(fp) as zf:
+                    self.assertEqual(zf.namelist(),
+                            [l + klass._EXT_CONTAINED for l in ('foo', 'bar', 'baz')]
+                            + [StoreZipManifest.NAME])
+                    self.assertEqual(
+                            {z.filename: z.header_offset for z in zf.infolist()[:-1]},
+                            {name: m[0] for name, m in manifest._members.items()},
+                            )
+                self.assertTrue(st.read('bar', config=config).equals(f4))
+
+    def test_store_zip_manifest_b(self) -> None:
+        f1, f2, _ = get_test_framesA()
+
+        with temp_file('.zip') as fp:
+            st = StoreZipPickle(fp)
+            st.write(((f.name, f) for f in (f1, f2)))
+            self.assertIsNone(StoreZipManifest.read(fp))
+            self.assertIsNone(st._label_to_shape())
+
+            # appending cannot add a manifest to a ZIP without one
+            with self.assertRaises(StoreParameterConflict):
+                st.append(((f.name, f) for f in (f1,)), config=StoreConfig(write_manifest=True))
+            self.assertIsNone(StoreZipManifest.read(fp))
+            self.assertEqual(list(st.labels()), ['foo', 'bar'])
+
+            st.append(((f.name, f) for f in (f1,)))
+            self.assertIsNone(StoreZipManifest.read(fp))
+            self.assertEqual(list(st.labels()), ['foo', 'bar'])
+
+    def test_store_zip_manifest_c(self) -> None:
+        f1 = ff.parse('s(3,2)|v(int)|i(I,str)|c(I,str)').rename('f1')
+        config = StoreConfig(include_index=False, write_manifest=True)
+        config_depth = StoreConfig(index_depth=1)
+        config_select = StoreConfig(columns_select=('zZbu',))
+        config_filter = StoreConfig(row_filter=RowFilterColumn('zZbu') > 0)
+
+        for klass in (StoreZipCSV, StoreZipParquet, StoreZipPickle, StoreZipNPZ):
+            with temp_file('.zip') as fp:
+                st = klass(fp)
+                st.write(((f.name, f) for f in (f1,)), config=config)
+                self.assertEqual(st._label_to_shape(config), {'f1': (3, 2)})
+
+                # a shape is only reported if the read reproduces the stored shape
+                if klass._DEPTHS_STORED:
+                    self.assertEqual(st._label_to_shape(config_depth), {'f1': (3, 2)})
+                    self.assertEqual(st.read('f1', config=config_depth).shape, (3, 2))
+                else:
+                    self.assertEqual(st._label_to_shape(config_depth), {})
+                    self.assertEqual(st.read('f1', config=config_depth).shape, (3, 1))
+
+                self.assertEqual(st._label_to_shape(config_select), {})
+                if klass is not StoreZipPickle: # pickles are read whole
+                    self.assertEqual(st.read('f1', config=config_select).shape, (3, 1))
+
+                self.assertEqual(st._label_to_shape(config_filter), {})
+                self.assertEqual(st.read('f1', config=config_filter).shape, (2, 2))
+
 class TestUnitMultiProcess(TestCase):
 
     def run_assertions(self, klass: tp.Type[_StoreZip]) -> None:
@@ -424,6 +660,158 @@ class TestUnitMultiProcess(TestCase):
             self.assertIs(post[0].index.__class__, IndexDate)
             self.assertIs(post[1].index.__class__, IndexDate)
 
+    def test_store_zip_npz_b(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,bool,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,4)|v(float)|c(I,str)').rename('b')
+
+        config = StoreConfig(columns_select=('zUvW', 'zZbu'))
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in (f1, f2)))
+
+            post = tuple(st.read_many(('a', 'b'), config=config))
+            self.assertTrue(post[0].equals(f1[['zZbu', 'zUvW']], compare_dtype=True))
+            self.assertTrue(post[1].equals(f2[['zZbu', 'zUvW']], compare_dtype=True))
+
+    def test_store_zip_columns_select_cache_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,bool,str)|c(I,str)').rename('a')
+        config_select = StoreConfig(columns_select=('zUvW',))
+        config_select_threads = StoreConfig(columns_select=('zUvW',),
+                read_use_threads=True,
+                read_max_workers=2,
+                )
+
+        for cls in (StoreZipNPZ, StoreZipNPY):
+            with temp_file('.zip') as fp:
+                st = cls(fp)
+                st.write(((f.name, f) for f in (f1,)))
+
+                for config in (config_select, config_select_threads):
+                    post1 = st.read('a', config=config)
+                    self.assertEqual(post1.shape, (4, 1))
+                    # a projected Frame is not cached, and is not returned by a full read
+                    self.assertEqual(len(st._weak_cache), 0)
+                    self.assertEqual(st.read('a').shape, (4, 6))
+
+                post2 = st.read('a')
+                self.assertIs(st._weak_cache['a'], post2)
+                # a cached full Frame is not returned by a projected read
+                self.assertEqual(st.read('a', config=config_select).shape, (4, 1))
+
+    def test_store_zip_row_filter_cache_a(self) -> None:
+        f1 = Frame.from_fields(((1, 2, 3, 4), ('a', 'b', 'c', 'd')), columns=('x', 'y'), name='a')
+        config = StoreConfig(row_filter=RowFilterColumn('x') > 2)
+
+        for cls in (StoreZipNPZ, StoreZipNPY):
+            with temp_file('.zip') as fp:
+                st = cls(fp)
+                st.write(((f.name, f) for f in (f1,)))
+
+                post1 = st.read('a', config=config)
+                self.assertEqual(post1['x'].values.tolist(), [3, 4])
+                # a filtered Frame is not cached, and is not returned by a full read
+                self.assertEqual(len(st._weak_cache), 0)
+                post2 = st.read('a')
+                self.assertEqual(post2.shape, (4, 2))
+                self.assertIs(st._weak_cache['a'], post2)
+                # a cached full Frame is not returned by a filtered read
+                self.assertEqual(st.read('a', config=config).shape, (2, 2))
+
+    def test_store_zip_npz_codec_a(self) -> None:
+        f1 = ff.parse('s(40,6)|v(int,bool,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(30,4)|v(float)|c(I,str)').rename('b')
+        config = StoreConfig(write_codec='zlib')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPZ(fp)
+            st.write(((f.name, f) for f in (f1, f2)), config=config, compression=zipfile.ZIP_STORED)
+
+            # the codec is detected when read
+            post = tuple(st.read_many(('a', 'b')))
+            self.assertTrue(post[0].equals(f1, compare_dtype=True))
+            self.assertTrue(post[1].equals(f2, compare_dtype=True))
+
+    def test_store_zip_row_filter_a(self) -> None:
+        f1 = ff.parse('s(6,3)|v(int,str,bool)|c(I,str)').rename('a')
+        f2 = ff.parse('s(4,3)|v(int,str,bool)|c(I,str)').rename('b')
+        rf = (RowFilterColumn('zZbu') > 0) & (RowFilterColumn('zUvW') == False)
+
+        for read_max_workers, read_use_threads in ((None, False), (2, False), (2, True)):
+            config = StoreConfig(
+                    row_filter=rf,
+                    read_max_workers=read_max_workers,
+                    read_use_threads=read_use_threads,
+                    )
+            for cls in (StoreZipNPZ, StoreZipParquet, StoreZipPickle, StoreZipNPY):
+                with temp_file('.zip') as fp:
+                    st = cls(fp)
+                    st.write(((f.name, f) for f in (f1, f2)), config=StoreConfig(include_index=False))
+                    post = tuple(st.read_many(('a', 'b'), config=config))
+                    self.assertEqual(post[0].values.tolist(),
+                            f1.loc[(f1['zZbu'] > 0) & (f1['zUvW'] == False)].values.tolist())
+                    self.assertEqual(post[1].values.tolist(),
+                            f2.loc[(f2['zZbu'] > 0) & (f2['zUvW'] == False)].values.tolist())
+
+    def test_store_zip_row_filter_b(self) -> None:
+        f1 = Frame.from_fields(((1.0, np.nan, 3.0, np.nan), ('p', 'q', 'r', 's')),
+                columns=('c', 'd'),
+                name='a',
+                )
+        c = RowFilterColumn('c')
+        filters = (
+                (c == None, ['q', 's']), # pylint: disable=C0121
+                (c != None, ['p', 'r']), # pylint: disable=C0121
+                (~(c > 2), ['p', 'q', 's']),
+                (c.isin((3.0, None)), ['q', 'r', 's']),
+                )
+        for rf, expected in filters:
+            config = StoreConfig(row_filter=rf, include_index=False)
+            # NaN is missing for all stores and for Frame.from_parquet()
+            for cls in (StoreZipNPZ, StoreZipParquet, StoreZipCSV, StoreSQLite):
+                with temp_file('.sqlite' if cls is StoreSQLite else '.zip') as fp:
+                    st = cls(fp)
+                    st.write(((f1.name, f1),), config=config)
+                    post = st.read('a', config=config)
+                    self.assertEqual(post['d'].values.tolist(), expected)
+
+            with temp_file('.parquet') as fp:
+                f1.to_parquet(fp, include_index=False)
+                post = Frame.from_parquet(fp, row_filter=rf)
+                self.assertEqual(post['d'].values.tolist(), expected)
+                # a filter column not in columns_select is read to apply the filter
+                post = Frame.from_parquet(fp, row_filter=rf, columns_select=('d',))
+                self.assertEqual(post.columns.values.tolist(), ['d'])
+                self.assertEqual(post['d'].values.tolist(), expected)
+                post = Frame.from_concat(Frame.from_parquet_iter(fp,
+                        row_filter=rf,
+                        columns_select=('d',),
+                        ))
+                self.assertEqual(post['d'].values.tolist(), expected)
+
+    def test_store_zip_row_filter_c(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)|c(I,str)').rename('a')
+        # a filter column not in columns_select is read to apply the filter
+        rf = RowFilterColumn('zZbu') > 0
+
+        for read_max_workers, read_use_threads in ((None, False), (2, False), (2, True)):
+            config = StoreConfig(
+                    row_filter=rf,
+                    columns_select=('ztsv',),
+                    include_index=False,
+                    read_max_workers=read_max_workers,
+                    read_use_threads=read_use_threads,
+                    )
+            for cls in (StoreZipNPZ, StoreZipParquet, StoreZipCSV, StoreZipNPY):
+                with temp_file('.zip') as fp:
+                    st = cls(fp)
+                    st.write(((f1.name, f1),), config=StoreConfig(include_index=False))
+                    post = st.read('a', config=config)
+                    self.assertEqual(post.columns.values.tolist(), ['ztsv'])
+                    self.assertEqual(post['ztsv'].values.tolist(), [-41157, 5729, -168387])
+                    post = tuple(st.read_many(('a',), config=config))[0]
+                    self.assertEqual(post['ztsv'].values.tolist(), [-41157, 5729, -168387])
+
     #---------------------------------------------------------------------------
     def test_store_zip_npy_a(self) -> None:
 
@@ -464,6 +852,180 @@ class TestUnitMultiProcess(TestCase):
             post = tuple(st.read_many(('a', 'b', 'c')))
             self.assertEqual(len(post), 3)
 
+    def test_store_zip_npy_c(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,int,bool)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(4,8)|v(bool,str,float)|i(I,str)|c(I,str)').rename('b')
+        f3 = ff.parse('s(4,7)|v(str)|i(I,str)|c(I,str)').rename('c')
+
+        config = StoreConfig(read_max_workers=2, read_use_threads=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1, f2, f3)), config=config)
+
+            f4 = st.read('b', config=config)
+            post = tuple(st.read_many(('c', 'b', 'a'), config=config))
+            self.assertTrue(post[0].equals(f3, compare_dtype=True))
+            self.assertIs(post[1], f4)
+            self.assertTrue(post[2].equals(f1, compare_dtype=True))
+            self.assertEqual(len(st._weak_cache), 3)
+
+            post2 = tuple(st.read_many(('a', 'b'), config=config, container_type=FrameHE))
+            self.assertIs(post2[0].__class__, FrameHE)
+            self.assertTrue(post2[1].equals(f2, compare_dtype=True))
+    def test_store_zip_npy_d(self) -> None:
+
+        f1 = ff.parse('s(4,6)|v(int,int,bool,dtD)|i(I,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(20,8)|v(bool,str,float)|i(ID,dtD)|c(I,str)').rename('b')
+
+        config = StoreConfig(read_memory_map=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1, f2)), compression=zipfile.ZIP_STORED)
+
+            post = tuple(st.read_many(('b', 'a'), config=config, container_type=FrameGO))
+            self.assertTrue(post[0].equals(f2, compare_dtype=True))
+            self.assertTrue(post[1].equals(f1, compare_dtype=True))
+            self.assertIs(post[1].__class__, FrameGO)
+
+            for block in post[0]._blocks._blocks:
+                self.assertIs(block.base.__class__, mmap.mmap)
+                self.assertTrue(block.flags.aligned)
+                self.assertFalse(block.flags.writeable)
+
+            # memory maps are retained by arrays
+            s = post[0].iloc[:4, 1]
+            del post
+            self.assertEqual(s.values.tolist(), f2.iloc[:4, 1].values.tolist())
+
+    def test_store_zip_npy_e(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,bool)').rename('a')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1,)))
+
+            with self.assertRaises(ErrorInitStoreConfig):
+                st.read('a', config=StoreConfig(read_memory_map=True))
+
+    def test_store_zip_npy_f(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,bool,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,4)|v(float)|c(I,str)').rename('b')
+
+        config = StoreConfigMap.from_initializer({
+                'a': StoreConfig(columns_select=('zUvW', 'zZbu', 'zkuW')),
+                'b': StoreConfig(columns_select=('ztsv',)),
+                })
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1, f2)))
+
+            post = tuple(st.read_many(('a', 'b'), config=config))
+            self.assertTrue(post[0].equals(f1[['zZbu', 'zUvW', 'zkuW']], compare_dtype=True))
+            self.assertTrue(post[1].equals(f2[['ztsv']], compare_dtype=True))
+
+            st = StoreZipNPY(fp)
+            config = StoreConfig(columns_select=('zUvW',), read_use_threads=True, read_max_workers=2)
+            post = tuple(st.read_many(('a', 'b'), config=config))
+            self.assertEqual(post[0].columns.values.tolist(), ['zUvW'])
+            self.assertEqual(post[1].columns.values.tolist(), ['zUvW'])
+
+
+    def test_store_zip_npy_g(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,bool,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,4)|v(float)|c(I,str)').rename('b')
+        f3 = ff.parse('s(5,2)|v(int64)|c(I,str)').rename('a')
+        config = StoreConfig(read_memory_map=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1, f2)), compression=zipfile.ZIP_STORED)
+            st.append(((f.name, f) for f in (f3,)), compression=zipfile.ZIP_STORED)
+            self.assertEqual(list(st.labels()), ['a', 'b'])
+
+            post = tuple(st.read_many(('a', 'b'), config=config))
+            self.assertTrue(post[0].equals(f3, compare_dtype=True))
+            self.assertTrue(post[1].equals(f2, compare_dtype=True))
+            del post
+
+            self.assertTrue(st.compact() > 0)
+            self.assertEqual(list(st.labels()), ['a', 'b'])
+
+            post = tuple(st.read_many(('a', 'b'), config=config))
+            self.assertTrue(post[0].equals(f3, compare_dtype=True))
+            self.assertTrue(post[1].equals(f2, compare_dtype=True))
+            for frame in post:
+                for block in frame._blocks._blocks:
+                    self.assertIs(block.base.__class__, mmap.mmap)
+                    self.assertTrue(block.flags.aligned)
+
+    def test_store_zip_npy_h(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)').rename('a')
+        f2 = ff.parse('s(4,3)|v(object)').rename('a')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1,)))
+
+            # a failed append retains the stored Frame
+            with self.assertRaises(ErrorNPYEncode):
+                st.append(((f.name, f) for f in (f2,)))
+            st._mtime_update()
+            self.assertEqual(list(st.labels()), ['a'])
+            self.assertTrue(st.read('a').equals(f1))
+
+    def test_store_zip_npy_dictionary_encode_a(self) -> None:
+        f1 = ff.parse('s(40,3)|v(str,int)|c(I,str)').rename('a')
+        f1 = f1.assign.iloc[:, 0](np.array(['foo', 'bar'] * 20))
+        config = StoreConfig(write_dictionary_encode=True)
+        config = StoreConfig(write_dictionary_encode=True, write_compact_strings=True)
+
+        for cls in (StoreZipNPY, StoreZipNPZ):
+            with temp_file('.zip') as fp:
+                st = cls(fp)
+                st.write(((f.name, f) for f in (f1,)), config=config)
+                self.assertTrue(st.read('a').equals(f1, compare_dtype=True))
+
+    def test_store_zip_npy_manifest_a(self) -> None:
+        f1 = ff.parse('s(4,6)|v(int,bool,str)|c(I,str)').rename('a')
+        f2 = ff.parse('s(3,4)|v(float)|c(I,str)').rename('b')
+        f3 = ff.parse('s(5,2)|v(int64)|c(I,str)').rename('a')
+        config = StoreConfig(read_memory_map=True, write_manifest=True)
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1, f2)), config=config, compression=zipfile.ZIP_STORED)
+            self.assertEqual(list(st.labels()), ['a', 'b'])
+            self.assertEqual(st._label_to_shape(), {'a': (4, 6), 'b': (3, 4)})
+
+            st.append(((f.name, f) for f in (f3,)), compression=zipfile.ZIP_STORED)
+            self.assertEqual(list(st.labels()), ['a', 'b'])
+            self.assertEqual(st._label_to_shape(), {'a': (5, 2), 'b': (3, 4)})
+
+            for _ in range(2):
+                post = tuple(st.read_many(('a', 'b'), config=config))
+                self.assertTrue(post[0].equals(f3, compare_dtype=True))
+                self.assertTrue(post[1].equals(f2, compare_dtype=True))
+                for frame in post:
+                    for block in frame._blocks._blocks:
+                        self.assertIs(block.base.__class__, mmap.mmap)
+                        self.assertTrue(block.flags.aligned)
+                del post
+                st.compact()
+
+    def test_store_zip_npy_manifest_b(self) -> None:
+        f1 = ff.parse('s(4,3)|v(int)').rename('a')
+
+        with temp_file('.zip') as fp:
+            st = StoreZipNPY(fp)
+            st.write(((f.name, f) for f in (f1,)), config=StoreConfig(write_manifest=True))
+
+            with self.assertRaises(ErrorInitStoreConfig):
+                st.read('a', config=StoreConfig(read_memory_map=True))
+
 if __name__ == '__main__':
     import unittest
     unittest.main()
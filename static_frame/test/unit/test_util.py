@@ -42,12 +42,16 @@ from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_1d
 from static_frame.core.util import argmin_2d
 from static_frame.core.util import array1d_to_last_contiguous_to_edge
+from static_frame.core.util import array_dictionary_encode
 from static_frame.core.util import array_from_element_apply
 from static_frame.core.util import array_from_element_method
 from static_frame.core.util import array_sample
 from static_frame.core.util import array_shift
+from static_frame.core.util import array_str_compact
+from static_frame.core.util import array_str_expand
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import array_ufunc_axis_skipna
+from static_frame.core.util import array_widen
 from static_frame.core.util import binary_transition
 from static_frame.core.util import blocks_to_array_2d
 from static_frame.core.util import bytes_to_size_label
@@ -1221,6 +1225,31 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_array_widen_a(self) -> None:
+        a1 = np.array([2.5])
+        self.assertIs(array_widen(a1, np.dtype(float)), a1)
+
+        post = array_widen(a1, np.dtype(np.int64))
+        self.assertIs(post, a1)
+
+        post = array_widen(np.array([3]), np.dtype(float))
+        self.assertEqual(post.dtype, np.dtype(float))
+        self.assertFalse(post.flags.writeable)
+
+        post = array_widen(np.array([None]), np.dtype(np.int64))
+        self.assertEqual(post.dtype, np.dtype(float))
+        self.assertTrue(np.isnan(post[0]))
+
+        post = array_widen(np.array([None]), np.dtype('datetime64[D]'))
+        self.assertEqual(post.dtype, np.dtype('datetime64[D]'))
+        self.assertTrue(np.isnat(post[0]))
+
+        post = array_widen(np.array([None]), np.dtype(bool))
+        self.assertEqual(post.tolist(), [None])
+
+        post = array_widen(np.array(['a']), np.dtype(np.int64))
+        self.assertEqual(post.dtype, np.dtype(object))
+
     def test_concat_resolved_a(self) -> None:
         a1 = np.array([[3,4,5],[0,0,0]])
         a2 = np.array([1,2,3]).reshape((1,3))
@@ -2762,6 +2791,48 @@ class TestUnit(TestCase):
         self.assertEqual(pos.tolist(), [0, 1, 2])
         self.assertEqual(indexer.tolist(), [0, 1, 2, 1, 0])
 
+    def test_array_dictionary_encode_a(self) -> None:
+        a1 = np.array([['b', 'a'], ['c', 'b'], ['b', 'b']])
+        values, codes = array_dictionary_encode(a1)
+        self.assertEqual(values.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertEqual(codes.tolist(), [[1, 0], [2, 1], [1, 1]])
+        self.assertTrue((values[codes] == a1).all())
+        self.assertFalse(codes.flags.writeable)
+
+    def test_array_dictionary_encode_b(self) -> None:
+        values, codes = array_dictionary_encode(np.arange(300).astype(str))
+        self.assertEqual(codes.dtype, np.uint16)
+        self.assertEqual(len(values), 300)
+
+        values, codes = array_dictionary_encode(np.array([], dtype=str))
+        self.assertEqual(codes.shape, (0,))
+        self.assertEqual(len(values), 0)
+
+    def test_array_str_compact_a(self) -> None:
+        a1 = np.array(['a', 'bcd', '', 'x' * 20])
+        buffer, lengths = array_str_compact(a1)
+        self.assertEqual(buffer.dtype, np.uint8)
+        self.assertEqual(len(buffer), 24)
+        self.assertEqual(lengths.tolist(), [1, 3, 0, 20])
+
+        a2 = array_str_expand(buffer, lengths, a1.dtype)
+        self.assertEqual(a2.dtype, a1.dtype)
+        self.assertEqual(a2.tolist(), a1.tolist())
+        self.assertFalse(a2.flags.writeable)
+
+    def test_array_str_compact_b(self) -> None:
+        a1 = np.array([['ab', '\U0001F600'], ['', 'c']], dtype='>U4')[:, 1]
+        buffer, lengths = array_str_compact(a1)
+        self.assertEqual(buffer.dtype, np.uint32)
+        a2 = array_str_expand(buffer, lengths, a1.dtype)
+        self.assertEqual(a2.dtype, a1.dtype)
+        self.assertEqual(a2.tolist(), ['\U0001F600', 'c'])
+
+        a3 = np.array([['a', 'bb'], ['', 'ccc']])
+        a4 = array_str_expand(*array_str_compact(a3), a3.dtype)
+        self.assertEqual(a4.tolist(), a3.tolist())
+
 
     #---------------------------------------------------------------------------
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import gzip
 import io
 # import json
@@ -88,6 +89,14 @@ class TestUnit(TestCase):
             self.assertTrue(isinstance(post, BytesIOTemporaryFile))
             self.assertEqual(b'foo', post.read())
 
+    def test_www_from_file_async_a(self) -> None:
+        with patch('urllib.request.urlopen') as mock:
+            prepare_mock(mock, 'foo')
+
+            post: io.StringIO = asyncio.run(WWW.from_file_async(URL, encoding='utf-8', in_memory=True)) # type: ignore
+            self.assertTrue(isinstance(post, io.StringIO))
+            self.assertEqual(post.read(), 'foo')
+
 
     def test_www_from_file_from_delimited_a(self) -> None:
         with patch('urllib.request.urlopen') as mock: